@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from reports.InvoiceViewer import InvoiceViewer
 from sqlite_cli.models.invoice_model import Invoice
 from sqlite_cli.models.service_request_model import ServiceRequest
@@ -15,6 +15,8 @@ from sqlite_cli.models.tax_model import Tax
 from sqlite_cli.models.currency_model import Currency
 from sqlite_cli.models.service_model import Service
 from screens.customers.crud_customer import CrudCustomer
+from utils.search_controller import SearchController
+from utils.image_cache import get_image_cache
 
 class BillingScreen(tk.Frame):
     def __init__(self, parent: tk.Widget, open_previous_screen_callback: Callable[[], None]) -> None:
@@ -29,6 +31,7 @@ class BillingScreen(tk.Frame):
         
         # Configuración de estilos
         self.configure(bg="#f5f5f5")  # Fondo general
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
         self.refresh_data()
 
@@ -162,12 +165,12 @@ class BillingScreen(tk.Frame):
 
         # Products tab
         products_tab = tk.Frame(self.catalog_notebook, bg="#f5f5f5")
-        products_icon = tk.PhotoImage(file="assets/iconos/comercio_electronico.png").subsample(20, 20)  # Reducir tamaño
+        products_icon = get_image_cache().icon("assets/iconos/comercio_electronico.png", 20)  # Reducir tamaño
         self.catalog_notebook.add(products_tab, text=" Productos", image=products_icon, compound=tk.LEFT)  # Espacio antes del texto
 
         # Services tab
         services_tab = tk.Frame(self.catalog_notebook, bg="#f5f5f5")
-        services_icon = tk.PhotoImage(file="assets/iconos/gestion_de_productos.png").subsample(20, 20)  # Reducir tamaño
+        services_icon = get_image_cache().icon("assets/iconos/gestion_de_productos.png", 20)  # Reducir tamaño
         self.catalog_notebook.add(services_tab, text=" Servicios", image=services_icon, compound=tk.LEFT)  # Espacio antes del texto
 
         # Guardar referencias a las imágenes
@@ -175,7 +178,7 @@ class BillingScreen(tk.Frame):
         self.services_icon = services_icon
 
         # Treeview para productos disponibles
-        products_available_icon = tk.PhotoImage(file="assets/iconos/comercio_electronico.png").subsample(20, 20)
+        products_available_icon = get_image_cache().icon("assets/iconos/comercio_electronico.png", 20)
         lbl_products = tk.Frame(products_tab, bg="#f5f5f5")
         lbl_products.pack(anchor=tk.W)
 
@@ -234,7 +237,7 @@ class BillingScreen(tk.Frame):
         self.products_tree.bind("<Button-1>", self.on_product_click)
 
         # Treeview para servicios disponibles
-        services_available_icon = tk.PhotoImage(file="assets/iconos/gestion_de_productos.png").subsample(20, 20)
+        services_available_icon = get_image_cache().icon("assets/iconos/gestion_de_productos.png", 20)
         lbl_services = tk.Frame(services_tab, bg="#f5f5f5")
         lbl_services.pack(anchor=tk.W)
 
@@ -291,7 +294,7 @@ class BillingScreen(tk.Frame):
         self.services_tree.bind("<Button-1>", self.on_service_click)
 
         # Treeview para carrito de compras (más ancha)
-        cart_icon = tk.PhotoImage(file="assets/iconos/carrito_de_supermercado.png").subsample(18, 18)
+        cart_icon = get_image_cache().icon("assets/iconos/carrito_de_supermercado.png", 18)
         lbl_cart_frame = tk.Frame(tables_frame, bg="#f5f5f5")
         lbl_cart_frame.pack(anchor=tk.W)
 
@@ -440,19 +443,25 @@ class BillingScreen(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         field = self.search_field_var.get()
-        
+        field = field if field != "Todos los campos" else None
+        self.search_controller.submit(
+            lambda: (
+                InventoryItem.search_active(search_term, field),
+                Service.search_active(search_term, field)
+            ),
+            event
+        )
+
+    def show_search_results(self, results: Tuple[List[Dict], List[Dict]]) -> None:
+        products, services = results
+
         # Clear both trees
         for item in self.products_tree.get_children():
             self.products_tree.delete(item)
         for item in self.services_tree.get_children():
             self.services_tree.delete(item)
         
-        # Search products
-        products = InventoryItem.search_active(
-            search_term, 
-            field if field != "Todos los campos" else None
-        )
-        
+        # Show products
         for i, item in enumerate(products):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
             self.products_tree.insert("", tk.END, values=(
@@ -465,12 +474,7 @@ class BillingScreen(tk.Frame):
                 f"{float(item['price']):.2f}" if item['price'] else "0.00"
             ), tags=(tag,))
         
-        # Search services
-        services = Service.search_active(
-            search_term,
-            field if field != "Todos los campos" else None
-        )
-        
+        # Show services
         for i, service in enumerate(services):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
             self.services_tree.insert("", tk.END, values=(
@@ -1,14 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, List, Dict, Any
+from typing import Callable, List, Dict, Any, Tuple
 from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
-from PIL import Image, ImageTk
-import os
+from utils.search_controller import SearchController
+from utils.image_cache import get_image_cache
+from widgets.virtual_grid import VirtualGrid
 from sqlite_cli.models.catalog_model import CatalogModel  # Importamos el modelo de catálogo
 
+GRID_THUMBNAIL_SIZE = (120, 120)   # Miniatura de las tarjetas del grid
+DETAIL_IMAGE_SIZE = (330, 200)     # Imagen del panel de detalles
+
 class CatalogScreen(tk.Frame):
     def __init__(self, parent: tk.Widget, open_previous_screen_callback: Callable[[], None]) -> None:
         super().__init__(parent)
@@ -18,9 +22,9 @@ class CatalogScreen(tk.Frame):
         self.search_field_var = tk.StringVar(value="Productos")
         self.current_image = None
         self.selected_item = None  # Para almacenar el ítem seleccionado
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
         self.refresh_data()
-        self.display_products(CatalogModel.get_all_products())
         self.display_services(CatalogModel.get_all_services())
 
     def pack(self, **kwargs: Any) -> None:
@@ -230,269 +234,138 @@ class CatalogScreen(tk.Frame):
         self.details_desc_label.pack(fill=tk.X, pady=(0, 10))
 
     def setup_products_frame(self):
-        # Canvas y scrollbar para productos
-        self.products_canvas = tk.Canvas(self.products_frame, bg="#f5f5f5", highlightthickness=0)
-        self.products_scrollbar = ttk.Scrollbar(self.products_frame, orient="vertical", command=self.products_canvas.yview)
-        self.products_scrollable_frame = tk.Frame(self.products_canvas, bg="#f5f5f5")
-
-        self.products_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.products_canvas.configure(
-                scrollregion=self.products_canvas.bbox("all")
-            )
+        # Grid virtualizado: sólo hay tarjetas para las filas visibles
+        self.products_grid = VirtualGrid(
+            self.products_frame,
+            build_card=self.build_product_card,
+            fill_card=self.fill_product_card,
+            on_click=self.show_product_details,
+            card_width=200,
+            card_height=250,
+            columns=3,
+            empty_text="No se encontraron productos"
         )
-
-        self.products_canvas.create_window((0, 0), window=self.products_scrollable_frame, anchor="nw")
-        self.products_canvas.configure(yscrollcommand=self.products_scrollbar.set)
-
-        self.products_scrollbar.pack(side="right", fill="y")
-        self.products_canvas.pack(side="left", fill="both", expand=True)
+        self.products_grid.pack(fill=tk.BOTH, expand=True)
 
     def setup_services_frame(self):
-        # Canvas y scrollbar para servicios
-        self.services_canvas = tk.Canvas(self.services_frame, bg="#f5f5f5", highlightthickness=0)
-        self.services_scrollbar = ttk.Scrollbar(self.services_frame, orient="vertical", command=self.services_canvas.yview)
-        self.services_scrollable_frame = tk.Frame(self.services_canvas, bg="#f5f5f5")
-
-        self.services_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.services_canvas.configure(
-                scrollregion=self.services_canvas.bbox("all")
-            )
+        # Grid virtualizado: sólo hay tarjetas para las filas visibles
+        self.services_grid = VirtualGrid(
+            self.services_frame,
+            build_card=self.build_service_card,
+            fill_card=self.fill_service_card,
+            on_click=self.show_service_details,
+            card_width=200,
+            card_height=200,
+            columns=3,
+            empty_text="No se encontraron servicios"
         )
-
-        self.services_canvas.create_window((0, 0), window=self.services_scrollable_frame, anchor="nw")
-        self.services_canvas.configure(yscrollcommand=self.services_scrollbar.set)
-
-        self.services_scrollbar.pack(side="right", fill="y")
-        self.services_canvas.pack(side="left", fill="both", expand=True)
+        self.services_grid.pack(fill=tk.BOTH, expand=True)
 
     def display_products(self, products: List[Dict]) -> None:
-        # Limpiar frame de productos
-        for widget in self.products_scrollable_frame.winfo_children():
-            widget.destroy()
+        self.products_grid.set_items(products)
 
-        if not products:
-            no_products_label = CustomLabel(
-                self.products_scrollable_frame,
-                text="No se encontraron productos",
-                font=("Arial", 12),
-                fg="#666",
-                bg="#f5f5f5"
-            )
-            no_products_label.pack(pady=20)
-            return
-
-        # Crear un frame para contener el grid de productos
-        grid_container = tk.Frame(self.products_scrollable_frame, bg="#f5f5f5")
-        grid_container.pack(fill=tk.BOTH, expand=True)
-
-        # Mostrar productos en un grid 3x3
-        max_cols = 3
-        row = 0
-        col = 0
-
-        for i, product in enumerate(products):
-            # Crear frame para cada producto
-            product_frame = tk.Frame(
-                grid_container,
-                bg="white",
-                bd=1,
-                relief=tk.RAISED,
-                padx=10,
-                pady=10,
-                width=200,  # Ancho fijo
-                height=250  # Alto fijo
-            )
-            product_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-            product_frame.grid_propagate(False)  # Mantener tamaño fijo
-            product_frame.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-
-            # Mostrar imagen si existe
-            if product.get('image_path') and os.path.exists(product['image_path']):
-                try:
-                    img = Image.open(product['image_path'])
-                    img.thumbnail((120, 120))  # Tamaño más pequeño para el grid
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    img_label = tk.Label(product_frame, image=photo, bg="white")
-                    img_label.image = photo  # keep a reference!
-                    img_label.pack(pady=(0, 10))
-                    img_label.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-                except Exception as e:
-                    print(f"Error loading image: {e}")
-                    no_img_label = CustomLabel(
-                        product_frame,
-                        text="Imagen no disponible",
-                        font=("Arial", 8),
-                        fg="#999",
-                        bg="white"
-                    )
-                    no_img_label.pack(pady=(0, 10))
-                    no_img_label.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-            else:
-                no_img_label = CustomLabel(
-                    product_frame,
-                    text="Imagen no disponible",
-                    font=("Arial", 8),
-                    fg="#999",
-                    bg="white"
-                )
-                no_img_label.pack(pady=(0, 10))
-                no_img_label.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-
-            # Mostrar información del producto
-            name_label = CustomLabel(
-                product_frame,
-                text=product['product'],
-                font=("Arial", 10, "bold"),
-                fg="#333",
-                bg="white",
-                wraplength=180  # Ajustar texto largo
-            )
-            name_label.pack()
-            name_label.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-
-            # Precio sin signo de $
-            price_label = CustomLabel(
-                product_frame,
-                text=f"Precio: {product['price']:.2f}",
-                font=("Arial", 9),
-                fg="#2ecc71",
-                bg="white"
-            )
-            price_label.pack()
-            price_label.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-
-            stock_label = CustomLabel(
-                product_frame,
-                text=f"Disponibles: {product['stock']}",
-                font=("Arial", 8),
-                fg="#666",
-                bg="white"
+    def display_services(self, services: List[Dict]) -> None:
+        self.services_grid.set_items(services)
+
+    @staticmethod
+    def build_product_card(parent: tk.Widget) -> tk.Frame:
+        """Crea una tarjeta de producto vacía (se recicla al desplazarse)"""
+        card = tk.Frame(parent, bg="white", bd=1, relief=tk.RAISED, padx=10, pady=10)
+
+        # Imagen: se muestra el texto de reemplazo hasta que llega la miniatura
+        card.img_label = tk.Label(card, text="Imagen no disponible", font=("Arial", 8), fg="#999", bg="white")
+        card.img_label.pack(pady=(0, 10))
+        card.img_label.image_path = None
+
+        card.name_label = CustomLabel(
+            card,
+            text="",
+            font=("Arial", 10, "bold"),
+            fg="#333",
+            bg="white",
+            wraplength=180  # Ajustar texto largo
+        )
+        card.name_label.pack()
+
+        # Precio sin signo de $
+        card.price_label = CustomLabel(card, text="", font=("Arial", 9), fg="#2ecc71", bg="white")
+        card.price_label.pack()
+
+        card.stock_label = CustomLabel(card, text="", font=("Arial", 8), fg="#666", bg="white")
+        card.stock_label.pack()
+
+        card.exp_label = CustomLabel(card, text="", font=("Arial", 7), fg="#e74c3c", bg="white")
+        card.exp_label.pack()
+        return card
+
+    def fill_product_card(self, card: tk.Frame, product: Dict) -> None:
+        """Muestra un producto en una tarjeta y pide su miniatura"""
+        card.name_label.configure(text=product['product'])
+        card.price_label.configure(text=f"Precio: {product['price']:.2f}")
+        card.stock_label.configure(text=f"Disponibles: {product['stock']}")
+        expiration = product.get('expiration_date')
+        card.exp_label.configure(text=f"Vence: {expiration}" if expiration else "")
+
+        image_path = product.get('image_path')
+        img_label = card.img_label
+        img_label.image_path = image_path
+        img_label.configure(image="", text="Imagen no disponible")
+        img_label.image = None
+        if image_path:
+            # Decodificada en segundo plano si no está en la caché
+            get_image_cache().load_async(
+                image_path, GRID_THUMBNAIL_SIZE, img_label,
+                lambda photo, label=img_label, path=image_path: self.set_card_image(label, photo, path)
             )
-            stock_label.pack()
-            stock_label.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-
-            if product.get('expiration_date'):
-                exp_label = CustomLabel(
-                    product_frame,
-                    text=f"Vence: {product['expiration_date']}",
-                    font=("Arial", 7),
-                    fg="#e74c3c",
-                    bg="white"
-                )
-                exp_label.pack()
-                exp_label.bind("<Button-1>", lambda e, p=product: self.show_product_details(p))
-
-            # Actualizar grid (3 columnas máximo)
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-
-        # Configurar grid para que se expanda correctamente
-        for i in range(row + 1):
-            grid_container.grid_rowconfigure(i, weight=1)
-        for i in range(max_cols):
-            grid_container.grid_columnconfigure(i, weight=1)
 
-    def display_services(self, services: List[Dict]) -> None:
-        # Limpiar frame de servicios
-        for widget in self.services_scrollable_frame.winfo_children():
-            widget.destroy()
+    @staticmethod
+    def set_card_image(label: tk.Label, photo, image_path: str) -> None:
+        """Coloca la miniatura en la tarjeta si sigue mostrando el mismo producto."""
+        if photo is not None and label.image_path == image_path:
+            label.configure(image=photo, text="")
+            label.image = photo  # keep a reference!
+
+    @staticmethod
+    def build_service_card(parent: tk.Widget) -> tk.Frame:
+        """Crea una tarjeta de servicio vacía (se recicla al desplazarse)"""
+        card = tk.Frame(parent, bg="white", bd=1, relief=tk.RAISED, padx=15, pady=15)
+
+        # Mostrar icono de servicio
+        service_icon = CustomLabel(card, text="⚙️", font=("Arial", 20), bg="white")
+        service_icon.pack(pady=(0, 10))
+
+        card.name_label = CustomLabel(
+            card,
+            text="",
+            font=("Arial", 10, "bold"),
+            fg="#333",
+            bg="white",
+            wraplength=180  # Ajustar texto largo
+        )
+        card.name_label.pack()
 
-        if not services:
-            no_services_label = CustomLabel(
-                self.services_scrollable_frame,
-                text="No se encontraron servicios",
-                font=("Arial", 12),
-                fg="#666",
-                bg="#f5f5f5"
-            )
-            no_services_label.pack(pady=20)
-            return
-
-        # Crear un frame para contener el grid de servicios
-        grid_container = tk.Frame(self.services_scrollable_frame, bg="#f5f5f5")
-        grid_container.pack(fill=tk.BOTH, expand=True)
-
-        # Mostrar servicios en un grid 3x3
-        max_cols = 3
-        row = 0
-        col = 0
-
-        for i, service in enumerate(services):
-            service_frame = tk.Frame(
-                grid_container,
-                bg="white",
-                bd=1,
-                relief=tk.RAISED,
-                padx=15,
-                pady=15,
-                width=200,  # Ancho fijo
-                height=200  # Alto fijo
-            )
-            service_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-            service_frame.grid_propagate(False)  # Mantener tamaño fijo
-            service_frame.bind("<Button-1>", lambda e, s=service: self.show_service_details(s))
-
-            # Mostrar icono de servicio
-            service_icon = CustomLabel(
-                service_frame,
-                text="⚙️",
-                font=("Arial", 20),  # Tamaño más pequeño
-                bg="white"
-            )
-            service_icon.pack(pady=(0, 10))
-            service_icon.bind("<Button-1>", lambda e, s=service: self.show_service_details(s))
-
-            # Mostrar información del servicio
-            name_label = CustomLabel(
-                service_frame,
-                text=service['name'],
-                font=("Arial", 10, "bold"),
-                fg="#333",
-                bg="white",
-                wraplength=180  # Ajustar texto largo
-            )
-            name_label.pack()
-            name_label.bind("<Button-1>", lambda e, s=service: self.show_service_details(s))
-
-            # Precio sin signo de $
-            price_label = CustomLabel(
-                service_frame,
-                text=f"Precio: {service['price']:.2f}",
-                font=("Arial", 9),
-                fg="#2ecc71",
-                bg="white"
-            )
-            price_label.pack()
-            price_label.bind("<Button-1>", lambda e, s=service: self.show_service_details(s))
-
-            if service.get('description'):
-                desc_label = CustomLabel(
-                    service_frame,
-                    text=service['description'][:50] + "..." if len(service['description']) > 50 else service['description'],
-                    font=("Arial", 8),
-                    fg="#666",
-                    bg="white",
-                    wraplength=180  # Ajustar texto largo
-                )
-                desc_label.pack()
-                desc_label.bind("<Button-1>", lambda e, s=service: self.show_service_details(s))
-
-            # Actualizar grid (3 columnas máximo)
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-
-        # Configurar grid para que se expanda correctamente
-        for i in range(row + 1):
-            grid_container.grid_rowconfigure(i, weight=1)
-        for i in range(max_cols):
-            grid_container.grid_columnconfigure(i, weight=1)
+        # Precio sin signo de $
+        card.price_label = CustomLabel(card, text="", font=("Arial", 9), fg="#2ecc71", bg="white")
+        card.price_label.pack()
+
+        card.desc_label = CustomLabel(
+            card,
+            text="",
+            font=("Arial", 8),
+            fg="#666",
+            bg="white",
+            wraplength=180  # Ajustar texto largo
+        )
+        card.desc_label.pack()
+        return card
+
+    @staticmethod
+    def fill_service_card(card: tk.Frame, service: Dict) -> None:
+        """Muestra un servicio en una tarjeta"""
+        card.name_label.configure(text=service['name'])
+        card.price_label.configure(text=f"Precio: {service['price']:.2f}")
+        description = service.get('description') or ""
+        card.desc_label.configure(text=description[:50] + "..." if len(description) > 50 else description)
 
     def show_product_details(self, product: Dict) -> None:
         """Muestra los detalles del producto seleccionado en el panel derecho"""
@@ -502,25 +375,11 @@ class CatalogScreen(tk.Frame):
         for widget in self.details_image_frame.winfo_children():
             widget.destroy()
             
-        if product.get('image_path') and os.path.exists(product['image_path']):
-            try:
-                img = Image.open(product['image_path'])
-                img.thumbnail((330, 200))  # Tamaño más grande para el panel de detalles
-                photo = ImageTk.PhotoImage(img)
-                
-                img_label = tk.Label(self.details_image_frame, image=photo, bg="white")
-                img_label.image = photo  # keep a reference!
-                img_label.pack(expand=True, fill=tk.BOTH)
-            except Exception as e:
-                print(f"Error loading image: {e}")
-                no_img_label = CustomLabel(
-                    self.details_image_frame,
-                    text="Imagen no disponible",
-                    font=("Arial", 10),
-                    fg="#999",
-                    bg="white"
-                )
-                no_img_label.pack(expand=True, fill=tk.BOTH)
+        photo = get_image_cache().load(product.get('image_path'), DETAIL_IMAGE_SIZE)
+        if photo is not None:
+            img_label = tk.Label(self.details_image_frame, image=photo, bg="white")
+            img_label.image = photo  # keep a reference!
+            img_label.pack(expand=True, fill=tk.BOTH)
         else:
             no_img_label = CustomLabel(
                 self.details_image_frame,
@@ -576,27 +435,35 @@ class CatalogScreen(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         search_type = self.search_field_var.get()
-        
+        self.search_controller.submit(
+            lambda: (search_type, self.fetch_catalog(search_type, search_term)),
+            event
+        )
+
+    @staticmethod
+    def fetch_catalog(search_type: str, search_term: str) -> List[Dict]:
+        """Consulta productos o servicios (se ejecuta fuera del hilo de Tk)"""
         if search_type == "Productos":
             # Usamos el modelo de catálogo para obtener productos
             if search_term:
-                products = CatalogModel.search_products(search_term)
-            else:
-                products = CatalogModel.get_all_products()
-                
-            self.display_products(products)
+                return CatalogModel.search_products(search_term)
+            return CatalogModel.get_all_products()
+        # Usamos el modelo de catálogo para obtener servicios
+        if search_term:
+            return CatalogModel.search_services(search_term)
+        return CatalogModel.get_all_services()
+
+    def show_search_results(self, results: Tuple[str, List[Dict]]) -> None:
+        search_type, items = results
+        
+        if search_type == "Productos":
+            self.display_products(items)
             self.notebook.select(self.products_frame)
-            self.status_bar.configure(text=f"Mostrando {len(products)} productos")
+            self.status_bar.configure(text=f"Mostrando {len(items)} productos")
         else:
-            # Usamos el modelo de catálogo para obtener servicios
-            if search_term:
-                services = CatalogModel.search_services(search_term)
-            else:
-                services = CatalogModel.get_all_services()
-                
-            self.display_services(services)
+            self.display_services(items)
             self.notebook.select(self.services_frame)
-            self.status_bar.configure(text=f"Mostrando {len(services)} servicios")
+            self.status_bar.configure(text=f"Mostrando {len(items)} servicios")
 
     def refresh_data(self) -> None:
         """Actualiza los datos del catálogo"""
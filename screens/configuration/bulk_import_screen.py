@@ -0,0 +1,310 @@
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from typing import Any, Callable, Dict, Optional
+from sqlite_cli.models.bulk_import_model import IMPORT_SPECS, BulkImport
+from utils.session_manager import SessionManager
+from widgets.custom_button import CustomButton
+from widgets.custom_combobox import CustomCombobox
+from widgets.custom_label import CustomLabel
+
+POLL_MS = 100  # Frecuencia con la que se recoge el avance del hilo de importación
+
+
+class BulkImportScreen(tk.Frame):
+    def __init__(
+        self,
+        parent: tk.Widget,
+        open_previous_screen_callback: Callable[[], None]
+    ) -> None:
+        super().__init__(parent)
+        self.parent = parent
+        self.open_previous_screen_callback = open_previous_screen_callback
+        self.configure(bg="#f5f5f5")
+
+        # Variables
+        self.entity_var = tk.StringVar(value=IMPORT_SPECS["inventory"]["label"])
+        self.file_var = tk.StringVar()
+        self.status_var = tk.StringVar(value="Seleccione el tipo de datos y el archivo a importar.")
+
+        # La importación corre en un hilo aparte; el avance llega por esta cola
+        self._events: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+        self.configure_ui()
+
+    def pack(self, **kwargs: Any) -> None:
+        self.parent.state('zoomed')
+        super().pack(fill=tk.BOTH, expand=True)
+
+    def configure_ui(self) -> None:
+        # Header
+        header_frame = tk.Frame(self, bg="#4a6fa5")
+        header_frame.pack(side=tk.TOP, fill=tk.X)
+
+        title_label = CustomLabel(
+            header_frame,
+            text="Importar Datos (CSV/Excel)",
+            font=("Arial", 20, "bold"),
+            fg="white",
+            bg="#4a6fa5"
+        )
+        title_label.pack(side=tk.LEFT, padx=20, pady=15)
+
+        # Botón de regreso
+        self.btn_back = CustomButton(
+            header_frame,
+            text="Regresar",
+            command=self.go_back,
+            padding=8,
+            width=10,
+        )
+        self.btn_back.pack(side=tk.RIGHT, padx=20, pady=5)
+
+        # Frame de opciones
+        options_frame = tk.Frame(self, bg="#f5f5f5", padx=20, pady=10)
+        options_frame.pack(fill=tk.X)
+
+        # Fila 1: Tipo de datos + plantilla
+        row1_frame = tk.Frame(options_frame, bg="#f5f5f5")
+        row1_frame.pack(fill=tk.X, pady=5)
+
+        CustomLabel(
+            row1_frame,
+            text="Importar:",
+            font=("Arial", 10),
+            bg="#f5f5f5"
+        ).pack(side=tk.LEFT)
+
+        self.entity_combo = CustomCombobox(
+            row1_frame,
+            textvariable=self.entity_var,
+            values=[spec["label"] for spec in IMPORT_SPECS.values()],
+            state="readonly",
+            width=20
+        )
+        self.entity_combo.pack(side=tk.LEFT, padx=5)
+
+        btn_template = CustomButton(
+            row1_frame,
+            text="Guardar Plantilla",
+            command=self.save_template,
+            padding=6,
+            width=16
+        )
+        btn_template.pack(side=tk.LEFT, padx=5)
+
+        # Fila 2: Archivo + botones
+        row2_frame = tk.Frame(options_frame, bg="#f5f5f5")
+        row2_frame.pack(fill=tk.X, pady=5)
+
+        CustomLabel(
+            row2_frame,
+            text="Archivo:",
+            font=("Arial", 10),
+            bg="#f5f5f5"
+        ).pack(side=tk.LEFT)
+
+        file_entry = ttk.Entry(
+            row2_frame,
+            textvariable=self.file_var,
+            width=60,
+            font=("Arial", 10),
+            state="readonly"
+        )
+        file_entry.pack(side=tk.LEFT, padx=5)
+
+        btn_browse = CustomButton(
+            row2_frame,
+            text="Examinar",
+            command=self.browse_file,
+            padding=6,
+            width=10
+        )
+        btn_browse.pack(side=tk.LEFT, padx=5)
+
+        self.btn_import = CustomButton(
+            row2_frame,
+            text="Importar",
+            command=self.start_import,
+            padding=6,
+            width=10
+        )
+        self.btn_import.pack(side=tk.LEFT, padx=5)
+
+        # Fila 3: Avance
+        row3_frame = tk.Frame(options_frame, bg="#f5f5f5")
+        row3_frame.pack(fill=tk.X, pady=5)
+
+        self.progress_bar = ttk.Progressbar(row3_frame, orient=tk.HORIZONTAL, length=300, mode="indeterminate")
+        self.progress_bar.pack(side=tk.LEFT)
+
+        CustomLabel(
+            row3_frame,
+            text="",
+            textvariable=self.status_var,
+            font=("Arial", 10),
+            bg="#f5f5f5",
+            anchor="w"
+        ).pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
+
+        # Errores por fila
+        tree_container = tk.Frame(self, bg="#f5f5f5", padx=20, pady=10)
+        tree_container.pack(fill=tk.BOTH, expand=True)
+
+        v_scroll = ttk.Scrollbar(tree_container, orient=tk.VERTICAL)
+        v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        columns = ("Fila", "Columna", "Error")
+        self.tree = ttk.Treeview(
+            tree_container,
+            columns=columns,
+            show="headings",
+            yscrollcommand=v_scroll.set,
+            style="Custom.Treeview",
+        )
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        v_scroll.config(command=self.tree.yview)
+
+        for col, width, anchor in (("Fila", 80, tk.CENTER), ("Columna", 180, tk.W), ("Error", 600, tk.W)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor=anchor)
+
+        self.tree.tag_configure('evenrow', background='#ffffff')
+        self.tree.tag_configure('oddrow', background='#f0f0f0')
+
+    def _selected_entity(self) -> str:
+        label = self.entity_var.get()
+        for entity, spec in IMPORT_SPECS.items():
+            if spec["label"] == label:
+                return entity
+        return "inventory"
+
+    def browse_file(self) -> None:
+        file_path = filedialog.askopenfilename(
+            title="Seleccionar archivo a importar",
+            filetypes=[("CSV o Excel", "*.csv *.xlsx"), ("CSV", "*.csv"), ("Excel", "*.xlsx")],
+            parent=self
+        )
+        if file_path:
+            self.file_var.set(file_path)
+
+    def save_template(self) -> None:
+        """Guarda un CSV vacío con los encabezados que espera la importación."""
+        entity = self._selected_entity()
+        file_path = filedialog.asksaveasfilename(
+            title="Guardar plantilla",
+            defaultextension=".csv",
+            initialfile=f"plantilla_{entity}.csv",
+            filetypes=[("CSV", "*.csv")],
+            parent=self
+        )
+        if not file_path:
+            return
+        try:
+            with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+                f.write(";".join(BulkImport.template_header(entity)) + "\n")
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudo guardar la plantilla:\n{str(e)}", parent=self)
+
+    def start_import(self) -> None:
+        if self._worker is not None:
+            return
+        file_path = self.file_var.get()
+        if not file_path or not os.path.exists(file_path):
+            messagebox.showwarning("Advertencia", "Seleccione un archivo para importar", parent=self)
+            return
+
+        entity = self._selected_entity()
+        label = IMPORT_SPECS[entity]["label"]
+        if not messagebox.askyesno(
+            "Importar Datos",
+            f"Se importarán {label.lower()} desde:\n{file_path}\n\n"
+            "Los registros existentes con el mismo código se actualizarán.\n¿Desea continuar?",
+            parent=self
+        ):
+            return
+
+        self.tree.delete(*self.tree.get_children())
+        self._set_running(True)
+        self.status_var.set("Leyendo archivo...")
+
+        # La sesión se resuelve aquí, en el hilo de Tk
+        user_id = SessionManager.get_user_id()
+        self._worker = threading.Thread(
+            target=self._run_import, args=(entity, file_path, user_id), daemon=True
+        )
+        self._worker.start()
+        self.after(POLL_MS, self._poll)
+
+    def _run_import(self, entity: str, file_path: str, user_id: Optional[int]) -> None:
+        try:
+            result = BulkImport.import_file(
+                entity, file_path, user_id=user_id,
+                progress=lambda rows: self._events.put(("progress", rows))
+            )
+        except Exception as e:
+            self._events.put(("error", str(e)))
+            return
+        self._events.put(("done", result))
+
+    def _poll(self) -> None:
+        while True:
+            try:
+                kind, data = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.status_var.set(f"{data} filas procesadas...")
+            elif kind == "error":
+                self._finish()
+                self.status_var.set("La importación no se realizó.")
+                messagebox.showerror("Error", f"No se pudo importar el archivo:\n{data}", parent=self)
+                return
+            else:
+                self._finish()
+                self.show_result(data)
+                return
+        self.after(POLL_MS, self._poll)
+
+    def _finish(self) -> None:
+        self._worker = None
+        self._set_running(False)
+
+    def _set_running(self, running: bool) -> None:
+        for button in (self.btn_import, self.btn_back):
+            if running:
+                button.disable()
+            else:
+                button.enable()
+        self.entity_combo.configure(state="disabled" if running else "readonly")
+        if running:
+            self.progress_bar.start(10)
+        else:
+            self.progress_bar.stop()
+
+    def show_result(self, result: Dict[str, Any]) -> None:
+        summary = (
+            f"{result['rows']} filas: {result['inserted']} nuevas, "
+            f"{result['updated']} actualizadas, {result['invalid']} con errores."
+        )
+        self.status_var.set(summary)
+        for i, error in enumerate(result["errors"]):
+            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
+            self.tree.insert("", tk.END, values=(error["row"], error["column"], error["message"]), tags=(tag,))
+
+        if result["invalid"]:
+            messagebox.showwarning(
+                "Importación con errores",
+                f"{summary}\n\nLas filas con errores no se importaron; revise la lista.",
+                parent=self
+            )
+        else:
+            messagebox.showinfo("Éxito", f"Importación completada.\n{summary}", parent=self)
+
+    def go_back(self) -> None:
+        if self._worker is not None:
+            return
+        self.open_previous_screen_callback()
@@ -0,0 +1,227 @@
+import tkinter as tk
+from datetime import datetime
+from tkinter import ttk, messagebox, filedialog
+from typing import Any, Callable, Dict, List, Tuple
+from sqlite_cli.database.profiler import get_profiler
+from sqlite_cli.database.write_queue import get_write_queue
+from utils.ui_monitor import get_ui_monitor
+from widgets.custom_button import CustomButton
+from widgets.custom_label import CustomLabel
+
+MAX_ROWS = 300  # Filas que se listan por pestaña
+
+
+class DiagnosticsScreen(tk.Frame):
+    def __init__(
+        self,
+        parent: tk.Widget,
+        open_previous_screen_callback: Callable[[], None]
+    ) -> None:
+        super().__init__(parent)
+        self.parent = parent
+        self.open_previous_screen_callback = open_previous_screen_callback
+        self.configure(bg="#f5f5f5")
+
+        monitor = get_ui_monitor()
+        self.enabled_var = tk.BooleanVar(value=monitor.enabled)
+        self.budget_var = tk.StringVar(value=f"{monitor.budget_ms:g}")
+        self.summary_var = tk.StringVar()
+
+        self.configure_ui()
+
+    def pack(self, **kwargs: Any) -> None:
+        self.parent.state('zoomed')
+        super().pack(fill=tk.BOTH, expand=True)
+        self.refresh()
+
+    def configure_ui(self) -> None:
+        # Header
+        header_frame = tk.Frame(self, bg="#4a6fa5")
+        header_frame.pack(side=tk.TOP, fill=tk.X)
+
+        title_label = CustomLabel(
+            header_frame,
+            text="Diagnóstico de la Interfaz",
+            font=("Arial", 20, "bold"),
+            fg="white",
+            bg="#4a6fa5"
+        )
+        title_label.pack(side=tk.LEFT, padx=20, pady=15)
+
+        btn_back = CustomButton(
+            header_frame,
+            text="Regresar",
+            command=self.go_back,
+            padding=8,
+            width=10,
+        )
+        btn_back.pack(side=tk.RIGHT, padx=20, pady=5)
+
+        # Opciones
+        options_frame = tk.Frame(self, bg="#f5f5f5", padx=20, pady=10)
+        options_frame.pack(fill=tk.X)
+
+        ttk.Checkbutton(
+            options_frame,
+            text="Medir la interfaz",
+            variable=self.enabled_var,
+            command=self.apply_settings
+        ).pack(side=tk.LEFT)
+
+        CustomLabel(
+            options_frame,
+            text="Presupuesto por manejador (ms):",
+            font=("Arial", 10),
+            bg="#f5f5f5"
+        ).pack(side=tk.LEFT, padx=(20, 5))
+
+        budget_entry = ttk.Entry(options_frame, textvariable=self.budget_var, width=8, font=("Arial", 10))
+        budget_entry.pack(side=tk.LEFT)
+        budget_entry.bind("<Return>", lambda event: self.apply_settings())
+
+        for text, command in (
+            ("Aplicar", self.apply_settings),
+            ("Actualizar", self.refresh),
+            ("Reiniciar", self.reset),
+            ("Exportar JSON", self.export_json)
+        ):
+            CustomButton(
+                options_frame,
+                text=text,
+                command=command,
+                padding=6,
+                width=14 if text == "Exportar JSON" else 10
+            ).pack(side=tk.LEFT, padx=5)
+
+        CustomLabel(
+            self,
+            text="",
+            textvariable=self.summary_var,
+            font=("Arial", 10),
+            bg="#f5f5f5",
+            anchor="w",
+            justify=tk.LEFT
+        ).pack(fill=tk.X, padx=20)
+
+        notebook = ttk.Notebook(self)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+
+        self.handlers_tree = self._create_tree(notebook, "Manejadores", (
+            ("Manejador", 420, tk.W), ("Tipo", 80, tk.W), ("Llamadas", 80, tk.E), ("Total ms", 90, tk.E),
+            ("Prom. ms", 80, tk.E), ("p95 ms", 80, tk.E), ("Máx. ms", 80, tk.E), ("Sobre presupuesto", 130, tk.E)
+        ))
+        self.screens_tree = self._create_tree(notebook, "Pantallas", (
+            ("Pantalla", 220, tk.W), ("Aperturas", 80, tk.E), ("Construcción ms", 120, tk.E),
+            ("Mostrar ms", 100, tk.E), ("Mostrar máx. ms", 120, tk.E),
+            ("Primer pintado ms", 130, tk.E), ("Primer pintado p95", 130, tk.E)
+        ))
+        self.stalls_tree = self._create_tree(notebook, "Bloqueos", (
+            ("Hora", 170, tk.W), ("Bloqueado ms", 110, tk.E), ("Manejador", 420, tk.W), ("Manejador ms", 110, tk.E)
+        ))
+
+    def _create_tree(self, notebook: ttk.Notebook, title: str, columns: Tuple[Tuple[str, int, str], ...]) -> ttk.Treeview:
+        container = tk.Frame(notebook, bg="#f5f5f5")
+        notebook.add(container, text=title)
+
+        v_scroll = ttk.Scrollbar(container, orient=tk.VERTICAL)
+        v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        tree = ttk.Treeview(
+            container,
+            columns=[col for col, _, _ in columns],
+            show="headings",
+            yscrollcommand=v_scroll.set,
+            style="Custom.Treeview",
+        )
+        tree.pack(fill=tk.BOTH, expand=True)
+        v_scroll.config(command=tree.yview)
+
+        for col, width, anchor in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=width, anchor=anchor)
+
+        tree.tag_configure('evenrow', background='#ffffff')
+        tree.tag_configure('oddrow', background='#f0f0f0')
+        tree.tag_configure('slow', background='#fde2e2')
+        return tree
+
+    @staticmethod
+    def _fill(tree: ttk.Treeview, rows: List[Tuple], slow: List[bool]) -> None:
+        tree.delete(*tree.get_children())
+        for i, (values, is_slow) in enumerate(zip(rows[:MAX_ROWS], slow)):
+            tag = 'slow' if is_slow else ('evenrow' if i % 2 == 0 else 'oddrow')
+            tree.insert("", tk.END, values=["" if value is None else value for value in values], tags=(tag,))
+
+    def apply_settings(self) -> None:
+        try:
+            budget_ms = float(self.budget_var.get().replace(",", "."))
+            if budget_ms <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Advertencia", "El presupuesto debe ser un número de milisegundos", parent=self)
+            return
+        monitor = get_ui_monitor()
+        monitor.enabled = self.enabled_var.get()
+        monitor.budget_ms = budget_ms
+        self.refresh()
+
+    def refresh(self) -> None:
+        monitor = get_ui_monitor()
+
+        handlers = monitor.handlers()
+        self._fill(self.handlers_tree, [
+            (h["handler"], h["kind"], h["calls"], f"{h['total_ms']:.1f}", f"{h['avg_ms']:.2f}",
+             f"{h['p95_ms']:.2f}", f"{h['max_ms']:.1f}", h["over_budget"])
+            for h in handlers
+        ], [h["over_budget"] > 0 for h in handlers])
+
+        screens = monitor.screens()
+        self._fill(self.screens_tree, [
+            (s["screen"], s["opens"], s["build_ms"], s["show_ms_last"], s["show_ms_max"],
+             s["first_paint_ms_last"], s["first_paint_ms_p95"])
+            for s in screens
+        ], [(s["first_paint_ms_last"] or 0) >= monitor.budget_ms for s in screens])
+
+        stalls = monitor.stalls()
+        self._fill(self.stalls_tree, [
+            (s["at"].replace("T", " "), s["blocked_ms"], s["handler"] or "(fuera de los manejadores)", s["handler_ms"])
+            for s in stalls
+        ], [True] * len(stalls))
+
+        self.summary_var.set(self._summary(monitor.loop(), get_write_queue().stats()))
+
+    @staticmethod
+    def _summary(loop: Dict[str, Any], queue: Dict[str, Any]) -> str:
+        profiler = get_profiler()
+        sql = "activo" if profiler.enabled else "inactivo (Configuración > Perfilador SQL)"
+        return (
+            f"Bucle principal: {loop['stalls']} bloqueos de {loop['budget_ms']:g} ms o más, "
+            f"{loop['blocked_ms']:.0f} ms bloqueado ({loop['blocked_pct']:.2f}% de {loop['uptime_s']:.0f} s), "
+            f"peor retraso {loop['max_lag_ms']:.0f} ms\n"
+            f"Cola de escritura: {queue['completed']} transacciones en {queue['batches']} commits, "
+            f"espera p95 {queue['wait_ms_p95']:.1f} ms, pendientes {queue['queue_depth']} - Perfilador SQL: {sql}"
+        )
+
+    def reset(self) -> None:
+        get_ui_monitor().reset()
+        self.refresh()
+
+    def export_json(self) -> None:
+        file_path = filedialog.asksaveasfilename(
+            title="Exportar diagnóstico",
+            defaultextension=".json",
+            initialfile=f"diagnostico_{datetime.now():%Y%m%d_%H%M%S}.json",
+            filetypes=[("JSON", "*.json")],
+            parent=self
+        )
+        if not file_path:
+            return
+        try:
+            get_ui_monitor().export_json(file_path)
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudo exportar el diagnóstico:\n{str(e)}", parent=self)
+            return
+        messagebox.showinfo("Éxito", f"Diagnóstico exportado en:\n{file_path}", parent=self)
+
+    def go_back(self) -> None:
+        self.open_previous_screen_callback()
@@ -0,0 +1,165 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Any, Callable
+from sqlite_cli.database.profiler import get_profiler, set_profiling
+from widgets.custom_button import CustomButton
+from widgets.custom_label import CustomLabel
+
+MAX_ROWS = 200  # Sentencias que se listan (las de más tiempo acumulado)
+
+
+class SQLProfilerScreen(tk.Frame):
+    def __init__(
+        self,
+        parent: tk.Widget,
+        open_previous_screen_callback: Callable[[], None]
+    ) -> None:
+        super().__init__(parent)
+        self.parent = parent
+        self.open_previous_screen_callback = open_previous_screen_callback
+        self.configure(bg="#f5f5f5")
+
+        profiler = get_profiler()
+        self.enabled_var = tk.BooleanVar(value=profiler.enabled)
+        self.slow_ms_var = tk.StringVar(value=f"{profiler.slow_ms:g}")
+        self.status_var = tk.StringVar()
+
+        self.configure_ui()
+        self.refresh()
+
+    def pack(self, **kwargs: Any) -> None:
+        self.parent.state('zoomed')
+        super().pack(fill=tk.BOTH, expand=True)
+
+    def configure_ui(self) -> None:
+        # Header
+        header_frame = tk.Frame(self, bg="#4a6fa5")
+        header_frame.pack(side=tk.TOP, fill=tk.X)
+
+        title_label = CustomLabel(
+            header_frame,
+            text="Perfilador SQL",
+            font=("Arial", 20, "bold"),
+            fg="white",
+            bg="#4a6fa5"
+        )
+        title_label.pack(side=tk.LEFT, padx=20, pady=15)
+
+        btn_back = CustomButton(
+            header_frame,
+            text="Regresar",
+            command=self.go_back,
+            padding=8,
+            width=10,
+        )
+        btn_back.pack(side=tk.RIGHT, padx=20, pady=5)
+
+        # Opciones
+        options_frame = tk.Frame(self, bg="#f5f5f5", padx=20, pady=10)
+        options_frame.pack(fill=tk.X)
+
+        ttk.Checkbutton(
+            options_frame,
+            text="Perfilar consultas",
+            variable=self.enabled_var,
+            command=self.apply_settings
+        ).pack(side=tk.LEFT)
+
+        CustomLabel(
+            options_frame,
+            text="Consulta lenta desde (ms):",
+            font=("Arial", 10),
+            bg="#f5f5f5"
+        ).pack(side=tk.LEFT, padx=(20, 5))
+
+        slow_entry = ttk.Entry(options_frame, textvariable=self.slow_ms_var, width=8, font=("Arial", 10))
+        slow_entry.pack(side=tk.LEFT)
+        slow_entry.bind("<Return>", lambda event: self.apply_settings())
+
+        for text, command in (("Aplicar", self.apply_settings), ("Actualizar", self.refresh), ("Reiniciar", self.reset)):
+            CustomButton(
+                options_frame,
+                text=text,
+                command=command,
+                padding=6,
+                width=10
+            ).pack(side=tk.LEFT, padx=5)
+
+        CustomLabel(
+            self,
+            text="",
+            textvariable=self.status_var,
+            font=("Arial", 10),
+            bg="#f5f5f5",
+            anchor="w",
+            justify=tk.LEFT
+        ).pack(fill=tk.X, padx=20)
+
+        # Sentencias por tiempo acumulado
+        tree_container = tk.Frame(self, bg="#f5f5f5", padx=20, pady=10)
+        tree_container.pack(fill=tk.BOTH, expand=True)
+
+        v_scroll = ttk.Scrollbar(tree_container, orient=tk.VERTICAL)
+        v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        columns = ("Llamadas", "Total ms", "Prom. ms", "p95 ms", "Filas", "Lentas", "Origen", "Consulta")
+        self.tree = ttk.Treeview(
+            tree_container,
+            columns=columns,
+            show="headings",
+            yscrollcommand=v_scroll.set,
+            style="Custom.Treeview",
+        )
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        v_scroll.config(command=self.tree.yview)
+
+        widths = (80, 90, 80, 80, 80, 60, 260, 700)
+        for col, width in zip(columns, widths):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor=tk.W if col in ("Origen", "Consulta") else tk.E)
+
+        self.tree.tag_configure('evenrow', background='#ffffff')
+        self.tree.tag_configure('oddrow', background='#f0f0f0')
+        self.tree.tag_configure('slow', background='#fde2e2')
+
+    def apply_settings(self) -> None:
+        try:
+            slow_ms = float(self.slow_ms_var.get().replace(",", "."))
+            if slow_ms < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Advertencia", "El umbral debe ser un número de milisegundos", parent=self)
+            return
+        set_profiling(self.enabled_var.get(), slow_ms)
+        self.refresh()
+
+    def refresh(self) -> None:
+        profiler = get_profiler()
+        stats = profiler.stats(limit=MAX_ROWS)
+
+        self.tree.delete(*self.tree.get_children())
+        for i, row in enumerate(stats):
+            tag = 'slow' if row["slow"] else ('evenrow' if i % 2 == 0 else 'oddrow')
+            self.tree.insert("", tk.END, values=(
+                row["calls"],
+                f"{row['total_ms']:.1f}",
+                f"{row['avg_ms']:.2f}",
+                f"{row['p95_ms']:.2f}",
+                row["rows"],
+                row["slow"],
+                row["caller"],
+                row["shape"]
+            ), tags=(tag,))
+
+        state = "activo" if profiler.enabled else "inactivo"
+        self.status_var.set(
+            f"Perfilador {state} desde {profiler.started_at:%d/%m/%Y %H:%M:%S} - "
+            f"{len(stats)} sentencias. Consultas lentas: {profiler.log_path}"
+        )
+
+    def reset(self) -> None:
+        get_profiler().reset()
+        self.refresh()
+
+    def go_back(self) -> None:
+        self.open_previous_screen_callback()
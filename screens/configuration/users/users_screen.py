@@ -8,6 +8,7 @@ from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
+from utils.search_controller import SearchController
 
 class UsersScreen(tk.Frame):
     def __init__(self, parent: tk.Widget, open_previous_screen_callback: Callable[[], None]) -> None:
@@ -17,6 +18,7 @@ class UsersScreen(tk.Frame):
         self.search_var = tk.StringVar()
         self.search_field_var = tk.StringVar(value="Todos los campos")
         self.configure(bg="#f5f5f5")  # Fondo general
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
         self.refresh_data()
 
@@ -165,11 +167,14 @@ class UsersScreen(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         field = self.search_field_var.get()
-        
+        self.search_controller.submit(
+            lambda: User.search_active(search_term, field if field != "Todos los campos" else None),
+            event
+        )
+
+    def show_search_results(self, users: List[Dict]) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-            
-        users = User.search_active(search_term, field if field != "Todos los campos" else None)
         
         # Diccionario de traducción de roles
         role_translation = {
@@ -233,7 +238,7 @@ class UsersScreen(tk.Frame):
         
         if response:
             try:
-                status_inactive = next((s for s in Status.all() if s['name'] == 'inactive'), None)
+                status_inactive = Status.get_by_name('inactive')
                 if status_inactive:
                     User.update_status(user_id, status_inactive['id'])
                     messagebox.showinfo("Éxito", "Usuario desactivado correctamente", parent=self)
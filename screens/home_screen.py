@@ -1,14 +1,26 @@
 import tkinter as tk
 from tkinter import Menu, ttk
 from tkinter import filedialog
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageTk
 from typing import Callable, Any
 from utils.session_manager import SessionManager
 import tkinter.messagebox as messagebox
 import os
-import shutil
-from datetime import datetime
+import queue
+import threading
 import sqlite3
+from sqlite_cli.database.backup import (
+    BackupCancelled, backup_database, backup_filename, restore_database, rotate_backups
+)
+from utils.artwork import get_artwork_loader, render
+from widgets.progress_window import ProgressWindow
+
+MAINTENANCE_POLL_MS = 100  # Frecuencia con la que se recoge el avance de respaldos y restauraciones
+CAROUSEL_IMAGES = [f"assets/carrusel/{i}.png" for i in range(1, 7)]
+CAROUSEL_SIZE = (1000, 500)
+CAROUSEL_RADIUS = 20
+CAROUSEL_FIRST_MS = 8000      # Primer cambio de imagen
+CAROUSEL_INTERVAL_MS = 10000  # Cambios siguientes
 
 class HomeScreen(tk.Frame):
     def __init__(
@@ -37,7 +49,10 @@ class HomeScreen(tk.Frame):
         open_users_management_callback: Callable[[], None],
         open_currency_management_callback: Callable[[], None],
         open_taxes_management_callback: Callable[[], None],
-        open_system_info_callback: Callable[[], None]
+        open_system_info_callback: Callable[[], None],
+        open_bulk_import_callback: Callable[[], None],
+        open_sql_profiler_callback: Callable[[], None],
+        open_diagnostics_callback: Callable[[], None]
     ) -> None:
         super().__init__(parent)
         self.parent = parent
@@ -79,14 +94,20 @@ class HomeScreen(tk.Frame):
             "users_management": open_users_management_callback,
             "currency_management": open_currency_management_callback,
             "taxes_management": open_taxes_management_callback,
-            "system_info": open_system_info_callback
+            "system_info": open_system_info_callback,
+            "bulk_import": open_bulk_import_callback,
+            "sql_profiler": open_sql_profiler_callback,
+            "diagnostics": open_diagnostics_callback
         }
 
         self.images = {}
         self.menu_buttons = {}
+        # Imágenes del carrusel: PIL (renderizada) y PhotoImage (creado al mostrarla)
+        self.carousel_sources = []
         self.carousel_images = []
         self.current_image_index = 0
         self.button_icons = {}  # Diccionario para almacenar los iconos de los botones
+        self._maintenance_running = False  # Respaldo o restauración en curso
         self.configure_ui()
 
     def pack(self, **kwargs: Any) -> None:
@@ -229,7 +250,10 @@ class HomeScreen(tk.Frame):
                 "Gestión de Usuarios": "users_management",
                 "Gestión de Monedas": "currency_management",
                 "Gestión de Impuestos": "taxes_management",
-                "Información del Sistema": "system_info"
+                "Información del Sistema": "system_info",
+                "Importar Datos (CSV/Excel)": "bulk_import",
+                "Perfilador SQL": "sql_profiler",
+                "Diagnóstico de la Interfaz": "diagnostics"
             },
             self.config_callbacks,
             config_icon
@@ -250,7 +274,7 @@ class HomeScreen(tk.Frame):
         self.show_current_image()
 
         # Programar el cambio automático de imágenes
-        self.after(8000, self.rotate_carousel())
+        self.after(CAROUSEL_FIRST_MS, self.rotate_carousel)
 
         # Pie de página con imágenes
         bottom_frame = tk.Frame(self, bg="white", height=120)
@@ -288,68 +312,63 @@ class HomeScreen(tk.Frame):
             self.button_icons[icon_name] = photo
             return photo
 
-    def create_rounded_image(self, image_path, size):
-        """Crea una imagen con bordes redondeados"""
-        img = Image.open(image_path).resize(size, Image.Resampling.LANCZOS)
-        
-        # Crear máscara para bordes redondeados
-        mask = Image.new('L', size, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.rounded_rectangle((0, 0) + size, radius=20, fill=255)
-        
-        # Aplicar máscara
-        result = Image.new('RGBA', size)
-        result.paste(img, (0, 0), mask)
-        
-        return ImageTk.PhotoImage(result)
-
     def load_carousel_images(self):
-        """Carga las imágenes del carrusel desde la carpeta assets/carrusel"""
+        """
+        Carga las imágenes del carrusel desde la carpeta assets/carrusel.
+
+        Al arrancar sólo se renderiza la primera; el resto se renderiza en
+        segundo plano (``utils.artwork``) y se suma al carrusel a medida que
+        está lista. Las imágenes escaladas y redondeadas quedan en caché en
+        disco: los arranques siguientes no vuelven a procesarlas.
+        """
+        self.carousel_sources = [None] * len(CAROUSEL_IMAGES)
+        self.carousel_images = [None] * len(CAROUSEL_IMAGES)
         try:
-            for i in range(1, 7):  # Imágenes del 1.png al 6.png
-                img_path = f"assets/carrusel/{i}.png"
-                # Tamaño más grande (750x450) con bordes redondeados
-                photo = self.create_rounded_image(img_path, (1000, 500))
-                self.carousel_images.append(photo)
-        except Exception as e:
+            self.carousel_sources[0] = render(CAROUSEL_IMAGES[0], CAROUSEL_SIZE, CAROUSEL_RADIUS)
+        except (OSError, ValueError) as e:
             print(f"Error cargando imágenes del carrusel: {e}")
-            # Si hay error, crear imagen de respaldo con bordes redondeados
-            backup_img = Image.new('RGB', (1200, 550), color='white')
-            mask = Image.new('L', (1200, 550), 0)
-            draw = ImageDraw.Draw(mask)
-            draw.rounded_rectangle((0, 0, 1200, 550), radius=20, fill=255)
-            result = Image.new('RGBA', (1200, 550))
-            result.paste(backup_img, (0, 0), mask)
-            photo = ImageTk.PhotoImage(result)
-            self.carousel_images = [photo] * 6
+            # Imagen de respaldo: el fondo blanco con bordes redondeados
+            self.carousel_sources[0] = Image.new('RGBA', CAROUSEL_SIZE, 'white')
+
+        loader = get_artwork_loader()
+        for index, path in enumerate(CAROUSEL_IMAGES[1:], start=1):
+            loader.load_async(
+                path, CAROUSEL_SIZE, self,
+                lambda image, index=index: self.add_carousel_image(index, image),
+                radius=CAROUSEL_RADIUS
+            )
+
+    def add_carousel_image(self, index, image):
+        """Suma al carrusel una imagen renderizada en segundo plano (``None`` si falló)"""
+        self.carousel_sources[index] = image
 
     def show_current_image(self):
         """Muestra la imagen actual del carrusel"""
-        if hasattr(self, 'current_image_label'):
-            self.current_image_label.destroy()
-
-        if not self.carousel_images:
-            return
-
-        self.current_image_label = tk.Label(
-            self.image_container,
-            image=self.carousel_images[self.current_image_index],
-            bg="white",
-            borderwidth=0,
-            highlightthickness=0
-        )
-        self.current_image_label.pack(expand=True, fill=tk.BOTH)
+        index = self.current_image_index
+        if self.carousel_images[index] is None:
+            self.carousel_images[index] = ImageTk.PhotoImage(self.carousel_sources[index])
+
+        if not hasattr(self, 'current_image_label'):
+            self.current_image_label = tk.Label(
+                self.image_container,
+                bg="white",
+                borderwidth=0,
+                highlightthickness=0
+            )
+            self.current_image_label.pack(expand=True, fill=tk.BOTH)
+        self.current_image_label.configure(image=self.carousel_images[index])
 
     def rotate_carousel(self):
-        """Rota las imágenes del carrusel automáticamente"""
-        if not self.carousel_images:
-            return
+        """Rota las imágenes del carrusel automáticamente (sólo entre las ya renderizadas)"""
+        ready = [i for i, image in enumerate(self.carousel_sources) if image is not None]
+        following = [i for i in ready if i > self.current_image_index]
+        next_index = following[0] if following else ready[0]
+        if next_index != self.current_image_index:
+            self.current_image_index = next_index
+            self.show_current_image()
 
-        self.current_image_index = (self.current_image_index + 1) % len(self.carousel_images)
-        self.show_current_image()
-        
         # Programar el próximo cambio
-        self.after(10000, self.rotate_carousel)
+        self.after(CAROUSEL_INTERVAL_MS, self.rotate_carousel)
 
     def create_dropdown_menu(self, parent, title, options, callbacks_dict, icon=None):
         """Crea un menú desplegable estilo menú contextual con icono"""
@@ -405,6 +424,11 @@ class HomeScreen(tk.Frame):
             command=self.compress_database
         )
         
+        menu.add_command(
+            label="Respaldar Ahora",
+            command=self.backup_database
+        )
+        
         menu.add_command(
             label="Exportar Base de Datos",
             command=self.export_database
@@ -476,34 +500,44 @@ class HomeScreen(tk.Frame):
                 parent=self
             )
 
+    def backup_database(self) -> None:
+        """Respaldo comprimido en la carpeta de respaldos, con la rotación del respaldo automático."""
+
+        def task(progress):
+            path = backup_database(progress=progress)
+            rotate_backups()
+            return path
+
+        self._run_maintenance_task(
+            "Respaldando Base de Datos",
+            task,
+            "Respaldo creado en:\n{result}",
+            "No se pudo respaldar la base de datos"
+        )
+
     def export_database(self) -> None:
-        default_filename = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+        default_filename = backup_filename(compress=True)
         
         file_path = filedialog.asksaveasfilename(
             title="Exportar Base de Datos",
-            defaultextension=".db",
+            defaultextension=".gz",
             initialfile=default_filename,
-            filetypes=[("SQLite Database", "*.db"), ("Todos los archivos", "*.*")]
+            filetypes=[
+                ("Respaldo comprimido", "*.db.gz"),
+                ("SQLite Database", "*.db"),
+                ("Todos los archivos", "*.*")
+            ]
         )
         
         if not file_path:
             return
 
-        try:
-            db_path = self.get_db_path()
-            shutil.copyfile(db_path, file_path)
-            
-            messagebox.showinfo(
-                "Éxito",
-                f"Base de datos exportada exitosamente a:\n{file_path}",
-                parent=self
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"No se pudo exportar la base de datos:\n{str(e)}",
-                parent=self
-            )
+        self._run_maintenance_task(
+            "Exportando Base de Datos",
+            lambda progress: backup_database(file_path, progress=progress),
+            "Base de datos exportada exitosamente a:\n{result}",
+            "No se pudo exportar la base de datos"
+        )
 
     def import_database(self) -> None:
         confirm = messagebox.askyesno(
@@ -518,30 +552,88 @@ class HomeScreen(tk.Frame):
 
         file_path = filedialog.askopenfilename(
             title="Seleccionar Base de Datos",
-            filetypes=[("SQLite Database", "*.db"), ("Todos los archivos", "*.*")]
+            filetypes=[
+                ("Base de datos o respaldo", "*.db *.db.gz"),
+                ("Todos los archivos", "*.*")
+            ]
         )
         
         if not file_path:
             return
 
-        try:
-            db_path = self.get_db_path()
-            backup_dir = os.path.join(os.path.dirname(db_path), 'backups')
-            os.makedirs(backup_dir, exist_ok=True)
-            backup_filename = f"db_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-            backup_path = os.path.join(backup_dir, backup_filename)
-            shutil.copyfile(db_path, backup_path)
-            shutil.copyfile(file_path, db_path)
-            
-            messagebox.showinfo(
-                "Éxito",
-                f"Base de datos importada exitosamente desde:\n{file_path}\n\n"
-                f"Se creó un backup en:\n{backup_path}",
-                parent=self
-            )
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"No se pudo importar la base de datos:\n{str(e)}",
-                parent=self
-            )
\ No newline at end of file
+        # La restauración no se cancela: una vez que empieza a escribir debe terminar.
+        # Las llaves de la ruta se escapan: el mensaje pasa luego por ``format``
+        source = file_path.replace("{", "{{").replace("}", "}}")
+        self._run_maintenance_task(
+            "Importando Base de Datos",
+            lambda progress: restore_database(file_path, progress=progress),
+            f"Base de datos importada exitosamente desde:\n{source}\n\n"
+            "Se creó un backup en:\n{result}",
+            "No se pudo importar la base de datos",
+            cancellable=False
+        )
+
+    def _run_maintenance_task(
+        self,
+        title: str,
+        task: Callable[[Callable[[float, str], None]], Any],
+        success_message: str,
+        error_message: str,
+        cancellable: bool = True
+    ) -> None:
+        """
+        Ejecuta un respaldo o restauración en un hilo aparte con ventana de avance.
+
+        :param task: Recibe la función de avance y devuelve el resultado
+        :param success_message: Mensaje final; ``{result}`` se reemplaza por el resultado
+        """
+        if self._maintenance_running:
+            messagebox.showwarning("Advertencia", "Ya hay una tarea de mantenimiento en curso", parent=self)
+            return
+        self._maintenance_running = True
+
+        events: "queue.Queue" = queue.Queue()
+        cancelled = threading.Event()
+
+        def cancel() -> None:
+            cancelled.set()
+            window.cancelling()
+
+        window = ProgressWindow(self, title, cancel if cancellable else None)
+
+        def progress(fraction: float, message: str) -> None:
+            if cancelled.is_set():
+                raise BackupCancelled()
+            events.put(("progress", (fraction, message)))
+
+        def run() -> None:
+            try:
+                events.put(("done", task(progress)))
+            except BackupCancelled:
+                events.put(("cancelled", None))
+            except Exception as e:
+                events.put(("error", e))
+
+        def poll() -> None:
+            latest = None
+            while True:
+                try:
+                    kind, data = events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "progress":
+                    latest = data
+                    continue
+                self._maintenance_running = False
+                window.destroy()
+                if kind == "done":
+                    messagebox.showinfo("Éxito", success_message.format(result=data), parent=self)
+                elif kind == "error":
+                    messagebox.showerror("Error", f"{error_message}:\n{str(data)}", parent=self)
+                return
+            if latest is not None and not cancelled.is_set():
+                window.update_progress(*latest)
+            self.after(MAINTENANCE_POLL_MS, poll)
+
+        threading.Thread(target=run, name="maintenance", daemon=True).start()
+        self.after(MAINTENANCE_POLL_MS, poll)
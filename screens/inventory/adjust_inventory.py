@@ -2,8 +2,8 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Callable, Optional
 from sqlite_cli.models.inventory_model import InventoryItem
-from sqlite_cli.models.inventory_movement_model import InventoryMovement
 from sqlite_cli.models.movement_type_model import MovementType
+from sqlite_cli.models.stock_model import InsufficientStockError, Stock
 from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
@@ -210,10 +210,6 @@ class AdjustInventory(tk.Toplevel):
                 messagebox.showwarning("Advertencia", "Debe especificar al menos un cambio", parent=self)
                 return
             
-            item = InventoryItem.get_by_id(self.item_id)
-            if not item:
-                raise ValueError("Producto no encontrado")
-            
             if self.adjustment_type == "positive":
                 movement_type = MovementType.get_by_name("Ajuste positivo")
                 reference_type = "positive_adjustment"
@@ -228,48 +224,26 @@ class AdjustInventory(tk.Toplevel):
             if not movement_type:
                 raise ValueError("Tipo de movimiento no encontrado")
             
-            new_quantity = item['quantity'] + quantity_change
-            new_stock = item['stock'] + stock_change
-            
-            if new_quantity < 0 or new_stock < 0:
-                messagebox.showwarning("Advertencia", "Los valores resultantes no pueden ser negativos", parent=self)
-                return
-            
             user_id = SessionManager.get_user_id()
             if not user_id:
                 raise ValueError("No se pudo obtener el ID del usuario")
             
-            # Actualizar inventario
-            InventoryItem.update(
-                item_id=self.item_id,
-                code=item['code'],
-                product=item['product'],
-                quantity=new_quantity,
-                stock=new_stock,
-                min_stock=item['min_stock'],
-                max_stock=item['max_stock'],
-                cost=item['cost'],
-                price=item['price'],
-                supplier_id=item.get('supplier_id'),
-                expiration_date=item.get('expiration_date'),
-                image_path=item.get('image_path')
-            )
-            
-            # Registrar movimiento
-            InventoryMovement.create(
-                inventory_id=self.item_id,
-                movement_type_id=movement_type['id'],
-                quantity_change=quantity_change,
-                stock_change=stock_change,
-                previous_quantity=item['quantity'],
-                new_quantity=new_quantity,
-                previous_stock=item['stock'],
-                new_stock=new_stock,
-                user_id=user_id,
-                reference_id=self.item_id,
-                reference_type=reference_type,
-                notes=notes
-            )
+            # Actualizar inventario y registrar el movimiento sobre los valores
+            # actuales de la fila (otra terminal pudo vender mientras tanto)
+            try:
+                Stock.apply(
+                    inventory_id=self.item_id,
+                    movement_type_id=movement_type['id'],
+                    user_id=user_id,
+                    quantity_change=quantity_change,
+                    stock_change=stock_change,
+                    reference_id=self.item_id,
+                    reference_type=reference_type,
+                    notes=notes
+                )
+            except InsufficientStockError:
+                messagebox.showwarning("Advertencia", "Los valores resultantes no pueden ser negativos", parent=self)
+                return
             
             messagebox.showinfo("Éxito", "Ajuste aplicado correctamente", parent=self)
             if self.refresh_callback:
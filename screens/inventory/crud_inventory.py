@@ -8,7 +8,7 @@ from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
 from utils.field_formatter import FieldFormatter
-from PIL import Image, ImageTk
+from utils.image_cache import get_image_cache
 import os
 
 class CrudInventory(tk.Toplevel):
@@ -279,14 +279,13 @@ class CrudInventory(tk.Toplevel):
             filetypes=[("Image files", "*.jpg *.jpeg *.png")]
         )
         if file_path:
-            try:
-                img = Image.open(file_path)
-                img.thumbnail((300, 300))
-                self.image_path = file_path
-                self.current_image = ImageTk.PhotoImage(img)
-                self.image_label.config(image=self.current_image)
-            except Exception as e:
-                messagebox.showerror("Error", f"No se pudo cargar la imagen: {str(e)}", parent=self)
+            photo = get_image_cache().load(file_path, (300, 300))
+            if photo is None:
+                messagebox.showerror("Error", "No se pudo cargar la imagen", parent=self)
+                return
+            self.image_path = file_path
+            self.current_image = photo
+            self.image_label.config(image=self.current_image)
 
     def validate_required_fields(self) -> bool:
         if self.from_sales:
@@ -334,13 +333,9 @@ class CrudInventory(tk.Toplevel):
         
         if item.get('image_path'):
             self.image_path = item['image_path']
-            try:
-                img = Image.open(item['image_path'])
-                img.thumbnail((300, 300))
-                self.current_image = ImageTk.PhotoImage(img)
+            self.current_image = get_image_cache().load(item['image_path'], (300, 300))
+            if self.current_image is not None:
                 self.image_label.config(image=self.current_image)
-            except Exception as e:
-                print(f"Error loading image: {e}")
 
     def create_item(self) -> None:
         if not self.validate_required_fields():
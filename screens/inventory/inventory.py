@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Callable, List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from screens.inventory.crud_inventory import CrudInventory
 from screens.inventory.adjust_inventory import AdjustInventory
 from sqlite_cli.models.inventory_model import InventoryItem
@@ -9,7 +9,10 @@ from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
-from PIL import Image, ImageTk
+from widgets.virtual_treeview import VirtualTreeview
+from utils.search_controller import SearchController
+from utils.image_cache import get_image_cache
+from utils.image_store import VARIANT_SIZES
 import os
 
 class Inventory(tk.Frame):
@@ -21,6 +24,7 @@ class Inventory(tk.Frame):
         self.search_field_var = tk.StringVar(value="Todos los campos")
         self.current_image = None
         self.configure(bg="#f5f5f5")  # Fondo general
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
         self.refresh_data()
 
@@ -167,7 +171,7 @@ class Inventory(tk.Frame):
         tree_frame = tk.Frame(self, bg="#f5f5f5")
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
 
-        self.tree = ttk.Treeview(tree_frame, columns=(
+        self.tree = VirtualTreeview(tree_frame, columns=(
             "ID", "Código", "Producto", "Cantidad", "Existencias", "Stock mínimo", 
             "Stock máximo", "Precio compra", "Precio venta", "Proveedor", "Vencimiento"
         ), show="headings")
@@ -227,9 +231,10 @@ class Inventory(tk.Frame):
                 self.clear_image()
                 return
 
-            img = Image.open(image_path)
-            img.thumbnail((50, 50))
-            self.current_image = ImageTk.PhotoImage(img)
+            self.current_image = get_image_cache().load(image_path, (50, 50))
+            if self.current_image is None:
+                self.clear_image()
+                return
             self.image_label.config(image=self.current_image)
         except Exception as e:
             print(f"Error loading image: {e}")
@@ -255,13 +260,16 @@ class Inventory(tk.Frame):
             messagebox.showerror("Error", "La imagen no se encuentra en la ruta especificada", parent=self)
             return
 
+        # Limitada al tamaño del visor: usa el derivado en lugar del original
+        photo = get_image_cache().load(image_path, VARIANT_SIZES["viewer"])
+        if photo is None:
+            messagebox.showerror("Error", "No se pudo cargar la imagen", parent=self)
+            return
+
         top = tk.Toplevel(self)
         top.title("Imagen del Producto")
         top.configure(bg="#f5f5f5")
         
-        img = Image.open(image_path)
-        photo = ImageTk.PhotoImage(img)
-        
         label = tk.Label(top, image=photo, bg="#f5f5f5")
         label.image = photo  # keep a reference!
         label.pack()
@@ -269,31 +277,53 @@ class Inventory(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         field = self.search_field_var.get()
+        field = field if field != "Todos los campos" else None
         
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        items = InventoryItem.search_active(search_term, field if field != "Todos los campos" else None)
-        
-        for i, item in enumerate(items):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.tree.insert("", tk.END, values=(
-                item['id'],
-                item['code'],
-                item['product'],
-                item['quantity'],
-                item['stock'],
-                item['min_stock'],
-                item['max_stock'],
-                item['cost'],
-                item['price'],
-                item.get('supplier_company', ''),
-                item.get('expiration_date', '')
-            ), tags=(tag,))
+        if search_term:
+            # Búsqueda por relevancia (limitada a SEARCH_LIMIT filas)
+            fetch = lambda: {
+                'rows': InventoryItem.search_active(search_term, field),
+                'next_cursor': None,
+                'total': None
+            }
+        else:
+            # Listado completo: se carga por páginas al desplazarse
+            fetch = lambda: InventoryItem.page_active(with_total=True)
+        self.search_controller.submit(fetch, event)
+
+    def show_search_results(self, page: Dict) -> None:
+        self.tree.set_rows(
+            [self.format_row(item) for item in page['rows']],
+            loader=self.load_next_page,
+            cursor=page['next_cursor'],
+            total=page['total']
+        )
         
-        self.status_bar.configure(text=f"Mostrando {len(items)} productos")
+        total = page['total'] if page['total'] is not None else len(page['rows'])
+        self.status_bar.configure(text=f"Mostrando {total} productos")
         self.clear_image()
 
+    def load_next_page(self, cursor: str) -> Tuple[List[Tuple], Optional[str]]:
+        """Carga la siguiente página del listado al desplazarse"""
+        page = InventoryItem.page_active(cursor=cursor)
+        return [self.format_row(item) for item in page['rows']], page['next_cursor']
+
+    @staticmethod
+    def format_row(item: Dict) -> Tuple:
+        return (
+            item['id'],
+            item['code'],
+            item['product'],
+            item['quantity'],
+            item['stock'],
+            item['min_stock'],
+            item['max_stock'],
+            item['cost'],
+            item['price'],
+            item.get('supplier_company', ''),
+            item.get('expiration_date', '')
+        )
+
     def refresh_data(self) -> None:
         self.search_var.set("")
         self.search_field_var.set("Todos los campos")
@@ -389,7 +419,7 @@ class Inventory(tk.Frame):
         
         if response:
             try:
-                status_inactive = next((s for s in Status.all() if s['name'] == 'inactive'), None)
+                status_inactive = Status.get_by_name('inactive')
                 if status_inactive:
                     InventoryItem.update_status(item_id, status_inactive['id'])
                     messagebox.showinfo("Éxito", "Producto deshabilitado correctamente", parent=self)
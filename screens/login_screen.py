@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
 from PIL import Image, ImageTk
-from typing import Any, Callable
+from typing import Any, Callable, Optional
+from utils.artwork import cached, get_artwork_loader
 from utils.session_manager import SessionManager
 
 class LoginScreen(tk.Frame):
@@ -112,16 +113,27 @@ class LoginScreen(tk.Frame):
             print(f"No se pudo cargar {path}: {e}")
 
     def load_image(self, parent: tk.Widget, path: str) -> tk.Label:
-        try:
-            screen_width = self.parent.winfo_screenwidth()
-            screen_height = self.parent.winfo_screenheight()
-            img = Image.open(path).resize((screen_width, screen_height), Image.Resampling.LANCZOS)
+        """
+        Fondo a pantalla completa. Si ya está escalado en la caché de
+        ilustraciones se muestra al instante; si no, se renderiza en segundo
+        plano y aparece sobre el fondo blanco cuando está listo.
+        """
+        label = tk.Label(parent, bg="white", bd=0)
+        size = (self.parent.winfo_screenwidth(), self.parent.winfo_screenheight())
+
+        def show(img: Optional[Image.Image]) -> None:
+            if img is None:
+                return
             photo = ImageTk.PhotoImage(img)
             self.images[path] = photo
-            return tk.Label(parent, image=photo, bd=0)
-        except Exception as e:
-            print(f"No se pudo cargar imagen de fondo {path}: {e}")
-            return tk.Label(parent, bg="white")
+            label.configure(image=photo)
+
+        img = cached(path, size)
+        if img is not None:
+            show(img)
+        else:
+            get_artwork_loader().load_async(path, size, label, show)
+        return label
 
     def authenticate(self) -> None:
         username = self.username_var.get().strip()
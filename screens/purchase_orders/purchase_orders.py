@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from typing import Any, Callable
+from typing import Any, Callable, Dict, List
 from reports.purchase_order_viewer import PurchaseOrderViewer
 from sqlite_cli.models.purchase_order_model import PurchaseOrder
 from sqlite_cli.models.inventory_model import InventoryItem
@@ -12,6 +12,7 @@ from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
 from utils.field_formatter import FieldFormatter
+from utils.search_controller import SearchController
 
 class PurchaseOrdersScreen(tk.Frame):
     def __init__(self, parent: tk.Widget, open_previous_screen_callback: Callable[[], None]) -> None:
@@ -477,6 +478,7 @@ class PurchaseOrdersScreen(tk.Frame):
         self.center_window(search_window)
         search_window.transient(self)
         search_window.grab_set()
+        self.supplier_search = SearchController(search_window, self.show_suppliers)
         
         # Main frame
         main_frame = tk.Frame(search_window, bg="#f5f5f5")
@@ -592,11 +594,12 @@ class PurchaseOrdersScreen(tk.Frame):
     def search_suppliers(self, event=None) -> None:
         """Search suppliers based on search term"""
         search_term = self.search_var.get().lower()
-        
+        self.supplier_search.submit(lambda: PurchaseOrder.get_suppliers(search_term), event)
+    
+    def show_suppliers(self, suppliers: List[Dict]) -> None:
+        """Fill the supplier search tree"""
         for item in self.tree.get_children():
             self.tree.delete(item)
-            
-        suppliers = PurchaseOrder.get_suppliers(search_term)
         
         for i, supplier in enumerate(suppliers):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
@@ -812,6 +815,7 @@ class PurchaseOrdersScreen(tk.Frame):
         self.center_window(search_window)
         search_window.transient(self)
         search_window.grab_set()
+        self.product_search = SearchController(search_window, self.show_products)
         
         # Main frame
         main_frame = tk.Frame(search_window, bg="#f5f5f5")
@@ -934,12 +938,18 @@ class PurchaseOrdersScreen(tk.Frame):
             
         search_term = self.product_search_var.get().lower()
         field = self.product_search_field_var.get()
+        supplier_id = self.current_supplier_id
         
+        def fetch():
+            products = InventoryItem.search_active(search_term, field if field != "Todos los campos" else None)
+            return [p for p in products if p.get('supplier_id') == supplier_id]
+        
+        self.product_search.submit(fetch, event)
+    
+    def show_products(self, supplier_products: List[Dict]) -> None:
+        """Fill the product search tree"""
         for item in self.product_tree.get_children():
             self.product_tree.delete(item)
-            
-        products = InventoryItem.search_active(search_term, field if field != "Todos los campos" else None)
-        supplier_products = [p for p in products if p.get('supplier_id') == self.current_supplier_id]
         
         for i, product in enumerate(supplier_products):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
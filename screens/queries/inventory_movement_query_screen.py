@@ -3,6 +3,8 @@ from tkinter import ttk, messagebox
 from typing import Any, Optional, Callable
 from datetime import datetime
 from sqlite_cli.models.inventory_report_model import InventoryReport
+from utils.pdf_generator import PDFGenerator
+from utils.report_exporter import ReportExporter
 from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_combobox import CustomCombobox
@@ -136,6 +138,24 @@ class InventoryMovementQueryScreen(tk.Frame):
         action_frame = tk.Frame(row1_frame, bg="#f5f5f5")
         action_frame.pack(side=tk.RIGHT)
         
+        btn_pdf = CustomButton(
+            action_frame,
+            text="Generar PDF",
+            command=self.generate_pdf,
+            padding=6,
+            width=12
+        )
+        btn_pdf.pack(side=tk.LEFT, padx=(0, 5))
+        
+        btn_export = CustomButton(
+            action_frame,
+            text="Exportar",
+            command=self.export_report,
+            padding=6,
+            width=10
+        )
+        btn_export.pack(side=tk.LEFT, padx=(0, 5))
+        
         btn_back = CustomButton(
             action_frame,
             text="Regresar",
@@ -235,12 +255,13 @@ class InventoryMovementQueryScreen(tk.Frame):
         end_date = self.end_date_var.get().replace("/", "-") if self.end_date_var.get() else None
         movement_type = self.movement_type_var.get() if self.movement_type_var.get() != "Todos" else None
         
-        movements = InventoryReport.get_inventory_movements_report(
-            inventory_id=self.inventory_id,
-            start_date=start_date,
-            end_date=end_date,
-            movement_type=movement_type
-        )
+        query = {
+            "inventory_id": self.inventory_id,
+            "start_date": start_date,
+            "end_date": end_date,
+            "movement_type": movement_type
+        }
+        movements = InventoryReport.get_inventory_movements_report(**query)
         
         for i, movement in enumerate(movements):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
@@ -262,6 +283,7 @@ class InventoryMovementQueryScreen(tk.Frame):
         
         self.count_label.config(text=f"{len(movements)} movimientos encontrados")
         self.current_movements = movements
+        self.current_query = query
 
     def _get_current_filters(self):
         """Obtiene los filtros actuales aplicados"""
@@ -279,6 +301,34 @@ class InventoryMovementQueryScreen(tk.Frame):
             
         return ", ".join(filters) if filters else "Sin filtros aplicados"
     
+    def generate_pdf(self):
+        """Genera el reporte de movimientos en PDF con los filtros aplicados"""
+        if not getattr(self, 'current_movements', None):
+            messagebox.showwarning("Advertencia", "No hay datos para generar PDF", parent=self)
+            return
+        
+        product = getattr(self, 'product_info', None)
+        title = f"Movimientos de {product['product']} ({product['code']})" if product else "Movimientos de Inventario"
+        PDFGenerator.generate_inventory_movements_report(
+            parent=self,
+            title=title,
+            items=self.current_movements,
+            filters=self._get_current_filters(),
+            query=self.current_query
+        )
+    
+    def export_report(self):
+        """Exporta a CSV o JSON Lines los movimientos con los filtros aplicados"""
+        if not getattr(self, 'current_movements', None):
+            messagebox.showwarning("Advertencia", "No hay datos para exportar", parent=self)
+            return
+        ReportExporter.export_report(
+            self,
+            "inventory_movements_report",
+            self.current_query,
+            total=len(self.current_movements)
+        )
+    
     def go_back(self) -> None:
         """Regresa a la pantalla anterior"""
         self.pack_forget()
@@ -1,10 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, Any
+from typing import Callable, Any, Dict, List
 from screens.queries.inventory_movement_query_screen import InventoryMovementQueryScreen
 from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
+from widgets.virtual_treeview import VirtualTreeview
+from utils.search_controller import SearchController
 from sqlite_cli.models.inventory_report_model import InventoryReport
 
 class InventoryQueryScreen(tk.Frame):
@@ -19,6 +21,7 @@ class InventoryQueryScreen(tk.Frame):
         self.search_var = tk.StringVar()
         self.configure(bg="#f5f5f5")
         self.selected_item_id = None
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
 
     def pack(self, **kwargs: Any) -> None:
@@ -72,7 +75,7 @@ class InventoryQueryScreen(tk.Frame):
             font=("Arial", 10)
         )
         search_entry.pack(side=tk.LEFT, padx=5)
-        search_entry.bind("<KeyRelease>", lambda e: self.refresh_data())
+        search_entry.bind("<KeyRelease>", self.refresh_data)
 
         # Botón de historial de movimientos
         btn_movements = CustomButton(
@@ -89,7 +92,7 @@ class InventoryQueryScreen(tk.Frame):
         tree_frame = tk.Frame(self, bg="#f5f5f5", padx=20)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        self.tree = ttk.Treeview(
+        self.tree = VirtualTreeview(
             tree_frame,
             columns=("ID", "Código", "Producto", "Descripción", "Cantidad", "Existencias", 
                     "Stock mínimo", "Stock máximo", "Precio compra", "Precio venta", 
@@ -134,33 +137,33 @@ class InventoryQueryScreen(tk.Frame):
         if selected:
             self.selected_item_id = self.tree.item(selected[0])['values'][0]
 
-    def refresh_data(self) -> None:
+    def refresh_data(self, event=None) -> None:
         """Actualiza los datos del reporte según los filtros"""
         search_term = self.search_var.get()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        items = InventoryReport.get_inventory_report(search_term=search_term if search_term else None)
-        
-        for i, item in enumerate(items):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            expiration_date = item['expiration_date'] if item['expiration_date'] != "None" else "None"
-            supplier = item['supplier_company'] if item['supplier_company'] != "None" else "None"
-            self.tree.insert("", tk.END, values=(
+        self.search_controller.submit(
+            lambda: InventoryReport.get_inventory_report(search_term=search_term if search_term else None),
+            event
+        )
+
+    def show_search_results(self, items: List[Dict]) -> None:
+        """Muestra las filas del reporte en la tabla"""
+        self.tree.set_rows([
+            (
                 item['id'],
-                item['code'] if item['code'] != "None" else "None",
-                item['product'] if item['product'] != "None" else "None",
-                item['description'] if item['description'] != "None" else "None",
+                item['code'],
+                item['product'],
+                item['description'],
                 item['quantity'],
                 item['stock'],
                 item['min_stock'],
                 item['max_stock'],
                 f"{item['cost']:.2f}",
                 f"{item['price']:.2f}",
-                supplier,
-                expiration_date
-            ), tags=(tag,))
+                item['supplier_company'],
+                item['expiration_date']
+            )
+            for item in items
+        ])
 
     def open_movement_query(self) -> None:
         """Abre la pantalla de consulta de movimientos para el producto seleccionado"""
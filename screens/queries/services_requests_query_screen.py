@@ -1,9 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, Any
+from typing import Callable, Any, Dict, List
 from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
+from widgets.virtual_treeview import VirtualTreeview
+from utils.search_controller import SearchController
 from sqlite_cli.models.service_request_query import ServiceRequestQuery
 
 class ServiceRequestsQueryScreen(tk.Frame):
@@ -18,6 +20,7 @@ class ServiceRequestsQueryScreen(tk.Frame):
         self.search_var = tk.StringVar()
         self.configure(bg="#f5f5f5")
         self.selected_item_id = None
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
 
     def pack(self, **kwargs: Any) -> None:
@@ -71,7 +74,7 @@ class ServiceRequestsQueryScreen(tk.Frame):
             font=("Arial", 10)
         )
         search_entry.pack(side=tk.LEFT, padx=5)
-        search_entry.bind("<KeyRelease>", lambda e: self.refresh_data())
+        search_entry.bind("<KeyRelease>", self.refresh_data)
 
         # Botón de historial
         btn_history = CustomButton(
@@ -88,7 +91,7 @@ class ServiceRequestsQueryScreen(tk.Frame):
         tree_frame = tk.Frame(self, bg="#f5f5f5", padx=20)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        self.tree = ttk.Treeview(
+        self.tree = VirtualTreeview(
             tree_frame,
             columns=("ID", "Número", "Empleado", "Cliente", "Servicio", "Estado", "Fecha"),
             show="headings",
@@ -134,31 +137,30 @@ class ServiceRequestsQueryScreen(tk.Frame):
         }
         return status_translations.get(status, status)
 
-    def refresh_data(self) -> None:
+    def refresh_data(self, event=None) -> None:
         """Actualiza los datos del reporte según los filtros"""
         search_term = self.search_var.get()
-        
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        requests = ServiceRequestQuery.get_service_requests_report(
-            search_term=search_term if search_term else None
+        self.search_controller.submit(
+            lambda: ServiceRequestQuery.get_service_requests_report(
+                search_term=search_term if search_term else None
+            ),
+            event
         )
-        
-        for i, req in enumerate(requests):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            # Traducir el estado al español
-            translated_status = self.translate_status(req['request_status'])
-            
-            self.tree.insert("", tk.END, values=(
+
+    def show_search_results(self, requests: List[Dict]) -> None:
+        """Muestra las solicitudes en la tabla"""
+        self.tree.set_rows([
+            (
                 req['id'],
                 req['request_number'],
                 req['employee'],
                 req['customer'],
                 req['service'],
-                translated_status,  # Usar el estado traducido
+                self.translate_status(req['request_status']),  # Estado traducido al español
                 req['created_at']
-            ), tags=(tag,))
+            )
+            for req in requests
+        ])
 
     def open_history_screen(self) -> None:
         """Abre la pantalla de historial para la solicitud seleccionada"""
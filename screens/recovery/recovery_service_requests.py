@@ -5,6 +5,7 @@ from sqlite_cli.models.service_request_model import ServiceRequest
 from sqlite_cli.models.status_model import Status
 from widgets.custom_button import CustomButton
 from widgets.custom_combobox import CustomCombobox
+from utils.search_controller import SearchController
 from widgets.custom_entry import CustomEntry
 from widgets.custom_label import CustomLabel
 
@@ -16,6 +17,7 @@ class RecoveryServiceRequests(tk.Frame):
         self.search_var = tk.StringVar()
         self.search_field_var = tk.StringVar(value="Todos los campos")
         self.configure(bg="#f5f5f5")  # Fondo general
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
         self.refresh_data()
 
@@ -149,11 +151,14 @@ class RecoveryServiceRequests(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         field = self.search_field_var.get()
-        
+        self.search_controller.submit(
+            lambda: ServiceRequest.search_inactive(search_term, field if field != "Todos los campos" else None),
+            event
+        )
+
+    def show_search_results(self, requests: List[Dict]) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-            
-        requests = ServiceRequest.search_inactive(search_term, field if field != "Todos los campos" else None)
         
         for i, req in enumerate(requests):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
@@ -196,7 +201,7 @@ class RecoveryServiceRequests(tk.Frame):
         
         if response:
             try:
-                status_active = next((s for s in Status.all() if s['name'] == 'active'), None)
+                status_active = Status.get_by_name('active')
                 if status_active:
                     ServiceRequest.update_status(request_id, status_active['id'])
                     messagebox.showinfo("Éxito", "Solicitud habilitada correctamente", parent=self)
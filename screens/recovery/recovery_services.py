@@ -4,6 +4,7 @@ from typing import Callable, List, Dict, Any
 from sqlite_cli.models.service_model import Service
 from widgets.custom_button import CustomButton
 from widgets.custom_combobox import CustomCombobox
+from utils.search_controller import SearchController
 from widgets.custom_entry import CustomEntry
 from widgets.custom_label import CustomLabel
 
@@ -15,6 +16,7 @@ class RecoveryServices(tk.Frame):
         self.search_var = tk.StringVar()
         self.search_field_var = tk.StringVar(value="Todos los campos")
         self.configure(bg="#f5f5f5")  # Fondo general
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
         self.refresh_data()
 
@@ -145,11 +147,14 @@ class RecoveryServices(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         field = self.search_field_var.get()
-        
+        self.search_controller.submit(
+            lambda: Service.search_inactive(search_term, field if field != "Todos los campos" else None),
+            event
+        )
+
+    def show_search_results(self, services: List[Dict]) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-            
-        services = Service.search_inactive(search_term, field if field != "Todos los campos" else None)
         
         for i, service in enumerate(services):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
@@ -7,6 +7,7 @@ from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
+from utils.search_controller import SearchController
 
 class RecoverySuppliers(tk.Frame):
     def __init__(self, parent: tk.Widget, open_previous_screen_callback: Callable[[], None]) -> None:
@@ -16,6 +17,7 @@ class RecoverySuppliers(tk.Frame):
         self.search_var = tk.StringVar()
         self.search_field_var = tk.StringVar(value="Todos los campos")
         self.configure(bg="#f5f5f5")  # Fondo general
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
 
     def pack(self, **kwargs: Any) -> None:
@@ -157,11 +159,14 @@ class RecoverySuppliers(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         field = self.search_field_var.get()
-        
+        self.search_controller.submit(
+            lambda: Supplier.search_inactive(search_term, field if field != "Todos los campos" else None),
+            event
+        )
+
+    def show_search_results(self, suppliers: List[Dict]) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-            
-        suppliers = Supplier.search_inactive(search_term, field if field != "Todos los campos" else None)
         
         for i, supplier in enumerate(suppliers):
             tag = 'evenrow' if i % 2 == 0 else 'oddrow'
@@ -207,7 +212,7 @@ class RecoverySuppliers(tk.Frame):
         
         if response:
             try:
-                status_active = next((s for s in Status.all() if s['name'] == 'active'), None)
+                status_active = Status.get_by_name('active')
                 if status_active:
                     Supplier.update_status(supplier_id, status_active['id'])
                     messagebox.showinfo("Éxito", "Proveedor habilitado correctamente", parent=self)
@@ -8,6 +8,7 @@ from widgets.custom_entry import CustomEntry
 from widgets.custom_checkbutton import CustomCheckbutton
 from reports.inventory_report_viewer import InventoryReportViewer
 from utils.pdf_generator import PDFGenerator
+from utils.report_exporter import ReportExporter
 from utils.field_formatter import FieldFormatter
 
 class FullInventoryReportScreen(tk.Frame):
@@ -249,6 +250,15 @@ class FullInventoryReportScreen(tk.Frame):
         )
         btn_pdf.pack(side=tk.LEFT, padx=5)
 
+        btn_export = CustomButton(
+            btn_frame,
+            text="Exportar",
+            command=self.export_report,
+            padding=6,
+            width=15,
+        )
+        btn_export.pack(side=tk.LEFT, padx=5)
+
         # Treeview con scroll horizontal y vertical
         tree_container = tk.Frame(self, bg="#f5f5f5", padx=20)
         tree_container.pack(fill=tk.BOTH, expand=True, pady=10)
@@ -355,20 +365,21 @@ class FullInventoryReportScreen(tk.Frame):
                     messagebox.showerror("Error", "Formato de fecha inválido. Use DD/MM/AAAA", parent=self)
                     return
             
-            items = InventoryReport.get_inventory_report(
-                search_term=search_term,
-                supplier_id=supplier,
-                min_quantity=quantity,
-                max_quantity=quantity,
-                min_stock=min_stock,
-                max_stock=max_stock,
-                start_date=start_date,
-                end_date=end_date,
-                order_by_sales=self.most_sold_var.get()
-            )
+            query = {
+                "search_term": search_term,
+                "supplier_id": supplier,
+                "min_quantity": quantity,
+                "max_quantity": quantity,
+                "min_stock": min_stock,
+                "max_stock": max_stock,
+                "start_date": start_date,
+                "end_date": end_date,
+                "order_by_sales": self.most_sold_var.get()
+            }
+            items = InventoryReport.get_inventory_report(**query)
             
             if items:
-                self.update_table(items)
+                self.update_table(items, query)
             else:
                 messagebox.showinfo("Información", "No se encontraron coincidencias", parent=self)
         except ValueError as e:
@@ -377,9 +388,9 @@ class FullInventoryReportScreen(tk.Frame):
     def refresh_data(self):
         """Carga todos los datos iniciales"""
         items = InventoryReport.get_inventory_report()
-        self.update_table(items)
+        self.update_table(items, {})
 
-    def update_table(self, items):
+    def update_table(self, items, query=None):
         """Actualiza la tabla"""
         self.tree.delete(*self.tree.get_children())
         for i, item in enumerate(items):
@@ -401,6 +412,8 @@ class FullInventoryReportScreen(tk.Frame):
             ), tags=(tag,))
         self.count_label.config(text=f"{len(items)} productos encontrados")
         self.current_items = items
+        # Filtros de la consulta mostrada: el PDF vuelve a leerla por lotes
+        self.current_query = query
 
     def generate_report(self):
         """Genera el reporte visual"""
@@ -416,11 +429,24 @@ class FullInventoryReportScreen(tk.Frame):
                 parent=self,
                 title="Reporte de Inventario",
                 items=self.current_items,
-                filters=""
+                filters="",
+                query=self.current_query
             )
         else:
             messagebox.showwarning("Advertencia", "No hay datos para generar PDF", parent=self)
 
+    def export_report(self):
+        """Exporta a CSV o JSON Lines el reporte con los filtros aplicados"""
+        if hasattr(self, 'current_items') and self.current_items:
+            ReportExporter.export_report(
+                self,
+                "inventory_report",
+                self.current_query,
+                total=len(self.current_items)
+            )
+        else:
+            messagebox.showwarning("Advertencia", "No hay datos para exportar", parent=self)
+
     def go_back(self) -> None:
         """Regresa a la pantalla anterior"""
         self.pack_forget()
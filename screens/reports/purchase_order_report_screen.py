@@ -8,6 +8,7 @@ from widgets.custom_entry import CustomEntry
 from sqlite_cli.models.purchase_order_report_model import PurchaseOrderReport
 from reports.purchase_order_viewer import PurchaseOrderViewer
 from utils.pdf_generator import PDFGenerator
+from utils.report_exporter import ReportExporter
 from utils.field_formatter import FieldFormatter
 
 class PurchaseOrderReportScreen(tk.Frame):
@@ -162,6 +163,25 @@ class PurchaseOrderReportScreen(tk.Frame):
         )
         btn_pdf.pack(side=tk.LEFT, padx=5)
 
+        # Botones de exportación (CSV / JSON Lines)
+        btn_export = CustomButton(
+            btn_frame,
+            text="Exportar",
+            command=self.export_report,
+            padding=6,
+            width=12,
+        )
+        btn_export.pack(side=tk.LEFT, padx=5)
+
+        btn_export_items = CustomButton(
+            btn_frame,
+            text="Exportar Detalle",
+            command=lambda: self.export_report(items=True),
+            padding=6,
+            width=14,
+        )
+        btn_export_items.pack(side=tk.LEFT, padx=5)
+
         # Treeview para mostrar las órdenes
         tree_frame = tk.Frame(self, bg="#f5f5f5", padx=20)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=10)
@@ -210,13 +230,20 @@ class PurchaseOrderReportScreen(tk.Frame):
         start_date = self.start_date_var.get().replace("/", "-") if self.start_date_var.get() else None
         end_date = self.end_date_var.get().replace("/", "-") if self.end_date_var.get() else None
         search_term = self.search_var.get()
+        self.current_query = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "search_term": search_term if search_term else None
+        }
 
         # Obtener reporte de órdenes de compra
         orders = PurchaseOrderReport.get_purchase_orders_report(
             start_date=start_date,
             end_date=end_date,
-            search_term=search_term if search_term else None
+            search_term=search_term if search_term else None,
+            include_items=False
         )
+        self.current_total = len(orders)
 
         # Actualizar treeview
         for item in self.tree.get_children():
@@ -304,6 +331,16 @@ class PurchaseOrderReportScreen(tk.Frame):
             created_by=order_data['created_by']
         )
 
+    def export_report(self, items: bool = False) -> None:
+        """Exporta a CSV o JSON Lines el reporte con los filtros actuales"""
+        report = "purchase_orders_report_items" if items else "purchase_orders_report"
+        ReportExporter.export_report(
+            self,
+            report,
+            self.current_query,
+            total=None if items else self.current_total
+        )
+
     def go_back(self) -> None:
         """Regresa a la pantalla anterior"""
         self.pack_forget()
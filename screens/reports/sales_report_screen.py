@@ -6,11 +6,13 @@ from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
+from widgets.virtual_treeview import VirtualTreeview
 from sqlite_cli.models.sales_report_model import SalesReport
 from sqlite_cli.models.customer_model import Customer
 from reports.InvoiceViewer import InvoiceViewer
 from utils.session_manager import SessionManager
 from utils.pdf_generator import PDFGenerator
+from utils.report_exporter import ReportExporter
 from utils.field_formatter import FieldFormatter
 
 class SalesReportScreen(tk.Frame):
@@ -165,11 +167,30 @@ class SalesReportScreen(tk.Frame):
         )
         btn_pdf.pack(side=tk.LEFT, padx=5)
 
+        # Botones de exportación (CSV / JSON Lines)
+        btn_export = CustomButton(
+            btn_frame,
+            text="Exportar",
+            command=self.export_report,
+            padding=6,
+            width=12,
+        )
+        btn_export.pack(side=tk.LEFT, padx=5)
+
+        btn_export_items = CustomButton(
+            btn_frame,
+            text="Exportar Detalle",
+            command=lambda: self.export_report(items=True),
+            padding=6,
+            width=14,
+        )
+        btn_export_items.pack(side=tk.LEFT, padx=5)
+
         # Treeview para mostrar las ventas
         tree_frame = tk.Frame(self, bg="#f5f5f5", padx=20)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        self.tree = ttk.Treeview(
+        self.tree = VirtualTreeview(
             tree_frame,
             columns=("ID", "Fecha", "Cliente", "Cédula", "Tipo", "Productos", "Servicios", "Total"),
             show="headings",
@@ -212,21 +233,24 @@ class SalesReportScreen(tk.Frame):
         start_date = self.start_date_var.get().replace("/", "-") if self.start_date_var.get() else None
         end_date = self.end_date_var.get().replace("/", "-") if self.end_date_var.get() else None
         search_term = self.search_var.get()
+        self.current_query = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "search_term": search_term if search_term else None
+        }
 
         # Obtener reporte de ventas
         sales = SalesReport.get_sales_report(
             start_date=start_date,
             end_date=end_date,
-            search_term=search_term if search_term else None
+            search_term=search_term if search_term else None,
+            include_items=False
         )
+        self.current_total = len(sales)
 
-        # Actualizar treeview
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        for i, sale in enumerate(sales):
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            self.tree.insert("", tk.END, values=(
+        # Actualizar treeview (sólo se materializan las filas visibles)
+        self.tree.set_rows([
+            (
                 sale['invoice_id'],
                 sale['issue_date'],
                 sale['customer_name'],
@@ -235,7 +259,9 @@ class SalesReportScreen(tk.Frame):
                 sale['product_count'],
                 sale['service_count'],
                 f"Bs. {sale['total']:,.2f}"
-            ), tags=(tag,))
+            )
+            for sale in sales
+        ])
 
     def view_invoice(self, event=None) -> None:
         """Muestra el recibo de la venta seleccionada"""
@@ -317,6 +343,16 @@ class SalesReportScreen(tk.Frame):
             employee_info=employee_info
         )
 
+    def export_report(self, items: bool = False) -> None:
+        """Exporta a CSV o JSON Lines el reporte con los filtros actuales"""
+        report = "sales_report_items" if items else "sales_report"
+        ReportExporter.export_report(
+            self,
+            report,
+            self.current_query,
+            total=None if items else self.current_total
+        )
+
     def go_back(self) -> None:
         """Regresa a la pantalla anterior"""
         self.pack_forget()
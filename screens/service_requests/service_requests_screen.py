@@ -10,6 +10,7 @@ from widgets.custom_button import CustomButton
 from widgets.custom_label import CustomLabel
 from widgets.custom_entry import CustomEntry
 from widgets.custom_combobox import CustomCombobox
+from utils.search_controller import SearchController
 
 class ServiceRequestsScreen(tk.Frame):
     def __init__(self, parent: tk.Widget, open_previous_screen_callback: Callable[[], None]) -> None:
@@ -19,6 +20,7 @@ class ServiceRequestsScreen(tk.Frame):
         self.search_var = tk.StringVar()
         self.search_field_var = tk.StringVar(value="Todos los campos")
         self.configure(bg="#f5f5f5")
+        self.search_controller = SearchController(self, self.show_search_results)
         self.configure_ui()
         self.refresh_data()
 
@@ -171,11 +173,14 @@ class ServiceRequestsScreen(tk.Frame):
     def on_search(self, event=None) -> None:
         search_term = self.search_var.get().lower()
         field = self.search_field_var.get()
-        
+        self.search_controller.submit(
+            lambda: ServiceRequest.search_active(search_term, field if field != "Todos los campos" else None),
+            event
+        )
+
+    def show_search_results(self, items: List[Dict]) -> None:
         for item in self.tree.get_children():
             self.tree.delete(item)
-            
-        items = ServiceRequest.search_active(search_term, field if field != "Todos los campos" else None)
         
         status_mapping = {
             "started": "Iniciado",
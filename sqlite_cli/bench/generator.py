@@ -0,0 +1,391 @@
+# bench/generator.py
+import random
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Sequence, Tuple
+from sqlite_cli.database.database import get_db_connection, init_db
+from sqlite_cli.database.migrator import run_migrations
+
+# Filas por llamada a executemany (una transacción por lote)
+INSERT_BATCH = 5000
+
+# Volúmenes por defecto: del orden de un año de un comercio mediano
+DEFAULT_VOLUMES: Dict[str, int] = {
+    "customers": 20000,
+    "suppliers": 200,
+    "inventory": 5000,
+    "services": 300,
+    "invoices": 100000,
+    "purchase_orders": 5000,
+}
+
+_FIRST_NAMES = ["Ana", "Luis", "María", "José", "Carmen", "Pedro", "Rosa", "Carlos", "Elena", "Jorge"]
+_LAST_NAMES = ["Pérez", "González", "Rodríguez", "Martínez", "Hernández", "López", "Díaz", "Morales"]
+_PRODUCTS = ["Teclado", "Mouse", "Monitor", "Cable", "Cargador", "Disco", "Memoria", "Router", "Batería"]
+_ADJECTIVES = ["inalámbrico", "USB", "HDMI", "portátil", "gamer", "básico", "pro", "compacto"]
+_BANKS = ["Banco de Venezuela", "Banesco", "Mercantil", "Provincial", "BNC"]
+_SERVICES = ["Reparación", "Mantenimiento", "Instalación", "Diagnóstico", "Limpieza", "Configuración"]
+
+
+def _batches(rows: Iterator[Tuple], size: int = INSERT_BATCH) -> Iterator[List[Tuple]]:
+    batch: List[Tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _bulk_insert(conn, sql: str, rows: Iterator[Tuple]) -> int:
+    """
+    Inserta ``rows`` con executemany por lotes y devuelve cuántas filas
+    escribió (las que ignoró un ``INSERT OR IGNORE`` no cuentan).
+    """
+    count = 0
+    for batch in _batches(rows):
+        count += conn.executemany(sql, batch).rowcount
+        conn.commit()
+    return count
+
+
+def _ids(conn, table: str) -> List[int]:
+    return [row[0] for row in conn.execute(f"SELECT id FROM {table} ORDER BY id")]
+
+
+def _lookup(conn, table: str) -> Dict[str, int]:
+    return {row[1]: row[0] for row in conn.execute(f"SELECT id, name FROM {table}")}
+
+
+def _seed_reference_data(conn) -> None:
+    """Catálogos mínimos que necesitan las filas generadas."""
+    conn.executemany("INSERT OR IGNORE INTO status (name) VALUES (?)", [("active",), ("inactive",)])
+    conn.execute("INSERT OR IGNORE INTO roles (name) VALUES ('admin')")
+    conn.execute('''
+        INSERT OR IGNORE INTO person (first_name, last_name, id_number)
+        VALUES ('Bench', 'Admin', 'BENCH-0')
+    ''')
+    conn.execute('''
+        INSERT OR IGNORE INTO users (username, password, person_id, role_id)
+        SELECT 'bench', '-', p.id, r.id FROM person p, roles r
+        WHERE p.id_number = 'BENCH-0' AND r.name = 'admin'
+    ''')
+    conn.executemany(
+        "INSERT OR IGNORE INTO invoice_status (name) VALUES (?)",
+        [("Paid",), ("Pending",), ("Cancelled",), ("Partial",)]
+    )
+    conn.executemany("INSERT OR IGNORE INTO invoice_types (name) VALUES (?)", [("Venta",), ("Servicio",)])
+    conn.executemany(
+        "INSERT OR IGNORE INTO purchase_order_status (name) VALUES (?)",
+        [("draft",), ("sent",), ("received",), ("cancelled",)]
+    )
+    conn.execute("INSERT OR IGNORE INTO request_status (name) VALUES ('Nuevo')")
+    conn.executemany(
+        "INSERT OR IGNORE INTO movement_types (name, affects_quantity, affects_stock) VALUES (?, 1, 1)",
+        [("Entrada inicial",), ("Compra",), ("Venta",), ("Ajuste positivo",), ("Ajuste negativo",)]
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO service_request_movement_types (name) VALUES (?)",
+        [("CREACION",), ("CANCELACION",)]
+    )
+    conn.commit()
+
+
+def _dates(days: int) -> Sequence[str]:
+    """Fechas ``YYYY-MM-DD`` de los últimos ``days`` días."""
+    today = date.today()
+    return [(today - timedelta(days=offset)).isoformat() for offset in range(days)]
+
+
+def _timestamp(rng: random.Random, day: str, now: str) -> str:
+    """Hora de atención (08:00 a 19:59) de ``day``, sin pasar de ``now``."""
+    return min(f"{day} {rng.randint(8, 19):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}", now)
+
+
+def generate_dataset(volumes: Dict[str, int] = None, seed: int = 42, days: int = 365) -> Dict[str, int]:
+    """
+    Genera un volumen de datos realista en la base de datos configurada.
+
+    Además de las entidades genera los pagos de cada factura y los
+    movimientos de inventario: entrada inicial por producto al comienzo
+    del rango, salida por cada línea vendida (en orden cronológico, con una
+    compra antes si no alcanza el stock) y un ajuste final que deja holgura
+    para las ventas del benchmark. Cada cadena de movimientos cuadra con el
+    stock del producto y ninguna fecha queda en el futuro. Usa
+    ``executemany`` por lotes en una sola conexión; los triggers FTS e
+    índices de las migraciones se mantienen activos para medir con el
+    esquema real. Conviene apuntar ``SQLITE_CLI_DB_PATH`` a un archivo
+    descartable y usar el perfil de PRAGMA ``bulk``.
+
+    :param volumes: Cantidades por entidad (ver ``DEFAULT_VOLUMES``)
+    :param seed: Semilla del generador aleatorio (datos reproducibles)
+    :param days: Rango de fechas de facturas y órdenes hacia atrás desde hoy
+    :return: Filas insertadas por tabla
+    :raises ValueError: Si la base de datos ya tiene datos (los resultados
+        dejarían de ser comparables entre corridas)
+    """
+    volumes = {**DEFAULT_VOLUMES, **(volumes or {})}
+    rng = random.Random(seed)
+    init_db()
+    run_migrations()
+
+    conn = get_db_connection()
+    try:
+        filled = [table for table in DEFAULT_VOLUMES if conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()]
+        if filled:
+            raise ValueError(f"La base de datos ya tiene datos ({', '.join(filled)})")
+        # Mismo reloj que CURRENT_TIMESTAMP de las filas que escribe la aplicación
+        now = conn.execute("SELECT datetime('now')").fetchone()[0]
+        dates = [day for day in _dates(days) if day <= now[:10]]
+        _seed_reference_data(conn)
+        counts = _generate_entities(conn, rng, volumes, f"{dates[-1]} 08:00:00")
+        counts.update(_generate_sales(conn, rng, volumes["invoices"], dates, now))
+        counts.update(_generate_purchase_orders(conn, rng, volumes["purchase_orders"], dates))
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    return counts
+
+
+def _generate_entities(conn, rng: random.Random, volumes: Dict[str, int], start: str) -> Dict[str, int]:
+    status = _lookup(conn, "status")
+    active, inactive = status["active"], status["inactive"]
+    counts = {}
+
+    def status_id() -> int:
+        return inactive if rng.random() < 0.05 else active
+
+    counts["customers"] = _bulk_insert(conn, '''
+        INSERT OR IGNORE INTO customers (first_name, last_name, id_number, email, address, phone, status_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        (
+            rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES), f"V-{10000000 + n}",
+            f"cliente{n}@correo.com", f"Calle {n % 300}", f"0414{n:07d}", status_id()
+        )
+        for n in range(volumes["customers"])
+    ))
+
+    counts["suppliers"] = _bulk_insert(conn, '''
+        INSERT OR IGNORE INTO suppliers (code, id_number, first_name, last_name, company, tax_id, status_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        (
+            f"PRV{n:05d}", f"J-{30000000 + n}", rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES),
+            f"Distribuidora {rng.choice(_LAST_NAMES)} {n}", f"J-{30000000 + n}-0", active
+        )
+        for n in range(volumes["suppliers"])
+    ))
+    supplier_ids = _ids(conn, "suppliers")
+
+    def inventory_rows() -> Iterator[Tuple]:
+        for n in range(volumes["inventory"]):
+            stock = rng.randint(0, 500)
+            cost = round(rng.uniform(1, 200), 2)
+            yield (
+                f"PROD{n:06d}", f"{rng.choice(_PRODUCTS)} {rng.choice(_ADJECTIVES)} {n}",
+                f"Producto de prueba {n}", stock, stock, 5, 500, cost, round(cost * 1.3, 2),
+                status_id(), rng.choice(supplier_ids)
+            )
+
+    counts["inventory"] = _bulk_insert(conn, '''
+        INSERT OR IGNORE INTO inventory (
+            code, product, description, quantity, stock, min_stock, max_stock,
+            cost, price, status_id, supplier_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', inventory_rows())
+
+    user_id = conn.execute("SELECT id FROM users WHERE username = 'bench'").fetchone()[0]
+    initial_entry = _lookup(conn, "movement_types")["Entrada inicial"]
+    # Entrada inicial de cada producto al comienzo del rango, en una sola sentencia
+    counts["initial_movements"] = conn.execute('''
+        INSERT INTO inventory_movements (
+            inventory_id, movement_type_id, quantity_change, stock_change,
+            previous_quantity, new_quantity, previous_stock, new_stock,
+            reference_type, user_id, notes, created_at
+        )
+        SELECT id, ?, quantity, stock, 0, quantity, 0, stock, 'initial', ?, 'Entrada generada', ?
+        FROM inventory
+    ''', (initial_entry, user_id, start)).rowcount
+    conn.commit()
+
+    counts["services"] = _bulk_insert(conn, '''
+        INSERT OR IGNORE INTO services (code, name, price, description, status_id)
+        VALUES (?, ?, ?, ?, ?)
+    ''', (
+        (
+            f"SRV{n:05d}", f"{rng.choice(_SERVICES)} {rng.choice(_PRODUCTS).lower()} {n}",
+            round(rng.uniform(5, 150), 2), f"Servicio de prueba {n}", status_id()
+        )
+        for n in range(volumes["services"])
+    ))
+    return counts
+
+
+def _generate_sales(conn, rng: random.Random, invoices: int, dates: Sequence[str], now: str) -> Dict[str, int]:
+    """
+    Facturas con 1-5 productos y, en una de cada cinco, una solicitud de servicio.
+    Cada factura lleva uno o dos pagos y cada línea de producto su movimiento de venta.
+
+    Las facturas se generan en orden cronológico y el stock se recorre hacia
+    adelante desde la entrada inicial: si una venta no alcanza, antes se
+    registra una compra, así que ninguna cadena de movimientos queda negativa.
+    """
+    customer_ids = _ids(conn, "customers")
+    products = conn.execute("SELECT id, price FROM inventory").fetchall()
+    stock = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT id, quantity, stock FROM inventory")}
+    user_id = conn.execute("SELECT id FROM users WHERE username = 'bench'").fetchone()[0]
+    movement_types = _lookup(conn, "movement_types")
+    sale_movement = movement_types["Venta"]
+    purchase_movement = movement_types["Compra"]
+    adjustment_movement = movement_types["Ajuste positivo"]
+    services = conn.execute("SELECT id, price FROM services").fetchall()
+    invoice_status = _lookup(conn, "invoice_status")
+    invoice_types = _lookup(conn, "invoice_types")
+    request_status_id = _lookup(conn, "request_status")["Nuevo"]
+    statuses = [invoice_status["Paid"]] * 8 + [invoice_status["Pending"], invoice_status["Cancelled"]]
+
+    first_invoice = (conn.execute("SELECT COALESCE(MAX(id), 0) FROM invoices").fetchone()[0]) + 1
+    first_request = (conn.execute("SELECT COALESCE(MAX(id), 0) FROM service_requests").fetchone()[0]) + 1
+
+    timestamps = sorted(_timestamp(rng, rng.choice(dates), now) for _ in range(invoices))
+
+    invoice_rows, detail_rows, request_rows, payment_rows, movement_rows = [], [], [], [], []
+    for n in range(invoices):
+        invoice_id = first_invoice + n
+        customer_id = rng.choice(customer_ids)
+        created_at = timestamps[n]
+        issue_date = created_at[:10]
+        subtotal = 0.0
+        for _ in range(rng.randint(1, 5)):
+            product_id, price = rng.choice(products)
+            quantity = rng.randint(1, 4)
+            subtotal += quantity * price
+            detail_rows.append((invoice_id, product_id, None, quantity, price, round(quantity * price, 2)))
+
+            physical, available = stock[product_id]
+            if available < quantity:
+                # Reposición justo antes de la venta
+                restock = quantity + rng.randint(20, 100)
+                movement_rows.append((
+                    product_id, purchase_movement, restock, restock, physical, physical + restock, available,
+                    available + restock, None, "purchase", user_id, "Compra generada", created_at
+                ))
+                physical, available = physical + restock, available + restock
+            stock[product_id] = (physical, available - quantity)
+            movement_rows.append((
+                product_id, sale_movement, 0, -quantity, physical, physical, available,
+                available - quantity, invoice_id, "invoice", user_id, f"Venta factura #{invoice_id}", created_at
+            ))
+
+        invoice_type = invoice_types["Venta"]
+        if services and rng.random() < 0.2:
+            request_id = first_request + len(request_rows)
+            service_id, price = rng.choice(services)
+            request_rows.append((
+                request_id, f"SR-BENCH-{request_id}", customer_id, service_id, "Solicitud generada", 1, price,
+                request_status_id
+            ))
+            subtotal += price
+            detail_rows.append((invoice_id, None, request_id, 1, price, price))
+            invoice_type = invoice_types["Servicio"]
+
+        taxes = round(subtotal * 0.16, 2)
+        total = round(subtotal + taxes, 2)
+        invoice_rows.append((
+            invoice_id, customer_id, invoice_type, issue_date, round(subtotal, 2), taxes,
+            total, rng.choice(statuses), created_at
+        ))
+
+        if rng.random() < 0.3:
+            cash = round(total * rng.uniform(0.2, 0.8), 2)
+            payment_rows.append((invoice_id, "Efectivo", None, cash, None, created_at))
+            payment_rows.append((
+                invoice_id, "Transferencia", rng.choice(_BANKS), round(total - cash, 2),
+                f"REF{invoice_id}", created_at
+            ))
+        else:
+            payment_rows.append((invoice_id, "Efectivo", None, total, None, created_at))
+
+    counts = {}
+    counts["service_requests"] = _bulk_insert(conn, '''
+        INSERT INTO service_requests (
+            id, request_number, customer_id, service_id, description, quantity, total, request_status_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', iter(request_rows))
+    counts["invoices"] = _bulk_insert(conn, '''
+        INSERT INTO invoices (
+            id, customer_id, invoice_type_id, issue_date, subtotal, taxes, total, status_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', iter(invoice_rows))
+    counts["invoice_details"] = _bulk_insert(conn, '''
+        INSERT INTO invoice_details (invoice_id, product_id, service_request_id, quantity, unit_price, subtotal)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', iter(detail_rows))
+    counts["invoice_payments"] = _bulk_insert(conn, '''
+        INSERT INTO invoice_payments (invoice_id, payment_method, bank, amount, reference, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', iter(payment_rows))
+    # Holgura para que las ventas de prueba del benchmark nunca fallen por
+    # stock insuficiente, registrada como ajuste para que la cadena cuadre
+    for product_id, (physical, available) in stock.items():
+        movement_rows.append((
+            product_id, adjustment_movement, 1000, 1000, physical, physical + 1000, available,
+            available + 1000, None, "adjustment", user_id, "Holgura del benchmark", now
+        ))
+    counts["inventory_movements"] = _bulk_insert(conn, '''
+        INSERT INTO inventory_movements (
+            inventory_id, movement_type_id, quantity_change, stock_change,
+            previous_quantity, new_quantity, previous_stock, new_stock,
+            reference_id, reference_type, user_id, notes, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', iter(movement_rows))
+
+    conn.executemany(
+        "UPDATE inventory SET stock = ?, quantity = ? WHERE id = ?",
+        [
+            (available + 1000, physical + 1000, product_id)
+            for product_id, (physical, available) in stock.items()
+        ]
+    )
+    conn.commit()
+    return counts
+
+
+def _generate_purchase_orders(conn, rng: random.Random, orders: int, dates: Sequence[str]) -> Dict[str, int]:
+    """Órdenes de compra con 1-8 productos cada una."""
+    supplier_ids = _ids(conn, "suppliers")
+    products = conn.execute("SELECT id, product, cost FROM inventory").fetchall()
+    order_statuses = list(_lookup(conn, "purchase_order_status").values())
+    user_id = conn.execute("SELECT id FROM users WHERE username = 'bench'").fetchone()[0]
+    first_order = (conn.execute("SELECT COALESCE(MAX(id), 0) FROM purchase_orders").fetchone()[0]) + 1
+
+    order_rows, detail_rows = [], []
+    for n in range(orders):
+        order_id = first_order + n
+        subtotal = 0.0
+        for _ in range(rng.randint(1, 8)):
+            product_id, name, cost = rng.choice(products)
+            quantity = rng.randint(5, 100)
+            subtotal += quantity * cost
+            detail_rows.append((order_id, product_id, name, quantity, cost, cost))
+        taxes = round(subtotal * 0.16, 2)
+        issue_date = rng.choice(dates)
+        order_rows.append((
+            order_id, f"OC-BENCH-{order_id:07d}", rng.choice(supplier_ids), issue_date, issue_date,
+            rng.choice(order_statuses), round(subtotal, 2), taxes, round(subtotal + taxes, 2), user_id
+        ))
+
+    counts = {}
+    counts["purchase_orders"] = _bulk_insert(conn, '''
+        INSERT INTO purchase_orders (
+            id, order_number, supplier_id, issue_date, expected_delivery_date, status_id,
+            subtotal, taxes, total, created_by
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', iter(order_rows))
+    counts["purchase_order_details"] = _bulk_insert(conn, '''
+        INSERT INTO purchase_order_details (order_id, product_id, product_name, quantity, unit_price, reference_price)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', iter(detail_rows))
+    return counts
@@ -0,0 +1,190 @@
+# bench/report_benchmark.py
+import argparse
+import os
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+# Comparación de los reportes con detalle: una consulta por fila (implementación
+# anterior) frente a la consulta de detalle única de SalesReport/PurchaseOrderReport.
+#
+#   python -m sqlite_cli.bench.report_benchmark --db /tmp/bench.db --generate
+
+_LEGACY_SALES_QUERY = '''
+    SELECT i.id as invoice_id, i.issue_date, i.subtotal, i.taxes, i.total,
+           c.id as customer_id, c.first_name || ' ' || c.last_name as customer_name,
+           c.id_number as customer_id_number, it.name as invoice_type,
+           s.name as status_name, i.created_at
+    FROM invoices i
+    JOIN customers c ON i.customer_id = c.id
+    JOIN invoice_status s ON i.status_id = s.id
+    JOIN invoice_types it ON i.invoice_type_id = it.id
+    WHERE i.issue_date >= ? AND i.issue_date < DATE(?, '+1 day')
+    ORDER BY i.issue_date DESC
+'''
+
+_LEGACY_SALES_DETAIL_QUERY = '''
+    SELECT d.id, d.quantity, d.unit_price, d.subtotal,
+           CASE
+               WHEN d.product_id IS NOT NULL THEN 'product'
+               WHEN d.service_request_id IS NOT NULL THEN 'service'
+           END as item_type,
+           COALESCE(p.product, s.name) as item_name,
+           COALESCE(p.code, sr.service_id || '-' || sr.id) as item_code,
+           CASE
+               WHEN d.product_id IS NOT NULL THEN p.price
+               WHEN d.service_request_id IS NOT NULL THEN sr.total / sr.quantity
+           END as item_price,
+           d.created_at as detail_created_at
+    FROM invoice_details d
+    LEFT JOIN inventory p ON d.product_id = p.id
+    LEFT JOIN service_requests sr ON d.service_request_id = sr.id
+    LEFT JOIN services s ON sr.service_id = s.id
+    WHERE d.invoice_id = ?
+    ORDER BY d.id
+'''
+
+_LEGACY_ORDERS_QUERY = '''
+    SELECT po.id, po.order_number, po.issue_date, po.expected_delivery_date,
+           po.subtotal, po.taxes, po.total, po.notes,
+           s.company as supplier_company, s.id_number as supplier_id_number,
+           u.username as created_by
+    FROM purchase_orders po
+    JOIN suppliers s ON po.supplier_id = s.id
+    JOIN users u ON po.created_by = u.id
+    WHERE po.issue_date >= ? AND po.issue_date < DATE(?, '+1 day')
+    ORDER BY po.issue_date DESC
+'''
+
+_LEGACY_ORDER_DETAIL_QUERY = '''
+    SELECT pod.*, i.code as product_code, i.product as product_name
+    FROM purchase_order_details pod
+    LEFT JOIN inventory i ON pod.product_id = i.id
+    WHERE pod.order_id = ?
+    ORDER BY pod.id
+'''
+
+
+def legacy_sales_report(start_date: str, end_date: str) -> List[Dict]:
+    """Reporte de ventas con una consulta de detalle por factura (versión anterior)."""
+    from sqlite_cli.database.database import get_db_connection
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(_LEGACY_SALES_QUERY, (start_date, end_date))
+    sales = [dict(row) for row in cursor.fetchall()]
+    for sale in sales:
+        cursor.execute(_LEGACY_SALES_DETAIL_QUERY, (sale['invoice_id'],))
+        sale['items'] = [dict(row) for row in cursor.fetchall()]
+        sale['product_count'] = sum(1 for item in sale['items'] if item['item_type'] == 'product')
+        sale['service_count'] = sum(1 for item in sale['items'] if item['item_type'] == 'service')
+    conn.close()
+    return sales
+
+
+def legacy_purchase_orders_report(start_date: str, end_date: str) -> List[Dict]:
+    """Reporte de órdenes con una consulta de detalle por orden (versión anterior)."""
+    from sqlite_cli.database.database import get_db_connection
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(_LEGACY_ORDERS_QUERY, (start_date, end_date))
+    orders = [dict(row) for row in cursor.fetchall()]
+    for order in orders:
+        cursor.execute(_LEGACY_ORDER_DETAIL_QUERY, (order['id'],))
+        order['items'] = [dict(row) for row in cursor.fetchall()]
+        order['product_count'] = len(order['items'])
+    conn.close()
+    return orders
+
+
+def time_call(func: Callable[[], object], repeat: int = 3) -> Dict:
+    """Ejecuta ``func`` ``repeat`` veces y devuelve el mejor tiempo y las filas."""
+    best = None
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        rows = len(result) if hasattr(result, '__len__') else 0
+    return {"seconds": best, "rows": rows}
+
+
+def run_report_benchmark(windows: Dict[str, tuple], repeat: int = 3) -> List[Dict]:
+    """
+    Mide cada reporte (anterior y actual) en cada rango de fechas.
+
+    :param windows: {etiqueta: (fecha inicio, fecha fin)}
+    :param repeat: Repeticiones por medición (se toma la mejor)
+    :return: Una fila por (reporte, rango) con tiempos y aceleración
+    """
+    from sqlite_cli.models.sales_report_model import SalesReport
+    from sqlite_cli.models.purchase_order_report_model import PurchaseOrderReport
+
+    results = []
+    for label, (start, end) in windows.items():
+        cases = [
+            ("SalesReport.get_sales_report",
+             lambda: legacy_sales_report(start, end),
+             lambda: SalesReport.get_sales_report(start, end),
+             lambda: SalesReport.get_sales_report(start, end, include_items=False)),
+            ("PurchaseOrderReport.get_purchase_orders_report",
+             lambda: legacy_purchase_orders_report(start, end),
+             lambda: PurchaseOrderReport.get_purchase_orders_report(start, end),
+             lambda: PurchaseOrderReport.get_purchase_orders_report(start, end, include_items=False)),
+        ]
+        for name, legacy, set_based, counts_only in cases:
+            before = time_call(legacy, repeat)
+            after = time_call(set_based, repeat)
+            summary = time_call(counts_only, repeat)
+            results.append({
+                "report": name,
+                "window": label,
+                "rows": after["rows"],
+                "legacy_s": before["seconds"],
+                "set_based_s": after["seconds"],
+                "counts_only_s": summary["seconds"],
+                "speedup": before["seconds"] / after["seconds"] if after["seconds"] else None,
+            })
+    return results
+
+
+def format_results(results: List[Dict]) -> str:
+    lines = [f"{'reporte':<48} {'rango':<6} {'filas':>7} {'anterior':>10} {'conjunto':>10} {'conteos':>10} {'x':>6}"]
+    for r in results:
+        lines.append(
+            f"{r['report']:<48} {r['window']:<6} {r['rows']:>7} "
+            f"{r['legacy_s']:>9.3f}s {r['set_based_s']:>9.3f}s {r['counts_only_s']:>9.3f}s {r['speedup']:>5.1f}x"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de los reportes de ventas y órdenes de compra.")
+    parser.add_argument('--db', help="Archivo de base de datos (por defecto SQLITE_CLI_DB_PATH).")
+    parser.add_argument('--generate', action='store_true', help="Genera datos antes de medir.")
+    parser.add_argument('--invoices', type=int, default=100000, help="(--generate) Facturas a generar.")
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por medición.")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        os.environ["SQLITE_CLI_DB_PATH"] = args.db
+    from sqlite_cli.database.connection_manager import configure
+    configure(db_path=args.db, pragma_profile="bulk" if args.generate else None)
+
+    if args.generate:
+        from sqlite_cli.bench.generator import generate_dataset
+        started = time.perf_counter()
+        counts = generate_dataset({"invoices": args.invoices})
+        print(f"Datos generados en {time.perf_counter() - started:.1f}s: {counts}")
+        configure(pragma_profile="default")
+
+    today = date.today()
+    windows = {
+        "30d": ((today - timedelta(days=30)).isoformat(), today.isoformat()),
+        "365d": ((today - timedelta(days=365)).isoformat(), today.isoformat()),
+    }
+    print(format_results(run_report_benchmark(windows, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
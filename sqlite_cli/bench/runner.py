@@ -0,0 +1,248 @@
+# bench/runner.py
+import csv
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlite_cli.database.write_queue import get_write_queue
+
+# Repeticiones por defecto de cada llamada medida
+DEFAULT_REPEAT = 5
+
+# Terminales que cobran a la vez en la medición concurrente
+CONCURRENT_TERMINALS = 4
+
+# Columnas del archivo CSV de resultados
+RESULT_COLUMNS = ["call", "group", "runs", "rows", "min_ms", "median_ms", "p95_ms", "mean_ms", "max_ms"]
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(name: str, group: str, func: Callable[[], object], repeat: int = DEFAULT_REPEAT) -> Dict:
+    """
+    Ejecuta ``func`` ``repeat`` veces y resume los tiempos en milisegundos.
+
+    :param name: Nombre de la llamada (p. ej. ``"InventoryItem.search_active"``)
+    :param group: Categoría (search, report, checkout, cancellation)
+    :param func: Llamada sin argumentos
+    :param repeat: Ejecuciones
+    :return: Fila de resultados (ver ``RESULT_COLUMNS``)
+    """
+    samples = []
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+        if isinstance(result, dict) and 'rows' in result:
+            rows = len(result['rows'])
+        elif hasattr(result, '__len__'):
+            rows = len(result)
+    return {
+        "call": name,
+        "group": group,
+        "runs": repeat,
+        "rows": rows,
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(_percentile(samples, 0.95), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def _read_calls() -> List[Tuple[str, str, Callable[[], object]]]:
+    """Búsquedas y reportes frecuentes de las pantallas (sólo lectura)."""
+    from sqlite_cli.models.inventory_model import InventoryItem
+    from sqlite_cli.models.customer_model import Customer
+    from sqlite_cli.models.supplier_model import Supplier
+    from sqlite_cli.models.service_model import Service
+    from sqlite_cli.models.invoice_model import Invoice
+    from sqlite_cli.models.sales_report_model import SalesReport
+    from sqlite_cli.models.purchase_order_report_model import PurchaseOrderReport
+    from sqlite_cli.models.inventory_report_model import InventoryReport
+
+    today = date.today()
+    month_ago = (today - timedelta(days=30)).isoformat()
+    year_ago = (today - timedelta(days=365)).isoformat()
+    today = today.isoformat()
+
+    return [
+        ("InventoryItem.search_active('tecl')", "search", lambda: InventoryItem.search_active("tecl")),
+        ("InventoryItem.search_active('')", "search", lambda: InventoryItem.search_active("")),
+        ("InventoryItem.page_active", "search", lambda: InventoryItem.page_active(with_total=True)),
+        ("Customer.search_active('ana')", "search", lambda: Customer.search_active("ana")),
+        ("Customer.search_active('V-1000')", "search", lambda: Customer.search_active("V-1000")),
+        ("Supplier.search_active('distri')", "search", lambda: Supplier.search_active("distri")),
+        ("Service.search_active('rep')", "search", lambda: Service.search_active("rep")),
+        ("Invoice.search(customer_id=1)", "search", lambda: Invoice.search(customer_id=1)),
+        ("SalesReport.get_sales_report(30d)", "report",
+         lambda: SalesReport.get_sales_report(month_ago, today, include_items=False)),
+        ("SalesReport.get_sales_report(365d)", "report",
+         lambda: SalesReport.get_sales_report(year_ago, today, include_items=False)),
+        ("PurchaseOrderReport.get_purchase_orders_report(365d)", "report",
+         lambda: PurchaseOrderReport.get_purchase_orders_report(year_ago, today, include_items=False)),
+        ("InventoryReport.get_inventory_report", "report", InventoryReport.get_inventory_report),
+        ("InventoryReport.get_inventory_movements_report(30d)", "report",
+         lambda: InventoryReport.get_inventory_movements_report(start_date=month_ago, end_date=today)),
+    ]
+
+
+def _login_bench_user() -> None:
+    """Abre la sesión del usuario que crea el generador (lo exigen las ventas)."""
+    from sqlite_cli.models.user_model import User
+    from utils.session_manager import SessionManager
+
+    user = User.get_by_username("bench")
+    if not user:
+        raise ValueError("Usuario 'bench' no encontrado: genere los datos con el comando bench")
+    SessionManager._current_user = user
+
+
+def _sample_sales(repeat: int, seed: int) -> List[Dict]:
+    """Argumentos de ``Invoice.create_paid_invoice`` para ``repeat`` ventas de prueba."""
+    from sqlite_cli.database.database import get_db_connection
+
+    rng = random.Random(seed)
+    conn = get_db_connection()
+    try:
+        customers = [row[0] for row in conn.execute("SELECT id FROM customers WHERE status_id = 1 LIMIT 1000")]
+        products = conn.execute("SELECT id, price FROM inventory WHERE stock > 100 LIMIT 1000").fetchall()
+    finally:
+        conn.close()
+
+    sales = []
+    for _ in range(repeat):
+        items = []
+        for product_id, price in rng.sample(products, k=min(len(products), rng.randint(1, 5))):
+            quantity = rng.randint(1, 3)
+            items.append({
+                'id': product_id, 'quantity': quantity, 'unit_price': price,
+                'total': round(price * quantity, 2), 'is_service': False
+            })
+        subtotal = round(sum(item['total'] for item in items), 2)
+        taxes = round(subtotal * 0.16, 2)
+        total = round(subtotal + taxes, 2)
+        sales.append({
+            'customer_id': rng.choice(customers),
+            'subtotal': subtotal,
+            'taxes': taxes,
+            'total': total,
+            'items': items,
+            'payment_details': [{'method': 'Efectivo', 'amount': total}],
+        })
+    return sales
+
+
+def _write_calls(repeat: int, seed: int) -> List[Dict]:
+    """Mide el cobro de facturas y luego la anulación de esas mismas facturas."""
+    from sqlite_cli.models.invoice_model import Invoice
+
+    _login_bench_user()
+    sales = iter(_sample_sales(repeat * (1 + CONCURRENT_TERMINALS), seed))
+    created: List[int] = []
+
+    def checkout() -> int:
+        invoice_id = Invoice.create_paid_invoice(**next(sales))
+        created.append(invoice_id)
+        return invoice_id
+
+    def concurrent_checkout() -> List[int]:
+        # Varias terminales cobrando a la vez (el escritor agrupa sus commits)
+        batch = [next(sales) for _ in range(CONCURRENT_TERMINALS)]
+        with ThreadPoolExecutor(CONCURRENT_TERMINALS) as pool:
+            invoice_ids = list(pool.map(lambda sale: Invoice.create_paid_invoice(**sale), batch))
+        created.extend(invoice_ids)
+        return invoice_ids
+
+    results = [
+        measure("Invoice.create_paid_invoice", "checkout", checkout, repeat),
+        measure(f"Invoice.create_paid_invoice x{CONCURRENT_TERMINALS} (concurrente)", "checkout",
+                concurrent_checkout, repeat),
+    ]
+
+    pending = iter(list(created))
+    results.append(measure(
+        "Invoice.update_status('Cancelled')", "cancellation",
+        lambda: Invoice.update_status(next(pending), "Cancelled"), len(created)
+    ))
+    return results
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_bench(repeat: int = DEFAULT_REPEAT, include_writes: bool = True, seed: int = 42) -> List[Dict]:
+    """
+    Mide las llamadas de modelo frecuentes sobre la base de datos configurada.
+
+    Las escrituras (cobro y anulación) modifican la base de datos: usar
+    siempre una base generada para el benchmark.
+
+    :param repeat: Ejecuciones por llamada
+    :param include_writes: Incluye cobro y anulación de facturas
+    :param seed: Semilla para elegir clientes y productos de las ventas
+    :return: Una fila por llamada (ver ``RESULT_COLUMNS``)
+    """
+    results = [measure(name, group, func, repeat) for name, group, func in _read_calls()]
+    if include_writes:
+        results.extend(_write_calls(repeat, seed))
+    return results
+
+
+def write_results(path: str, results: List[Dict], metadata: Dict) -> None:
+    """
+    Guarda los resultados para compararlos entre commits.
+
+    ``.csv`` escribe una fila por llamada (con el commit y la fecha en cada
+    fila); cualquier otra extensión escribe JSON con los metadatos completos.
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["revision", "timestamp"] + RESULT_COLUMNS)
+            writer.writeheader()
+            for row in results:
+                writer.writerow({"revision": metadata.get("revision"), "timestamp": metadata["timestamp"], **row})
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({**metadata, "results": results}, f, ensure_ascii=False, indent=2)
+
+
+def bench_metadata(volumes: Dict[str, int], generated: Dict[str, int], repeat: int) -> Dict:
+    """Contexto de la medición: commit, versiones y volúmenes de datos."""
+    return {
+        "revision": _git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "volumes": volumes,
+        "generated": generated,
+        "write_queue": get_write_queue().stats(),
+    }
+
+
+def format_results(results: List[Dict]) -> str:
+    lines = [f"{'llamada':<56} {'filas':>7} {'mín ms':>9} {'mediana':>9} {'p95':>9}"]
+    for r in results:
+        lines.append(
+            f"{r['call']:<56} {r['rows']:>7} {r['min_ms']:>9.2f} {r['median_ms']:>9.2f} {r['p95_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
@@ -1,6 +1,21 @@
 # cli.py
 import argparse
 from database.database import init_db
+from database.migrator import run_migrations, format_report
+from database.query_plan_check import check_query_plans
+# El gestor de conexiones debe ser el mismo módulo que usan los modelos
+from sqlite_cli.database.connection_manager import DEFAULT_DB_PATH, configure
+from sqlite_cli.database.profiler import format_stats, get_profiler, set_profiling
+from sqlite_cli.database.backup import BACKUP_KEEP, BackupError, backup_database, restore_database, rotate_backups
+from bench.generator import DEFAULT_VOLUMES, generate_dataset
+from bench.runner import DEFAULT_REPEAT, bench_metadata, format_results, run_bench, write_results
+from sqlite_cli.models.inventory_model import InventoryItem
+from sqlite_cli.models.bulk_import_model import IMPORT_BATCH, IMPORT_SPECS, BulkImport
+from sqlite_cli.models.user_model import User
+from utils.data_export import EXPORTS, export_report
+import os
+import sys
+import time
 from seeds.customer_seeds import seed_customers
 from seeds.inventory_seeds import seed_inventory
 from seeds.service_request_seeds import seed_service_requests
@@ -22,7 +37,35 @@ from seeds.service_request_movement_type_seeds import seed_service_request_movem
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="CLI para gestionar el inventario.")
-    parser.add_argument('command', choices=['init', 'seed', 'reset'], help="Comando a ejecutar.")
+    parser.add_argument('command', choices=['init', 'seed', 'reset', 'migrate', 'check-indexes', 'bench', 'backfill-images', 'import', 'export', 'backup', 'restore'], help="Comando a ejecutar.")
+    parser.add_argument('--dry-run', action='store_true', help="(migrate) Muestra las migraciones pendientes sin aplicarlas.")
+    parser.add_argument('--target', type=int, help="(migrate) Versión máxima de esquema a aplicar.")
+    parser.add_argument('--db', help="(bench) Base de datos desechable donde generar y medir. "
+                        "(import, export, backup, restore) Base de datos a usar.")
+    parser.add_argument('--scale', type=float, default=1.0, help="(bench) Multiplica todos los volúmenes por defecto.")
+    parser.add_argument('--volume', action='append', default=[], metavar="ENTIDAD=N",
+                        help=f"(bench) Volumen de una entidad ({', '.join(DEFAULT_VOLUMES)}).")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="(bench) Ejecuciones por llamada medida.")
+    parser.add_argument('--output', help="(bench) Archivo de resultados (.json o .csv; bench_results.json por defecto). "
+                        "(export) Archivo de destino (.csv o .jsonl). "
+                        "(backup) Archivo de respaldo (.db o .db.gz; por defecto, en la carpeta backups).")
+    parser.add_argument('--no-generate', action='store_true', help="(bench) Mide sobre datos ya generados.")
+    parser.add_argument('--read-only', action='store_true', help="(bench) Omite las mediciones de cobro y anulación.")
+    parser.add_argument('--profile', action='store_true',
+                        help="(bench) Perfila las sentencias SQL de la medición (igual que SQLITE_CLI_PROFILE=1).")
+    parser.add_argument('--batch-size', type=int, help="(backfill-images, import) Filas por transacción "
+                        f"(200 y {IMPORT_BATCH} por defecto).")
+    parser.add_argument('--entity', choices=list(IMPORT_SPECS), help="(import) Tipo de registros del archivo.")
+    parser.add_argument('--file', help="(import) Archivo CSV o Excel (.xlsx) con encabezados. "
+                        "(restore) Respaldo a restaurar (.db o .db.gz).")
+    parser.add_argument('--user', help="(import) Usuario que registra los movimientos de inventario.")
+    parser.add_argument('--report', choices=list(EXPORTS), help="(export) Reporte a exportar.")
+    parser.add_argument('--start-date', help="(export) Fecha inicial AAAA-MM-DD.")
+    parser.add_argument('--end-date', help="(export) Fecha final AAAA-MM-DD.")
+    parser.add_argument('--search', help="(export) Término de búsqueda del reporte.")
+    parser.add_argument('--no-compress', action='store_true', help="(backup) Respaldo sin comprimir en la carpeta backups.")
+    parser.add_argument('--keep', type=int, default=BACKUP_KEEP,
+                        help=f"(backup) Respaldos que se conservan en la carpeta backups ({BACKUP_KEEP} por defecto).")
     
     args = parser.parse_args()
 
@@ -89,6 +132,187 @@ def main() -> None:
         seed_taxes()
         
         print("Base de datos reinicializada con datos de ejemplo.")
+    elif args.command == 'migrate':
+        report = run_migrations(dry_run=args.dry_run, target=args.target)
+        print(format_report(report))
+        if args.dry_run:
+            for entry in report:
+                for statement in entry['statements']:
+                    print(f"  {entry['version']:04d}: {statement}")
+    elif args.command == 'check-indexes':
+        print(format_report(run_migrations()))
+        problems = check_query_plans()
+        for problem in problems:
+            print(f"[SCAN] {problem['call']}: {'; '.join(problem['scans'])}")
+            print(f"       {problem['sql']}")
+        if problems:
+            print(f"{len(problems)} consulta(s) recorren tablas completas.")
+            sys.exit(1)
+        print("Todas las consultas frecuentes usan índices.")
+    elif args.command == 'bench':
+        run_bench_command(parser, args)
+    elif args.command == 'backfill-images':
+        # Ejecutar desde la carpeta de la aplicación: las rutas de imagen son relativas a ella
+        stats = InventoryItem.backfill_images(batch_size=args.batch_size or 200)
+        print(f"Imágenes revisadas: {stats['rows']}, actualizadas: {stats['updated']}, "
+              f"derivados creados: {stats['derivatives']}, archivos eliminados: {stats['removed']}")
+        if stats['missing'] or stats['errors']:
+            print(f"Archivos faltantes: {stats['missing']}, errores: {stats['errors']}")
+    elif args.command == 'import':
+        run_import_command(parser, args)
+    elif args.command == 'export':
+        run_export_command(parser, args)
+    elif args.command in ('backup', 'restore'):
+        run_backup_command(parser, args)
+
+
+def _parse_volumes(parser: argparse.ArgumentParser, args: argparse.Namespace) -> dict:
+    volumes = {name: max(1, int(count * args.scale)) for name, count in DEFAULT_VOLUMES.items()}
+    for item in args.volume:
+        name, _, value = item.partition("=")
+        if name not in DEFAULT_VOLUMES or not value.isdigit():
+            parser.error(f"--volume inválido: {item!r} (use ENTIDAD=N con {', '.join(DEFAULT_VOLUMES)})")
+        volumes[name] = int(value)
+    return volumes
+
+
+def run_bench_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Genera datos a escala de producción, mide las llamadas frecuentes y guarda los resultados."""
+    if not args.db:
+        parser.error("bench requiere --db (se escriben y modifican datos de prueba)")
+    if os.path.abspath(args.db) == os.path.abspath(DEFAULT_DB_PATH):
+        parser.error("bench no puede usar la base de datos de la aplicación")
+
+    volumes = _parse_volumes(parser, args)
+    generated = {}
+    if not args.no_generate:
+        configure(db_path=args.db, pragma_profile="bulk")
+        started = time.perf_counter()
+        try:
+            generated = generate_dataset(volumes)
+        except ValueError as e:
+            parser.error(f"{e}: use un archivo nuevo en --db, o --no-generate para medir sobre esos datos")
+        print(f"Datos generados en {time.perf_counter() - started:.1f}s:")
+        for table, count in generated.items():
+            print(f"  {table}: {count}")
+
+    # Las mediciones usan el perfil normal de la aplicación
+    configure(db_path=args.db, pragma_profile="default")
+    if args.profile:
+        set_profiling(True)
+    profiler = get_profiler()
+    profiler.reset()
+    results = run_bench(repeat=args.repeat, include_writes=not args.read_only)
+    print(format_results(results))
+
+    metadata = bench_metadata(volumes, generated, args.repeat)
+    if profiler.enabled:
+        metadata["sql_profile"] = profiler.stats(limit=50)
+        print("\nSentencias SQL con más tiempo acumulado:")
+        print(format_stats(profiler.stats(limit=15)))
+        print(f"Consultas lentas (>= {profiler.slow_ms:g} ms): {profiler.log_path}")
+
+    output = args.output or "bench_results.json"
+    write_results(output, results, metadata)
+    print(f"Resultados guardados en {output}")
+
+
+def run_import_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Importa productos, clientes, proveedores o servicios desde un CSV o Excel."""
+    if not args.entity or not args.file:
+        parser.error("import requiere --entity y --file")
+    if args.db:
+        configure(db_path=args.db)
+
+    user_id = None
+    if args.user:
+        user = User.get_by_username(args.user)
+        if not user:
+            parser.error(f"No existe el usuario {args.user!r}")
+        user_id = user['id']
+    elif args.entity == 'inventory':
+        parser.error("import --entity inventory requiere --user (registra los movimientos iniciales)")
+
+    started = time.perf_counter()
+    try:
+        result = BulkImport.import_file(
+            args.entity, args.file, user_id=user_id,
+            batch_size=args.batch_size or IMPORT_BATCH,
+            progress=lambda rows: print(f"  {rows} filas procesadas...")
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"Importación terminada en {time.perf_counter() - started:.1f}s: {result['rows']} filas, "
+          f"{result['inserted']} nuevas, {result['updated']} actualizadas, {result['invalid']} con errores.")
+    for error in result['errors']:
+        column = f" [{error['column']}]" if error['column'] else ""
+        print(f"  Fila {error['row']}{column}: {error['message']}")
+    if result['invalid']:
+        sys.exit(1)
+
+
+def run_export_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exporta un reporte a CSV o JSON Lines leyendo las filas por lotes."""
+    if not args.report or not args.output:
+        parser.error("export requiere --report y --output")
+    if args.db:
+        configure(db_path=args.db)
+
+    query = {"start_date": args.start_date, "end_date": args.end_date}
+    # Los movimientos no tienen búsqueda por texto
+    if args.report != 'inventory_movements_report':
+        query["search_term"] = args.search
+
+    started = time.perf_counter()
+    try:
+        count = export_report(
+            args.output, args.report, query,
+            progress=lambda fraction, message: print(f"  {message}")
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"{EXPORTS[args.report][0]}: {count} filas exportadas en {time.perf_counter() - started:.1f}s a {args.output}")
+
+
+def _print_progress():
+    """Avance por consola: una línea por etapa y cada 10% dentro de ella."""
+    last = {"stage": None, "step": -1}
+
+    def progress(fraction: float, message: str) -> None:
+        stage = message.split(" ")[0]
+        step = int(fraction * 10)
+        if stage != last["stage"] or step != last["step"]:
+            last["stage"], last["step"] = stage, step
+            print(f"  {fraction:4.0%} {message}")
+    return progress
+
+
+def run_backup_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Respaldo en caliente (backup) o restauración (restore) de la base de datos."""
+    if args.command == 'restore' and not args.file:
+        parser.error("restore requiere --file")
+    if args.db:
+        configure(db_path=args.db)
+
+    started = time.perf_counter()
+    try:
+        if args.command == 'restore':
+            safety = restore_database(args.file, progress=_print_progress())
+            print(f"Base de datos restaurada desde {args.file} en {time.perf_counter() - started:.1f}s")
+            print(f"Respaldo de la base de datos anterior: {safety}")
+            return
+        path = backup_database(
+            args.output, compress=False if args.no_compress else None, progress=_print_progress()
+        )
+    except (BackupError, OSError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"Respaldo creado en {time.perf_counter() - started:.1f}s: {path} ({os.path.getsize(path) // 1024} KB)")
+    if not args.output:
+        for removed in rotate_backups(args.keep):
+            print(f"  Respaldo antiguo eliminado: {removed}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
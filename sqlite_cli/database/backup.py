@@ -0,0 +1,387 @@
+# database/backup.py
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from sqlite_cli.database.connection_manager import PRAGMA_PROFILES, get_manager, retire_connections
+from sqlite_cli.database.write_queue import run_exclusive
+
+BACKUP_PAGES = 1024          # Páginas copiadas por paso (~4 MB): entre pasos escribe el POS
+BACKUP_KEEP = 14             # Respaldos que se conservan en la carpeta de respaldos
+BACKUP_PREFIX = "db_backup_"
+COMPRESS_CHUNK = 1024 * 1024
+CHECK_OPS = 100000           # Instrucciones de SQLite entre avances de la verificación
+
+# Respaldo automático: horas entre respaldos (0 lo desactiva) y cada cuánto
+# se revisa si toca uno. El primero espera unos segundos tras el arranque.
+SCHEDULE_HOURS = float(os.environ.get("SQLITE_CLI_BACKUP_HOURS", "24"))
+SCHEDULE_CHECK_SECONDS = 15 * 60
+SCHEDULE_START_DELAY = 60
+
+# Tablas que debe tener un archivo para aceptarlo como base de datos del sistema
+REQUIRED_TABLES = ("users", "inventory", "invoices", "status")
+
+# Avance: (fracción entre 0 y 1, mensaje), como en ``utils.data_export``.
+# Si lanza una excepción (p. ej. ``BackupCancelled``) el respaldo se aborta.
+ProgressCallback = Callable[[float, str], None]
+
+# Un respaldo o restauración a la vez por proceso (manual o programado)
+_lock = threading.Lock()
+
+
+class BackupCancelled(Exception):
+    """El usuario canceló el respaldo desde el avance."""
+
+
+class BackupError(Exception):
+    """El respaldo o el archivo a restaurar no pasó la verificación."""
+
+
+def backup_dir(db_path: Optional[str] = None) -> str:
+    """Carpeta de respaldos: ``backups`` junto al archivo de la base de datos."""
+    return os.path.join(os.path.dirname(os.path.abspath(db_path or get_manager().db_path)), "backups")
+
+
+def backup_filename(compress: bool = True) -> str:
+    """
+    Nombre con fecha y hora (hasta microsegundos), el mismo formato de los
+    respaldos previos a una restauración.
+    """
+    name = f"{BACKUP_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.db"
+    return f"{name}.gz" if compress else name
+
+
+def _new_backup_path(directory: str, compress: bool) -> str:
+    """Ruta de un respaldo nuevo en ``directory`` que no pisa ningún archivo existente."""
+    path = os.path.join(directory, backup_filename(compress))
+    stem, ext = path.split(".db", 1)
+    counter = 1
+    while os.path.exists(path):
+        path = f"{stem}_{counter}.db{ext}"
+        counter += 1
+    return path
+
+
+def _busy_timeout() -> float:
+    return PRAGMA_PROFILES[get_manager().pragma_profile].get("busy_timeout", 5000) / 1000
+
+
+def _report(progress: Optional[ProgressCallback], start: float, end: float) -> Optional[ProgressCallback]:
+    """Reescala el avance de una etapa al tramo [start, end] del total."""
+    if progress is None:
+        return None
+    return lambda fraction, message: progress(start + (end - start) * fraction, message)
+
+
+def _copy_pages(src: sqlite3.Connection, dst: sqlite3.Connection, progress: Optional[ProgressCallback]) -> None:
+    """Copia ``src`` en ``dst`` con la API de respaldo, ``BACKUP_PAGES`` páginas por paso."""
+
+    def step(status: int, remaining: int, total: int) -> None:
+        if progress and total:
+            progress((total - remaining) / total, f"Copiando páginas ({total - remaining}/{total})")
+
+    src.backup(dst, pages=BACKUP_PAGES, progress=step)
+
+
+def _check_integrity(conn: sqlite3.Connection, progress: Optional[ProgressCallback]) -> None:
+    """
+    ``PRAGMA integrity_check`` con avance. La verificación no informa cuánto
+    falta, así que sólo se repite el mensaje; una excepción del avance la interrumpe.
+    """
+    failure: List[BaseException] = []
+
+    def handler() -> int:
+        try:
+            progress(0.0, "Verificando integridad...")
+        except BaseException as e:
+            failure.append(e)
+            return 1
+        return 0
+
+    if progress:
+        progress(0.0, "Verificando integridad...")
+        conn.set_progress_handler(handler, CHECK_OPS)
+    try:
+        rows = conn.execute("PRAGMA integrity_check").fetchall()
+    except sqlite3.OperationalError:
+        if failure:
+            raise failure[0]
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+    if rows != [("ok",)]:
+        problems = "; ".join(row[0] for row in rows[:5])
+        raise BackupError(f"El archivo no pasó la verificación de integridad: {problems}")
+    if progress:
+        progress(1.0, "Integridad verificada")
+
+
+def _gzip(source: str, dest: str, progress: Optional[ProgressCallback]) -> None:
+    total = os.path.getsize(source) or 1
+    done = 0
+    with open(source, "rb") as f_in, gzip.open(dest, "wb", compresslevel=6) as f_out:
+        while True:
+            chunk = f_in.read(COMPRESS_CHUNK)
+            if not chunk:
+                break
+            f_out.write(chunk)
+            done += len(chunk)
+            if progress:
+                progress(done / total, f"Comprimiendo ({done // 1048576}/{total // 1048576} MB)")
+
+
+def _gunzip(source: str, dest: str) -> None:
+    with gzip.open(source, "rb") as f_in, open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, COMPRESS_CHUNK)
+
+
+def _remove(*paths: str) -> None:
+    for path in paths:
+        for name in (path, f"{path}-journal", f"{path}-wal", f"{path}-shm"):
+            if os.path.exists(name):
+                os.remove(name)
+
+
+def backup_database(
+    dest_path: Optional[str] = None,
+    compress: Optional[bool] = None,
+    progress: Optional[ProgressCallback] = None
+) -> str:
+    """
+    Respaldo en caliente de la base de datos con la API de respaldo de SQLite.
+
+    La copia se hace por pasos de ``BACKUP_PAGES`` páginas dentro de una
+    transacción de lectura: el respaldo es una foto consistente del momento
+    en que empezó y, gracias al modo WAL, las ventas siguen escribiéndose
+    mientras tanto (sin la transacción, cada escritura reiniciaría la copia).
+    El resultado se verifica con ``PRAGMA integrity_check``, se comprime con
+    gzip si corresponde y sólo entonces toma su nombre definitivo; si algo
+    falla o se cancela no queda un archivo a medias.
+
+    :param dest_path: Archivo de destino (por defecto, uno nuevo en ``backup_dir()``
+        que nunca reemplaza un respaldo existente)
+    :param compress: Comprimir con gzip (por defecto, si el destino termina en .gz)
+    :param progress: Avance (fracción, mensaje); si lanza una excepción se cancela
+    :return: Ruta del respaldo
+    """
+    if compress is None:
+        compress = dest_path is None or dest_path.endswith(".gz")
+    if dest_path is None:
+        directory = backup_dir()
+        os.makedirs(directory, exist_ok=True)
+        dest_path = _new_backup_path(directory, compress)
+
+    db_path = get_manager().db_path
+    copy_path = f"{dest_path}.part.db"
+    packed_path = f"{dest_path}.part"
+    copy_end = 0.5 if compress else 0.75
+
+    with _lock:
+        try:
+            _remove(copy_path, packed_path)
+            src = sqlite3.connect(db_path, timeout=_busy_timeout(), isolation_level=None)
+            dst = sqlite3.connect(copy_path)
+            try:
+                # Transacción de lectura: fija la foto que se copia
+                src.execute("BEGIN")
+                src.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+                _copy_pages(src, dst, _report(progress, 0.0, copy_end))
+                src.execute("COMMIT")
+                # El respaldo es un único archivo, sin -wal ni -shm al abrirlo
+                dst.execute("PRAGMA journal_mode=DELETE")
+                _check_integrity(dst, _report(progress, copy_end, copy_end + 0.25))
+            finally:
+                src.close()
+                dst.close()
+
+            if compress:
+                _gzip(copy_path, packed_path, _report(progress, 0.75, 1.0))
+                os.replace(packed_path, dest_path)
+                _remove(copy_path)
+            else:
+                os.replace(copy_path, dest_path)
+        except BaseException:
+            _remove(copy_path, packed_path)
+            raise
+
+    if progress:
+        progress(1.0, "Respaldo completado")
+    return dest_path
+
+
+def list_backups(directory: Optional[str] = None) -> List[Dict]:
+    """Respaldos de la carpeta, del más reciente al más antiguo: {'path', 'size', 'modified'}."""
+    directory = directory or backup_dir()
+    if not os.path.isdir(directory):
+        return []
+    backups = []
+    for name in os.listdir(directory):
+        if name.startswith(BACKUP_PREFIX) and name.endswith((".db", ".db.gz")):
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            backups.append({
+                "path": path,
+                "size": stat.st_size,
+                "modified": datetime.fromtimestamp(stat.st_mtime),
+            })
+    backups.sort(key=lambda backup: backup["modified"], reverse=True)
+    return backups
+
+
+def rotate_backups(keep: int = BACKUP_KEEP, directory: Optional[str] = None) -> List[str]:
+    """
+    Elimina los respaldos más antiguos y deja sólo los ``keep`` más recientes.
+
+    :return: Rutas eliminadas
+    """
+    removed = []
+    for backup in list_backups(directory)[keep:]:
+        os.remove(backup["path"])
+        removed.append(backup["path"])
+    return removed
+
+
+def restore_database(source_path: str, progress: Optional[ProgressCallback] = None) -> str:
+    """
+    Reemplaza la base de datos por un respaldo (.db o .db.gz).
+
+    El archivo se verifica antes de tocar nada (integridad y tablas del
+    sistema) y la base de datos actual se respalda primero en ``backup_dir()``.
+    La copia usa la API de respaldo sobre el archivo abierto, no un
+    reemplazo del archivo, así que el -wal de la base actual no queda
+    desfasado. Corre en el escritor (``write_queue.run_exclusive``), sin
+    ninguna escritura de la aplicación en curso, y no cierra conexiones que
+    otros hilos estén usando: se vencen y cada hilo abre una nueva al
+    liberarlas. Al terminar se vacía la caché de tablas de referencia y se
+    aplican las migraciones pendientes, por si el respaldo es de una versión anterior.
+
+    :param source_path: Respaldo a restaurar
+    :param progress: Avance (fracción, mensaje); sólo se puede cancelar
+        antes de empezar a sobrescribir la base de datos
+    :return: Ruta del respaldo de la base de datos que se reemplazó
+    """
+    from sqlite_cli.database.migrator import run_migrations
+    from sqlite_cli.database.reference_cache import ReferenceCache
+
+    directory = backup_dir()
+    os.makedirs(directory, exist_ok=True)
+    unpacked = None
+    if source_path.endswith(".gz"):
+        if progress:
+            progress(0.0, "Descomprimiendo respaldo...")
+        unpacked = os.path.join(directory, f"restore_{os.getpid()}.part.db")
+        _gunzip(source_path, unpacked)
+
+    try:
+        # La copia corre en el hilo escritor
+        src = sqlite3.connect(f"file:{unpacked or source_path}?mode=ro", uri=True, check_same_thread=False)
+        try:
+            try:
+                tables = {row[0] for row in src.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            except sqlite3.DatabaseError as e:
+                raise BackupError(f"El archivo no es una base de datos válida: {e}")
+            missing = [table for table in REQUIRED_TABLES if table not in tables]
+            if missing:
+                raise BackupError(f"El archivo no es una base de datos del sistema (faltan: {', '.join(missing)})")
+            _check_integrity(src, _report(progress, 0.05, 0.25))
+
+            safety_backup = backup_database(progress=_report(progress, 0.25, 0.6))
+
+            def copy() -> None:
+                dst = sqlite3.connect(get_manager().db_path, timeout=_busy_timeout())
+                try:
+                    _copy_pages(src, dst, _report(progress, 0.6, 0.95))
+                finally:
+                    dst.close()
+                # Antes de la siguiente escritura encolada
+                retire_connections()
+
+            with _lock:
+                run_exclusive(copy)
+        finally:
+            src.close()
+    finally:
+        if unpacked:
+            _remove(unpacked)
+
+    ReferenceCache.invalidate()
+    if progress:
+        progress(0.95, "Aplicando migraciones...")
+    run_migrations()
+    if progress:
+        progress(1.0, "Restauración completada")
+    return safety_backup
+
+
+class BackupScheduler:
+    """
+    Respaldo automático en un hilo de fondo.
+
+    Cada ``SCHEDULE_CHECK_SECONDS`` revisa el respaldo más reciente de la
+    carpeta; si tiene más de ``hours`` horas (o no hay ninguno) hace uno
+    comprimido y rota la carpeta. Los errores se informan y se reintenta en
+    la próxima revisión: un respaldo fallido no debe detener la aplicación.
+    """
+
+    def __init__(self, hours: float = SCHEDULE_HOURS, keep: int = BACKUP_KEEP) -> None:
+        self.hours = hours
+        self.keep = keep
+        self.last_error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.hours <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="backup-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def due(self) -> bool:
+        backups = list_backups()
+        if not backups:
+            return True
+        age = datetime.now() - backups[0]["modified"]
+        return age.total_seconds() >= self.hours * 3600
+
+    def _cancel_on_stop(self, fraction: float, message: str) -> None:
+        if self._stop.is_set():
+            raise BackupCancelled()
+
+    def _run(self) -> None:
+        wait = SCHEDULE_START_DELAY
+        while not self._stop.wait(wait):
+            wait = SCHEDULE_CHECK_SECONDS
+            try:
+                if self.due():
+                    backup_database(progress=self._cancel_on_stop)
+                    rotate_backups(self.keep)
+                self.last_error = None
+            except BackupCancelled:
+                return
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Error en el respaldo automático: {e}")
+
+
+_scheduler: Optional[BackupScheduler] = None
+
+
+def start_backup_scheduler() -> BackupScheduler:
+    """Inicia el respaldo automático del proceso (``SQLITE_CLI_BACKUP_HOURS=0`` lo desactiva)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = BackupScheduler()
+        _scheduler.start()
+    return _scheduler
+
+
+def stop_backup_scheduler() -> None:
+    """Detiene el respaldo automático; un respaldo en curso se cancela y se descarta."""
+    if _scheduler is not None:
+        _scheduler.stop()
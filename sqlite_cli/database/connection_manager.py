@@ -0,0 +1,412 @@
+# database/connection_manager.py
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+from sqlite_cli.database.profiler import ProfiledConnection, get_profiler
+
+# Ruta por defecto de la base de datos (se resuelve una sola vez)
+DEFAULT_DB_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "db.db")
+
+# Perfiles de PRAGMA aplicados a cada conexión nueva
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Perfil normal de la aplicación (POS interactivo)
+    "default": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -16000,   # ~16 MB de caché de páginas
+        "temp_store": "MEMORY",
+        "mmap_size": 67108864,  # 64 MB
+    },
+    # Máxima durabilidad (cada commit sincroniza el disco)
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 10000,
+        "cache_size": -8000,
+        "temp_store": "MEMORY",
+    },
+    # Cargas masivas (semillas, importaciones, benchmarks)
+    "bulk": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "busy_timeout": 30000,
+        "cache_size": -64000,
+        "temp_store": "MEMORY",
+        "mmap_size": 268435456,
+    },
+}
+
+DEFAULT_POOL_SIZE = 4      # Conexiones máximas para hilos de trabajo
+CHECKOUT_TIMEOUT = 10.0    # Segundos de espera por una conexión libre
+
+
+class PooledConnection:
+    """
+    Envoltura de una conexión del pool.
+
+    Se comporta como un ``sqlite3.Connection`` (delegando cursor, execute,
+    commit, rollback, etc.), pero ``close()`` devuelve la conexión al gestor
+    en lugar de cerrarla. Usada como context manager hace commit al salir
+    sin errores, rollback si hubo excepción, y libera la conexión.
+    """
+
+    def __init__(self, manager: "ConnectionManager", conn: sqlite3.Connection) -> None:
+        object.__setattr__(self, "_manager", manager)
+        object.__setattr__(self, "_conn", conn)
+        object.__setattr__(self, "_released", False)
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        """Conexión sqlite3 subyacente."""
+        return self._conn
+
+    def close(self) -> None:
+        """Devuelve la conexión al gestor (no la cierra físicamente)."""
+        if not self._released:
+            object.__setattr__(self, "_released", True)
+            self._manager._release(self._conn)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._conn, name, value)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self.close()
+
+    def __del__(self) -> None:
+        # Si un modelo lanza una excepción antes de llamar a close(),
+        # la conexión vuelve al gestor cuando se recolecta la envoltura.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionManager:
+    """
+    Gestor de conexiones SQLite del proceso.
+
+    - El hilo principal (Tk) mantiene una única conexión de larga vida.
+    - Los hilos de trabajo toman conexiones de un pool acotado y las
+      devuelven al terminar.
+    - Las llamadas anidadas en el mismo hilo reutilizan la misma conexión;
+      al liberar la última se descarta cualquier transacción pendiente.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        pragma_profile: str = "default",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        checkout_timeout: float = CHECKOUT_TIMEOUT
+    ) -> None:
+        if pragma_profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Perfil de PRAGMA desconocido: {pragma_profile}")
+        self.db_path = db_path
+        self.pragma_profile = pragma_profile
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._main_conn: Optional[sqlite3.Connection] = None
+        self._all: List[sqlite3.Connection] = []
+        # Conexiones en uso (checkout o ``bind``) y conexiones vencidas por ``retire()``
+        self._busy: Set[sqlite3.Connection] = set()
+        self._retired: Set[sqlite3.Connection] = set()
+
+    # ------------------------------------------------------------------
+    # Creación de conexiones
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Abre una conexión nueva y le aplica el perfil de PRAGMA. Con el
+        perfilador SQL activo (``database.profiler``) la conexión es perfilada.
+        """
+        pragmas = PRAGMA_PROFILES[self.pragma_profile]
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=pragmas.get("busy_timeout", 5000) / 1000,
+            check_same_thread=False,
+            factory=ProfiledConnection if get_profiler().enabled else sqlite3.Connection
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        with self._lock:
+            self._all.append(conn)
+        return conn
+
+    # ------------------------------------------------------------------
+    # Checkout / liberación
+    # ------------------------------------------------------------------
+    def checkout(self) -> PooledConnection:
+        """
+        Obtiene la conexión del hilo actual.
+
+        :return: Envoltura cuya ``close()`` devuelve la conexión al gestor.
+        """
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.conn = self._acquire()
+        self._local.depth = depth + 1
+        return PooledConnection(self, self._local.conn)
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Toma la conexión del hilo y la marca en uso (``retire()`` no la cierra)."""
+        if threading.current_thread() is threading.main_thread():
+            with self._lock:
+                if self._main_conn is not None:
+                    self._busy.add(self._main_conn)
+                    return self._main_conn
+            main_conn = self._connect()
+            with self._lock:
+                self._main_conn = main_conn
+                self._busy.add(main_conn)
+            return main_conn
+
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise sqlite3.OperationalError(
+                f"No hay conexiones libres en el pool (máximo {self.pool_size})"
+            )
+        try:
+            while True:
+                conn = self._idle.get_nowait()
+                with self._lock:
+                    # Las devueltas al pool justo durante retire() ya no sirven
+                    if any(c is conn for c in self._all):
+                        self._busy.add(conn)
+                        return conn
+        except queue.Empty:
+            pass
+        try:
+            conn = self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._busy.add(conn)
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        depth = getattr(self._local, "depth", 0)
+        if depth <= 0 or getattr(self._local, "conn", None) is not conn:
+            # Liberación desde otro hilo (p. ej. recolección tardía) o
+            # posterior a close_all(): no hay nada que devolver.
+            return
+        self._local.depth = depth - 1
+        if self._local.depth > 0:
+            return
+
+        self._local.conn = None
+        with self._lock:
+            self._busy.discard(conn)
+            retired = conn in self._retired
+            self._retired.discard(conn)
+        if retired:
+            # Vencida por retire() mientras estaba en uso: se cierra ahora
+            self._close_quietly(conn)
+            if threading.current_thread() is not threading.main_thread():
+                self._slots.release()
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.ProgrammingError:
+            # La conexión fue cerrada por close_all()
+            return
+
+        if conn is not self._main_conn:
+            self._idle.put(conn)
+            self._slots.release()
+
+    def open_dedicated(self) -> sqlite3.Connection:
+        """
+        Abre una conexión fuera del pool para un hilo de larga vida (el
+        escritor de ``write_queue``): no ocupa un lugar de los hilos de
+        trabajo. ``close_all()`` también la cierra.
+        """
+        return self._connect()
+
+    def is_open(self, conn: sqlite3.Connection) -> bool:
+        """Indica si ``conn`` es del gestor y sigue abierta (no pasó por ``close_all()``)."""
+        with self._lock:
+            return any(c is conn for c in self._all)
+
+    @contextmanager
+    def bind(self, conn: sqlite3.Connection) -> Iterator[None]:
+        """
+        Usa ``conn`` (de ``open_dedicated``) como conexión del hilo actual
+        durante el bloque: los checkouts del hilo la reutilizan.
+        """
+        with self._lock:
+            self._busy.add(conn)
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            with self._lock:
+                self._busy.discard(conn)
+                retired = conn in self._retired
+                self._retired.discard(conn)
+            if retired:
+                self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """
+        Context manager de checkout sin transacción implícita.
+
+        Ejemplo::
+
+            with manager.connection() as conn:
+                rows = conn.execute("SELECT ...").fetchall()
+        """
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Administración
+    # ------------------------------------------------------------------
+    def retire(self) -> None:
+        """
+        Vence todas las conexiones abiertas sin cerrarlas bajo los pies de
+        quien las usa: las libres se cierran ya, las que están en uso (de
+        cualquier hilo) al liberarse, y cada hilo abre una nueva en su
+        próximo checkout. Se usa tras restaurar un respaldo o al cambiar el
+        tipo de conexión (perfilador SQL).
+        """
+        with self._lock:
+            conns, self._all = self._all, []
+            self._main_conn = None
+            busy = [conn for conn in conns if conn in self._busy]
+            self._retired.update(busy)
+            idle = [conn for conn in conns if conn not in self._busy]
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for conn in idle:
+            self._close_quietly(conn)
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close_all(self) -> None:
+        """Cierra físicamente todas las conexiones abiertas por el gestor."""
+        with self._lock:
+            conns, self._all = self._all, []
+            conns.extend(self._retired)
+            self._retired.clear()
+            self._busy.clear()
+            self._main_conn = None
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._local = threading.local()
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado actual del pool (para diagnóstico)."""
+        with self._lock:
+            opened = len(self._all)
+        return {
+            "db_path": self.db_path,
+            "pragma_profile": self.pragma_profile,
+            "pool_size": self.pool_size,
+            "open_connections": opened,
+            "idle_connections": self._idle.qsize(),
+        }
+
+
+_manager: Optional[ConnectionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_manager() -> ConnectionManager:
+    """Devuelve el gestor de conexiones del proceso (creándolo si hace falta)."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = ConnectionManager(
+                    db_path=os.environ.get("SQLITE_CLI_DB_PATH", DEFAULT_DB_PATH),
+                    pragma_profile=os.environ.get("SQLITE_CLI_PRAGMA_PROFILE", "default")
+                )
+    return _manager
+
+
+def configure(
+    db_path: Optional[str] = None,
+    pragma_profile: Optional[str] = None,
+    pool_size: Optional[int] = None
+) -> ConnectionManager:
+    """
+    Reconfigura el gestor del proceso. Cierra las conexiones existentes.
+
+    :param db_path: Ruta del archivo de base de datos
+    :param pragma_profile: Nombre de un perfil de ``PRAGMA_PROFILES``
+    :param pool_size: Conexiones máximas para hilos de trabajo
+    :return: El nuevo gestor
+    """
+    global _manager
+    with _manager_lock:
+        current = _manager
+        if current is not None:
+            current.close_all()
+        _manager = ConnectionManager(
+            db_path=db_path or (current.db_path if current else DEFAULT_DB_PATH),
+            pragma_profile=pragma_profile or (current.pragma_profile if current else "default"),
+            pool_size=pool_size or (current.pool_size if current else DEFAULT_POOL_SIZE)
+        )
+    return _manager
+
+
+def close_all_connections() -> None:
+    """Cierra todas las conexiones del proceso (p. ej. antes de reemplazar db.db)."""
+    if _manager is not None:
+        _manager.close_all()
+
+
+def retire_connections() -> None:
+    """
+    Vence las conexiones del proceso sin cerrar las que otro hilo está usando
+    (ver ``ConnectionManager.retire``): cada hilo abre una nueva al pedirla.
+    """
+    if _manager is not None:
+        _manager.retire()
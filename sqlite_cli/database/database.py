@@ -1,29 +1,53 @@
 # database/database.py
 import sqlite3
-import os
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional, Sequence
+from sqlite_cli.database.connection_manager import get_manager, PooledConnection
 
-def get_db_connection() -> sqlite3.Connection:
+# Filas leídas del cursor por lote al recorrer consultas grandes
+STREAM_BATCH = 500
+
+def get_db_connection() -> PooledConnection:
     """
-    Obtiene una conexión a la base de datos SQLite.
+    Obtiene una conexión a la base de datos SQLite desde el gestor del proceso.
+    
+    La conexión es reutilizada: ``close()`` la devuelve al pool en lugar de
+    cerrarla, y descarta cualquier transacción no confirmada.
     
     :return: Una conexión a la base de datos SQLite.
     """
-    # Obtener la ruta del directorio actual del script
-    current_dir: str = os.path.dirname(os.path.abspath(__file__))
-    # Construir la ruta completa a la base de datos
-    db_path: str = os.path.join(current_dir, "db.db")
-    
-    # Conectar a la base de datos
-    conn: sqlite3.Connection = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # Para acceder a las filas como diccionarios
-    return conn
+    return get_manager().checkout()
+
+def iter_query(
+    query: str,
+    params: Sequence = (),
+    format_row: Callable[[sqlite3.Row], Any] = dict,
+    batch_size: int = STREAM_BATCH
+) -> Iterator[Any]:
+    """
+    Ejecuta ``query`` y entrega las filas una a una sin materializar el resultado.
+
+    El cursor se lee por lotes de ``batch_size`` filas; la conexión vuelve
+    al pool al agotar el iterador o al cerrarlo antes.
+
+    :param format_row: Convierte cada ``sqlite3.Row`` (por defecto en ``dict``)
+    """
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute(query, tuple(params))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield format_row(row)
+    finally:
+        conn.close()
 
 def init_db() -> None:
     """
     Inicializa la base de datos y crea todas las tablas si no existen.
     """
-    conn: sqlite3.Connection = get_db_connection()
+    conn = get_db_connection()
     cursor: sqlite3.Cursor = conn.cursor()
     
     # Tabla de estados
@@ -422,4 +446,8 @@ def init_db() -> None:
     ''')
     
     conn.commit()
-    conn.close()
\ No newline at end of file
+    conn.close()
+
+    # Migraciones versionadas (índices, columnas nuevas, etc.)
+    from sqlite_cli.database.migrator import run_migrations
+    run_migrations()
@@ -0,0 +1,147 @@
+# database/fts.py
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Límite por defecto de resultados en búsquedas por texto
+SEARCH_LIMIT = 500
+
+# Tokenizador: sin distinción de mayúsculas ni acentos ("inalambrico" encuentra
+# "inalámbrico") e índices de prefijo para búsqueda mientras se escribe.
+FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+# Tablas FTS5 espejo: tabla fuente -> (tabla FTS, columnas indexadas).
+# El rowid de la tabla FTS es el id de la fila fuente.
+FTS_TABLES: Dict[str, Tuple[str, List[str]]] = {
+    "inventory": ("inventory_fts", ["code", "product", "description", "company"]),
+    "customers": ("customers_fts", ["first_name", "last_name", "id_number", "email", "phone", "address"]),
+    "suppliers": ("suppliers_fts", [
+        "code", "id_number", "first_name", "last_name", "address",
+        "phone", "email", "tax_id", "company"
+    ]),
+    "services": ("services_fts", ["code", "name", "description"]),
+}
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_NUMERIC_RE = re.compile(r"^[\d.,\-/]+$")
+
+
+def build_match_query(search_term: str, column: Optional[str] = None) -> Optional[str]:
+    """
+    Convierte lo que escribe el usuario en una expresión MATCH de FTS5.
+
+    Cada palabra se busca como prefijo y todas deben aparecer
+    ("tecl inal" -> ``"tecl"* "inal"*``). Las comillas y operadores del
+    usuario se descartan para que la consulta nunca sea inválida.
+
+    :param search_term: Texto de búsqueda
+    :param column: Restringe la búsqueda a una columna de la tabla FTS
+    :return: Expresión MATCH, o None si el término no tiene palabras
+    """
+    tokens = _TOKEN_RE.findall(search_term or "")
+    if not tokens:
+        return None
+    expression = " ".join(f'"{token}"*' for token in tokens)
+    if column:
+        return f"{column} : ({expression})"
+    return expression
+
+
+def is_numeric_term(search_term: str) -> bool:
+    """Indica si el término parece un número/fecha (no indexado en FTS)."""
+    return bool(_NUMERIC_RE.match(search_term.strip()))
+
+
+def fts_join(source: str, alias: str, match: str) -> Tuple[str, List]:
+    """
+    Fragmento JOIN que limita ``alias`` a las filas que coinciden en FTS.
+
+    Expone ``fts.fts_rank`` (bm25, menor es mejor) para ordenar resultados.
+
+    :param source: Tabla fuente (clave de ``FTS_TABLES``)
+    :param alias: Alias de la tabla fuente en la consulta
+    :param match: Expresión de ``build_match_query``
+    :return: (sql, parámetros)
+    """
+    fts_table = FTS_TABLES[source][0]
+    sql = f'''
+            JOIN (
+                SELECT rowid AS fts_id, rank AS fts_rank
+                FROM {fts_table}
+                WHERE {fts_table} MATCH ?
+            ) fts ON fts.fts_id = {alias}.id
+    '''
+    return sql, [match]
+
+
+def fts_condition(source: str, alias: str, match: str) -> Tuple[str, List]:
+    """
+    Condición WHERE con las filas de ``alias`` que coinciden en FTS. A
+    diferencia de ``fts_join`` se puede combinar con ``OR`` (sin ranking).
+
+    :return: (sql, parámetros)
+    """
+    fts_table = FTS_TABLES[source][0]
+    return f"{alias}.id IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ?)", [match]
+
+
+def source_values(source: str, columns: List[str], row: str) -> str:
+    """
+    Expresiones SQL con los valores FTS de una fila de ``source``, en el
+    orden de ``columns`` (la empresa de un producto sale de su proveedor).
+
+    :param source: Tabla fuente
+    :param columns: Columnas de la tabla FTS
+    :param row: Referencia a la fila: la tabla fuente en un ``SELECT`` o
+        ``new`` en un disparador
+    :return: Lista separada por comas
+    """
+    values = []
+    for column in columns:
+        if source == "inventory" and column == "company":
+            values.append(f"(SELECT company FROM suppliers sp WHERE sp.id = {row}.supplier_id)")
+        else:
+            values.append(f"{row}.{column}")
+    return ", ".join(values)
+
+
+@contextmanager
+def deferred_fts(conn: Any, source: str) -> Iterator[None]:
+    """
+    Suspende los disparadores FTS de alta y modificación de ``source``.
+
+    Indexar fila por fila desde los disparadores es lo más costoso de una
+    carga masiva; dentro del bloque se escriben las filas sin ellos y luego
+    se indexan de una vez con ``refresh_fts``. Los disparadores se quitan y
+    se restauran en la transacción en curso, así que ninguna otra conexión
+    escribe mientras faltan y un ``rollback`` los deja como estaban.
+    """
+    triggers = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN (?, ?)",
+        (f"{source}_fts_ai", f"{source}_fts_au")
+    ).fetchall()
+    for name, _ in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+    try:
+        yield
+    finally:
+        for _, sql in triggers:
+            conn.execute(sql)
+
+
+def refresh_fts(conn: Any, source: str, where: str, params: Tuple = ()) -> None:
+    """
+    Reindexa en FTS las filas de ``source`` que cumplen ``where``.
+
+    :param conn: Conexión (con la transacción de la escritura)
+    :param source: Tabla fuente (clave de ``FTS_TABLES``)
+    :param where: Condición sobre la tabla fuente
+    :param params: Parámetros de la condición
+    """
+    fts_table, columns = FTS_TABLES[source]
+    conn.execute(f'''
+        INSERT OR REPLACE INTO {fts_table} (rowid, {", ".join(columns)})
+        SELECT id, {source_values(source, columns, source)}
+        FROM {source}
+        WHERE {where}
+    ''', params)
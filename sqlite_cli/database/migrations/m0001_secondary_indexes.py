@@ -0,0 +1,59 @@
+# database/migrations/m0001_secondary_indexes.py
+VERSION = 1
+DESCRIPTION = "Índices secundarios para filtros, JOINs y reportes"
+
+# Congelados tal como se publicaron: las migraciones posteriores cambian
+# índices con su propio DDL, nunca editando esta lista.
+_STATEMENTS = [
+    # Inventario: listados por estado ordenados por producto, filtro por proveedor
+    "CREATE INDEX IF NOT EXISTS idx_inventory_status_product ON inventory(status_id, product)",
+    "CREATE INDEX IF NOT EXISTS idx_inventory_supplier ON inventory(supplier_id)",
+
+    # Movimientos de inventario: historial por producto y reporte por fechas
+    "CREATE INDEX IF NOT EXISTS idx_inventory_movements_inventory_created ON inventory_movements(inventory_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_inventory_movements_created ON inventory_movements(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_inventory_movements_type ON inventory_movements(movement_type_id)",
+    "CREATE INDEX IF NOT EXISTS idx_inventory_movements_user ON inventory_movements(user_id)",
+
+    # Facturas: reporte de ventas por rango de fechas y búsqueda por cliente
+    "CREATE INDEX IF NOT EXISTS idx_invoices_issue_date ON invoices(issue_date)",
+    "CREATE INDEX IF NOT EXISTS idx_invoices_customer_issue_date ON invoices(customer_id, issue_date)",
+    "CREATE INDEX IF NOT EXISTS idx_invoices_status ON invoices(status_id)",
+
+    # Detalles y pagos de factura (el de product_id cubre el COUNT del reporte de inventario)
+    "CREATE INDEX IF NOT EXISTS idx_invoice_details_invoice ON invoice_details(invoice_id)",
+    "CREATE INDEX IF NOT EXISTS idx_invoice_details_product ON invoice_details(product_id)",
+    "CREATE INDEX IF NOT EXISTS idx_invoice_details_service_request ON invoice_details(service_request_id)",
+    "CREATE INDEX IF NOT EXISTS idx_invoice_payments_invoice ON invoice_payments(invoice_id)",
+
+    # Solicitudes de servicio y su historial
+    "CREATE INDEX IF NOT EXISTS idx_service_requests_status ON service_requests(status_id)",
+    "CREATE INDEX IF NOT EXISTS idx_service_requests_customer ON service_requests(customer_id)",
+    "CREATE INDEX IF NOT EXISTS idx_service_requests_service ON service_requests(service_id)",
+    "CREATE INDEX IF NOT EXISTS idx_service_requests_employee ON service_requests(employee_id)",
+    "CREATE INDEX IF NOT EXISTS idx_service_requests_request_status ON service_requests(request_status_id)",
+    "CREATE INDEX IF NOT EXISTS idx_service_requests_created ON service_requests(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_service_request_movements_request_created ON service_request_movements(request_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_service_request_movements_created ON service_request_movements(created_at)",
+
+    # Órdenes de compra
+    "CREATE INDEX IF NOT EXISTS idx_purchase_orders_issue_date ON purchase_orders(issue_date)",
+    "CREATE INDEX IF NOT EXISTS idx_purchase_orders_status_issue_date ON purchase_orders(status_id, issue_date)",
+    "CREATE INDEX IF NOT EXISTS idx_purchase_orders_supplier ON purchase_orders(supplier_id)",
+    "CREATE INDEX IF NOT EXISTS idx_purchase_order_details_order ON purchase_order_details(order_id)",
+    "CREATE INDEX IF NOT EXISTS idx_purchase_order_details_product ON purchase_order_details(product_id)",
+
+    # Claves de estado del resto de entidades
+    "CREATE INDEX IF NOT EXISTS idx_customers_status ON customers(status_id)",
+    "CREATE INDEX IF NOT EXISTS idx_suppliers_status ON suppliers(status_id)",
+    "CREATE INDEX IF NOT EXISTS idx_services_status_name ON services(status_id, name)",
+    "CREATE INDEX IF NOT EXISTS idx_users_status ON users(status_id)",
+    "CREATE INDEX IF NOT EXISTS idx_banks_status ON banks(status_id)",
+    "CREATE INDEX IF NOT EXISTS idx_currencies_status ON currencies(status_id)",
+    "CREATE INDEX IF NOT EXISTS idx_taxes_status ON taxes(status_id)",
+]
+
+
+def upgrade(ctx) -> None:
+    for statement in _STATEMENTS:
+        ctx.execute(statement)
@@ -0,0 +1,62 @@
+# database/migrations/m0002_full_text_search.py
+from sqlite_cli.database.fts import source_values
+
+VERSION = 2
+DESCRIPTION = "Tablas FTS5 para inventario, clientes, proveedores y servicios"
+
+# Congelados tal como se publicaron (``fts.FTS_TABLES`` puede cambiar después
+# con otra migración): tokenizador y tabla fuente -> (tabla FTS, columnas)
+_FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+_FTS_TABLES = {
+    "inventory": ("inventory_fts", ["code", "product", "description", "company"]),
+    "customers": ("customers_fts", ["first_name", "last_name", "id_number", "email", "phone", "address"]),
+    "suppliers": ("suppliers_fts", [
+        "code", "id_number", "first_name", "last_name", "address",
+        "phone", "email", "tax_id", "company"
+    ]),
+    "services": ("services_fts", ["code", "name", "description"]),
+}
+
+
+def upgrade(ctx) -> None:
+    for source, (fts_table, columns) in _FTS_TABLES.items():
+        column_list = ", ".join(columns)
+        watched = [c for c in columns if not (source == "inventory" and c == "company")]
+        if source == "inventory":
+            watched.append("supplier_id")
+
+        ctx.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5({column_list}, {_FTS_OPTIONS})")
+        ctx.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {source}_fts_ai AFTER INSERT ON {source} BEGIN
+                INSERT OR REPLACE INTO {fts_table} (rowid, {column_list})
+                VALUES (new.id, {source_values(source, columns, "new")});
+            END
+        ''')
+        ctx.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {source}_fts_au AFTER UPDATE OF {", ".join(watched)} ON {source} BEGIN
+                INSERT OR REPLACE INTO {fts_table} (rowid, {column_list})
+                VALUES (new.id, {source_values(source, columns, "new")});
+            END
+        ''')
+        ctx.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {source}_fts_ad AFTER DELETE ON {source} BEGIN
+                DELETE FROM {fts_table} WHERE rowid = old.id;
+            END
+        ''')
+
+    # La empresa del proveedor también se indexa en cada producto
+    ctx.execute('''
+        CREATE TRIGGER IF NOT EXISTS suppliers_company_inventory_fts_au AFTER UPDATE OF company ON suppliers BEGIN
+            UPDATE inventory_fts SET company = new.company
+            WHERE rowid IN (SELECT id FROM inventory WHERE supplier_id = new.id);
+        END
+    ''')
+
+    # Llenado inicial por lotes (idempotente gracias a INSERT OR REPLACE)
+    for source, (fts_table, columns) in _FTS_TABLES.items():
+        ctx.run_in_batches(source, f'''
+            INSERT OR REPLACE INTO {fts_table} (rowid, {", ".join(columns)})
+            SELECT id, {source_values(source, columns, source)}
+            FROM {source}
+            WHERE id >= ? AND id < ?
+        ''')
@@ -0,0 +1,14 @@
+# database/migrations/m0003_invoice_details_covering_index.py
+VERSION = 3
+DESCRIPTION = "Índice cubriente de invoice_details para los conteos del reporte de ventas"
+
+
+def upgrade(ctx) -> None:
+    # Los conteos de productos/servicios por factura se resuelven sólo con el
+    # índice, sin leer las filas de invoice_details. Reemplaza al índice
+    # simple por invoice_id, que queda como prefijo redundante.
+    ctx.execute('''
+        CREATE INDEX IF NOT EXISTS idx_invoice_details_invoice_items
+        ON invoice_details(invoice_id, product_id, service_request_id)
+    ''')
+    ctx.execute("DROP INDEX IF EXISTS idx_invoice_details_invoice")
@@ -0,0 +1,194 @@
+# database/migrator.py
+import importlib
+import pkgutil
+import re
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database import migrations
+
+BATCH_SIZE = 5000          # Filas por lote en reescrituras grandes
+BATCH_PAUSE = 0.01         # Pausa entre lotes para dejar pasar escrituras del POS
+
+_MODULE_RE = re.compile(r"^m(\d{4})_\w+$")
+
+
+class Migration:
+    """Una migración descubierta en ``sqlite_cli/database/migrations``."""
+
+    def __init__(self, version: int, name: str, description: str, upgrade: Callable) -> None:
+        self.version = version
+        self.name = name
+        self.description = description
+        self.upgrade = upgrade
+
+
+class MigrationContext:
+    """
+    Acceso a la base de datos que recibe ``upgrade(ctx)``.
+
+    Las sentencias de ``execute`` corren dentro de la transacción de la
+    migración. ``run_in_batches`` confirma lo pendiente y procesa la tabla
+    por rangos de ID, cada uno en su propia transacción corta, para no
+    bloquear el punto de venta durante minutos. Las actualizaciones por
+    lotes deben ser idempotentes: si la migración se interrumpe se vuelve
+    a ejecutar completa.
+
+    En modo ``dry_run`` sólo se registran las sentencias.
+    """
+
+    def __init__(self, conn, dry_run: bool = False, batch_size: int = BATCH_SIZE) -> None:
+        self.conn = conn
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.statements: List[str] = []
+        self.rows_processed = 0
+
+    def execute(self, sql: str, params: Sequence = ()) -> None:
+        self.statements.append(" ".join(sql.split()))
+        if not self.dry_run:
+            self.conn.execute(sql, params)
+
+    def table_exists(self, name: str) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?", (name,)
+        ).fetchone()
+        return row is not None
+
+    def column_exists(self, table: str, column: str) -> bool:
+        return any(row[1] == column for row in self.conn.execute(f"PRAGMA table_info({table})"))
+
+    def run_in_batches(self, table: str, sql: str, batch_size: Optional[int] = None) -> int:
+        """
+        Ejecuta ``sql`` por rangos de ``id`` sobre ``table``.
+
+        :param table: Tabla a recorrer (debe tener columna ``id``)
+        :param sql: Sentencia con dos parámetros ``?`` para el rango [desde, hasta)
+        :param batch_size: Filas por lote (por defecto ``BATCH_SIZE``)
+        :return: Número de lotes ejecutados
+        """
+        size = batch_size or self.batch_size
+        bounds = self.conn.execute(f"SELECT MIN(id), MAX(id) FROM {table}").fetchone()
+        self.statements.append(f"[lotes de {size}] " + " ".join(sql.split()))
+        if bounds[0] is None:
+            return 0
+
+        low, high = bounds[0], bounds[1]
+        batches = (high - low) // size + 1
+        if self.dry_run:
+            return batches
+
+        self.conn.commit()
+        for start in range(low, high + 1, size):
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self.conn.execute(sql, (start, start + size))
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.rows_processed += max(cursor.rowcount, 0)
+            time.sleep(BATCH_PAUSE)
+        self.conn.execute("BEGIN IMMEDIATE")
+        return batches
+
+
+def discover_migrations() -> List[Migration]:
+    """Carga los módulos ``mNNNN_*`` del paquete de migraciones, ordenados por versión."""
+    found = []
+    for info in pkgutil.iter_modules(migrations.__path__):
+        match = _MODULE_RE.match(info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{migrations.__name__}.{info.name}")
+        version = getattr(module, "VERSION", int(match.group(1)))
+        if version != int(match.group(1)):
+            raise ValueError(f"La migración {info.name} declara VERSION = {version}")
+        found.append(Migration(version, info.name, getattr(module, "DESCRIPTION", ""), module.upgrade))
+    found.sort(key=lambda m: m.version)
+    return found
+
+
+def get_current_version() -> int:
+    """Versión de esquema registrada en ``PRAGMA user_version``."""
+    conn = get_db_connection()
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def run_migrations(
+    dry_run: bool = False,
+    target: Optional[int] = None,
+    batch_size: int = BATCH_SIZE
+) -> List[Dict]:
+    """
+    Aplica, en orden, las migraciones con versión mayor a la actual.
+
+    Cada migración corre en una transacción ``BEGIN IMMEDIATE`` y al terminar
+    actualiza ``PRAGMA user_version``; si falla se revierte y se detiene.
+
+    :param dry_run: Sólo informa qué se ejecutaría, sin modificar la base de datos
+    :param target: Versión máxima a aplicar (por defecto, todas)
+    :param batch_size: Filas por lote en las reescrituras grandes
+    :return: Reporte por migración: {'version', 'name', 'description',
+             'status', 'seconds', 'statements', 'rows'}
+    """
+    report = []
+    conn = get_db_connection()
+    try:
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        for migration in discover_migrations():
+            if migration.version <= current or (target is not None and migration.version > target):
+                continue
+
+            ctx = MigrationContext(conn, dry_run=dry_run, batch_size=batch_size)
+            started = time.perf_counter()
+            if not dry_run:
+                conn.execute("BEGIN IMMEDIATE")
+            try:
+                migration.upgrade(ctx)
+                if not dry_run:
+                    conn.execute(f"PRAGMA user_version = {migration.version}")
+                    conn.commit()
+            except Exception:
+                if conn.in_transaction:
+                    conn.rollback()
+                report.append(_entry(migration, "error", started, ctx))
+                raise
+            report.append(_entry(migration, "pendiente" if dry_run else "aplicada", started, ctx))
+            current = migration.version
+
+        if report and not dry_run:
+            conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+    return report
+
+
+def _entry(migration: Migration, status: str, started: float, ctx: MigrationContext) -> Dict:
+    return {
+        "version": migration.version,
+        "name": migration.name,
+        "description": migration.description,
+        "status": status,
+        "seconds": time.perf_counter() - started,
+        "statements": list(ctx.statements),
+        "rows": ctx.rows_processed,
+    }
+
+
+def format_report(report: List[Dict]) -> str:
+    """Reporte de tiempos legible para la consola."""
+    if not report:
+        return "La base de datos ya está actualizada."
+    lines = []
+    for entry in report:
+        lines.append(
+            f"{entry['version']:04d} {entry['name']:<40} {entry['status']:<10} "
+            f"{entry['seconds'] * 1000:9.1f} ms  {entry['rows']} filas"
+        )
+    total = sum(entry['seconds'] for entry in report)
+    lines.append(f"Total: {total * 1000:.1f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,91 @@
+# database/pagination.py
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence
+from sqlite_cli.database.database import get_db_connection
+
+# Filas por página por defecto en listados y reportes
+PAGE_SIZE = 200
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Cursor opaco con la clave de orden y el ID de la última fila entregada."""
+    raw = json.dumps([sort_value, row_id], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Inverso de ``encode_cursor``: devuelve [clave de orden, id]."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Cursor de paginación inválido: {cursor!r}") from e
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError(f"Cursor de paginación inválido: {cursor!r}")
+    return values
+
+
+def paginate(
+    query: str,
+    params: Sequence,
+    id_column: str,
+    sort_column: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = PAGE_SIZE,
+    descending: bool = False,
+    with_total: bool = False
+) -> Dict:
+    """
+    Ejecuta ``query`` por páginas usando paginación por clave (keyset).
+
+    En lugar de ``OFFSET`` (que recorre todas las filas anteriores), cada
+    página continúa desde la clave ``(sort_column, id_column)`` de la última
+    fila de la página anterior, así que pedir la página 500 cuesta lo mismo
+    que la primera si hay un índice sobre la clave de orden.
+
+    :param query: ``SELECT ... WHERE ...`` sin ``ORDER BY`` ni ``LIMIT``
+    :param params: Parámetros de ``query``
+    :param id_column: Columna única de desempate (p. ej. ``"i.id"``)
+    :param sort_column: Columna de orden (no nula); ``None`` ordena sólo por ID
+    :param cursor: ``next_cursor`` de la página anterior (``None`` = primera página)
+    :param page_size: Filas por página
+    :param descending: Orden descendente
+    :param with_total: Calcula también el total de filas (una consulta ``COUNT`` extra)
+    :return: {'rows': [...], 'next_cursor': str o None, 'total': int o None}
+    """
+    direction = "DESC" if descending else "ASC"
+    operator = "<" if descending else ">"
+    sort_key = sort_column.split(".")[-1] if sort_column else None
+    id_key = id_column.split(".")[-1]
+
+    page_query = query
+    page_params = list(params)
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        if sort_column:
+            page_query += f" AND ({sort_column}, {id_column}) {operator} (?, ?)"
+            page_params.extend([sort_value, last_id])
+        else:
+            page_query += f" AND {id_column} {operator} ?"
+            page_params.append(last_id)
+
+    order_by = f"{sort_column} {direction}, " if sort_column else ""
+    page_query += f" ORDER BY {order_by}{id_column} {direction} LIMIT ?"
+    # Una fila extra indica si hay página siguiente sin contar el total
+    page_params.append(page_size + 1)
+
+    conn = get_db_connection()
+    try:
+        total = None
+        if with_total:
+            total = conn.execute(f"SELECT COUNT(*) FROM ({query})", list(params)).fetchone()[0]
+        rows = [dict(row) for row in conn.execute(page_query, page_params).fetchall()]
+    finally:
+        conn.close()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(last[sort_key] if sort_key else None, last[id_key])
+    return {"rows": rows, "next_cursor": next_cursor, "total": total}
@@ -0,0 +1,405 @@
+# database/profiler.py
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Any, Deque, Dict, List, Optional
+
+# Activación por entorno: SQLITE_CLI_PROFILE=1 y umbral de consulta lenta en ms
+PROFILE_ENABLED = os.environ.get("SQLITE_CLI_PROFILE", "") not in ("", "0")
+SLOW_QUERY_MS = float(os.environ.get("SQLITE_CLI_SLOW_MS", "100"))
+
+SAMPLES_PER_SHAPE = 500       # Ejecuciones recientes por consulta para el p95
+SLOW_LOG_INTERVAL = 60.0      # Segundos mínimos entre entradas de una misma consulta lenta
+SLOW_LOG_MAX_BYTES = 1024 * 1024
+SLOW_LOG_BACKUPS = 5
+SHAPE_CACHE_SIZE = 4096
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT", "REPLACE")
+
+# Módulos de la capa de datos que no cuentan como "origen" de una consulta
+_INFRA_DIRS = (
+    os.path.dirname(os.path.abspath(__file__)) + os.sep,
+    os.path.dirname(sqlite3.__file__) + os.sep,
+    threading.__file__,
+)
+
+
+def statement_shape(sql: str) -> str:
+    """
+    Forma de una sentencia: literales como ``?``, listas ``IN (?, ?, ...)``
+    colapsadas y espacios normalizados, para agrupar sus ejecuciones.
+    """
+    shape = _STRING_RE.sub("?", sql)
+    shape = _NUMBER_RE.sub("?", shape)
+    shape = _IN_LIST_RE.sub("(?, ...)", shape)
+    return _SPACE_RE.sub(" ", shape).strip()
+
+
+def _caller() -> str:
+    """
+    Método que originó la consulta: el primer marco fuera de la capa de
+    datos o, si no hay ninguno (sentencias propias del escritor), el hilo.
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_INFRA_DIRS):
+            code = frame.f_code
+            return getattr(code, "co_qualname", code.co_name)
+        frame = frame.f_back
+    return threading.current_thread().name
+
+
+class _ShapeStats:
+    __slots__ = ("shape", "calls", "seconds", "rows", "slow", "samples", "callers", "last_logged")
+
+    def __init__(self, shape: str) -> None:
+        self.shape = shape
+        self.calls = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.slow = 0
+        # Cada muestra es [segundos]: las lecturas posteriores suman a la suya
+        self.samples: Deque[List[float]] = deque(maxlen=SAMPLES_PER_SHAPE)
+        self.callers: Counter = Counter()
+        self.last_logged = 0.0
+
+
+class _Execution:
+    """Ejecución en curso de un cursor: se completa con sus lecturas."""
+    __slots__ = ("stats", "sql", "params", "sample", "rows", "caller", "expanded")
+
+    def __init__(self, stats: _ShapeStats, sql: str, params: Any, sample: List[float], caller: str) -> None:
+        self.stats = stats
+        self.sql = sql
+        self.params = params
+        self.sample = sample
+        self.rows = 0
+        self.caller = caller
+        self.expanded: Optional[str] = None
+
+
+class QueryProfiler:
+    """
+    Perfilador de consultas de la capa ``sqlite_cli``.
+
+    Con el perfilador activo, el gestor de conexiones abre
+    ``ProfiledConnection``: cada sentencia se agrupa por su forma
+    (``statement_shape``) y acumula llamadas, tiempo total (ejecución más
+    lectura de filas), p95, filas devueltas y los métodos que la originan.
+    Las ejecuciones que superan ``slow_ms`` se escriben, con su
+    ``EXPLAIN QUERY PLAN``, en un log rotativo junto a la base de datos.
+    ``set_trace_callback`` aporta el texto con los parámetros ya expandidos
+    y las sentencias que no pasan por ``execute`` (scripts y triggers).
+    """
+
+    def __init__(self, enabled: bool = PROFILE_ENABLED, slow_ms: float = SLOW_QUERY_MS) -> None:
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _ShapeStats] = {}
+        self._shapes: Dict[str, str] = {}
+        self._local = threading.local()
+        self._logger: Optional[logging.Logger] = None
+        self._log_path: Optional[str] = None
+
+    # --- Registro (lo llaman las conexiones perfiladas) ----------------
+
+    def begin(self, sql: str, params: Any, seconds: float, rows: int = 0) -> _Execution:
+        shape = self._shapes.get(sql)
+        if shape is None:
+            shape = statement_shape(sql)
+            if len(self._shapes) < SHAPE_CACHE_SIZE:
+                self._shapes[sql] = shape
+        caller = _caller()
+        sample = [seconds]
+        with self._lock:
+            stats = self._stats.get(shape)
+            if stats is None:
+                stats = self._stats[shape] = _ShapeStats(shape)
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.rows += rows
+            stats.samples.append(sample)
+            stats.callers[caller] += 1
+        execution = _Execution(stats, sql, params, sample, caller)
+        execution.rows = rows
+        return execution
+
+    def add_rows(self, execution: _Execution, seconds: float, rows: int) -> None:
+        execution.rows += rows
+        with self._lock:
+            execution.stats.seconds += seconds
+            execution.stats.rows += rows
+            execution.sample[0] += seconds
+
+    def finish(self, execution: _Execution, conn: sqlite3.Connection) -> None:
+        """Cierra una ejecución (filas agotadas, cursor reutilizado o liberado) y la registra si fue lenta."""
+        elapsed_ms = execution.sample[0] * 1000
+        if elapsed_ms < self.slow_ms:
+            return
+        stats = execution.stats
+        now = time.monotonic()
+        with self._lock:
+            stats.slow += 1
+            if now - stats.last_logged < SLOW_LOG_INTERVAL:
+                return
+            stats.last_logged = now
+        self._log_slow(execution, elapsed_ms, conn)
+
+    def trace(self, statement: str) -> None:
+        """``set_trace_callback``: guarda el texto expandido o registra sentencias sin medir."""
+        if getattr(self._local, "depth", 0):
+            self._local.expanded = statement
+        elif self.enabled and not statement.startswith("--"):
+            # executescript y similares: se cuentan, sin tiempo
+            self.begin(statement, None, 0.0)
+
+    def enter(self) -> None:
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        self._local.expanded = None
+
+    def leave(self) -> Optional[str]:
+        self._local.depth -= 1
+        return getattr(self._local, "expanded", None)
+
+    # --- Consulta de resultados --------------------------------------
+
+    def stats(self, limit: Optional[int] = None) -> List[Dict]:
+        """Consultas ordenadas por tiempo total: shape, calls, total_ms, avg_ms, p95_ms, rows, slow, caller."""
+        with self._lock:
+            snapshot = [
+                (s.shape, s.calls, s.seconds, s.rows, s.slow, [sample[0] for sample in s.samples],
+                 s.callers.most_common(3))
+                for s in self._stats.values()
+            ]
+        result = []
+        for shape, calls, seconds, rows, slow, samples, callers in snapshot:
+            samples.sort()
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0
+            result.append({
+                "shape": shape,
+                "calls": calls,
+                "total_ms": round(seconds * 1000, 2),
+                "avg_ms": round(seconds * 1000 / calls, 3) if calls else 0.0,
+                "p95_ms": round(p95 * 1000, 3),
+                "rows": rows,
+                "slow": slow,
+                "caller": callers[0][0] if callers else "?",
+                "callers": [{"caller": name, "calls": count} for name, count in callers],
+            })
+        result.sort(key=lambda row: row["total_ms"], reverse=True)
+        return result[:limit] if limit else result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+        self.started_at = datetime.now()
+
+    @property
+    def log_path(self) -> str:
+        """Log de consultas lentas: ``logs/slow_queries.log`` junto a la base de datos."""
+        if self._log_path is None:
+            from sqlite_cli.database.connection_manager import get_manager
+            directory = os.path.join(os.path.dirname(os.path.abspath(get_manager().db_path)), "logs")
+            self._log_path = os.path.join(directory, "slow_queries.log")
+        return self._log_path
+
+    # --- Internos ----------------------------------------------------
+
+    def _get_logger(self) -> logging.Logger:
+        if self._logger is None:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            logger = logging.getLogger("sqlite_cli.slow_queries")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            handler = RotatingFileHandler(
+                self.log_path, maxBytes=SLOW_LOG_MAX_BYTES, backupCount=SLOW_LOG_BACKUPS, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
+
+    def _log_slow(self, execution: _Execution, elapsed_ms: float, conn: sqlite3.Connection) -> None:
+        lines = [
+            f"{elapsed_ms:.1f} ms | {execution.caller} | {execution.rows} filas",
+            # Texto con los parámetros ya sustituidos (set_trace_callback) si está disponible
+            f"  SQL: {_SPACE_RE.sub(' ', execution.expanded or execution.sql).strip()}",
+        ]
+        if execution.params and not execution.expanded:
+            lines.append(f"  Parámetros: {execution.params!r}"[:500])
+        lines.extend(f"  Plan: {step}" for step in self._query_plan(execution, conn))
+        try:
+            self._get_logger().info("\n".join(lines))
+        except OSError:
+            pass
+
+    def _query_plan(self, execution: _Execution, conn: sqlite3.Connection) -> List[str]:
+        sql = execution.sql.lstrip()
+        if not sql[:7].upper().startswith(_EXPLAINABLE) or isinstance(execution.params, list):
+            return []
+        self.enter()
+        try:
+            # Cursor base: el plan no se vuelve a perfilar
+            cursor = sqlite3.Cursor(conn)
+            rows = cursor.execute(f"EXPLAIN QUERY PLAN {sql}", execution.params or ()).fetchall()
+            return [row[3] for row in rows]
+        except sqlite3.Error:
+            return []
+        finally:
+            self.leave()
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor que mide sus ejecuciones y lecturas en el perfilador."""
+
+    _execution: Optional[_Execution] = None
+
+    def execute(self, sql: str, parameters: Any = ()) -> "ProfiledCursor":
+        return self._run(super().execute, sql, parameters, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> "ProfiledCursor":
+        # Los parámetros de un lote no se guardan (no se usan para el plan)
+        return self._run(super().executemany, sql, seq_of_parameters, [])
+
+    def _run(self, method: Any, sql: str, parameters: Any, logged_params: Any) -> "ProfiledCursor":
+        self._finish()
+        profiler = get_profiler()
+        if not profiler.enabled:
+            method(sql, parameters)
+            return self
+        profiler.enter()
+        started = time.perf_counter()
+        try:
+            method(sql, parameters)
+        finally:
+            expanded = profiler.leave()
+        self._execution = profiler.begin(sql, logged_params, time.perf_counter() - started)
+        if logged_params is parameters:
+            self._execution.expanded = expanded
+        if self.description is None:
+            # Sin filas que leer (INSERT, UPDATE sin RETURNING, PRAGMA de escritura...)
+            self._finish()
+        return self
+
+    def _read(self, started: float, rows: int, exhausted: bool) -> None:
+        execution = self._execution
+        if execution is not None:
+            get_profiler().add_rows(execution, time.perf_counter() - started, rows)
+            if exhausted:
+                self._finish()
+
+    def _finish(self) -> None:
+        execution = self._execution
+        if execution is not None:
+            self._execution = None
+            get_profiler().finish(execution, self.connection)
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._read(started, 0 if row is None else 1, row is None)
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        started = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._read(started, len(rows), not rows)
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._read(started, len(rows), True)
+        return rows
+
+    def __next__(self) -> Any:
+        started = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._read(started, 0, True)
+            raise
+        self._read(started, 1, False)
+        return row
+
+    def close(self) -> None:
+        self._finish()
+        super().close()
+
+    def __del__(self) -> None:
+        # Cursores que no se leyeron hasta el final (p. ej. un solo ``fetchone``)
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Conexión cuyos cursores (y ``execute`` directos) pasan por el perfilador."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.set_trace_callback(get_profiler().trace)
+
+    def cursor(self, factory: type = ProfiledCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def format_stats(stats: List[Dict]) -> str:
+    """Tabla de texto de ``QueryProfiler.stats`` (CLI y log)."""
+    lines = [f"{'llamadas':>8} {'total ms':>10} {'p95 ms':>8} {'filas':>8} {'lentas':>6}  origen / consulta"]
+    for row in stats:
+        lines.append(
+            f"{row['calls']:>8} {row['total_ms']:>10.1f} {row['p95_ms']:>8.2f} {row['rows']:>8} {row['slow']:>6}"
+            f"  {row['caller']}\n{'':>45}{row['shape'][:100]}"
+        )
+    return "\n".join(lines)
+
+
+_profiler: Optional[QueryProfiler] = None
+
+
+def get_profiler() -> QueryProfiler:
+    """Perfilador del proceso (activo si ``SQLITE_CLI_PROFILE=1``)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = QueryProfiler()
+    return _profiler
+
+
+def set_profiling(enabled: bool, slow_ms: Optional[float] = None) -> None:
+    """
+    Activa o desactiva el perfilador en caliente (pantalla de configuración).
+
+    Las conexiones abiertas se vencen (las que están en uso, al liberarse)
+    para que las nuevas se abran con (o sin) ``ProfiledConnection``:
+    desactivado no queda ningún costo.
+    """
+    from sqlite_cli.database.connection_manager import retire_connections
+
+    profiler = get_profiler()
+    if slow_ms is not None:
+        profiler.slow_ms = slow_ms
+    if profiler.enabled != enabled:
+        profiler.enabled = enabled
+        retire_connections()
@@ -0,0 +1,136 @@
+# database/query_plan_check.py
+import re
+from typing import Callable, Dict, List, Set, Tuple
+from sqlite_cli.database.database import get_db_connection
+
+# Tablas grandes: un "SCAN" sobre ellas en una consulta caliente es un error.
+# Las tablas de catálogo (status, invoice_status, movement_types, ...) y las
+# del personal (users, person) son pequeñas: con estadísticas reales SQLite
+# prefiere recorrerlas como bucle externo, y se permite.
+LARGE_TABLES = {
+    "inventory", "inventory_movements", "customers", "suppliers", "services",
+    "service_requests", "service_request_movements", "invoices",
+    "invoice_details", "invoice_payments", "purchase_orders",
+    "purchase_order_details",
+}
+
+# Reportes que por diseño listan una tabla completa: llamada -> tablas permitidas.
+# Así el resultado de la revisión no depende de los datos de la base.
+FULL_SCAN_ALLOWED: Dict[str, Set[str]] = {
+    # Todos los productos activos, sin filtros
+    "InventoryReport.get_inventory_report": {"inventory"},
+}
+
+_SCAN_RE = re.compile(r"^SCAN (\w+)(?: AS (\w+))?")
+
+
+def _hot_calls() -> List[Tuple[str, Callable[[], object]]]:
+    """Llamadas de modelo representativas de las consultas frecuentes."""
+    from sqlite_cli.models.inventory_model import InventoryItem
+    from sqlite_cli.models.inventory_movement_model import InventoryMovement
+    from sqlite_cli.models.customer_model import Customer
+    from sqlite_cli.models.supplier_model import Supplier
+    from sqlite_cli.models.service_model import Service
+    from sqlite_cli.models.service_request_model import ServiceRequest
+    from sqlite_cli.models.invoice_model import Invoice
+    from sqlite_cli.models.purchase_order_model import PurchaseOrder
+    from sqlite_cli.models.sales_report_model import SalesReport
+    from sqlite_cli.models.inventory_report_model import InventoryReport
+    from sqlite_cli.models.service_request_query import ServiceRequestQuery
+    from sqlite_cli.models.purchase_order_report_model import PurchaseOrderReport
+    from sqlite_cli.database.pagination import encode_cursor
+
+    return [
+        ("InventoryItem.all", InventoryItem.all),
+        ("InventoryItem.get_by_id", lambda: InventoryItem.get_by_id(1)),
+        ("InventoryItem.get_by_code", lambda: InventoryItem.get_by_code("PROD001")),
+        ("InventoryItem.page_active", lambda: InventoryItem.page_active(cursor=encode_cursor("M", 1))),
+        ("InventoryMovement.get_by_inventory", lambda: InventoryMovement.get_by_inventory(1)),
+        ("InventoryMovement.page",
+         lambda: InventoryMovement.page(inventory_id=1, cursor=encode_cursor("2024-01-31", 10))),
+        ("Customer.get_by_id_number", lambda: Customer.get_by_id_number("V-1")),
+        ("Customer.search_active", lambda: Customer.search_active("ana")),
+        ("Supplier.search_active", lambda: Supplier.search_active("acme")),
+        ("Service.search_active", lambda: Service.search_active("rep")),
+        ("ServiceRequest.get_by_id", lambda: ServiceRequest.get_by_id(1)),
+        ("Invoice.get_details", lambda: Invoice.get_details(1)),
+        ("Invoice.get_payments", lambda: Invoice.get_payments(1)),
+        ("Invoice.search", lambda: Invoice.search(customer_id=1)),
+        ("Invoice.page", lambda: Invoice.page(cursor=encode_cursor("2024-01-31", 10))),
+        ("PurchaseOrder.get_order_details", lambda: PurchaseOrder.get_order_details(1)),
+        ("SalesReport.get_sales_report", lambda: SalesReport.get_sales_report("2024-01-01", "2024-01-31")),
+        ("SalesReport.get_invoice_details", lambda: SalesReport.get_invoice_details(1)),
+        ("InventoryReport.get_inventory_report", InventoryReport.get_inventory_report),
+        ("InventoryReport.get_inventory_movements_report",
+         lambda: InventoryReport.get_inventory_movements_report(start_date="2024-01-01", end_date="2024-01-31")),
+        ("InventoryReport.get_inventory_movements_report(inventory_id)",
+         lambda: InventoryReport.get_inventory_movements_report(inventory_id=1)),
+        ("ServiceRequestQuery.get_service_requests_report",
+         lambda: ServiceRequestQuery.get_service_requests_report(customer_id=1)),
+        ("ServiceRequestQuery.get_service_request_movements_report",
+         lambda: ServiceRequestQuery.get_service_request_movements_report(request_id=1)),
+        ("PurchaseOrderReport.get_purchase_orders_report",
+         lambda: PurchaseOrderReport.get_purchase_orders_report("2024-01-01", "2024-01-31")),
+        ("PurchaseOrderReport.get_order_details", lambda: PurchaseOrderReport.get_order_details(1)),
+    ]
+
+
+def _table_aliases(sql: str) -> Dict[str, str]:
+    """Mapea alias -> tabla a partir de las cláusulas FROM/JOIN."""
+    aliases = {}
+    for table, alias in re.findall(r"(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", sql, re.IGNORECASE):
+        if alias and alias.upper() not in ("ON", "WHERE", "LEFT", "JOIN", "ORDER", "GROUP", "INNER"):
+            aliases[alias] = table
+        aliases[table] = table
+    return aliases
+
+
+def _full_scans(conn, sql: str, allowed: Set[str] = frozenset()) -> List[str]:
+    """Devuelve las líneas del plan que recorren completa una tabla grande (salvo ``allowed``)."""
+    aliases = _table_aliases(sql)
+    scans = []
+    for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall():
+        detail = row[3]
+        match = _SCAN_RE.match(detail)
+        if not match:
+            continue
+        name = match.group(2) or match.group(1)
+        table = aliases.get(name, match.group(1))
+        if table in LARGE_TABLES and table not in allowed:
+            scans.append(detail)
+    return scans
+
+
+def check_query_plans() -> List[Dict]:
+    """
+    Ejecuta las consultas frecuentes de los modelos y revisa su plan.
+
+    Las sentencias se capturan con ``set_trace_callback`` mientras se
+    invoca cada método de modelo y se analizan con ``EXPLAIN QUERY PLAN``.
+
+    :return: Lista de problemas: {'call', 'sql', 'scans'}; vacía si todo usa índices
+    """
+    conn = get_db_connection()
+    captured: List[str] = []
+    conn.set_trace_callback(captured.append)
+    problems = []
+    try:
+        for label, call in _hot_calls():
+            captured.clear()
+            try:
+                call()
+            except Exception:
+                # Sin datos algunas llamadas fallan después de consultar;
+                # lo importante son las sentencias ya capturadas.
+                pass
+            statements = [s for s in captured if s.lstrip().upper().startswith("SELECT")]
+            conn.set_trace_callback(None)
+            for sql in statements:
+                scans = _full_scans(conn, sql, FULL_SCAN_ALLOWED.get(label, set()))
+                if scans:
+                    problems.append({"call": label, "sql": " ".join(sql.split()), "scans": scans})
+            conn.set_trace_callback(captured.append)
+    finally:
+        conn.set_trace_callback(None)
+        conn.close()
+    return problems
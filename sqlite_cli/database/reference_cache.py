@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from sqlite_cli.database.connection_manager import get_manager
+from sqlite_cli.database.database import get_db_connection
+
+# Consulta que carga completa cada tabla de referencia (son tablas pequeñas
+# que cambian muy poco: impuestos, monedas, estados y tipos)
+REFERENCE_QUERIES: Dict[str, str] = {
+    "taxes": '''
+        SELECT t.*, s.name as status_name
+        FROM taxes t
+        JOIN status s ON t.status_id = s.id
+    ''',
+    "currencies": '''
+        SELECT c.*, s.name as status_name
+        FROM currencies c
+        JOIN status s ON c.status_id = s.id
+    ''',
+    "status": 'SELECT * FROM status',
+    "movement_types": 'SELECT * FROM movement_types',
+    "invoice_types": 'SELECT * FROM invoice_types',
+    "invoice_status": 'SELECT * FROM invoice_status',
+    "request_status": 'SELECT * FROM request_status',
+    "purchase_order_status": 'SELECT * FROM purchase_order_status',
+    "service_request_movement_types": 'SELECT * FROM service_request_movement_types',
+}
+
+# Segundos que se sirven de la caché las tablas que el usuario edita desde
+# cualquier terminal; al vencer se releen y así se ven los cambios hechos en
+# otro equipo. Las demás solo cambian con migraciones.
+REFERENCE_TTL: Dict[str, float] = {
+    "taxes": 10.0,
+    "currencies": 10.0,
+}
+
+# Tablas cuyas filas incluyen datos de otra (``status_name``)
+_DEPENDENTS: Dict[str, tuple] = {
+    "status": ("taxes", "currencies"),
+}
+
+
+class ReferenceCache:
+    """
+    Caché en memoria de las tablas de referencia, compartida por todos los modelos.
+
+    Cada tabla se carga completa la primera vez que se consulta y se
+    indexa por columna a demanda (``name``, ``id``...). Los modelos invalidan
+    su tabla al escribir; las de ``REFERENCE_TTL`` además se releen al vencer
+    su plazo (cambios de otras terminales) y toda la caché se vacía sola si
+    se reconfigura el gestor de conexiones (otra base de datos).
+
+    Se devuelven copias de las filas: modificarlas no altera la caché.
+    """
+
+    _lock = threading.RLock()
+    _rows: Dict[str, List[Dict]] = {}
+    _loaded_at: Dict[str, float] = {}
+    _indexes: Dict[tuple, Dict[Any, Dict]] = {}
+    _manager: Optional[object] = None
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def all(table: str) -> List[Dict]:
+        """Todas las filas de la tabla de referencia, en el orden de la consulta."""
+        return [dict(row) for row in ReferenceCache._load(table)]
+
+    @staticmethod
+    def get(table: str, value: Any, column: str = "name") -> Optional[Dict]:
+        """
+        Primera fila cuya ``column`` es igual a ``value`` (como ``LIMIT 1``).
+
+        :param table: Tabla de ``REFERENCE_QUERIES``
+        :param value: Valor buscado
+        :param column: Columna de búsqueda (por defecto ``name``)
+        :return: Copia de la fila o None
+        """
+        with ReferenceCache._lock:
+            rows = ReferenceCache._load(table)
+            index = ReferenceCache._indexes.get((table, column))
+            if index is None:
+                index = {}
+                for row in rows:
+                    index.setdefault(row.get(column), row)
+                ReferenceCache._indexes[(table, column)] = index
+            row = index.get(value)
+        return dict(row) if row is not None else None
+
+    @staticmethod
+    def invalidate(*tables: str) -> None:
+        """
+        Descarta las tablas indicadas (y las que dependen de ellas).
+        Sin argumentos vacía toda la caché.
+        """
+        with ReferenceCache._lock:
+            if not tables:
+                ReferenceCache._rows.clear()
+                ReferenceCache._loaded_at.clear()
+                ReferenceCache._indexes.clear()
+                return
+            targets = set(tables)
+            for table in tables:
+                targets.update(_DEPENDENTS.get(table, ()))
+            for table in targets:
+                ReferenceCache._rows.pop(table, None)
+                ReferenceCache._loaded_at.pop(table, None)
+            for key in [key for key in ReferenceCache._indexes if key[0] in targets]:
+                del ReferenceCache._indexes[key]
+
+    @staticmethod
+    def _load(table: str) -> List[Dict]:
+        if table not in REFERENCE_QUERIES:
+            raise ValueError(f"Tabla de referencia desconocida: {table}")
+        with ReferenceCache._lock:
+            manager = get_manager()
+            if manager is not ReferenceCache._manager:
+                ReferenceCache.invalidate()
+                ReferenceCache._manager = manager
+            ttl = REFERENCE_TTL.get(table)
+            loaded_at = ReferenceCache._loaded_at.get(table)
+            if ttl is not None and loaded_at is not None and time.monotonic() - loaded_at > ttl:
+                ReferenceCache.invalidate(table)
+            rows = ReferenceCache._rows.get(table)
+            if rows is not None:
+                ReferenceCache.hits += 1
+                return rows
+            ReferenceCache.misses += 1
+            conn = get_db_connection()
+            try:
+                rows = [dict(row) for row in conn.execute(REFERENCE_QUERIES[table]).fetchall()]
+            finally:
+                conn.close()
+            ReferenceCache._rows[table] = rows
+            ReferenceCache._loaded_at[table] = time.monotonic()
+            return rows
@@ -0,0 +1,105 @@
+# database/unit_of_work.py
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from sqlite_cli.database.connection_manager import get_manager, PooledConnection
+from sqlite_cli.database.reference_cache import REFERENCE_QUERIES, ReferenceCache
+
+
+class UnitOfWork:
+    """
+    Agrupa varias escrituras en una sola transacción.
+
+    Todas las sentencias se ejecutan sobre la misma conexión; el commit (o el
+    rollback si algo falla) lo hace ``unit_of_work()`` al salir del bloque.
+    También memoriza las búsquedas de catálogos por nombre (tipos de
+    movimiento, estados...) para no repetirlas en cada línea.
+    """
+
+    def __init__(self, conn: PooledConnection) -> None:
+        self.conn = conn
+        self._lookups: Dict[Tuple[str, str, Any], Optional[Dict]] = {}
+
+    def execute(self, query: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Ejecuta una sentencia dentro de la transacción."""
+        return self.conn.execute(query, params)
+
+    def executemany(self, query: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Ejecuta una sentencia para un lote de filas.
+
+        :return: Número de filas afectadas
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        return self.conn.executemany(query, rows).rowcount
+
+    def insert(self, query: str, params: Sequence[Any] = ()) -> int:
+        """Ejecuta un INSERT y devuelve el ID de la fila creada."""
+        return self.conn.execute(query, params).lastrowid
+
+    def fetchone(self, query: str, params: Sequence[Any] = ()) -> Optional[Dict]:
+        row = self.conn.execute(query, params).fetchone()
+        return dict(row) if row else None
+
+    def fetchall(self, query: str, params: Sequence[Any] = ()) -> List[Dict]:
+        return [dict(row) for row in self.conn.execute(query, params).fetchall()]
+
+    def lookup(self, table: str, value: Any, column: str = "name") -> Optional[Dict]:
+        """
+        Busca una fila de catálogo por columna (por defecto ``name``).
+
+        Las tablas de referencia se leen de ``ReferenceCache`` (compartida
+        entre operaciones); el resto se guarda durante la vida de la unidad
+        de trabajo.
+        """
+        if table in REFERENCE_QUERIES:
+            return ReferenceCache.get(table, value, column)
+        key = (table, column, value)
+        if key not in self._lookups:
+            self._lookups[key] = self.fetchone(
+                f"SELECT * FROM {table} WHERE {column} = ? LIMIT 1", (value,)
+            )
+        return self._lookups[key]
+
+
+@contextmanager
+def unit_of_work(immediate: bool = True) -> Iterator[UnitOfWork]:
+    """
+    Abre una transacción atómica sobre la conexión del hilo actual.
+
+    Con ``immediate=True`` se usa ``BEGIN IMMEDIATE`` para tomar el bloqueo de
+    escritura al inicio y no fallar a mitad de la venta. Si ya hay una
+    transacción abierta en la conexión se usa un SAVEPOINT anidado.
+
+    Ejemplo::
+
+        with unit_of_work() as uow:
+            invoice_id = uow.insert("INSERT INTO invoices ...", (...))
+            uow.executemany("INSERT INTO invoice_details ...", rows)
+    """
+    conn = get_manager().checkout()
+    nested = conn.in_transaction
+    try:
+        if nested:
+            conn.execute("SAVEPOINT unit_of_work")
+        else:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+
+        try:
+            yield UnitOfWork(conn)
+        except BaseException:
+            if nested:
+                conn.execute("ROLLBACK TO SAVEPOINT unit_of_work")
+                conn.execute("RELEASE SAVEPOINT unit_of_work")
+            else:
+                conn.rollback()
+            raise
+
+        if nested:
+            conn.execute("RELEASE SAVEPOINT unit_of_work")
+        else:
+            conn.commit()
+    finally:
+        conn.close()
@@ -0,0 +1,365 @@
+# database/write_queue.py
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from sqlite_cli.database.connection_manager import ConnectionManager, get_manager
+from sqlite_cli.database.unit_of_work import UnitOfWork, unit_of_work
+
+GROUP_MAX_JOBS = 64      # Trabajos que como máximo comparten un commit
+WRITE_TIMEOUT = 60.0     # Segundos que ``write_transaction`` espera su resultado
+METRICS_WINDOW = 1000    # Trabajos recientes sobre los que se calculan las esperas
+
+# Trabajo de escritura: recibe la unidad de trabajo del escritor y devuelve su resultado
+WriteJob = Callable[[UnitOfWork], Any]
+
+_STOP = object()
+
+
+class _Exclusive:
+    """Operación que el escritor ejecuta sola, sin lote ni transacción abierta."""
+
+    def __init__(self, operation: Callable[[], Any]) -> None:
+        self.operation = operation
+
+
+class WriteQueue:
+    """
+    Hilo escritor único del proceso.
+
+    Todas las transacciones de escritura que se encolan aquí se ejecutan,
+    en orden de llegada, en un solo hilo con su propia conexión: no compiten
+    entre sí por el bloqueo de escritura de SQLite, así que no hay
+    "database is locked" ni reintentos con pausas en el hilo de Tk.
+
+    Commit agrupado: los trabajos que ya esperan en la cola cuando el
+    escritor queda libre (hasta ``GROUP_MAX_JOBS``) se ejecutan dentro de
+    un mismo ``BEGIN IMMEDIATE ... COMMIT``, cada uno en su SAVEPOINT. Si un
+    trabajo falla sólo se revierte lo suyo; el resto se confirma. Los
+    resultados se entregan (``Future``) después del commit.
+    """
+
+    def __init__(self, group_max_jobs: int = GROUP_MAX_JOBS) -> None:
+        self.group_max_jobs = group_max_jobs
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_manager: Optional[ConnectionManager] = None
+
+        # Métricas
+        self._waits: Deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_batch = 0
+        self._busy_seconds = 0.0
+
+    def submit(self, job: WriteJob) -> Future:
+        """
+        Encola una transacción de escritura.
+
+        El trabajo debe escribir sólo con la ``UnitOfWork`` que recibe (sin
+        ``commit()`` propios). Si se llama desde el propio escritor (un
+        trabajo que encola otro) se ejecuta en el acto, dentro de la misma
+        transacción.
+
+        :return: Future con el valor devuelto por ``job`` (o su excepción)
+        """
+        future: Future = Future()
+        if threading.current_thread() is self._thread:
+            future.set_running_or_notify_cancel()
+            try:
+                with unit_of_work() as uow:
+                    future.set_result(job(uow))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        self._ensure_started()
+        with self._lock:
+            self._submitted += 1
+        self._queue.put((job, future, time.perf_counter()))
+        return future
+
+    def submit_exclusive(self, operation: Callable[[], Any]) -> Future:
+        """
+        Encola una operación que debe correr sin ninguna escritura en curso
+        (p. ej. copiar un respaldo sobre la base al restaurar).
+
+        El escritor termina el lote anterior, ejecuta ``operation()`` sin
+        transacción propia abierta y sólo después sigue con la cola: ninguna
+        escritura de la aplicación se intercala con ella.
+
+        :return: Future con el valor devuelto por ``operation`` (o su excepción)
+        """
+        future: Future = Future()
+        if threading.current_thread() is self._thread:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(operation())
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        self._ensure_started()
+        with self._lock:
+            self._submitted += 1
+        self._queue.put((_Exclusive(operation), future, time.perf_counter()))
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado de la cola (para diagnóstico): profundidad, esperas en ms y commits agrupados."""
+        with self._lock:
+            waits = sorted(self._waits)
+            batches = self._batches
+            stats = {
+                "queue_depth": self._queue.qsize(),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "batches": batches,
+                "max_batch": self._max_batch,
+                "avg_batch": round((self._completed + self._failed) / batches, 2) if batches else 0.0,
+                "busy_seconds": round(self._busy_seconds, 3),
+            }
+        stats["wait_ms_p50"] = round(waits[len(waits) // 2] * 1000, 2) if waits else 0.0
+        stats["wait_ms_p95"] = round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 2) if waits else 0.0
+        stats["wait_ms_max"] = round(waits[-1] * 1000, 2) if waits else 0.0
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Termina los trabajos ya encolados y detiene el hilo (al cerrar la aplicación)."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        if wait:
+            thread.join()
+
+    # --- Internos ----------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        pending = None
+        while True:
+            first = pending if pending is not None else self._queue.get()
+            pending = None
+            if first is _STOP:
+                return
+            if isinstance(first[0], _Exclusive):
+                self._run_exclusive(first)
+                continue
+            batch = [first]
+            stop = False
+            # Commit agrupado: sumar lo que ya está esperando, sin demorar el primero
+            while len(batch) < self.group_max_jobs:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item[0], _Exclusive):
+                    # Corre sola, después de confirmar este lote
+                    pending = item
+                    break
+                batch.append(item)
+            self._run_batch(batch)
+            if stop:
+                return
+
+    def _run_exclusive(self, item: Tuple[_Exclusive, Future, float]) -> None:
+        exclusive, future, queued = item
+        started = time.perf_counter()
+        with self._lock:
+            self._waits.append(started - queued)
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = exclusive.operation()
+        except BaseException as e:
+            error = e
+        else:
+            error = None
+        with self._lock:
+            if error is None:
+                self._completed += 1
+            else:
+                self._failed += 1
+            self._busy_seconds += time.perf_counter() - started
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def _run_batch(self, batch: List[Tuple[WriteJob, Future, float]]) -> None:
+        started = time.perf_counter()
+        jobs = [(job, future) for job, future, _ in batch if future.set_running_or_notify_cancel()]
+        with self._lock:
+            self._waits.extend(started - queued for _, _, queued in batch)
+        if not jobs:
+            return
+
+        done: List[Tuple[Future, Any]] = []
+        failed: List[Tuple[Future, BaseException]] = []
+        try:
+            manager = self._writer_connection()
+        except Exception as e:
+            failed.extend((future, e) for _, future in jobs)
+        else:
+            with manager.bind(self._conn):
+                self._execute_batch(manager, jobs, done, failed)
+
+        with self._lock:
+            self._batches += 1
+            self._max_batch = max(self._max_batch, len(jobs))
+            self._completed += len(done)
+            self._failed += len(failed)
+            self._busy_seconds += time.perf_counter() - started
+        for future, result in done:
+            future.set_result(result)
+        for future, error in failed:
+            future.set_exception(error)
+
+    def _writer_connection(self) -> ConnectionManager:
+        """
+        Conexión propia del escritor, fuera del pool. Se vuelve a abrir si el
+        gestor se reconfiguró o cerró sus conexiones (p. ej. al restaurar un respaldo).
+        """
+        manager = get_manager()
+        if self._conn is None or self._conn_manager is not manager or not manager.is_open(self._conn):
+            self._conn = manager.open_dedicated()
+            self._conn_manager = manager
+        return manager
+
+    @staticmethod
+    def _execute_batch(
+        manager: ConnectionManager,
+        jobs: List[Tuple[WriteJob, Future]],
+        done: List[Tuple[Future, Any]],
+        failed: List[Tuple[Future, BaseException]]
+    ) -> None:
+        # Los checkouts anidados de los trabajos (lecturas de los modelos,
+        # ``unit_of_work``) reutilizan esta misma conexión
+        conn = manager.checkout()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            uow = UnitOfWork(conn)
+            for job, future in jobs:
+                conn.execute("SAVEPOINT write_job")
+                try:
+                    result = job(uow)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT write_job")
+                    conn.execute("RELEASE SAVEPOINT write_job")
+                    failed.append((future, e))
+                    continue
+                conn.execute("RELEASE SAVEPOINT write_job")
+                done.append((future, result))
+            conn.commit()
+        except Exception as e:
+            # Falló el BEGIN o el COMMIT: no se escribió nada del lote
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except Exception:
+                pass
+            own_errors = {id(future): error for future, error in failed}
+            failed[:] = [(future, own_errors.get(id(future), e)) for _, future in jobs]
+            done.clear()
+        finally:
+            conn.close()
+
+
+_write_queue: Optional[WriteQueue] = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue() -> WriteQueue:
+    """Escritor compartido por todos los modelos del proceso."""
+    global _write_queue
+    if _write_queue is None:
+        with _write_queue_lock:
+            if _write_queue is None:
+                _write_queue = WriteQueue()
+    return _write_queue
+
+
+def submit_write(job: WriteJob) -> Future:
+    """Encola una transacción de escritura y devuelve su Future."""
+    return get_write_queue().submit(job)
+
+
+def _wait(future: Future, timeout: Optional[float]) -> Any:
+    """
+    Espera el resultado de un trabajo encolado.
+
+    Si se vence ``timeout`` el trabajo se cancela, pero sólo si todavía no
+    empezó: así el llamador que recibe ``TimeoutError`` sabe que no se
+    escribió nada y puede reintentar. Si ya está en ejecución se espera su
+    resultado real (una venta informada como fallida no debe confirmarse
+    después).
+    """
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        if future.cancel():
+            raise TimeoutError("La base de datos está ocupada: la operación no se realizó") from None
+        return future.result()
+
+
+def write_transaction(job: WriteJob, timeout: Optional[float] = WRITE_TIMEOUT) -> Any:
+    """
+    Ejecuta una transacción de escritura en el escritor y espera su resultado.
+
+    Quien no pueda bloquearse debe usar ``submit_write`` y el Future.
+
+    Ejemplo::
+
+        invoice_id = write_transaction(
+            lambda uow: uow.insert("INSERT INTO invoices ...", (...))
+        )
+
+    :raises TimeoutError: Si el trabajo no empezó dentro de ``timeout`` (no se escribió nada)
+    """
+    return _wait(get_write_queue().submit(job), timeout)
+
+
+def run_exclusive(operation: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+    """
+    Ejecuta ``operation`` en el escritor sin ninguna escritura en curso y
+    espera su resultado (sin límite por omisión: p. ej. restaurar un respaldo).
+    Con ``timeout`` se comporta como ``write_transaction``.
+    """
+    return _wait(get_write_queue().submit_exclusive(operation), timeout)
+
+
+def execute_write(query: str, params: Sequence[Any] = ()) -> Future:
+    """
+    Encola una sola sentencia de escritura.
+
+    :return: Future con ``lastrowid`` si es un INSERT, o las filas afectadas
+    """
+    is_insert = query.lstrip().upper().startswith("INSERT")
+
+    def job(uow: UnitOfWork) -> int:
+        cursor = uow.execute(query, params)
+        return cursor.lastrowid if is_insert else cursor.rowcount
+
+    return submit_write(job)
+
+
+def shutdown_write_queue() -> None:
+    if _write_queue is not None:
+        _write_queue.shutdown()
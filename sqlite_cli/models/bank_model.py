@@ -1,4 +1,5 @@
 from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class Bank:
@@ -10,14 +11,10 @@ class Bank:
         :param code: Código del banco (ej. '0102')
         :param name: Nombre del banco (ej. 'Banco de Venezuela')
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'INSERT INTO banks (code, name) VALUES (?, ?)',
             (code, name)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def all() -> List[Dict]:
@@ -86,13 +83,9 @@ class Bank:
         :param code: Código del banco
         :param status_id: ID del nuevo estado
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE banks SET
                 status_id = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE code = ?
-        ''', (status_id, code))
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        ''', (status_id, code)))
\ No newline at end of file
@@ -0,0 +1,484 @@
+import csv
+import json
+import os
+import re
+import sqlite3
+import unicodedata
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.fts import deferred_fts, refresh_fts
+from sqlite_cli.database.write_queue import write_transaction
+from sqlite_cli.models.movement_type_model import MovementType
+from utils.field_formatter import FieldFormatter
+from utils.session_manager import SessionManager
+
+# Filas por transacción (un executemany por lote)
+IMPORT_BATCH = 5000
+
+# Columnas importables de cada entidad:
+# (columna, encabezado del formulario, tipo de FieldFormatter, obligatoria, tipo Python)
+IMPORT_SPECS: Dict[str, Dict[str, Any]] = {
+    "inventory": {
+        "label": "Productos",
+        "table": "inventory",
+        "key": "code",
+        "columns": [
+            ("code", "Código", "code", True, str),
+            ("product", "Producto", "first_name", True, str),
+            ("description", "Descripción", "description", False, str),
+            ("quantity", "Cantidad", "integer", True, int),
+            ("stock", "Existencias", "integer", True, int),
+            ("min_stock", "Stock mínimo", "integer", False, int),
+            ("max_stock", "Stock máximo", "integer", False, int),
+            ("cost", "Precio de compra", "decimal", True, float),
+            ("price", "Precio de venta", "decimal", True, float),
+            ("supplier_code", "Proveedor", "code", False, str),
+            ("expiration_date", "Vencimiento", "date", False, str),
+        ],
+        # Valores de columnas NOT NULL cuando el archivo no las trae
+        "defaults": {"description": "", "min_stock": 0, "max_stock": 0},
+        # Sólo se escriben al crear: las existencias de un producto existente
+        # cambian con ajustes (que dejan su movimiento), no con importaciones
+        "insert_only": ("quantity", "stock"),
+    },
+    "customers": {
+        "label": "Clientes",
+        "table": "customers",
+        "key": "id_number",
+        "columns": [
+            ("first_name", "Nombres", "name", True, str),
+            ("last_name", "Apellidos", "name", True, str),
+            ("id_number", "Cédula", "integer", True, str),
+            ("email", "Email", "email", False, str),
+            ("phone", "Teléfono", "phone", False, str),
+            ("address", "Dirección", "address", False, str),
+        ],
+        "defaults": {},
+        "insert_only": (),
+    },
+    "suppliers": {
+        "label": "Proveedores",
+        "table": "suppliers",
+        "key": "code",
+        "columns": [
+            ("code", "Código", "code", True, str),
+            ("id_number", "Cédula", "integer", True, str),
+            ("first_name", "Nombres", "first_name", True, str),
+            ("last_name", "Apellidos", "last_name", True, str),
+            ("address", "Dirección", "address", True, str),
+            ("phone", "Teléfono", "phone", True, str),
+            ("email", "Email", "email", True, str),
+            ("tax_id", "RIF", "tax_id", True, str),
+            ("company", "Empresa", "company", True, str),
+        ],
+        "defaults": {},
+        "insert_only": (),
+    },
+    "services": {
+        "label": "Servicios",
+        "table": "services",
+        "key": "code",
+        "columns": [
+            ("code", "Código", "code", True, str),
+            ("name", "Nombre", "first_name", True, str),
+            ("price", "Precio", "decimal", True, float),
+            ("description", "Descripción", "description", False, str),
+        ],
+        "defaults": {},
+        "insert_only": (),
+    },
+}
+
+# Extensiones de archivo admitidas
+IMPORT_EXTENSIONS = (".csv", ".xlsx")
+
+# Lo mismo que aceptan ``format_integer``/``format_decimal`` sin alterar el valor
+_NUMBER_PATTERNS = {
+    "integer": re.compile(r"[0-9]+"),
+    "decimal": re.compile(r"[0-9]*\.?[0-9]*"),
+}
+
+ImportProgress = Callable[[int], None]
+
+
+def _normalize_header(text: Any) -> str:
+    """Encabezado comparable: minúsculas, sin acentos, sin ':' ni espacios extra."""
+    text = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode()
+    return " ".join(text.strip().rstrip(":").lower().replace("_", " ").split())
+
+
+def _read_csv(path: str) -> Iterator[List[Any]]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(64 * 1024)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(f, dialect)
+
+
+def _read_xlsx(path: str) -> Iterator[List[Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("Para importar archivos .xlsx instale el paquete openpyxl (o guarde el archivo como CSV)")
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for row in workbook.worksheets[0].iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
+
+class BulkImport:
+    """
+    Importación masiva de productos, clientes, proveedores y servicios.
+
+    Lee el archivo fila a fila, valida y normaliza cada campo con los mismos
+    formateadores de ``FieldFormatter`` que usan los formularios, y escribe
+    por lotes de ``IMPORT_BATCH`` filas (``executemany`` y una transacción
+    del escritor de ``write_queue`` por lote). Las filas se insertan o actualizan según la clave de la entidad
+    (``code`` o ``id_number``); los productos nuevos reciben su movimiento
+    de "Entrada inicial" en el mismo lote. Las filas inválidas no se
+    escriben y se informan con su número de fila en el archivo.
+    """
+
+    @staticmethod
+    def read_rows(path: str) -> Iterator[List[Any]]:
+        """Filas de un archivo .csv (coma, punto y coma o tabulador) o .xlsx (primera hoja)."""
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".csv":
+            return _read_csv(path)
+        if ext == ".xlsx":
+            return _read_xlsx(path)
+        raise ValueError(f"Formato no soportado: {ext or path} (use {' o '.join(IMPORT_EXTENSIONS)})")
+
+    @staticmethod
+    def import_file(
+        entity: str,
+        path: str,
+        user_id: Optional[int] = None,
+        batch_size: int = IMPORT_BATCH,
+        progress: Optional[ImportProgress] = None
+    ) -> Dict[str, Any]:
+        """
+        Importa un archivo con encabezados en la primera fila.
+
+        Los encabezados pueden ser el nombre de la columna (``code``) o la
+        etiqueta del formulario (``Código``). Las columnas opcionales que
+        no vienen en el archivo no se modifican en los registros existentes.
+
+        :param entity: Clave de ``IMPORT_SPECS``
+        :param path: Archivo .csv o .xlsx
+        :param user_id: Usuario de los movimientos de inventario (por defecto, el de la sesión)
+        :param batch_size: Filas por transacción
+        :param progress: Se llama con la cantidad de filas leídas tras cada lote
+        :return: Resumen con ``rows``, ``inserted``, ``updated``, ``invalid`` y ``errors``
+            (lista de ``{"row", "column", "message"}``)
+        """
+        return BulkImport.import_rows(entity, BulkImport.read_rows(path), user_id, batch_size, progress)
+
+    @staticmethod
+    def import_rows(
+        entity: str,
+        rows: Iterator[List[Any]],
+        user_id: Optional[int] = None,
+        batch_size: int = IMPORT_BATCH,
+        progress: Optional[ImportProgress] = None
+    ) -> Dict[str, Any]:
+        """Importa filas ya leídas (la primera es el encabezado). Ver ``import_file``."""
+        if entity not in IMPORT_SPECS:
+            raise ValueError(f"Entidad desconocida: {entity} (use {', '.join(IMPORT_SPECS)})")
+        spec = IMPORT_SPECS[entity]
+        result: Dict[str, Any] = {"rows": 0, "inserted": 0, "updated": 0, "invalid": 0, "errors": []}
+
+        rows = iter(rows)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError("El archivo está vacío")
+        positions = BulkImport._map_header(spec, header)
+
+        movement = None
+        if entity == "inventory":
+            user_id = user_id or SessionManager.get_user_id()
+            if not user_id:
+                raise ValueError("Se requiere un usuario para registrar los movimientos de inventario")
+            movement = MovementType.get_by_name('Entrada inicial')
+
+        present = [column for column, *_ in spec["columns"] if column in positions]
+        key = spec["key"]
+        conn = get_db_connection()
+        try:
+            known: Set[str] = {row[0] for row in conn.execute(f"SELECT {key} FROM {spec['table']}")}
+            suppliers: Dict[str, int] = {}
+            if "supplier_code" in positions:
+                suppliers = {row[0]: row[1] for row in conn.execute("SELECT code, id FROM suppliers")}
+        finally:
+            conn.close()
+        writer = _BatchWriter(spec, present, movement, user_id)
+        plan = BulkImport._column_plan(spec, positions)
+
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        for line, raw in enumerate(rows, start=2):
+            if not any(value not in (None, "") for value in raw):
+                continue
+            result["rows"] += 1
+            values, errors = BulkImport._validate_row(plan, raw, suppliers)
+            if errors:
+                result["invalid"] += 1
+                result["errors"].extend({"row": line, "column": column, "message": message} for column, message in errors)
+                continue
+            batch.append((line, values))
+            if len(batch) >= batch_size:
+                writer.write(batch, known, result)
+                batch = []
+                if progress:
+                    progress(result["rows"])
+        writer.write(batch, known, result)
+        if progress:
+            progress(result["rows"])
+        result["errors"].sort(key=lambda error: error["row"])
+        return result
+
+    @staticmethod
+    def template_header(entity: str) -> List[str]:
+        """Encabezados (etiquetas de formulario) de una plantilla para ``entity``."""
+        return [label for _, label, *_ in IMPORT_SPECS[entity]["columns"]]
+
+    # --- Validación --------------------------------------------------
+
+    @staticmethod
+    def _map_header(spec: Dict[str, Any], header: List[Any]) -> Dict[str, int]:
+        """Columna -> posición en el archivo. Falla si falta una columna obligatoria."""
+        names = {}
+        for column, label, _, _, _ in spec["columns"]:
+            names[_normalize_header(column)] = column
+            names[_normalize_header(label)] = column
+        positions: Dict[str, int] = {}
+        for index, title in enumerate(header):
+            column = names.get(_normalize_header(title))
+            if column and column not in positions:
+                positions[column] = index
+        missing = [label for column, label, _, required, _ in spec["columns"] if required and column not in positions]
+        if missing:
+            raise ValueError(f"Faltan columnas obligatorias: {', '.join(missing)}")
+        return positions
+
+    @staticmethod
+    def _cell_text(value: Any) -> str:
+        """Texto de una celda (las de Excel llegan como números o fechas)."""
+        if value.__class__ is str:
+            return value.strip()
+        if value is None:
+            return ""
+        if isinstance(value, (datetime, date)):
+            return value.strftime("%Y/%m/%d")
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value).strip()
+
+    @staticmethod
+    def _column_plan(spec: Dict[str, Any], positions: Dict[str, int]) -> List[tuple]:
+        """
+        Lo que ``_validate_row`` necesita de cada columna presente, resuelto
+        una sola vez por archivo: posición, formateador o patrón numérico,
+        obligatoriedad, tipo Python y valor por defecto.
+        """
+        plan = []
+        for column, label, field_type, required, kind in spec["columns"]:
+            if column not in positions:
+                continue
+            # Los números no se "limpian": un valor con otros caracteres es un error
+            number = _NUMBER_PATTERNS.get(field_type)
+            formatter = None if number else FieldFormatter.get_formatter(field_type)
+            plan.append((
+                column, label, field_type, positions[column], number, formatter,
+                required, kind, spec["defaults"].get(column)
+            ))
+        return plan
+
+    @staticmethod
+    def _validate_row(
+        plan: List[tuple],
+        raw: List[Any],
+        suppliers: Dict[str, int]
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+        values: Dict[str, Any] = {}
+        errors: List[Tuple[str, str]] = []
+        width = len(raw)
+        for column, label, field_type, index, number, formatter, required, kind, default in plan:
+            text = BulkImport._cell_text(raw[index] if index < width else None)
+
+            if number is not None:
+                if field_type == "decimal" and "," in text and "." not in text:
+                    text = text.replace(",", ".")
+                if text and not number.fullmatch(text):
+                    errors.append((label, f"'{text}' no es un número válido"))
+                    continue
+                formatted = text
+            elif formatter is not None:
+                formatted = formatter(text).strip()
+            else:
+                formatted = text
+
+            if not formatted:
+                if required:
+                    errors.append((label, "Campo obligatorio"))
+                else:
+                    values[column] = default
+                continue
+
+            if field_type == "email" and not FieldFormatter.is_valid_email(formatted):
+                errors.append((label, f"'{text}' no es un email válido"))
+                continue
+            if field_type == "date":
+                try:
+                    datetime.strptime(formatted, "%Y/%m/%d")
+                except ValueError:
+                    errors.append((label, f"'{text}' no es una fecha válida (AAAA/MM/DD)"))
+                    continue
+            try:
+                values[column] = kind(formatted)
+            except ValueError:
+                errors.append((label, f"'{text}' no es un número válido"))
+
+        if "supplier_code" in values:
+            code = values.pop("supplier_code")
+            if code and code not in suppliers:
+                errors.append(("Proveedor", f"No existe un proveedor con código '{code}'"))
+            values["supplier_id"] = suppliers.get(code) if code else None
+        return values, errors
+
+
+class _BatchWriter:
+    """
+    Escribe lotes de filas válidas: alta o actualización por clave y
+    movimientos de las altas. Cada lote es una transacción del escritor
+    único (``write_queue``), así que no compite con las ventas.
+    """
+
+    def __init__(
+        self,
+        spec: Dict[str, Any],
+        present: List[str],
+        movement: Optional[Dict],
+        user_id: Optional[int]
+    ) -> None:
+        self.table = spec["table"]
+        self.key = spec["key"]
+        self.defaults = spec["defaults"]
+        self.movement = movement
+        self.user_id = user_id
+
+        stored = ["supplier_id" if column == "supplier_code" else column for column in present]
+        self.columns = stored + [column for column in self.defaults if column not in stored]
+        self.updates = [column for column in stored if column != self.key and column not in spec["insert_only"]]
+        # Alta y actualización por separado (no ``ON CONFLICT DO UPDATE``: dentro de
+        # un upsert, los disparadores de búsqueda pierden su ``OR REPLACE``)
+        self.insert_sql = f'''
+            INSERT INTO {spec["table"]} ({", ".join(self.columns)}, status_id)
+            VALUES ({", ".join("?" for _ in self.columns)}, 1)
+        '''
+        assignments = "".join(f"{column} = ?, " for column in self.updates)
+        self.update_sql = f'''
+            UPDATE {spec["table"]} SET {assignments}updated_at = CURRENT_TIMESTAMP
+            WHERE {self.key} = ?
+        '''
+        self.movement_sql = '''
+            INSERT INTO inventory_movements (
+                inventory_id, movement_type_id, quantity_change, stock_change,
+                previous_quantity, new_quantity, previous_stock, new_stock,
+                user_id, notes
+            )
+            SELECT id, ?, quantity, stock, 0, quantity, 0, stock, ?, ?
+            FROM inventory WHERE code = ?
+        '''
+
+    def write(self, batch: List[Tuple[int, Dict[str, Any]]], known: Set[str], result: Dict[str, Any]) -> None:
+        """
+        Escribe el lote en una transacción; si falla, fila por fila para ubicar el error.
+
+        El lote se indexa en la búsqueda de una sola vez al final, no fila por fila.
+        """
+        if not batch:
+            return
+        inserted, updated, errors = write_transaction(lambda uow: self._write_batch(uow.conn, batch, known))
+        known |= inserted
+        result["inserted"] += len(inserted)
+        result["updated"] += updated
+        result["invalid"] += len(errors)
+        result["errors"].extend(errors)
+
+    def _write_batch(
+        self,
+        conn: Any,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        known: Set[str]
+    ) -> Tuple[Set[str], int, List[Dict[str, Any]]]:
+        """Trabajo del escritor: (claves dadas de alta, filas actualizadas, errores por fila)."""
+        conn.execute("SAVEPOINT import_batch")
+        try:
+            with deferred_fts(conn, self.table):
+                inserted = self._write(conn, batch, known)
+                refresh_fts(
+                    conn, self.table, f"{self.key} IN (SELECT value FROM json_each(?))",
+                    (json.dumps([values[self.key] for _, values in batch]),)
+                )
+        except sqlite3.DatabaseError:
+            conn.execute("ROLLBACK TO SAVEPOINT import_batch")
+            conn.execute("RELEASE SAVEPOINT import_batch")
+            return self._write_rows(conn, batch, known)
+        conn.execute("RELEASE SAVEPOINT import_batch")
+        return inserted, len(batch) - len(inserted), []
+
+    def _write_rows(
+        self,
+        conn: Any,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        known: Set[str]
+    ) -> Tuple[Set[str], int, List[Dict[str, Any]]]:
+        inserted: Set[str] = set()
+        updated = 0
+        errors: List[Dict[str, Any]] = []
+        for line, values in batch:
+            conn.execute("SAVEPOINT import_row")
+            try:
+                new_keys = self._write(conn, [(line, values)], known | inserted)
+            except sqlite3.DatabaseError as e:
+                conn.execute("ROLLBACK TO SAVEPOINT import_row")
+                conn.execute("RELEASE SAVEPOINT import_row")
+                errors.append({"row": line, "column": "", "message": str(e)})
+                continue
+            conn.execute("RELEASE SAVEPOINT import_row")
+            inserted |= new_keys
+            updated += 0 if new_keys else 1
+        return inserted, updated, errors
+
+    def _write(self, conn: Any, batch: List[Tuple[int, Dict[str, Any]]], known: Set[str]) -> Set[str]:
+        """Altas y actualizaciones del lote (sin commit). Devuelve las claves que no existían."""
+        inserts: List[tuple] = []
+        updates: List[tuple] = []
+        new_keys: Set[str] = set()
+        for _, values in batch:
+            key = values[self.key]
+            if key in known or key in new_keys:
+                updates.append(tuple(values[column] for column in self.updates) + (key,))
+            else:
+                new_keys.add(key)
+                inserts.append(tuple(
+                    values[column] if column in values else self.defaults.get(column)
+                    for column in self.columns
+                ))
+        if inserts:
+            conn.executemany(self.insert_sql, inserts)
+        if updates:
+            conn.executemany(self.update_sql, updates)
+        if self.movement and new_keys:
+            notes = "Entrada inicial del producto (importación)"
+            conn.executemany(
+                self.movement_sql,
+                [(self.movement['id'], self.user_id, notes, code) for code in new_keys]
+            )
+        return new_keys
@@ -1,4 +1,5 @@
 from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.fts import SEARCH_LIMIT, build_match_query, fts_join
 from typing import List, Dict, Optional
 
 class CatalogModel:
@@ -35,45 +36,57 @@ class CatalogModel:
         return services
 
     @staticmethod
-    def search_products(search_term: str = "") -> List[Dict]:
-        """Busca productos activos para el catálogo"""
+    def search_products(search_term: str = "", limit: Optional[int] = SEARCH_LIMIT) -> List[Dict]:
+        """Busca productos activos para el catálogo (por relevancia, vía inventory_fts)"""
+        match = build_match_query(search_term)
+        if not match:
+            return CatalogModel.get_all_products() if not search_term.strip() else []
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        query = '''
+        joins, params = fts_join("inventory", "i", match)
+        query = f'''
             SELECT i.id, i.code, i.product, i.stock, i.price, i.expiration_date, i.image_path, i.description
             FROM inventory i
+            {joins}
             JOIN status st ON i.status_id = st.id
-            WHERE st.name = 'active' AND 
-                  (LOWER(i.product) LIKE ? OR 
-                  LOWER(i.code) LIKE ? OR
-                  LOWER(i.description) LIKE ?)
-            ORDER BY i.product ASC
+            WHERE st.name = 'active'
+            ORDER BY fts.fts_rank, i.product ASC
         '''
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
         
-        cursor.execute(query, (f"%{search_term.lower()}%", f"%{search_term.lower()}%", f"%{search_term.lower()}%"))
+        cursor.execute(query, params)
         products = [dict(row) for row in cursor.fetchall()]
         conn.close()
         return products
 
     @staticmethod
-    def search_services(search_term: str = "") -> List[Dict]:
-        """Busca servicios activos para el catálogo"""
+    def search_services(search_term: str = "", limit: Optional[int] = SEARCH_LIMIT) -> List[Dict]:
+        """Busca servicios activos para el catálogo (por relevancia, vía services_fts)"""
+        match = build_match_query(search_term)
+        if not match:
+            return CatalogModel.get_all_services() if not search_term.strip() else []
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
-        query = '''
+        joins, params = fts_join("services", "s", match)
+        query = f'''
             SELECT s.id, s.code, s.name, s.price, s.description
             FROM services s
+            {joins}
             JOIN status st ON s.status_id = st.id
-            WHERE st.name = 'active' AND 
-                  (LOWER(s.name) LIKE ? OR 
-                  LOWER(s.code) LIKE ? OR
-                  LOWER(s.description) LIKE ?)
-            ORDER BY s.name ASC
+            WHERE st.name = 'active'
+            ORDER BY fts.fts_rank, s.name ASC
         '''
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
         
-        cursor.execute(query, (f"%{search_term.lower()}%", f"%{search_term.lower()}%", f"%{search_term.lower()}%"))
+        cursor.execute(query, params)
         services = [dict(row) for row in cursor.fetchall()]
         conn.close()
-        return services
\ No newline at end of file
+        return services
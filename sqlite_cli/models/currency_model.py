@@ -1,5 +1,6 @@
 # models/currency_model.py
-from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.reference_cache import ReferenceCache
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class Currency:
@@ -12,14 +13,11 @@ class Currency:
         :param symbol: Símbolo de la moneda (ej. '$', '€')
         :param value: Valor de la moneda (default 0.0)
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'INSERT INTO currencies (name, symbol, value) VALUES (?, ?, ?)',
             (name, symbol, value)
-        )
-        conn.commit()
-        conn.close()
+        ))
+        ReferenceCache.invalidate("currencies")
 
     @staticmethod
     def all() -> List[Dict]:
@@ -28,16 +26,7 @@ class Currency:
         
         :return: Lista de diccionarios con las monedas
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT c.*, s.name as status_name 
-            FROM currencies c
-            JOIN status s ON c.status_id = s.id
-        ''')
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        return ReferenceCache.all("currencies")
 
     @staticmethod
     def get_by_name(name: str) -> Optional[Dict]:
@@ -47,17 +36,7 @@ class Currency:
         :param name: Nombre de la moneda
         :return: Diccionario con los datos de la moneda o None
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT c.*, s.name as status_name 
-            FROM currencies c
-            JOIN status s ON c.status_id = s.id
-            WHERE c.name = ?
-        ''', (name,))
-        item = cursor.fetchone()
-        conn.close()
-        return dict(item) if item else None
+        return ReferenceCache.get("currencies", name)
 
     @staticmethod
     def update_value(name: str, new_value: float) -> None:
@@ -67,16 +46,13 @@ class Currency:
         :param name: Nombre de la moneda
         :param new_value: Nuevo valor
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE currencies SET
                 value = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE name = ?
-        ''', (new_value, name))
-        conn.commit()
-        conn.close()
+        ''', (new_value, name)))
+        ReferenceCache.invalidate("currencies")
 
     @staticmethod
     def update_status(name: str, status_id: int) -> None:
@@ -86,13 +62,10 @@ class Currency:
         :param name: Nombre de la moneda
         :param status_id: ID del nuevo estado
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE currencies SET
                 status_id = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE name = ?
-        ''', (status_id, name))
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        ''', (status_id, name)))
+        ReferenceCache.invalidate("currencies")
\ No newline at end of file
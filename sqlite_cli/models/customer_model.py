@@ -1,5 +1,8 @@
 from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+from sqlite_cli.database.fts import SEARCH_LIMIT, build_match_query, fts_join
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from sqlite_cli.database.write_queue import write_transaction
+from typing import List, Dict, Optional, Tuple
 
 class Customer:
     @staticmethod
@@ -12,68 +15,102 @@ class Customer:
         phone: Optional[str] = None,
         status_id: int = 1  # Por defecto activo
     ) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             '''INSERT INTO customers 
             (first_name, last_name, id_number, email, address, phone, status_id)
             VALUES (?, ?, ?, ?, ?, ?, ?)''',
             (first_name, last_name, id_number, email, address, phone, status_id)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
-    def search_active(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
+    def search_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        limit: Optional[int] = SEARCH_LIMIT
+    ) -> List[Dict]:
+        query, params, ranked = Customer._search_query(search_term, field)
+        if ranked:
+            query += " ORDER BY fts.fts_rank"
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
+        
         conn = get_db_connection()
         cursor = conn.cursor()
+        cursor.execute(query, params)
+        items = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return items
+
+    @staticmethod
+    def page_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de clientes activos en orden de registro (ver ``paginate``)"""
+        query, params, _ = Customer._search_query(search_term, field)
+        return paginate(query, params, "c.id", None, cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def _search_query(
+        search_term: str,
+        field: Optional[str]
+    ) -> Tuple[str, List, bool]:
+        """
+        Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``.
+
+        :return: (consulta, parámetros, si se filtra por ``customers_fts``)
+        """
+        joins = ""
+        join_params = []
+        conditions = ""
+        params = []
+        ranked = False
         
-        base_query = '''
+        if search_term:
+            # Columnas de customers_fts por campo de búsqueda. Cédula y
+            # teléfono se buscan con LIKE: FTS solo encuentra prefijos de
+            # palabra y "5678" debe hallar "V-12345678"
+            fts_columns = {
+                "Nombres": "first_name",
+                "Apellidos": "last_name",
+                "Email": "email"
+            }
+            code_columns = {
+                "Cédula": "c.id_number",
+                "Teléfono": "c.phone"
+            }
+            if field == "ID":
+                try:
+                    customer_id = int(search_term)
+                    conditions += " AND c.id = ?"
+                    params.append(customer_id)
+                except ValueError:
+                    conditions += " AND 1 = 0"
+            elif field in code_columns:
+                conditions += f" AND LOWER({code_columns[field]}) LIKE ?"
+                params.append(f"%{search_term.lower()}%")
+            elif not field or field in fts_columns:
+                match = build_match_query(search_term, fts_columns.get(field))
+                if match:
+                    joins, join_params = fts_join("customers", "c", match)
+                    ranked = True
+                else:
+                    conditions += " AND 1 = 0"
+        
+        base_query = f'''
             SELECT c.*, s.name as status_name 
             FROM customers c
+            {joins}
             JOIN status s ON c.status_id = s.id
             WHERE s.name = 'active'
         '''
         
-        params = []
-        
-        if search_term:
-            if field:
-                field_map = {
-                    "ID": "c.id",
-                    "Nombres": "c.first_name",
-                    "Apellidos": "c.last_name",
-                    "Cédula": "c.id_number",
-                    "Email": "c.email",
-                    "Teléfono": "c.phone"
-                }
-                field_name = field_map.get(field)
-                if field_name:
-                    if field == "ID":
-                        try:
-                            customer_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
-                            params.append(customer_id)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
-                        params.append(f"%{search_term}%")
-            else:
-                base_query += '''
-                    AND (LOWER(c.first_name) LIKE ? OR 
-                        LOWER(c.last_name) LIKE ? OR 
-                        LOWER(c.id_number) LIKE ? OR 
-                        LOWER(c.email) LIKE ? OR 
-                        LOWER(c.phone) LIKE ? OR 
-                        LOWER(c.address) LIKE ?)
-                '''
-                params.extend([f"%{search_term}%"] * 6)
-        
-        cursor.execute(base_query, params)
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        params = join_params + params
+        return base_query + conditions, params, ranked
 
     @staticmethod
     def all() -> List[Dict]:
@@ -127,9 +164,7 @@ class Customer:
         phone: Optional[str] = None,
         status_id: int = 1
     ) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             '''UPDATE customers SET
             first_name = ?,
             last_name = ?,
@@ -141,17 +176,11 @@ class Customer:
             updated_at = CURRENT_TIMESTAMP
             WHERE id = ?''',
             (first_name, last_name, id_number, email, address, phone, status_id, customer_id)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def update_status(customer_id: int, status_id: int) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'UPDATE customers SET status_id = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
             (status_id, customer_id)
-        )
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        ))
\ No newline at end of file
@@ -1,11 +1,14 @@
 from sqlite_cli.database.database import get_db_connection
-from typing import Any, List, Dict, Optional
+from sqlite_cli.database.fts import SEARCH_LIMIT, build_match_query, fts_condition, fts_join, is_numeric_term
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from typing import Any, List, Dict, Optional, Tuple
 import os
-import shutil
 from datetime import datetime
-from sqlite_cli.models.movement_type_model import MovementType
 from sqlite_cli.models.inventory_movement_model import InventoryMovement
+from sqlite_cli.database.unit_of_work import UnitOfWork
+from sqlite_cli.database.write_queue import write_transaction
 from utils.session_manager import SessionManager
+from utils import image_store
 
 class InventoryItem:
     IMAGE_FOLDER = "inventory_images"
@@ -18,29 +21,108 @@ class InventoryItem:
 
     @staticmethod
     def _save_image(image_path: Optional[str]) -> Optional[str]:
-        """Guarda una imagen en la carpeta designada y devuelve la nueva ruta"""
+        """
+        Guarda una imagen en la carpeta designada y devuelve la nueva ruta.
+
+        El archivo se nombra por el hash de su contenido (subir la misma foto
+        reutiliza el archivo existente) y se generan junto a él los derivados
+        pre-escalados que usan el catálogo y el inventario.
+        """
         if not image_path:
             return None
             
         InventoryItem._ensure_image_folder()
         
         try:
-            filename = os.path.basename(image_path)
-            dest_path = os.path.join(InventoryItem.IMAGE_FOLDER, filename)
-            
-            # Si el archivo existe, añade un sufijo numérico
-            counter = 1
-            while os.path.exists(dest_path):
-                name, ext = os.path.splitext(filename)
-                dest_path = os.path.join(InventoryItem.IMAGE_FOLDER, f"{name}_{counter}{ext}")
-                counter += 1
-            
-            shutil.copy2(image_path, dest_path)
-            return dest_path
+            return image_store.store_image(image_path, InventoryItem.IMAGE_FOLDER)
         except Exception as e:
             print(f"Error al guardar imagen: {e}")
             return None
 
+    @staticmethod
+    def _release_image(image_path: Optional[str]) -> None:
+        """Elimina una imagen (y sus derivados) si ningún producto la usa ya"""
+        if not image_path:
+            return
+        conn = get_db_connection()
+        try:
+            in_use = conn.execute(
+                "SELECT 1 FROM inventory WHERE image_path = ? LIMIT 1", (image_path,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if in_use:
+            return
+        try:
+            image_store.remove_image(image_path)
+        except Exception as e:
+            print(f"Error eliminando imagen anterior: {e}")
+
+    @staticmethod
+    def backfill_images(batch_size: int = 200) -> Dict[str, int]:
+        """
+        Migra las imágenes existentes al almacenamiento por contenido.
+
+        Renombra cada original por su hash (unificando duplicados), genera
+        los derivados que falten y actualiza ``image_path`` por lotes. Los
+        archivos con el nombre anterior se eliminan al final si ningún
+        producto los referencia. Se puede ejecutar varias veces.
+
+        :param batch_size: Filas actualizadas por transacción
+        :return: Conteo de filas procesadas, actualizadas, derivados creados,
+                 archivos faltantes, errores y archivos eliminados
+        """
+        stats = {"rows": 0, "updated": 0, "derivatives": 0, "missing": 0, "errors": 0, "removed": 0}
+        conn = get_db_connection()
+        try:
+            rows = conn.execute(
+                "SELECT id, image_path FROM inventory WHERE image_path IS NOT NULL AND image_path != '' ORDER BY id"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        pending: List[Tuple[str, int]] = []
+        replaced = set()
+
+        def flush() -> None:
+            if not pending:
+                return
+            write_transaction(lambda uow: uow.executemany(
+                "UPDATE inventory SET image_path = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?", pending
+            ))
+            stats["updated"] += len(pending)
+            pending.clear()
+
+        InventoryItem._ensure_image_folder()
+        for item_id, path in rows:
+            stats["rows"] += 1
+            if not os.path.exists(path):
+                stats["missing"] += 1
+                continue
+            try:
+                new_path = path
+                if not image_store.is_stored(path):
+                    new_path = image_store.store_image(path, InventoryItem.IMAGE_FOLDER, derivatives=False)
+                stats["derivatives"] += image_store.create_derivatives(new_path)
+            except Exception as e:
+                print(f"Error procesando imagen del producto {item_id} ({path}): {e}")
+                stats["errors"] += 1
+                continue
+            if new_path == path:
+                continue
+            pending.append((new_path, item_id))
+            replaced.add(path)
+            if len(pending) >= batch_size:
+                flush()
+        flush()
+
+        for path in replaced:
+            before = os.path.exists(path)
+            InventoryItem._release_image(path)
+            if before and not os.path.exists(path):
+                stats["removed"] += 1
+        return stats
+
     @staticmethod
     def create(
         code: str,
@@ -58,13 +140,11 @@ class InventoryItem:
     ) -> Dict[str, Any]:
         """Crea un nuevo producto en el inventario (activo por defecto) y retorna el registro completo"""
         saved_image_path = InventoryItem._save_image(image_path)
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        try:
-            # Insertamos el producto
-            cursor.execute('''
+        user_id = SessionManager.get_user_id()
+
+        def write(uow: UnitOfWork) -> Dict[str, Any]:
+            # Insertamos el producto y obtenemos el registro recién creado
+            created_item = uow.fetchone('''
                 INSERT INTO inventory (
                     code, product, description, quantity, stock, min_stock, max_stock, cost, price, 
                     supplier_id, expiration_date, image_path, status_id
@@ -75,16 +155,12 @@ class InventoryItem:
                 supplier_id, expiration_date, saved_image_path
             ))
             
-            # Obtenemos el producto recién creado
-            created_item = dict(cursor.fetchone())
-            
             # Buscamos el tipo de movimiento "Entrada inicial"
-            cursor.execute("SELECT id FROM movement_types WHERE name = 'Entrada inicial'")
-            movement_type = cursor.fetchone()
+            movement_type = uow.lookup("movement_types", "Entrada inicial")
             
             if movement_type:
                 # Insertamos el movimiento de inventario
-                cursor.execute('''
+                uow.execute('''
                     INSERT INTO inventory_movements (
                         inventory_id, movement_type_id, quantity_change, stock_change,
                         previous_quantity, new_quantity, previous_stock, new_stock,
@@ -99,18 +175,13 @@ class InventoryItem:
                     quantity,  # new_quantity
                     0,  # previous_stock
                     stock,  # new_stock
-                    SessionManager.get_user_id(),
+                    user_id,
                     "Entrada inicial del producto"
                 ))
             
-            conn.commit()
             return created_item  # Retornamos el producto completo
-            
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+
+        return write_transaction(write)
 
     @staticmethod
     def all() -> List[Dict]:
@@ -130,29 +201,108 @@ class InventoryItem:
         return items
 
     @staticmethod
-    def search_active(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
+    def search_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        limit: Optional[int] = SEARCH_LIMIT
+    ) -> List[Dict]:
         """Busca productos activos con filtro opcional"""
+        return InventoryItem._search('active', search_term, field, limit)
+
+    @staticmethod
+    def search_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        limit: Optional[int] = SEARCH_LIMIT
+    ) -> List[Dict]:
+        """Busca productos inactivos con filtro opcional"""
+        return InventoryItem._search('inactive', search_term, field, limit)
+
+    @staticmethod
+    def _search(
+        status_name: str,
+        search_term: str,
+        field: Optional[str],
+        limit: Optional[int]
+    ) -> List[Dict]:
+        """
+        Búsqueda de productos por estado.
+
+        Los campos de texto (código, producto, descripción, proveedor) se
+        buscan en ``inventory_fts`` por prefijo y sin acentos, ordenados por
+        relevancia y limitados a ``limit`` filas. Los campos numéricos y las
+        fechas mantienen la comparación directa.
+        """
+        query, params, ranked = InventoryItem._search_query(status_name, search_term, field)
+        if ranked:
+            query += " ORDER BY fts.fts_rank, i.product ASC"
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
+        else:
+            query += " ORDER BY i.product ASC"
+        
         conn = get_db_connection()
         cursor = conn.cursor()
-        
-        base_query = '''
-            SELECT i.*, st.name as status_name, sp.company as supplier_company
-            FROM inventory i
-            JOIN status st ON i.status_id = st.id
-            LEFT JOIN suppliers sp ON i.supplier_id = sp.id
-            WHERE st.name = 'active'
-        '''
-        
+        cursor.execute(query, params)
+        items = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return items
+
+    @staticmethod
+    def page_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de productos activos ordenados por nombre (ver ``paginate``)"""
+        query, params, _ = InventoryItem._search_query('active', search_term, field)
+        return paginate(query, params, "i.id", "i.product", cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def page_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de productos inactivos ordenados por nombre (ver ``paginate``)"""
+        query, params, _ = InventoryItem._search_query('inactive', search_term, field)
+        return paginate(query, params, "i.id", "i.product", cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def _search_query(
+        status_name: str,
+        search_term: str,
+        field: Optional[str]
+    ) -> Tuple[str, List, bool]:
+        """
+        Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``.
+
+        :return: (consulta, parámetros, si se filtra por ``inventory_fts``)
+        """
+        joins = ""
+        join_params = []
+        conditions = ""
         params = []
+        ranked = False
+        
+        # Columnas de inventory_fts por campo de búsqueda. El código no: FTS
+        # solo encuentra prefijos de palabra y "000043" debe hallar "PROD000043"
+        fts_columns = {
+            "Producto": "product",
+            "Descripción": "description",
+            "Proveedor": "company"
+        }
         
         if search_term:
             if field:
                 field_map = {
                     "ID": "i.id",
                     "Código": "i.code",
-                    "Producto": "i.product",
-                    "Descripción": "i.description",
-                    "Proveedor": "sp.company",
                     "Cantidad": "i.quantity",
                     "Existencias": "i.stock",
                     "Stock mínimo": "i.min_stock",
@@ -162,31 +312,47 @@ class InventoryItem:
                     "Vencimiento": "i.expiration_date"
                 }
                 field_name = field_map.get(field)
-                if field_name:
+                if field in fts_columns:
+                    match = build_match_query(search_term, fts_columns[field])
+                    if match:
+                        joins, join_params = fts_join("inventory", "i", match)
+                        ranked = True
+                    else:
+                        conditions += " AND 1 = 0"
+                elif field_name:
                     if field == "ID":
                         try:
                             item_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
+                            conditions += f" AND {field_name} = ?"
                             params.append(item_id)
                         except ValueError:
-                            base_query += " AND 1 = 0"
+                            conditions += " AND 1 = 0"
                     elif field == "Vencimiento":
                         try:
                             # Buscar por fecha (formato YYYY-MM-DD)
-                            date_obj = datetime.strptime(search_term, "%Y-%m-%d")
-                            base_query += f" AND DATE({field_name}) = DATE(?)"
+                            datetime.strptime(search_term, "%Y-%m-%d")
+                            conditions += f" AND DATE({field_name}) = DATE(?)"
                             params.append(search_term)
                         except ValueError:
-                            base_query += " AND 1 = 0"
+                            conditions += " AND 1 = 0"
+                    elif field == "Código":
+                        conditions += f" AND LOWER({field_name}) LIKE ?"
+                        params.append(f"%{search_term.lower()}%")
                     else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
+                        conditions += f" AND CAST({field_name} AS TEXT) LIKE ?"
                         params.append(f"%{search_term.lower()}%")
-            else:
-                base_query += '''
-                    AND (LOWER(i.code) LIKE ? OR 
-                        LOWER(i.product) LIKE ? OR 
-                        LOWER(i.description) LIKE ? OR
-                        LOWER(sp.company) LIKE ? OR
+            elif is_numeric_term(search_term):
+                # Cantidades, precios y fechas no están en el índice de texto;
+                # el número también se busca en FTS (nombres y descripciones)
+                match = build_match_query(search_term)
+                if match:
+                    fts_sql, fts_params = fts_condition("inventory", "i", match)
+                    fts_sql += " OR"
+                else:
+                    fts_sql, fts_params = "", []
+                conditions += f'''
+                    AND ({fts_sql}
+                        LOWER(i.code) LIKE ? OR 
                         CAST(i.quantity AS TEXT) LIKE ? OR
                         CAST(i.stock AS TEXT) LIKE ? OR
                         CAST(i.min_stock AS TEXT) LIKE ? OR
@@ -195,86 +361,23 @@ class InventoryItem:
                         CAST(i.price AS TEXT) LIKE ? OR
                         i.expiration_date LIKE ?)
                 '''
-                params.extend([f"%{search_term.lower()}%"] * 11)
-        
-        base_query += " ORDER BY i.product ASC"
-        cursor.execute(base_query, params)
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
-
-    @staticmethod
-    def search_inactive(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
-        """Busca productos inactivos con filtro opcional"""
-        conn = get_db_connection()
-        cursor = conn.cursor()
+                params.extend(fts_params + [f"%{search_term.lower()}%"] * 8)
+            else:
+                match = build_match_query(search_term)
+                if match:
+                    joins, join_params = fts_join("inventory", "i", match)
+                    ranked = True
         
-        base_query = '''
+        query = f'''
             SELECT i.*, st.name as status_name, sp.company as supplier_company
             FROM inventory i
+            {joins}
             JOIN status st ON i.status_id = st.id
             LEFT JOIN suppliers sp ON i.supplier_id = sp.id
-            WHERE st.name = 'inactive'
+            WHERE st.name = ?
         '''
-        
-        params = []
-        
-        if search_term:
-            if field:
-                field_map = {
-                    "ID": "i.id",
-                    "Código": "i.code",
-                    "Producto": "i.product",
-                    "Descripción": "i.description",
-                    "Proveedor": "sp.company",
-                    "Cantidad": "i.quantity",
-                    "Existencias": "i.stock",
-                    "Stock mínimo": "i.min_stock",
-                    "Stock máximo": "i.max_stock",
-                    "Precio de compra": "i.cost",
-                    "Precio de venta": "i.price",
-                    "Vencimiento": "i.expiration_date"
-                }
-                field_name = field_map.get(field)
-                if field_name:
-                    if field == "ID":
-                        try:
-                            item_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
-                            params.append(item_id)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    elif field == "Vencimiento":
-                        try:
-                            date_obj = datetime.strptime(search_term, "%Y-%m-%d")
-                            base_query += f" AND DATE({field_name}) = DATE(?)"
-                            params.append(search_term)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
-                        params.append(f"%{search_term.lower()}%")
-            else:
-                base_query += '''
-                    AND (LOWER(i.code) LIKE ? OR 
-                        LOWER(i.product) LIKE ? OR 
-                        LOWER(i.description) LIKE ? OR
-                        LOWER(sp.company) LIKE ? OR
-                        CAST(i.quantity AS TEXT) LIKE ? OR
-                        CAST(i.stock AS TEXT) LIKE ? OR
-                        CAST(i.min_stock AS TEXT) LIKE ? OR
-                        CAST(i.max_stock AS TEXT) LIKE ? OR
-                        CAST(i.cost AS TEXT) LIKE ? OR
-                        CAST(i.price AS TEXT) LIKE ? OR
-                        i.expiration_date LIKE ?)
-                '''
-                params.extend([f"%{search_term.lower()}%"] * 11)
-        
-        base_query += " ORDER BY i.product ASC"
-        cursor.execute(base_query, params)
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        params = join_params + [status_name] + params
+        return query + conditions, params, ranked
 
     @staticmethod
     def get_by_id(item_id: int) -> Optional[Dict]:
@@ -320,25 +423,20 @@ class InventoryItem:
         
         # Manejar la nueva imagen
         saved_image_path = None
+        replaced_image = None
         if image_path:
             if image_path != current_image:
-                # Eliminar la imagen anterior si es diferente
-                if current_image and os.path.exists(current_image):
-                    try:
-                        os.remove(current_image)
-                    except Exception as e:
-                        print(f"Error eliminando imagen anterior: {e}")
-                
                 saved_image_path = InventoryItem._save_image(image_path)
+                # La imagen anterior se elimina después de actualizar, si
+                # ningún otro producto comparte el mismo archivo
+                if current_image and saved_image_path != current_image:
+                    replaced_image = current_image
             else:
                 saved_image_path = current_image
         elif current_image:
             # Si no se proporciona nueva imagen pero hay una actual, mantenerla
             saved_image_path = current_image
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Construir la consulta dinámicamente según los parámetros proporcionados
         query = '''
             UPDATE inventory SET
@@ -369,23 +467,19 @@ class InventoryItem:
         query += ' WHERE id = ?'
         params.append(item_id)
         
-        cursor.execute(query, params)
-        conn.commit()
-        conn.close()
+        write_transaction(lambda uow: uow.execute(query, params))
+
+        InventoryItem._release_image(replaced_image)
 
     @staticmethod
     def update_status(item_id: int, status_id: int) -> None:
         """Actualiza solo el estado de un producto"""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE inventory SET
                 status_id = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        ''', (status_id, item_id))
-        conn.commit()
-        conn.close()
+        ''', (status_id, item_id)))
     
     @staticmethod
     def get_by_code(code: str) -> Optional[Dict]:
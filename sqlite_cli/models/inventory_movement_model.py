@@ -1,4 +1,6 @@
 from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class InventoryMovement:
@@ -35,6 +37,30 @@ class InventoryMovement:
         conn.close()
         return [dict(movement) for movement in movements]
     
+    @staticmethod
+    def page(
+        inventory_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de movimientos (de un producto o de todos), del más reciente al más antiguo."""
+        query = '''
+            SELECT im.*, mt.name as movement_type, u.username as user_name
+            FROM inventory_movements im
+            JOIN movement_types mt ON im.movement_type_id = mt.id
+            LEFT JOIN users u ON im.user_id = u.id
+            WHERE 1=1
+        '''
+        params = []
+        if inventory_id is not None:
+            query += " AND im.inventory_id = ?"
+            params.append(inventory_id)
+        return paginate(
+            query, params, "im.id", "im.created_at", cursor, page_size,
+            descending=True, with_total=with_total
+        )
+    
     @staticmethod
     def create(
         inventory_id: int,
@@ -51,9 +77,7 @@ class InventoryMovement:
         notes: str = None
     ) -> int:
         """Registra un nuevo movimiento de inventario."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        id_ = write_transaction(lambda uow: uow.insert(
             '''INSERT INTO inventory_movements (
                 inventory_id, movement_type_id, quantity_change, stock_change,
                 previous_quantity, new_quantity, previous_stock, new_stock,
@@ -64,8 +88,5 @@ class InventoryMovement:
                 previous_quantity, new_quantity, previous_stock, new_stock,
                 reference_id, reference_type, user_id, notes
             )
-        )
-        conn.commit()
-        id_ = cursor.lastrowid
-        conn.close()
+        ))
         return id_
\ No newline at end of file
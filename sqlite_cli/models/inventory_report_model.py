@@ -1,10 +1,11 @@
-from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+import sqlite3
+from sqlite_cli.database.database import STREAM_BATCH, iter_query
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
 class InventoryReport:
     @staticmethod
-    def get_inventory_report(
+    def _inventory_report_query(
         search_term: Optional[str] = None,
         supplier_id: Optional[int] = None,
         min_stock: Optional[int] = None,
@@ -15,13 +16,8 @@ class InventoryReport:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         order_by_sales: bool = False
-    ) -> List[Dict]:
-        """
-        Obtiene un reporte completo del inventario con filtros opcionales.
-        """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
+    ) -> Tuple[str, List]:
+        """Consulta y parámetros del reporte de inventario."""
         query = '''
             SELECT 
                 i.id,
@@ -97,33 +93,70 @@ class InventoryReport:
             query += " ORDER BY sales_count DESC, i.product ASC"
         else:
             query += " ORDER BY i.product ASC"
-        
-        cursor.execute(query, tuple(params))
-        items = []
-        for row in cursor.fetchall():
-            item = dict(row)
-            # Reemplazar None por "None" en los campos relevantes
-            for key in ['code', 'product', 'description', 'supplier_company', 'expiration_date']:
-                if item[key] is None:
-                    item[key] = "None"
-            items.append(item)
-        conn.close()
-        return items
+        return query, params
 
     @staticmethod
-    def get_inventory_movements_report(
-        inventory_id: Optional[int] = None,
+    def _format_inventory_row(row: sqlite3.Row) -> Dict:
+        item = dict(row)
+        # Reemplazar None por "None" en los campos relevantes
+        for key in ['code', 'product', 'description', 'supplier_company', 'expiration_date']:
+            if item[key] is None:
+                item[key] = "None"
+        return item
+
+    @staticmethod
+    def get_inventory_report(
+        search_term: Optional[str] = None,
+        supplier_id: Optional[int] = None,
+        min_stock: Optional[int] = None,
+        max_stock: Optional[int] = None,
+        min_quantity: Optional[int] = None,
+        max_quantity: Optional[int] = None,
+        expired_only: bool = False,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        movement_type: Optional[str] = None,
-        user_id: Optional[int] = None
+        order_by_sales: bool = False
     ) -> List[Dict]:
         """
-        Obtiene un reporte de movimientos de inventario con filtros opcionales.
+        Obtiene un reporte completo del inventario con filtros opcionales.
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
+        return list(InventoryReport.iter_inventory_report(
+            search_term=search_term,
+            supplier_id=supplier_id,
+            min_stock=min_stock,
+            max_stock=max_stock,
+            min_quantity=min_quantity,
+            max_quantity=max_quantity,
+            expired_only=expired_only,
+            start_date=start_date,
+            end_date=end_date,
+            order_by_sales=order_by_sales
+        ))
+
+    @staticmethod
+    def iter_inventory_report(batch_size: int = STREAM_BATCH, raw: bool = False, **filters: Any) -> Iterator[Dict]:
+        """
+        Recorre el reporte de inventario fila a fila, leyendo el cursor por lotes.
+
+        Acepta los mismos filtros que ``get_inventory_report``; la memoria no
+        depende del número de filas (lo usan los PDF y exportaciones grandes).
+
+        :param raw: Entrega los valores tal como están en la base de datos,
+            sin el formato de pantalla (para exportar)
+        """
+        query, params = InventoryReport._inventory_report_query(**filters)
+        format_row = dict if raw else InventoryReport._format_inventory_row
+        yield from iter_query(query, params, format_row, batch_size)
+
+    @staticmethod
+    def _movements_report_query(
+        inventory_id: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        movement_type: Optional[str] = None,
+        user_id: Optional[int] = None
+    ) -> Tuple[str, List]:
+        """Consulta y parámetros del reporte de movimientos."""
         query = '''
             SELECT 
                 im.id,
@@ -162,13 +195,13 @@ class InventoryReport:
         if start_date:
             # Convertir fecha de formato DD/MM/AAAA a AAAA-MM-DD para SQLite
             start_date = start_date.replace("/", "-")
-            query += " AND DATE(im.created_at) >= ?"
+            query += " AND im.created_at >= ?"
             params.append(start_date)
             
         if end_date:
             # Convertir fecha de formato DD/MM/AAAA a AAAA-MM-DD para SQLite
             end_date = end_date.replace("/", "-")
-            query += " AND DATE(im.created_at) <= ?"
+            query += " AND im.created_at < DATE(?, '+1 day')"
             params.append(end_date)
             
         if movement_type:
@@ -180,24 +213,53 @@ class InventoryReport:
             params.append(user_id)
             
         query += " ORDER BY im.created_at DESC"
+        return query, params
+
+    @staticmethod
+    def _format_movement_row(row: sqlite3.Row) -> Dict:
+        movement = dict(row)
+        # Formatear la fecha para mostrarla en un formato más amigable
+        if 'created_at' in movement and movement['created_at']:
+            try:
+                dt = datetime.strptime(movement['created_at'], '%Y-%m-%d %H:%M:%S')
+                movement['created_at'] = dt.strftime('%d/%m/%Y %H:%M')
+            except ValueError:
+                pass
         
-        cursor.execute(query, tuple(params))
-        movements = []
-        for row in cursor.fetchall():
-            movement = dict(row)
-            # Formatear la fecha para mostrarla en un formato más amigable
-            if 'created_at' in movement and movement['created_at']:
-                try:
-                    dt = datetime.strptime(movement['created_at'], '%Y-%m-%d %H:%M:%S')
-                    movement['created_at'] = dt.strftime('%d/%m/%Y %H:%M')
-                except ValueError:
-                    pass
-            
-            # Reemplazar None por "None" en los campos relevantes
-            for key in ['notes', 'reference_type', 'reference_id']:
-                if movement[key] is None:
-                    movement[key] = "None"
-                    
-            movements.append(movement)
-        conn.close()
-        return movements
\ No newline at end of file
+        # Reemplazar None por "None" en los campos relevantes
+        for key in ['notes', 'reference_type', 'reference_id']:
+            if movement[key] is None:
+                movement[key] = "None"
+        return movement
+
+    @staticmethod
+    def get_inventory_movements_report(
+        inventory_id: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        movement_type: Optional[str] = None,
+        user_id: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Obtiene un reporte de movimientos de inventario con filtros opcionales.
+        """
+        return list(InventoryReport.iter_inventory_movements_report(
+            inventory_id=inventory_id,
+            start_date=start_date,
+            end_date=end_date,
+            movement_type=movement_type,
+            user_id=user_id
+        ))
+
+    @staticmethod
+    def iter_inventory_movements_report(batch_size: int = STREAM_BATCH, raw: bool = False, **filters: Any) -> Iterator[Dict]:
+        """
+        Recorre el reporte de movimientos fila a fila, leyendo el cursor por lotes.
+
+        Acepta los mismos filtros que ``get_inventory_movements_report``.
+
+        :param raw: Entrega los valores sin el formato de pantalla (para exportar)
+        """
+        query, params = InventoryReport._movements_report_query(**filters)
+        format_row = dict if raw else InventoryReport._format_movement_row
+        yield from iter_query(query, params, format_row, batch_size)
\ No newline at end of file
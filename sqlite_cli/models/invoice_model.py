@@ -1,36 +1,20 @@
-import sqlite3
-import os
-import time
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
+from sqlite_cli.database.database import get_db_connection as get_pooled_connection
+from sqlite_cli.database.connection_manager import PooledConnection
+from sqlite_cli.database.unit_of_work import UnitOfWork
+from sqlite_cli.database.write_queue import write_transaction
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from sqlite_cli.database.reference_cache import ReferenceCache
 from datetime import datetime
-from sqlite_cli.models.inventory_model import InventoryItem
-from sqlite_cli.models.inventory_movement_model import InventoryMovement
-from sqlite_cli.models.movement_type_model import MovementType
-from sqlite_cli.models.service_request_model import ServiceRequest
 from sqlite_cli.models.service_model import Service
-from sqlite_cli.models.service_request_movement_type_model import ServiceRequestMovementType
+from sqlite_cli.models.stock_model import Stock
 from utils.session_manager import SessionManager
 
 class Invoice:
-    BUSY_TIMEOUT = 5000  # 5 segundos (en milisegundos)
-    MAX_RETRIES = 3      # Intentos máximos por operación
-
     @staticmethod
-    def get_db_connection() -> sqlite3.Connection:
-        """Crea una conexión a la base de datos con configuración optimizada."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(current_dir, "..", "database", "db.db")
-
-        conn = sqlite3.connect(
-            db_path,
-            timeout=Invoice.BUSY_TIMEOUT / 1000,
-            isolation_level=None,
-            check_same_thread=False
-        )
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute(f"PRAGMA busy_timeout={Invoice.BUSY_TIMEOUT}")
-        conn.row_factory = sqlite3.Row
-        return conn
+    def get_db_connection() -> PooledConnection:
+        """Obtiene la conexión compartida del gestor (WAL y busy_timeout vienen del perfil de PRAGMA)."""
+        return get_pooled_connection()
 
     @staticmethod
     def _execute_sql(
@@ -39,41 +23,21 @@ class Invoice:
         fetch: bool = False
     ) -> Union[List[Dict], int, None]:
         """
-        Ejecuta una consulta SQL con manejo de errores y reintentos.
+        Ejecuta una consulta SQL.
+
+        Las lecturas usan la conexión del hilo; las escrituras pasan por el
+        escritor único (``write_queue``), que las serializa con las del resto
+        de la aplicación sin reintentos ni pausas.
         """
-        conn = None
-        last_exception = None
-        
-        for attempt in range(Invoice.MAX_RETRIES):
+        if fetch:
+            conn = Invoice.get_db_connection()
             try:
-                conn = Invoice.get_db_connection()
-                cursor = conn.cursor()
-                
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                
-                if fetch:
-                    result = [dict(row) for row in cursor.fetchall()]
-                    conn.close()
-                    return result
-                
-                last_id = cursor.lastrowid
-                conn.commit()
-                conn.close()
-                
-                return last_id if "INSERT" in query.upper() else None
-                
-            except sqlite3.OperationalError as e:
-                last_exception = e
-                if "locked" in str(e).lower() and attempt < Invoice.MAX_RETRIES - 1:
-                    time.sleep(0.2 * (attempt + 1))
-                    continue
-                raise last_exception
+                return [dict(row) for row in conn.execute(query, params or ()).fetchall()]
             finally:
-                if conn:
-                    conn.close()
+                conn.close()
+
+        last_id = write_transaction(lambda uow: uow.insert(query, params or ()))
+        return last_id if "INSERT" in query.upper() else None
 
     @staticmethod
     def create_paid_invoice(
@@ -116,133 +80,155 @@ class Invoice:
         if abs(total_payments - total) > 0.01:  # Tolerancia de 1 céntimo
             raise ValueError(f"La suma de los pagos ({total_payments:.2f}) no coincide con el total ({total:.2f})")
 
-        # Obtener ID del tipo de factura "Venta"
-        invoice_type_id = Invoice._get_invoice_type_id("Venta")
-        
-        # 1. Registrar factura principal
-        invoice_id = Invoice._create_invoice(customer_id, invoice_type_id, subtotal, taxes, total)
-        
-        # 2. Registrar métodos de pago (uno por uno)
-        for payment in payment_details:
-            Invoice.add_payment(
-                invoice_id=invoice_id,
-                payment_method=payment['method'],
-                amount=payment['amount'],
-                bank=payment.get('bank'),
-                reference=payment.get('reference')
-            )
-        
-        # 3. Procesar items (uno por uno)
-        for item in items:
-            if item.get('is_service', False):
-                # Para servicios: crear service_request y luego detalle de servicio
-                service_request_id = ServiceRequest.create(
-                    customer_id=customer_id,
-                    service_id=item['id'],
-                    description=f"Servicio vendido en factura #{invoice_id}",
-                    quantity=item['quantity']
-                )
-                
-                # Registrar movimiento en el historial de servicios
-                movement_type = ServiceRequestMovementType.get_by_name("CREACION")
-                if not movement_type:
+        user_id = SessionManager.get_user_id()
+        if not user_id:
+            raise ValueError("Usuario no autenticado")
+
+        has_products = any(not item.get('is_service', False) for item in items)
+        has_services = any(item.get('is_service', False) for item in items)
+
+        # Toda la venta se registra en una sola transacción del escritor: si
+        # algo falla no queda ninguna factura, pago ni movimiento a medias.
+        def write(uow: UnitOfWork) -> int:
+            invoice_type = uow.lookup("invoice_types", "Venta")
+            if not invoice_type:
+                raise ValueError("Tipo de factura 'Venta' no encontrado")
+
+            status = uow.lookup("invoice_status", "Paid")
+            if not status:
+                raise ValueError("Estado 'Paid' no encontrado")
+
+            sale_movement = None
+            if has_products:
+                sale_movement = uow.lookup("movement_types", "Venta")
+                if not sale_movement:
+                    raise ValueError("Tipo de movimiento 'Venta' no encontrado")
+
+            creation_movement = None
+            if has_services:
+                creation_movement = uow.lookup("service_request_movement_types", "CREACION")
+                if not creation_movement:
                     raise ValueError("Tipo de movimiento 'CREACION' no encontrado")
 
-                user_id = SessionManager.get_user_id()
-                if not user_id:
-                    raise ValueError("Usuario no autenticado")
+            # 1. Registrar factura principal
+            issue_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            invoice_id = uow.insert(
+                '''
+                INSERT INTO invoices (
+                    customer_id, invoice_type_id, issue_date, 
+                    subtotal, taxes, total, status_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''',
+                (customer_id, invoice_type['id'], issue_date, subtotal, taxes, total, status['id'])
+            )
+
+            # 2. Registrar métodos de pago (en lote)
+            uow.executemany(
+                '''
+                INSERT INTO invoice_payments (
+                    invoice_id, payment_method, bank, amount, reference
+                ) VALUES (?, ?, ?, ?, ?)
+                ''',
+                [
+                    (invoice_id, p['method'], p.get('bank'), p['amount'], p.get('reference'))
+                    for p in payment_details
+                ]
+            )
 
-                # Insertar en service_request_movements
-                Invoice._execute_sql(
-                    '''
-                    INSERT INTO service_request_movements (
-                        request_id, movement_type_id, new_employee_id,
-                        new_status_id, new_request_status_id, reference_id,
-                        reference_type, user_id, notes
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''',
-                    (
-                        service_request_id, movement_type['id'], user_id,
+            # 3. Leer de una vez los precios de servicios involucrados
+            service_prices = Invoice._fetch_by_ids(
+                uow, "SELECT id, price FROM services WHERE id IN ({})",
+                [item['id'] for item in items if item.get('is_service', False)]
+            )
+
+            detail_rows = []
+            stock_changes = []
+            service_movement_rows = []
+
+            for item in items:
+                if item.get('is_service', False):
+                    service = service_prices.get(item['id'])
+                    if not service:
+                        raise ValueError("Servicio no encontrado")
+
+                    # Crear la solicitud de servicio asociada
+                    service_request_id = uow.insert(
+                        '''INSERT INTO service_requests 
+                        (request_number, customer_id, service_id, employee_id, 
+                        description, quantity, total, request_status_id, status_id)
+                        VALUES ('SR-', ?, ?, 0, ?, ?, ?, 1, 1)''',
+                        (customer_id, item['id'], f"Servicio vendido en factura #{invoice_id}",
+                        item['quantity'], service['price'] * item['quantity'])
+                    )
+                    uow.execute(
+                        'UPDATE service_requests SET request_number = ? WHERE id = ?',
+                        (f"SR-{service_request_id}", service_request_id)
+                    )
+
+                    service_movement_rows.append((
+                        service_request_id, creation_movement['id'], user_id,
                         1,  # ID del estado inicial (por ejemplo, 1 para "Pendiente")
                         1,  # ID del estado de solicitud inicial (por ejemplo, 1 para "Nuevo")
                         invoice_id,
                         'invoice',
                         user_id,
                         f"Servicio creado desde factura #{invoice_id}"
-                    )
-                )
-                
-                # Registrar detalle de servicio (con service_request_id y product_id=NULL)
-                Invoice._execute_sql(
-                    '''
-                    INSERT INTO invoice_details (
-                        invoice_id, service_request_id, product_id,
-                        quantity, unit_price, subtotal
-                    ) VALUES (?, ?, NULL, ?, ?, ?)
-                    ''',
-                    (invoice_id, service_request_id, item['quantity'], 
-                    item['unit_price'], item['total'])
-                )
-            else:
-                # Para productos: manejar inventario
-                product = InventoryItem.get_by_id(item['id'])
-                if not product:
-                    raise ValueError(f"Producto ID {item['id']} no encontrado")
-                
-                # Solo disminuir el stock (disponible para vender), no quantity (inventario físico)
-                new_stock = product['stock'] - item['quantity']
-                
-                if new_stock < 0:
-                    raise ValueError(f"Stock insuficiente para el producto ID {item['id']}")
-                
-                # Actualizar solo el stock en el inventario
-                Invoice._execute_sql(
-                    '''
-                    UPDATE inventory SET
-                        stock = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                    ''',
-                    (new_stock, item['id'])
-                )
-                
-                # Registrar movimiento de inventario
-                user_id = SessionManager.get_user_id()
-                if not user_id:
-                    raise ValueError("Usuario no autenticado")
-                
-                movement_type = MovementType.get_by_name("Venta")
-                if not movement_type:
-                    raise ValueError("Tipo de movimiento 'Venta' no encontrado")
-                
-                InventoryMovement.create(
-                    inventory_id=item['id'],
-                    movement_type_id=movement_type['id'],
-                    quantity_change=0,  # No cambia el quantity (inventario físico)
-                    stock_change=-item['quantity'],  # Solo disminuye el stock
-                    previous_quantity=product['quantity'],
-                    new_quantity=product['quantity'],  # Se mantiene igual
-                    previous_stock=product['stock'],
-                    new_stock=new_stock,
-                    reference_id=invoice_id,
-                    reference_type="invoice",
-                    user_id=user_id,
-                    notes=f"Venta factura #{invoice_id}"
-                )
-                
-                # Registrar detalle de producto (con product_id y service_request_id=NULL)
-                Invoice._execute_sql(
-                    '''
-                    INSERT INTO invoice_details (
-                        invoice_id, product_id, service_request_id,
-                        quantity, unit_price, subtotal
-                    ) VALUES (?, ?, NULL, ?, ?, ?)
-                    ''',
-                    (invoice_id, item['id'], item['quantity'], 
-                    item['unit_price'], item['total'])
-                )
-        
-        return invoice_id
+                    ))
+
+                    # Detalle de servicio (con service_request_id y product_id=NULL)
+                    detail_rows.append((
+                        invoice_id, None, service_request_id,
+                        item['quantity'], item['unit_price'], item['total']
+                    ))
+                else:
+                    # Solo disminuir el stock (disponible para vender), no quantity (inventario físico)
+                    stock_changes.append({'inventory_id': item['id'], 'stock_change': -item['quantity']})
+
+                    # Detalle de producto (con product_id y service_request_id=NULL)
+                    detail_rows.append((
+                        invoice_id, item['id'], None,
+                        item['quantity'], item['unit_price'], item['total']
+                    ))
+
+            # 4. Descontar el stock (falla si otra terminal vendió las últimas
+            #    unidades) y escribir movimientos y detalles en lotes
+            Stock.apply_many(
+                uow, stock_changes, sale_movement['id'] if sale_movement else None, user_id,
+                reference_id=invoice_id, reference_type="invoice",
+                notes=f"Venta factura #{invoice_id}"
+            )
+            uow.executemany(
+                '''
+                INSERT INTO service_request_movements (
+                    request_id, movement_type_id, new_employee_id,
+                    new_status_id, new_request_status_id, reference_id,
+                    reference_type, user_id, notes
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''',
+                service_movement_rows
+            )
+            uow.executemany(
+                '''
+                INSERT INTO invoice_details (
+                    invoice_id, product_id, service_request_id,
+                    quantity, unit_price, subtotal
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ''',
+                detail_rows
+            )
+            return invoice_id
+
+        return write_transaction(write)
+
+    @staticmethod
+    def _fetch_by_ids(uow: UnitOfWork, query: str, ids: List[int]) -> Dict[int, Dict]:
+        """Ejecuta una consulta ``... WHERE id IN ({})`` y devuelve las filas indexadas por ID."""
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return {}
+        placeholders = ", ".join("?" * len(unique_ids))
+        rows = uow.fetchall(query.format(placeholders), unique_ids)
+        return {row['id']: row for row in rows}
 
     @staticmethod
     def add_payment(
@@ -339,14 +325,10 @@ class Invoice:
     @staticmethod
     def _get_status_id(status_name: str) -> int:
         """Obtiene el ID de un estado de factura."""
-        result = Invoice._execute_sql(
-            "SELECT id FROM invoice_status WHERE name = ? LIMIT 1",
-            (status_name,),
-            fetch=True
-        )
-        if not result:
+        status = ReferenceCache.get("invoice_status", status_name)
+        if not status:
             raise ValueError(f"Estado '{status_name}' no encontrado")
-        return result[0]['id']
+        return status['id']
 
     @staticmethod
     def get_by_id(invoice_id: int) -> Optional[Dict]:
@@ -383,14 +365,10 @@ class Invoice:
     @staticmethod
     def _get_invoice_type_id(type_name: str) -> int:
         """Obtiene el ID de un tipo de factura."""
-        result = Invoice._execute_sql(
-            "SELECT id FROM invoice_types WHERE name = ? LIMIT 1",
-            (type_name,),
-            fetch=True
-        )
-        if not result:
+        invoice_type = ReferenceCache.get("invoice_types", type_name)
+        if not invoice_type:
             raise ValueError(f"Tipo de factura '{type_name}' no encontrado")
-        return result[0]['id']
+        return invoice_type['id']
 
     @staticmethod
     def get_details(invoice_id: int) -> List[Dict]:
@@ -455,6 +433,24 @@ class Invoice:
         
         status_id = Invoice._get_status_id(new_status)
         
+        if new_status == "Cancelled":
+            # El cambio de estado y la devolución al inventario van juntos;
+            # una factura ya anulada no vuelve a devolver existencias.
+            def cancel(uow: UnitOfWork) -> None:
+                cursor = uow.execute(
+                    '''
+                    UPDATE invoices
+                    SET status_id = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND status_id != ?
+                    ''',
+                    (status_id, invoice_id, status_id)
+                )
+                if cursor.rowcount:
+                    Invoice._handle_cancellation(uow, invoice_id)
+
+            write_transaction(cancel)
+            return True
+
         Invoice._execute_sql(
             '''
             UPDATE invoices
@@ -464,59 +460,44 @@ class Invoice:
             (status_id, invoice_id)
         )
         
-        if new_status == "Cancelled":
-            Invoice._handle_cancellation(invoice_id)
-        
         return True
 
     @staticmethod
-    def _handle_cancellation(invoice_id: int) -> None:
-        """Maneja la lógica de cancelación de facturas (solo para productos)."""
-        details = Invoice.get_details(invoice_id)
+    def _handle_cancellation(uow: UnitOfWork, invoice_id: int) -> None:
+        """Devuelve al inventario los productos de una factura anulada (dentro de ``uow``)."""
         user_id = SessionManager.get_user_id()
         if not user_id:
             raise ValueError("Usuario no autenticado")
         
-        movement_type = MovementType.get_by_name("Ajuste positivo")
+        movement_type = uow.lookup("movement_types", "Ajuste positivo")
         if not movement_type:
             raise ValueError("Tipo de movimiento 'Ajuste positivo' no encontrado")
         
-        for detail in details:
-            if detail['item_type'] == 'product' and detail['product_id']:
-                product = InventoryItem.get_by_id(detail['product_id'])
-                if not product:
-                    continue
-                
-                new_quantity = product['quantity'] + detail['quantity']
-                new_stock = product['stock'] + detail['quantity']
-                
-                # Actualizar inventario
-                Invoice._execute_sql(
-                    '''
-                    UPDATE inventory SET
-                        quantity = ?,
-                        stock = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                    ''',
-                    (new_quantity, new_stock, detail['product_id'])
-                )
-                
-                # Registrar movimiento
-                InventoryMovement.create(
-                    inventory_id=detail['product_id'],
-                    movement_type_id=movement_type['id'],
-                    quantity_change=detail['quantity'],
-                    stock_change=detail['quantity'],
-                    previous_quantity=product['quantity'],
-                    new_quantity=new_quantity,
-                    previous_stock=product['stock'],
-                    new_stock=new_stock,
-                    reference_id=invoice_id,
-                    reference_type="invoice_cancellation",
-                    user_id=user_id,
-                    notes=f"Cancelación factura #{invoice_id}"
-                )
+        # Sólo productos que siguen existiendo (el detalle puede apuntar a uno eliminado)
+        details = uow.fetchall(
+            '''
+            SELECT d.product_id, d.quantity
+            FROM invoice_details d
+            JOIN inventory i ON i.id = d.product_id
+            WHERE d.invoice_id = ?
+            ORDER BY d.id
+            ''',
+            (invoice_id,)
+        )
+        Stock.apply_many(
+            uow,
+            [
+                {
+                    'inventory_id': detail['product_id'],
+                    'quantity_change': detail['quantity'],
+                    'stock_change': detail['quantity'],
+                }
+                for detail in details
+            ],
+            movement_type['id'], user_id,
+            reference_id=invoice_id, reference_type="invoice_cancellation",
+            notes=f"Cancelación factura #{invoice_id}"
+        )
 
     @staticmethod
     def search(
@@ -527,6 +508,38 @@ class Invoice:
         search_term: Optional[str] = None
     ) -> List[Dict]:
         """Busca facturas con filtros opcionales."""
+        query, params = Invoice._search_query(customer_id, status, start_date, end_date, search_term)
+        query += " ORDER BY i.issue_date DESC"
+        
+        return Invoice._execute_sql(query, tuple(params), fetch=True) or []
+
+    @staticmethod
+    def page(
+        customer_id: Optional[int] = None,
+        status: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        search_term: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de facturas, de la más reciente a la más antigua (ver ``paginate``)."""
+        query, params = Invoice._search_query(customer_id, status, start_date, end_date, search_term)
+        return paginate(
+            query, params, "i.id", "i.issue_date", cursor, page_size,
+            descending=True, with_total=with_total
+        )
+
+    @staticmethod
+    def _search_query(
+        customer_id: Optional[int],
+        status: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        search_term: Optional[str]
+    ) -> Tuple[str, List]:
+        """Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``."""
         query = '''
             SELECT 
                 i.*,
@@ -548,11 +561,11 @@ class Invoice:
             params.append(status)
         
         if start_date:
-            query += " AND DATE(i.issue_date) >= ?"
+            query += " AND i.issue_date >= ?"
             params.append(start_date)
         
         if end_date:
-            query += " AND DATE(i.issue_date) <= ?"
+            query += " AND i.issue_date < DATE(?, '+1 day')"
             params.append(end_date)
         
         if search_term:
@@ -560,6 +573,4 @@ class Invoice:
             search_param = f"%{search_term}%"
             params.extend([search_param] * 4)
         
-        query += " ORDER BY i.issue_date DESC"
-        
-        return Invoice._execute_sql(query, tuple(params), fetch=True) or []
\ No newline at end of file
+        return query, params
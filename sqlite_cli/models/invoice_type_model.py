@@ -1,5 +1,6 @@
 # models/invoice_type_model.py
-from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.reference_cache import ReferenceCache
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class InvoiceType:
@@ -11,14 +12,11 @@ class InvoiceType:
         :param name: Nombre del tipo (ej. 'Compra', 'Venta')
         :param description: Descripción del tipo (opcional)
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'INSERT INTO invoice_types (name, description) VALUES (?, ?)',
             (name, description)
-        )
-        conn.commit()
-        conn.close()
+        ))
+        ReferenceCache.invalidate("invoice_types")
 
     @staticmethod
     def all() -> List[Dict]:
@@ -27,12 +25,7 @@ class InvoiceType:
         
         :return: Lista de diccionarios con los tipos de factura
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM invoice_types')
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        return ReferenceCache.all("invoice_types")
 
     @staticmethod
     def get_by_name(name: str) -> Optional[Dict]:
@@ -42,12 +35,7 @@ class InvoiceType:
         :param name: Nombre del tipo de factura
         :return: Diccionario con los datos del tipo o None
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM invoice_types WHERE name = ?', (name,))
-        item = cursor.fetchone()
-        conn.close()
-        return dict(item) if item else None
+        return ReferenceCache.get("invoice_types", name)
 
     @staticmethod
     def get_by_id(id: int) -> Optional[Dict]:
@@ -57,9 +45,4 @@ class InvoiceType:
         :param id: ID del tipo de factura
         :return: Diccionario con los datos del tipo o None
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM invoice_types WHERE id = ?', (id,))
-        item = cursor.fetchone()
-        conn.close()
-        return dict(item) if item else None
\ No newline at end of file
+        return ReferenceCache.get("invoice_types", id, "id")
\ No newline at end of file
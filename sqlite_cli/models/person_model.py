@@ -1,5 +1,6 @@
 # models/person_model.py
 from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class Person:
@@ -15,16 +16,11 @@ class Person:
         position: Optional[str] = None
     ) -> int:
         """Crea una nueva persona y devuelve su ID."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        person_id = write_transaction(lambda uow: uow.insert('''
             INSERT INTO person (
                 first_name, last_name, id_number, address, phone, email, department, position
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (first_name, last_name, id_number, address, phone, email, department, position))
-        person_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        ''', (first_name, last_name, id_number, address, phone, email, department, position)))
         return person_id
 
     @staticmethod
@@ -40,9 +36,7 @@ class Person:
         position: Optional[str] = None
     ) -> None:
         """Actualiza los datos de una persona."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE person SET
                 first_name = ?,
                 last_name = ?,
@@ -54,9 +48,7 @@ class Person:
                 position = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        ''', (first_name, last_name, id_number, address, phone, email, department, position, person_id))
-        conn.commit()
-        conn.close()
+        ''', (first_name, last_name, id_number, address, phone, email, department, position, person_id)))
 
     @staticmethod
     def get_by_id(person_id: int) -> Optional[Dict]:
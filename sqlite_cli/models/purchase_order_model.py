@@ -1,33 +1,19 @@
-import sqlite3
-import os
-import time
 from datetime import datetime
 from typing import List, Dict, Optional, Union
+from sqlite_cli.database.database import get_db_connection as get_pooled_connection
+from sqlite_cli.database.connection_manager import PooledConnection
+from sqlite_cli.database.unit_of_work import UnitOfWork
+from sqlite_cli.database.write_queue import write_transaction
 from sqlite_cli.models.supplier_model import Supplier
 from sqlite_cli.models.inventory_model import InventoryItem
 from sqlite_cli.models.purchase_order_status_model import PurchaseOrderStatus
 from utils.session_manager import SessionManager
 
 class PurchaseOrder:
-    BUSY_TIMEOUT = 5000  # 5 segundos (en milisegundos)
-    MAX_RETRIES = 3      # Intentos máximos por operación
-
     @staticmethod
-    def get_db_connection() -> sqlite3.Connection:
-        """Crea una conexión a la base de datos con configuración optimizada."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(current_dir, "..", "database", "db.db")
-
-        conn = sqlite3.connect(
-            db_path,
-            timeout=PurchaseOrder.BUSY_TIMEOUT / 1000,
-            isolation_level=None,
-            check_same_thread=False
-        )
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute(f"PRAGMA busy_timeout={PurchaseOrder.BUSY_TIMEOUT}")
-        conn.row_factory = sqlite3.Row
-        return conn
+    def get_db_connection() -> PooledConnection:
+        """Obtiene la conexión compartida del gestor (WAL y busy_timeout vienen del perfil de PRAGMA)."""
+        return get_pooled_connection()
 
     @staticmethod
     def _execute_sql(
@@ -36,41 +22,21 @@ class PurchaseOrder:
         fetch: bool = False
     ) -> Union[List[Dict], int, None]:
         """
-        Ejecuta una consulta SQL con manejo de errores y reintentos.
+        Ejecuta una consulta SQL.
+
+        Las lecturas usan la conexión del hilo; las escrituras pasan por el
+        escritor único (``write_queue``), que las serializa con las del resto
+        de la aplicación sin reintentos ni pausas.
         """
-        conn = None
-        last_exception = None
-        
-        for attempt in range(PurchaseOrder.MAX_RETRIES):
+        if fetch:
+            conn = PurchaseOrder.get_db_connection()
             try:
-                conn = PurchaseOrder.get_db_connection()
-                cursor = conn.cursor()
-                
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                
-                if fetch:
-                    result = [dict(row) for row in cursor.fetchall()]
-                    conn.close()
-                    return result
-                
-                last_id = cursor.lastrowid
-                conn.commit()
-                conn.close()
-                
-                return last_id if "INSERT" in query.upper() else None
-                
-            except sqlite3.OperationalError as e:
-                last_exception = e
-                if "locked" in str(e).lower() and attempt < PurchaseOrder.MAX_RETRIES - 1:
-                    time.sleep(0.2 * (attempt + 1))
-                    continue
-                raise last_exception
+                return [dict(row) for row in conn.execute(query, params or ()).fetchall()]
             finally:
-                if conn:
-                    conn.close()
+                conn.close()
+
+        last_id = write_transaction(lambda uow: uow.insert(query, params or ()))
+        return last_id if "INSERT" in query.upper() else None
 
     @staticmethod
     def get_next_order_number() -> str:
@@ -131,27 +97,9 @@ class PurchaseOrder:
             if not status:
                 raise ValueError("Estado 'draft' no encontrado en purchase_order_status")
             
-            # 1. Registrar la orden principal
-            order_id = PurchaseOrder._execute_sql(
-                '''
-                INSERT INTO purchase_orders (
-                    order_number, supplier_id, issue_date,
-                    expected_delivery_date, status_id, subtotal,
-                    taxes, total, notes, created_by
-                ) VALUES (?, ?, datetime('now'), ?, ?, ?, ?, ?, ?, ?)
-                ''',
-                (
-                    order_number, supplier_id, delivery_date,
-                    status['id'], subtotal, iva, total, notes, created_by
-                )
-            )
-            
-            if not order_id:
-                raise ValueError("No se pudo crear la orden principal")
-            
-            # 2. Registrar los detalles de la orden
+            # Los productos sin ID se buscan por código antes de escribir
+            detail_rows = []
             for product in products:
-                # Buscar el producto por código si no tiene ID
                 product_id = None
                 if product.get('id'):
                     product_id = product['id']
@@ -159,21 +107,43 @@ class PurchaseOrder:
                     item = InventoryItem.get_by_code(product['code'])
                     if item:
                         product_id = item['id']
-                
-                PurchaseOrder._execute_sql(
+                detail_rows.append((
+                    product_id, product.get('name', product.get('description', '')),
+                    product['quantity'], product['unit_price'], product['unit_price']
+                ))
+
+            # La orden y sus detalles se registran en una sola transacción
+            def write(uow: UnitOfWork) -> int:
+                # 1. Registrar la orden principal
+                order_id = uow.insert(
+                    '''
+                    INSERT INTO purchase_orders (
+                        order_number, supplier_id, issue_date,
+                        expected_delivery_date, status_id, subtotal,
+                        taxes, total, notes, created_by
+                    ) VALUES (?, ?, datetime('now'), ?, ?, ?, ?, ?, ?, ?)
+                    ''',
+                    (
+                        order_number, supplier_id, delivery_date,
+                        status['id'], subtotal, iva, total, notes, created_by
+                    )
+                )
+                if not order_id:
+                    raise ValueError("No se pudo crear la orden principal")
+
+                # 2. Registrar los detalles de la orden (en lote)
+                uow.executemany(
                     '''
                     INSERT INTO purchase_order_details (
                         order_id, product_id, product_name, quantity,
                         unit_price, reference_price, notes
                     ) VALUES (?, ?, ?, ?, ?, ?, ?)
                     ''',
-                    (
-                        order_id, product_id, product.get('name', product.get('description', '')), 
-                        product['quantity'], product['unit_price'], product['unit_price'],
-                        f"Agregado en orden {order_number}"
-                    )
+                    [(order_id, *row, f"Agregado en orden {order_number}") for row in detail_rows]
                 )
-            
+                return order_id
+
+            write_transaction(write)
             return True
         except Exception as e:
             print(f"Error al crear orden de compra: {str(e)}")
@@ -1,39 +1,16 @@
-from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+from sqlite_cli.database.database import STREAM_BATCH, get_db_connection, iter_query
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
 class PurchaseOrderReport:
     @staticmethod
-    def get_purchase_orders_report(
+    def _purchase_orders_filter(
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         search_term: Optional[str] = None
-    ) -> List[Dict]:
-        """
-        Obtiene un reporte completo de órdenes de compra con sus detalles.
-        
-        :param start_date: Fecha de inicio en formato YYYY-MM-DD
-        :param end_date: Fecha de fin en formato YYYY-MM-DD
-        :param search_term: Término para buscar en todos los campos relevantes
-        :return: Lista de diccionarios con los datos completos de las órdenes
-        """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Consulta principal para obtener las órdenes
-        order_query = '''
-            SELECT 
-                po.id,
-                po.order_number,
-                po.issue_date,
-                po.expected_delivery_date,
-                po.subtotal,
-                po.taxes,
-                po.total,
-                po.notes,
-                s.company as supplier_company,
-                s.id_number as supplier_id_number,
-                u.username as created_by
+    ) -> Tuple[str, List]:
+        """``FROM ... WHERE`` de las órdenes del reporte y sus parámetros."""
+        order_filter = '''
             FROM purchase_orders po
             JOIN suppliers s ON po.supplier_id = s.id
             JOIN users u ON po.created_by = u.id
@@ -43,16 +20,16 @@ class PurchaseOrderReport:
         params = []
         
         if start_date:
-            order_query += " AND DATE(po.issue_date) >= ?"
+            order_filter += " AND po.issue_date >= ?"
             params.append(start_date)
         
         if end_date:
-            order_query += " AND DATE(po.issue_date) <= ?"
+            order_filter += " AND po.issue_date < DATE(?, '+1 day')"
             params.append(end_date)
         
         if search_term:
             search_param = f"%{search_term}%"
-            order_query += '''
+            order_filter += '''
                 AND (po.order_number LIKE ? 
                 OR s.company LIKE ? 
                 OR s.id_number LIKE ?
@@ -63,16 +40,63 @@ class PurchaseOrderReport:
             '''
             params.extend([search_param] * 7)
         
-        order_query += " ORDER BY po.issue_date DESC"
+        return order_filter, params
+
+    @staticmethod
+    def _purchase_orders_query(**filters: Any) -> Tuple[str, List]:
+        """Consulta y parámetros de las órdenes del reporte (sin ítems)."""
+        order_filter, params = PurchaseOrderReport._purchase_orders_filter(**filters)
+        # La cantidad de productos se cuenta en SQL con idx_purchase_order_details_order
+        query = '''
+            SELECT 
+                po.id,
+                po.order_number,
+                po.issue_date,
+                po.expected_delivery_date,
+                po.subtotal,
+                po.taxes,
+                po.total,
+                po.notes,
+                s.company as supplier_company,
+                s.id_number as supplier_id_number,
+                u.username as created_by,
+                (SELECT COUNT(*) FROM purchase_order_details pod
+                 WHERE pod.order_id = po.id) as product_count
+        ''' + order_filter + " ORDER BY po.issue_date DESC"
+        return query, params
+
+    @staticmethod
+    def get_purchase_orders_report(
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        search_term: Optional[str] = None,
+        include_items: bool = True
+    ) -> List[Dict]:
+        """
+        Obtiene un reporte completo de órdenes de compra con sus detalles.
         
+        :param start_date: Fecha de inicio en formato YYYY-MM-DD
+        :param end_date: Fecha de fin en formato YYYY-MM-DD
+        :param search_term: Término para buscar en todos los campos relevantes
+        :param include_items: Adjunta los ítems de cada orden en ``'items'``;
+            los listados que sólo muestran la cantidad deben pasar ``False``
+        :return: Lista de diccionarios con los datos completos de las órdenes
+        """
+        filters = dict(start_date=start_date, end_date=end_date, search_term=search_term)
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        order_query, params = PurchaseOrderReport._purchase_orders_query(**filters)
         cursor.execute(order_query, tuple(params))
         orders = [dict(row) for row in cursor.fetchall()]
         
-        if not orders:
+        if not orders or not include_items:
             conn.close()
-            return []
+            return orders
         
-        # Consulta para obtener los detalles de cada orden
+        # Detalles de todas las órdenes del reporte en una sola consulta
+        # (no una por orden), agrupados por orden en una pasada
+        order_filter, params = PurchaseOrderReport._purchase_orders_filter(**filters)
         detail_query = '''
             SELECT 
                 pod.*,
@@ -80,21 +104,60 @@ class PurchaseOrderReport:
                 i.product as product_name
             FROM purchase_order_details pod
             LEFT JOIN inventory i ON pod.product_id = i.id
-            WHERE pod.order_id = ?
-            ORDER BY pod.id
+            WHERE pod.order_id IN (SELECT po.id ''' + order_filter + ''')
+            ORDER BY pod.order_id, pod.id
         '''
         
-        # Obtener detalles para cada orden
+        items_by_order: Dict[int, List[Dict]] = {}
+        cursor.execute(detail_query, tuple(params))
+        for row in cursor.fetchall():
+            item = dict(row)
+            items_by_order.setdefault(item['order_id'], []).append(item)
+        
         for order in orders:
-            cursor.execute(detail_query, (order['id'],))
-            order['items'] = [dict(row) for row in cursor.fetchall()]
-            
-            # Calcular cantidad de productos
-            order['product_count'] = len(order['items'])
+            order['items'] = items_by_order.get(order['id'], [])
         
         conn.close()
         return orders
 
+    @staticmethod
+    def iter_purchase_orders_report(batch_size: int = STREAM_BATCH, **filters: Any) -> Iterator[Dict]:
+        """
+        Recorre las órdenes del reporte fila a fila, leyendo el cursor por lotes.
+
+        Acepta los mismos filtros que ``get_purchase_orders_report`` (sin ``include_items``).
+        """
+        query, params = PurchaseOrderReport._purchase_orders_query(**filters)
+        yield from iter_query(query, params, dict, batch_size)
+
+    @staticmethod
+    def iter_purchase_orders_report_items(batch_size: int = STREAM_BATCH, **filters: Any) -> Iterator[Dict]:
+        """
+        Recorre los productos pedidos en las órdenes del reporte, una fila por
+        ítem con los datos de su orden, leyendo el cursor por lotes.
+        """
+        order_filter, params = PurchaseOrderReport._purchase_orders_filter(**filters)
+        query = '''
+            SELECT 
+                po.order_number,
+                po.issue_date,
+                s.company as supplier_company,
+                s.id_number as supplier_id_number,
+                i.code as product_code,
+                COALESCE(i.product, pod.product_name) as product_name,
+                pod.quantity,
+                pod.received_quantity,
+                pod.unit_price,
+                pod.subtotal
+            FROM purchase_order_details pod
+            JOIN purchase_orders po ON pod.order_id = po.id
+            JOIN suppliers s ON po.supplier_id = s.id
+            LEFT JOIN inventory i ON pod.product_id = i.id
+            WHERE pod.order_id IN (SELECT po.id ''' + order_filter + ''')
+            ORDER BY po.issue_date DESC, pod.order_id, pod.id
+        '''
+        yield from iter_query(query, params, dict, batch_size)
+
     @staticmethod
     def get_order_details(order_id: int) -> Dict:
         """
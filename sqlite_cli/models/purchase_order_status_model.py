@@ -1,4 +1,5 @@
-from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.reference_cache import ReferenceCache
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class PurchaseOrderStatus:
@@ -11,15 +12,11 @@ class PurchaseOrderStatus:
         :param description: Descripción opcional del estado
         :return: ID del estado creado
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        last_id = write_transaction(lambda uow: uow.insert(
             'INSERT INTO purchase_order_status (name, description) VALUES (?, ?)',
             (name, description)
-        )
-        conn.commit()
-        last_id = cursor.lastrowid
-        conn.close()
+        ))
+        ReferenceCache.invalidate("purchase_order_status")
         return last_id
 
     @staticmethod
@@ -29,12 +26,7 @@ class PurchaseOrderStatus:
         
         :return: Lista de diccionarios con los estados
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM purchase_order_status')
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        return ReferenceCache.all("purchase_order_status")
 
     @staticmethod
     def get_by_id(status_id: int) -> Optional[Dict]:
@@ -44,12 +36,7 @@ class PurchaseOrderStatus:
         :param status_id: ID del estado
         :return: Diccionario con los datos del estado o None si no existe
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM purchase_order_status WHERE id = ?', (status_id,))
-        row = cursor.fetchone()
-        conn.close()
-        return dict(row) if row else None
+        return ReferenceCache.get("purchase_order_status", status_id, "id")
 
     @staticmethod
     def delete(status_id: int) -> bool:
@@ -59,12 +46,10 @@ class PurchaseOrderStatus:
         :param status_id: ID del estado a eliminar
         :return: True si se eliminó, False si no existía
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM purchase_order_status WHERE id = ?', (status_id,))
-        affected_rows = cursor.rowcount
-        conn.commit()
-        conn.close()
+        affected_rows = write_transaction(
+            lambda uow: uow.execute('DELETE FROM purchase_order_status WHERE id = ?', (status_id,)).rowcount
+        )
+        ReferenceCache.invalidate("purchase_order_status")
         return affected_rows > 0
     
     @staticmethod
@@ -75,9 +60,4 @@ class PurchaseOrderStatus:
         :param name: Nombre del estado
         :return: Diccionario con los datos del estado o None si no existe
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM purchase_order_status WHERE name = ?', (name,))
-        row = cursor.fetchone()
-        conn.close()
-        return dict(row) if row else None
\ No newline at end of file
+        return ReferenceCache.get("purchase_order_status", name)
\ No newline at end of file
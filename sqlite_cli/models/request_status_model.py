@@ -1,53 +1,33 @@
 # models/request_status_model.py
-from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.reference_cache import ReferenceCache
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class RequestStatus:
     @staticmethod
     def create(name: str, description: Optional[str] = None) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'INSERT INTO request_status (name, description) VALUES (?, ?)',
             (name, description)
-        )
-        conn.commit()
-        conn.close()
+        ))
+        ReferenceCache.invalidate("request_status")
 
     @staticmethod
     def all() -> List[Dict]:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM request_status')
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        return ReferenceCache.all("request_status")
 
     @staticmethod
     def get_by_id(status_id: int) -> Optional[Dict]:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM request_status WHERE id = ?', (status_id,))
-        item = cursor.fetchone()
-        conn.close()
-        return dict(item) if item else None
+        return ReferenceCache.get("request_status", status_id, "id")
 
     @staticmethod
     def get_by_name(name: str) -> Optional[Dict]:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM request_status WHERE name = ?', (name,))
-        item = cursor.fetchone()
-        conn.close()
-        return dict(item) if item else None
+        return ReferenceCache.get("request_status", name)
 
     @staticmethod
     def update(status_id: int, name: str, description: Optional[str] = None) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'UPDATE request_status SET name = ?, description = ? WHERE id = ?',
             (name, description, status_id)
-        )
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        ))
+        ReferenceCache.invalidate("request_status")
\ No newline at end of file
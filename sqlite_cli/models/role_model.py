@@ -1,19 +1,16 @@
 # models/role_model.py
 from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class Role:
     @staticmethod
     def create(name: str, description: Optional[str] = None) -> None:
         """Creates a new role in the database."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'INSERT INTO roles (name, description) VALUES (?, ?)',
             (name, description)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def all() -> List[Dict]:
@@ -1,33 +1,18 @@
-from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+from sqlite_cli.database.database import STREAM_BATCH, get_db_connection, iter_query
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
 class SalesReport:
     @staticmethod
-    def get_sales_report(
+    def _sales_report_filter(
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         customer_id: Optional[int] = None,
         invoice_id: Optional[int] = None,
         search_term: Optional[str] = None
-    ) -> List[Dict]:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Consulta principal para obtener las facturas
-        invoice_query = '''
-            SELECT 
-                i.id as invoice_id,
-                i.issue_date,
-                i.subtotal,
-                i.taxes,
-                i.total,
-                c.id as customer_id,
-                c.first_name || ' ' || c.last_name as customer_name,
-                c.id_number as customer_id_number,
-                it.name as invoice_type,
-                s.name as status_name,
-                i.created_at
+    ) -> Tuple[str, List]:
+        """``FROM ... WHERE`` de las facturas del reporte y sus parámetros."""
+        invoice_filter = '''
             FROM invoices i
             JOIN customers c ON i.customer_id = c.id
             JOIN invoice_status s ON i.status_id = s.id
@@ -40,18 +25,19 @@ class SalesReport:
         if start_date:
             # Aseguramos que la fecha esté en formato YYYY-MM-DD para SQLite
             start_date = start_date.replace("/", "-")
-            invoice_query += " AND DATE(i.issue_date) >= ?"
+            # Comparación directa sobre la columna para que use idx_invoices_issue_date
+            invoice_filter += " AND i.issue_date >= ?"
             params.append(start_date)
         
         if end_date:
             # Aseguramos que la fecha esté en formato YYYY-MM-DD para SQLite
             end_date = end_date.replace("/", "-")
-            invoice_query += " AND DATE(i.issue_date) <= ?"
+            invoice_filter += " AND i.issue_date < DATE(?, '+1 day')"
             params.append(end_date)
         
         if search_term:
             search_param = f"%{search_term}%"
-            invoice_query += '''
+            invoice_filter += '''
                 AND (i.id LIKE ? 
                 OR c.first_name LIKE ? 
                 OR c.last_name LIKE ? 
@@ -61,19 +47,78 @@ class SalesReport:
             '''
             params.extend([search_param] * 6)
         
-        invoice_query += " ORDER BY i.issue_date DESC"
+        return invoice_filter, params
+
+    @staticmethod
+    def _sales_report_query(**filters: Any) -> Tuple[str, List]:
+        """Consulta y parámetros de las facturas del reporte (sin ítems)."""
+        invoice_filter, params = SalesReport._sales_report_filter(**filters)
+        # Los conteos por tipo de ítem se resuelven en SQL con el índice de invoice_details
+        query = '''
+            SELECT 
+                i.id as invoice_id,
+                i.issue_date,
+                i.subtotal,
+                i.taxes,
+                i.total,
+                c.id as customer_id,
+                c.first_name || ' ' || c.last_name as customer_name,
+                c.id_number as customer_id_number,
+                it.name as invoice_type,
+                s.name as status_name,
+                i.created_at,
+                (SELECT COUNT(*) FROM invoice_details d
+                 WHERE d.invoice_id = i.id AND d.product_id IS NOT NULL) as product_count,
+                (SELECT COUNT(*) FROM invoice_details d
+                 WHERE d.invoice_id = i.id AND d.product_id IS NULL
+                   AND d.service_request_id IS NOT NULL) as service_count
+        ''' + invoice_filter + " ORDER BY i.issue_date DESC"
+        return query, params
+
+    @staticmethod
+    def get_sales_report(
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        invoice_id: Optional[int] = None,
+        search_term: Optional[str] = None,
+        include_items: bool = True
+    ) -> List[Dict]:
+        """
+        Obtiene el reporte de ventas con la cantidad de productos y servicios por factura.
+
+        :param start_date: Fecha de inicio en formato YYYY-MM-DD
+        :param end_date: Fecha de fin en formato YYYY-MM-DD
+        :param search_term: Término para buscar en los campos relevantes
+        :param include_items: Adjunta los ítems de cada factura en ``'items'``;
+            los listados que sólo muestran los conteos deben pasar ``False``
+        :return: Lista de diccionarios con los datos de las ventas
+        """
+        filters = dict(
+            start_date=start_date,
+            end_date=end_date,
+            customer_id=customer_id,
+            invoice_id=invoice_id,
+            search_term=search_term
+        )
+        conn = get_db_connection()
+        cursor = conn.cursor()
         
+        invoice_query, params = SalesReport._sales_report_query(**filters)
         cursor.execute(invoice_query, tuple(params))
         sales = [dict(row) for row in cursor.fetchall()]
         
-        if not sales:
+        if not sales or not include_items:
             conn.close()
-            return []
+            return sales
         
-        # Consulta para obtener los detalles de cada factura
+        # Detalles de todas las facturas del reporte en una sola consulta
+        # (no una por factura), agrupados por factura en una pasada
+        invoice_filter, params = SalesReport._sales_report_filter(**filters)
         detail_query = '''
             SELECT 
                 d.id,
+                d.invoice_id,
                 d.quantity,
                 d.unit_price,
                 d.subtotal,
@@ -98,22 +143,67 @@ class SalesReport:
             LEFT JOIN inventory p ON d.product_id = p.id
             LEFT JOIN service_requests sr ON d.service_request_id = sr.id
             LEFT JOIN services s ON sr.service_id = s.id
-            WHERE d.invoice_id = ?
-            ORDER BY d.id
+            WHERE d.invoice_id IN (SELECT i.id ''' + invoice_filter + ''')
+            ORDER BY d.invoice_id, d.id
         '''
         
-        # Obtener detalles para cada venta
+        items_by_invoice: Dict[int, List[Dict]] = {}
+        cursor.execute(detail_query, tuple(params))
+        for row in cursor.fetchall():
+            item = dict(row)
+            items_by_invoice.setdefault(item.pop('invoice_id'), []).append(item)
+        
         for sale in sales:
-            cursor.execute(detail_query, (sale['invoice_id'],))
-            sale['items'] = [dict(row) for row in cursor.fetchall()]
-            
-            # Calcular cantidades por tipo de ítem
-            sale['product_count'] = sum(1 for item in sale['items'] if item['item_type'] == 'product')
-            sale['service_count'] = sum(1 for item in sale['items'] if item['item_type'] == 'service')
+            sale['items'] = items_by_invoice.get(sale['invoice_id'], [])
         
         conn.close()
         return sales
 
+    @staticmethod
+    def iter_sales_report(batch_size: int = STREAM_BATCH, **filters: Any) -> Iterator[Dict]:
+        """
+        Recorre las facturas del reporte fila a fila, leyendo el cursor por lotes.
+
+        Acepta los mismos filtros que ``get_sales_report`` (sin ``include_items``).
+        """
+        query, params = SalesReport._sales_report_query(**filters)
+        yield from iter_query(query, params, dict, batch_size)
+
+    @staticmethod
+    def iter_sales_report_items(batch_size: int = STREAM_BATCH, **filters: Any) -> Iterator[Dict]:
+        """
+        Recorre los ítems vendidos de las facturas del reporte, una fila por ítem
+        con los datos de su factura, leyendo el cursor por lotes.
+        """
+        invoice_filter, params = SalesReport._sales_report_filter(**filters)
+        query = '''
+            SELECT 
+                i.id as invoice_id,
+                i.issue_date,
+                c.first_name || ' ' || c.last_name as customer_name,
+                c.id_number as customer_id_number,
+                st.name as status_name,
+                CASE
+                    WHEN d.product_id IS NOT NULL THEN 'product'
+                    WHEN d.service_request_id IS NOT NULL THEN 'service'
+                END as item_type,
+                COALESCE(p.code, sr.service_id || '-' || sr.id) as item_code,
+                COALESCE(p.product, sv.name) as item_name,
+                d.quantity,
+                d.unit_price,
+                d.subtotal
+            FROM invoice_details d
+            JOIN invoices i ON d.invoice_id = i.id
+            JOIN customers c ON i.customer_id = c.id
+            JOIN invoice_status st ON i.status_id = st.id
+            LEFT JOIN inventory p ON d.product_id = p.id
+            LEFT JOIN service_requests sr ON d.service_request_id = sr.id
+            LEFT JOIN services sv ON sr.service_id = sv.id
+            WHERE d.invoice_id IN (SELECT i.id ''' + invoice_filter + ''')
+            ORDER BY i.issue_date DESC, d.invoice_id, d.id
+        '''
+        yield from iter_query(query, params, dict, batch_size)
+
     @staticmethod
     def get_invoice_details(invoice_id: int) -> Dict:
         """
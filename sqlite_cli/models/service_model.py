@@ -1,5 +1,8 @@
 from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+from sqlite_cli.database.fts import SEARCH_LIMIT, build_match_query, fts_join
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from sqlite_cli.database.write_queue import write_transaction
+from typing import List, Dict, Optional, Tuple
 
 class Service:
     @staticmethod
@@ -10,16 +13,12 @@ class Service:
         description: Optional[str] = None
     ) -> None:
         """Crea un nuevo servicio (siempre activo)"""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             '''INSERT INTO services 
             (code, name, price, description, status_id)
             VALUES (?, ?, ?, ?, 1)''',  # 1 = activo por defecto
             (code, name, price, description)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def all() -> List[Dict]:
@@ -37,100 +36,121 @@ class Service:
         return items
 
     @staticmethod
-    def search_active(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
+    def search_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        limit: Optional[int] = SEARCH_LIMIT
+    ) -> List[Dict]:
         """Busca servicios activos con filtro opcional"""
+        return Service._search('active', search_term, field, limit)
+
+    @staticmethod
+    def search_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        limit: Optional[int] = SEARCH_LIMIT
+    ) -> List[Dict]:
+        """Busca servicios inactivos con filtro opcional"""
+        return Service._search('inactive', search_term, field, limit)
+
+    @staticmethod
+    def _search(
+        status_name: str,
+        search_term: str,
+        field: Optional[str],
+        limit: Optional[int]
+    ) -> List[Dict]:
+        """Búsqueda de servicios por estado usando services_fts (ordenada por relevancia)."""
+        query, params, ranked = Service._search_query(status_name, search_term, field)
+        if ranked:
+            query += " ORDER BY fts.fts_rank"
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
+        
         conn = get_db_connection()
         cursor = conn.cursor()
-        
-        base_query = '''
-            SELECT s.*, st.name as status_name
-            FROM services s
-            JOIN status st ON s.status_id = st.id
-            WHERE st.name = 'active'
-        '''
-        
-        params = []
-        
-        if search_term:
-            if field:
-                field_map = {
-                    "ID": "s.id",
-                    "Código": "s.code",
-                    "Nombre": "s.name",
-                    "Descripción": "s.description"
-                }
-                field_name = field_map.get(field)
-                if field_name:
-                    if field == "ID":
-                        try:
-                            service_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
-                            params.append(service_id)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
-                        params.append(f"%{search_term}%")
-            else:
-                base_query += '''
-                    AND (LOWER(s.code) LIKE ? OR 
-                        LOWER(s.name) LIKE ? OR 
-                        LOWER(s.description) LIKE ?)
-                '''
-                params.extend([f"%{search_term}%"] * 3)
-        
-        cursor.execute(base_query, params)
+        cursor.execute(query, params)
         items = [dict(row) for row in cursor.fetchall()]
         conn.close()
         return items
 
     @staticmethod
-    def search_inactive(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
-        """Busca servicios inactivos con filtro opcional"""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        base_query = '''
-            SELECT s.*, st.name as status_name
-            FROM services s
-            JOIN status st ON s.status_id = st.id
-            WHERE st.name = 'inactive'
-        '''
-        
+    def page_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de servicios activos ordenados por nombre (ver ``paginate``)"""
+        query, params, _ = Service._search_query('active', search_term, field)
+        return paginate(query, params, "s.id", "s.name", cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def page_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de servicios inactivos ordenados por nombre (ver ``paginate``)"""
+        query, params, _ = Service._search_query('inactive', search_term, field)
+        return paginate(query, params, "s.id", "s.name", cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def _search_query(
+        status_name: str,
+        search_term: str,
+        field: Optional[str]
+    ) -> Tuple[str, List, bool]:
+        """
+        Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``.
+
+        :return: (consulta, parámetros, si se filtra por ``services_fts``)
+        """
+        joins = ""
+        join_params = []
+        conditions = ""
         params = []
+        ranked = False
         
         if search_term:
-            if field:
-                field_map = {
-                    "ID": "s.id",
-                    "Código": "s.code",
-                    "Nombre": "s.name",
-                    "Descripción": "s.description"
-                }
-                field_name = field_map.get(field)
-                if field_name:
-                    if field == "ID":
-                        try:
-                            service_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
-                            params.append(service_id)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
-                        params.append(f"%{search_term}%")
-            else:
-                base_query += '''
-                    AND (LOWER(s.code) LIKE ? OR 
-                        LOWER(s.name) LIKE ? OR 
-                        LOWER(s.description) LIKE ?)
-                '''
-                params.extend([f"%{search_term}%"] * 3)
+            # Columnas de services_fts por campo de búsqueda. El código se
+            # busca con LIKE: FTS solo encuentra prefijos de palabra
+            fts_columns = {
+                "Nombre": "name",
+                "Descripción": "description"
+            }
+            code_columns = {"Código": "s.code"}
+            if field == "ID":
+                try:
+                    service_id = int(search_term)
+                    conditions += " AND s.id = ?"
+                    params.append(service_id)
+                except ValueError:
+                    conditions += " AND 1 = 0"
+            elif field in code_columns:
+                conditions += f" AND LOWER({code_columns[field]}) LIKE ?"
+                params.append(f"%{search_term.lower()}%")
+            elif not field or field in fts_columns:
+                match = build_match_query(search_term, fts_columns.get(field))
+                if match:
+                    joins, join_params = fts_join("services", "s", match)
+                    ranked = True
+                else:
+                    conditions += " AND 1 = 0"
         
-        cursor.execute(base_query, params)
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        base_query = f'''
+            SELECT s.*, st.name as status_name 
+            FROM services s
+            {joins}
+            JOIN status st ON s.status_id = st.id
+            WHERE st.name = ?
+        '''
+        params = join_params + [status_name] + params
+        return base_query + conditions, params, ranked
 
     @staticmethod
     def get_by_id(service_id: int) -> Optional[Dict]:
@@ -171,9 +191,7 @@ class Service:
         description: Optional[str] = None
     ) -> None:
         """Actualiza un servicio existente"""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             '''UPDATE services SET
             code = ?,
             name = ?,
@@ -182,34 +200,24 @@ class Service:
             updated_at = CURRENT_TIMESTAMP
             WHERE id = ?''',
             (code, name, price, description, service_id)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def disable(service_id: int) -> None:
         """Deshabilita un servicio (estado inactivo)"""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE services SET
                 status_id = (SELECT id FROM status WHERE name = 'inactive'),
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        ''', (service_id,))
-        conn.commit()
-        conn.close()
+        ''', (service_id,)))
 
     @staticmethod
     def enable(service_id: int) -> None:
         """Habilita un servicio (estado activo)"""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE services SET
                 status_id = (SELECT id FROM status WHERE name = 'active'),
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        ''', (service_id,))
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        ''', (service_id,)))
\ No newline at end of file
@@ -1,5 +1,8 @@
 from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from sqlite_cli.database.unit_of_work import UnitOfWork
+from sqlite_cli.database.write_queue import write_transaction
+from typing import List, Dict, Optional, Tuple
 
 class ServiceRequest:
     @staticmethod
@@ -11,19 +14,15 @@ class ServiceRequest:
         employee_id: int = 0,  # Valor por defecto
         request_status_id: int = 1
     ) -> int:  # Cambiado el tipo de retorno a int
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('SELECT price FROM services WHERE id = ?', (service_id,))
-            service = cursor.fetchone()
+        def write(uow: UnitOfWork) -> int:
+            service = uow.fetchone('SELECT price FROM services WHERE id = ?', (service_id,))
             if not service:
                 raise ValueError("Servicio no encontrado")
                 
             price = service['price']
             total = price * quantity
             
-            cursor.execute(
+            request_id = uow.insert(
                 '''INSERT INTO service_requests 
                 (request_number, customer_id, service_id, employee_id, 
                 description, quantity, total, request_status_id, status_id)
@@ -31,20 +30,13 @@ class ServiceRequest:
                 (customer_id, service_id, employee_id, description, 
                 quantity, total, request_status_id)
             )
-            
-            request_id = cursor.lastrowid
-            cursor.execute(
+            uow.execute(
                 'UPDATE service_requests SET request_number = ? WHERE id = ?',
                 (f"SR-{request_id}", request_id)
             )
-            
-            conn.commit()
             return request_id  # Devolvemos el ID del registro creado
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+
+        return write_transaction(write)
 
     @staticmethod
     def all() -> List[Dict]:
@@ -77,9 +69,29 @@ class ServiceRequest:
 
     @staticmethod
     def search_active(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
+        query, params = ServiceRequest._active_search_query(search_term, field)
         conn = get_db_connection()
         cursor = conn.cursor()
-        
+        cursor.execute(query, params)
+        items = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return items
+
+    @staticmethod
+    def page_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de solicitudes activas en orden de registro (ver ``paginate``)"""
+        query, params = ServiceRequest._active_search_query(search_term, field)
+        return paginate(query, params, "sr.id", None, cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def _active_search_query(search_term: str, field: Optional[str]) -> Tuple[str, List]:
+        """Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``"""
         base_query = '''
             SELECT sr.*, 
                    c.first_name || ' ' || c.last_name as customer_name,
@@ -133,10 +145,7 @@ class ServiceRequest:
                 '''
                 params.extend([f"%{search_term.lower()}%"] * 6)
         
-        cursor.execute(base_query, params)
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        return base_query, params
 
     @classmethod
     def get_by_id(cls, request_id: int) -> Optional[Dict]:
@@ -171,60 +180,63 @@ class ServiceRequest:
 
     @staticmethod
     def update_employee(request_id: int, employee_id: int) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             '''UPDATE service_requests SET
             employee_id = ?,
             updated_at = CURRENT_TIMESTAMP
             WHERE id = ?''',
             (employee_id, request_id)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def update_status(request_id: int, request_status_id: int) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'UPDATE service_requests SET status_id = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
             (request_status_id, request_id)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def update_request_status(request_id: int, request_status_id: int) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'UPDATE service_requests SET request_status_id = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
             (request_status_id, request_id)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def deactivate(request_id: int) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             '''UPDATE service_requests 
             SET status_id = (SELECT id FROM status WHERE name = 'inactive'),
             updated_at = CURRENT_TIMESTAMP
             WHERE id = ?''',
             (request_id,)
-        )
-        conn.commit()
-        conn.close()
+        ))
 
     @staticmethod
     def search_inactive(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
+        query, params = ServiceRequest._inactive_search_query(search_term, field)
         conn = get_db_connection()
         cursor = conn.cursor()
-        
+        cursor.execute(query, params)
+        items = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return items
+
+    @staticmethod
+    def page_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de solicitudes inactivas en orden de registro (ver ``paginate``)"""
+        query, params = ServiceRequest._inactive_search_query(search_term, field)
+        return paginate(query, params, "sr.id", None, cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def _inactive_search_query(search_term: str, field: Optional[str]) -> Tuple[str, List]:
+        """Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``"""
         base_query = '''
             SELECT sr.*, 
                    c.first_name || ' ' || c.last_name as customer_name,
@@ -279,21 +291,14 @@ class ServiceRequest:
                 '''
                 params.extend([f"%{search_term.lower()}%"] * 5)
         
-        cursor.execute(base_query, params)
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        return base_query, params
 
     @staticmethod
     def activate(request_id: int) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             '''UPDATE service_requests 
             SET status_id = (SELECT id FROM status WHERE name = 'active'),
             updated_at = CURRENT_TIMESTAMP
             WHERE id = ?''',
             (request_id,)
-        )
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        ))
\ No newline at end of file
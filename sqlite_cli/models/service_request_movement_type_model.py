@@ -1,4 +1,5 @@
-from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.reference_cache import ReferenceCache
+from sqlite_cli.database.write_queue import write_transaction
 from typing import Dict, Optional, List
 from utils.session_manager import SessionManager
 
@@ -6,37 +7,21 @@ class ServiceRequestMovementType:
     @classmethod
     def create(cls, name: str, description: str = None) -> None:
         """Crea un nuevo tipo de movimiento para solicitudes de servicio."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             "INSERT INTO service_request_movement_types (name, description) VALUES (?, ?)",
             (name, description)
-        )
-        conn.commit()
-        conn.close()
+        ))
+        ReferenceCache.invalidate("service_request_movement_types")
 
     @classmethod
     def all(cls) -> list:
         """Obtiene todos los tipos de movimiento de solicitudes de servicio."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM service_request_movement_types")
-        types = cursor.fetchall()
-        conn.close()
-        return types
+        return ReferenceCache.all("service_request_movement_types")
 
     @classmethod
     def get_by_name(cls, name: str) -> Optional[Dict]:
         """Obtiene un tipo de movimiento por su nombre."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM service_request_movement_types WHERE name = ? LIMIT 1",
-            (name,)
-        )
-        result = cursor.fetchone()
-        conn.close()
-        return dict(result) if result else None
+        return ReferenceCache.get("service_request_movement_types", name)
 
     @classmethod
     def record_movement(
@@ -54,7 +39,6 @@ class ServiceRequestMovementType:
         notes: Optional[str] = None
     ) -> None:
         """Registra un movimiento en el historial de solicitudes de servicio."""
-        conn = None
         try:
             # Obtener el tipo de movimiento
             movement_type = cls.get_by_name(movement_type_name)
@@ -67,9 +51,7 @@ class ServiceRequestMovementType:
                 raise ValueError("Usuario no autenticado")
             
             # Registrar el movimiento
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute(
+            write_transaction(lambda uow: uow.execute(
                 '''
                 INSERT INTO service_request_movements (
                     request_id, movement_type_id, previous_employee_id,
@@ -84,11 +66,7 @@ class ServiceRequestMovementType:
                     previous_request_status_id, new_request_status_id,
                     reference_id, reference_type, user_id, notes
                 )
-            )
-            conn.commit()
+            ))
             
         except Exception as e:
-            raise Exception(f"Error al registrar movimiento: {str(e)}")
-        finally:
-            if conn:
-                conn.close()
\ No newline at end of file
+            raise Exception(f"Error al registrar movimiento: {str(e)}")
\ No newline at end of file
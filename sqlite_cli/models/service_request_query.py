@@ -71,11 +71,11 @@ class ServiceRequestQuery:
             params.append(request_status_id)
             
         if start_date:
-            query += " AND DATE(sr.created_at) >= ?"
+            query += " AND sr.created_at >= ?"
             params.append(start_date.replace("/", "-"))
             
         if end_date:
-            query += " AND DATE(sr.created_at) <= ?"
+            query += " AND sr.created_at < DATE(?, '+1 day')"
             params.append(end_date.replace("/", "-"))
         
         query += " ORDER BY sr.created_at DESC"
@@ -158,11 +158,11 @@ class ServiceRequestQuery:
             params.append(request_id)
             
         if start_date:
-            query += " AND DATE(srm.created_at) >= ?"
+            query += " AND srm.created_at >= ?"
             params.append(start_date.replace("/", "-"))
             
         if end_date:
-            query += " AND DATE(srm.created_at) <= ?"
+            query += " AND srm.created_at < DATE(?, '+1 day')"
             params.append(end_date.replace("/", "-"))
             
         if db_movement_type and db_movement_type != "Todos":
@@ -1,5 +1,6 @@
 # models/status_model.py
-from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.reference_cache import ReferenceCache
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class Status:
@@ -11,14 +12,11 @@ class Status:
         :param name: Nombre del estado (ej. 'active', 'inactive')
         :param description: Descripción opcional del estado
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'INSERT INTO status (name, description) VALUES (?, ?)',
             (name, description)
-        )
-        conn.commit()
-        conn.close()
+        ))
+        ReferenceCache.invalidate("status")
 
     @staticmethod
     def all() -> List[Dict]:
@@ -27,9 +25,14 @@ class Status:
         
         :return: Lista de diccionarios con los estados
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM status')
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
\ No newline at end of file
+        return ReferenceCache.all("status")
+
+    @staticmethod
+    def get_by_name(name: str) -> Optional[Dict]:
+        """
+        Obtiene un estado por su nombre.
+        
+        :param name: Nombre del estado (ej. 'active', 'inactive')
+        :return: Diccionario con los datos del estado o None
+        """
+        return ReferenceCache.get("status", name)
\ No newline at end of file
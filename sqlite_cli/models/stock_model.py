@@ -0,0 +1,126 @@
+from typing import Dict, List, Optional
+from sqlite_cli.database.unit_of_work import UnitOfWork
+from sqlite_cli.database.write_queue import write_transaction
+
+
+class InsufficientStockError(ValueError):
+    """El cambio dejaría la cantidad o el stock de un producto en negativo."""
+
+    def __init__(self, inventory_id: int, message: Optional[str] = None) -> None:
+        super().__init__(message or f"Stock insuficiente para el producto ID {inventory_id}")
+        self.inventory_id = inventory_id
+
+
+class Stock:
+    """
+    Cambios de existencias con su movimiento de inventario.
+
+    Cada cambio es un ``UPDATE`` condicional que suma el delta sobre el
+    valor actual de la fila (``stock = stock + ?``) sólo si el resultado no
+    queda en negativo, y devuelve con ``RETURNING`` los valores finales. No
+    se lee el producto antes de escribirlo: dos terminales que venden el
+    mismo producto no se pisan, y los valores anterior/nuevo del movimiento
+    son los que realmente quedaron en la fila. Los movimientos se insertan
+    en lote dentro de la misma transacción.
+    """
+
+    _UPDATE = '''
+        UPDATE inventory SET
+            quantity = quantity + ?,
+            stock = stock + ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ? AND quantity + ? >= 0 AND stock + ? >= 0
+        RETURNING quantity, stock
+    '''
+
+    _INSERT_MOVEMENT = '''
+        INSERT INTO inventory_movements (
+            inventory_id, movement_type_id, quantity_change, stock_change,
+            previous_quantity, new_quantity, previous_stock, new_stock,
+            reference_id, reference_type, user_id, notes
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    @staticmethod
+    def apply_many(
+        uow: UnitOfWork,
+        changes: List[Dict],
+        movement_type_id: int,
+        user_id: int,
+        reference_id: Optional[int] = None,
+        reference_type: Optional[str] = None,
+        notes: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Aplica varios cambios de existencias dentro de la transacción ``uow``.
+
+        Si un producto no existe o quedaría en negativo se lanza la excepción
+        y se revierte todo lo escrito en la transacción.
+
+        :param changes: [{'inventory_id', 'quantity_change', 'stock_change'}]
+            (los cambios que faltan valen 0); un mismo producto puede repetirse
+        :return: Por cambio: {'inventory_id', 'previous_quantity', 'new_quantity',
+                 'previous_stock', 'new_stock'}
+        """
+        results = []
+        movement_rows = []
+        for change in changes:
+            inventory_id = change['inventory_id']
+            quantity_change = change.get('quantity_change', 0)
+            stock_change = change.get('stock_change', 0)
+
+            row = uow.fetchone(
+                Stock._UPDATE,
+                (quantity_change, stock_change, inventory_id, quantity_change, stock_change)
+            )
+            if row is None:
+                Stock._raise_rejected(uow, inventory_id)
+
+            result = {
+                'inventory_id': inventory_id,
+                'previous_quantity': row['quantity'] - quantity_change,
+                'new_quantity': row['quantity'],
+                'previous_stock': row['stock'] - stock_change,
+                'new_stock': row['stock'],
+            }
+            results.append(result)
+            movement_rows.append((
+                inventory_id, movement_type_id, quantity_change, stock_change,
+                result['previous_quantity'], result['new_quantity'],
+                result['previous_stock'], result['new_stock'],
+                reference_id, reference_type, user_id, notes
+            ))
+
+        uow.executemany(Stock._INSERT_MOVEMENT, movement_rows)
+        return results
+
+    @staticmethod
+    def apply(
+        inventory_id: int,
+        movement_type_id: int,
+        user_id: int,
+        quantity_change: int = 0,
+        stock_change: int = 0,
+        reference_id: Optional[int] = None,
+        reference_type: Optional[str] = None,
+        notes: Optional[str] = None
+    ) -> Dict:
+        """
+        Aplica un cambio de existencias en su propia transacción del
+        escritor (``write_queue``).
+
+        :return: {'inventory_id', 'previous_quantity', 'new_quantity',
+                 'previous_stock', 'new_stock'}
+        """
+        return write_transaction(lambda uow: Stock.apply_many(
+            uow,
+            [{'inventory_id': inventory_id, 'quantity_change': quantity_change, 'stock_change': stock_change}],
+            movement_type_id, user_id, reference_id, reference_type, notes
+        )[0])
+
+    @staticmethod
+    def _raise_rejected(uow: UnitOfWork, inventory_id: int) -> None:
+        # Sólo en el camino de error: distinguir producto inexistente de stock insuficiente
+        if uow.fetchone("SELECT id FROM inventory WHERE id = ?", (inventory_id,)) is None:
+            raise ValueError(f"Producto ID {inventory_id} no encontrado")
+        raise InsufficientStockError(inventory_id)
@@ -1,5 +1,8 @@
 from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+from sqlite_cli.database.fts import SEARCH_LIMIT, build_match_query, fts_join
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from sqlite_cli.database.write_queue import write_transaction
+from typing import List, Dict, Optional, Tuple
 
 class Supplier:
     @staticmethod
@@ -15,130 +18,134 @@ class Supplier:
         company: Optional[str] = None,
         status_id: int = 1  # Por defecto activo
     ) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             INSERT INTO suppliers (
                 code, id_number, first_name, last_name, 
                 address, phone, email, tax_id, company, status_id
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (code, id_number, first_name, last_name, address, phone, email, tax_id, company, status_id))
-        conn.commit()
-        conn.close()
+        ''', (code, id_number, first_name, last_name, address, phone, email, tax_id, company, status_id)))
+
+    @staticmethod
+    def search_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        limit: Optional[int] = SEARCH_LIMIT
+    ) -> List[Dict]:
+        return Supplier._search('active', search_term, field, limit)
 
     @staticmethod
-    def search_active(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
+    def search_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        limit: Optional[int] = SEARCH_LIMIT
+    ) -> List[Dict]:
+        return Supplier._search('inactive', search_term, field, limit)
+
+    @staticmethod
+    def _search(
+        status_name: str,
+        search_term: str,
+        field: Optional[str],
+        limit: Optional[int]
+    ) -> List[Dict]:
+        """Búsqueda de proveedores por estado usando suppliers_fts (ordenada por relevancia)."""
+        query, params, ranked = Supplier._search_query(status_name, search_term, field)
+        if ranked:
+            query += " ORDER BY fts.fts_rank"
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
+        
         conn = get_db_connection()
         cursor = conn.cursor()
-        
-        base_query = '''
-            SELECT s.*, st.name as status_name 
-            FROM suppliers s
-            JOIN status st ON s.status_id = st.id
-            WHERE st.name = 'active'
-        '''
-        
-        params = []
-        
-        if search_term:
-            if field:
-                field_map = {
-                    "ID": "s.id",
-                    "Código": "s.code",
-                    "Cédula": "s.id_number",
-                    "Nombres": "s.first_name",
-                    "Apellidos": "s.last_name",
-                    "Empresa": "s.company",
-                    "RIF": "s.tax_id",
-                    "Teléfono": "s.phone"
-                }
-                field_name = field_map.get(field)
-                if field_name:
-                    if field == "ID":
-                        try:
-                            supplier_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
-                            params.append(supplier_id)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
-                        params.append(f"%{search_term}%")
-            else:
-                base_query += '''
-                    AND (LOWER(s.code) LIKE ? OR 
-                        LOWER(s.id_number) LIKE ? OR 
-                        LOWER(s.first_name) LIKE ? OR 
-                        LOWER(s.last_name) LIKE ? OR 
-                        LOWER(s.address) LIKE ? OR 
-                        LOWER(s.phone) LIKE ? OR 
-                        LOWER(s.email) LIKE ? OR 
-                        LOWER(s.tax_id) LIKE ? OR 
-                        LOWER(s.company) LIKE ?)
-                '''
-                params.extend([f"%{search_term}%"] * 9)
-        
-        cursor.execute(base_query, params)
+        cursor.execute(query, params)
         items = [dict(row) for row in cursor.fetchall()]
         conn.close()
         return items
 
     @staticmethod
-    def search_inactive(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    def page_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de proveedores activos en orden de registro (ver ``paginate``)"""
+        query, params, _ = Supplier._search_query('active', search_term, field)
+        return paginate(query, params, "s.id", None, cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def page_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de proveedores inactivos en orden de registro (ver ``paginate``)"""
+        query, params, _ = Supplier._search_query('inactive', search_term, field)
+        return paginate(query, params, "s.id", None, cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def _search_query(
+        status_name: str,
+        search_term: str,
+        field: Optional[str]
+    ) -> Tuple[str, List, bool]:
+        """
+        Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``.
+
+        :return: (consulta, parámetros, si se filtra por ``suppliers_fts``)
+        """
+        joins = ""
+        join_params = []
+        conditions = ""
+        params = []
+        ranked = False
+        
+        if search_term:
+            # Columnas de suppliers_fts por campo de búsqueda. Código, cédula,
+            # RIF y teléfono se buscan con LIKE: FTS solo encuentra prefijos
+            # de palabra y "00043" debe hallar "PRV00043"
+            fts_columns = {
+                "Nombres": "first_name",
+                "Apellidos": "last_name",
+                "Empresa": "company"
+            }
+            code_columns = {
+                "Código": "s.code",
+                "Cédula": "s.id_number",
+                "RIF": "s.tax_id",
+                "Teléfono": "s.phone"
+            }
+            if field == "ID":
+                try:
+                    supplier_id = int(search_term)
+                    conditions += " AND s.id = ?"
+                    params.append(supplier_id)
+                except ValueError:
+                    conditions += " AND 1 = 0"
+            elif field in code_columns:
+                conditions += f" AND LOWER({code_columns[field]}) LIKE ?"
+                params.append(f"%{search_term.lower()}%")
+            elif not field or field in fts_columns:
+                match = build_match_query(search_term, fts_columns.get(field))
+                if match:
+                    joins, join_params = fts_join("suppliers", "s", match)
+                    ranked = True
+                else:
+                    conditions += " AND 1 = 0"
         
-        base_query = '''
+        base_query = f'''
             SELECT s.*, st.name as status_name 
             FROM suppliers s
+            {joins}
             JOIN status st ON s.status_id = st.id
-            WHERE st.name = 'inactive'
+            WHERE st.name = ?
         '''
-        
-        params = []
-        
-        if search_term:
-            if field:
-                field_map = {
-                    "ID": "s.id",
-                    "Código": "s.code",
-                    "Cédula": "s.id_number",
-                    "Nombres": "s.first_name",
-                    "Apellidos": "s.last_name",
-                    "Empresa": "s.company",
-                    "RIF": "s.tax_id",
-                    "Teléfono": "s.phone"
-                }
-                field_name = field_map.get(field)
-                if field_name:
-                    if field == "ID":
-                        try:
-                            supplier_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
-                            params.append(supplier_id)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
-                        params.append(f"%{search_term}%")
-            else:
-                base_query += '''
-                    AND (LOWER(s.code) LIKE ? OR 
-                        LOWER(s.id_number) LIKE ? OR 
-                        LOWER(s.first_name) LIKE ? OR 
-                        LOWER(s.last_name) LIKE ? OR 
-                        LOWER(s.address) LIKE ? OR 
-                        LOWER(s.phone) LIKE ? OR 
-                        LOWER(s.email) LIKE ? OR 
-                        LOWER(s.tax_id) LIKE ? OR 
-                        LOWER(s.company) LIKE ?)
-                '''
-                params.extend([f"%{search_term}%"] * 9)
-        
-        cursor.execute(base_query, params)
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        params = join_params + [status_name] + params
+        return base_query + conditions, params, ranked
 
     @staticmethod
     def get_by_id(supplier_id: int) -> Optional[Dict]:
@@ -167,9 +174,7 @@ class Supplier:
         tax_id: str,
         company: str
     ) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE suppliers SET
                 code = ?,
                 id_number = ?,
@@ -181,21 +186,15 @@ class Supplier:
                 tax_id = ?,
                 company = ?
             WHERE id = ?
-        ''', (code, id_number, first_name, last_name, address, phone, email, tax_id, company, supplier_id))
-        conn.commit()
-        conn.close()
+        ''', (code, id_number, first_name, last_name, address, phone, email, tax_id, company, supplier_id)))
 
     @staticmethod
     def update_status(supplier_id: int, status_id: int) -> None:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE suppliers SET
                 status_id = ?
             WHERE id = ?
-        ''', (status_id, supplier_id))
-        conn.commit()
-        conn.close()
+        ''', (status_id, supplier_id)))
 
     @staticmethod
     def get_by_id_number(id_number: str) -> Optional[Dict]:
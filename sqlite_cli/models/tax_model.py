@@ -1,5 +1,6 @@
 # models/tax_model.py
-from sqlite_cli.database.database import get_db_connection
+from sqlite_cli.database.reference_cache import ReferenceCache
+from sqlite_cli.database.write_queue import write_transaction
 from typing import List, Dict, Optional
 
 class Tax:
@@ -11,14 +12,11 @@ class Tax:
         :param name: Nombre del impuesto (ej. 'IVA')
         :param value: Valor del impuesto (default 0.0)
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        write_transaction(lambda uow: uow.execute(
             'INSERT INTO taxes (name, value) VALUES (?, ?)',
             (name, value)
-        )
-        conn.commit()
-        conn.close()
+        ))
+        ReferenceCache.invalidate("taxes")
 
     @staticmethod
     def all() -> List[Dict]:
@@ -27,16 +25,7 @@ class Tax:
         
         :return: Lista de diccionarios con los impuestos
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT t.*, s.name as status_name 
-            FROM taxes t
-            JOIN status s ON t.status_id = s.id
-        ''')
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        return ReferenceCache.all("taxes")
 
     @staticmethod
     def get_by_name(name: str) -> Optional[Dict]:
@@ -46,17 +35,7 @@ class Tax:
         :param name: Nombre del impuesto
         :return: Diccionario con los datos del impuesto o None
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT t.*, s.name as status_name 
-            FROM taxes t
-            JOIN status s ON t.status_id = s.id
-            WHERE t.name = ?
-        ''', (name,))
-        item = cursor.fetchone()
-        conn.close()
-        return dict(item) if item else None
+        return ReferenceCache.get("taxes", name)
 
     @staticmethod
     def update_value(name: str, new_value: float) -> None:
@@ -66,16 +45,13 @@ class Tax:
         :param name: Nombre del impuesto
         :param new_value: Nuevo valor
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE taxes SET
                 value = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE name = ?
-        ''', (new_value, name))
-        conn.commit()
-        conn.close()
+        ''', (new_value, name)))
+        ReferenceCache.invalidate("taxes")
 
     @staticmethod
     def update_status(name: str, status_id: int) -> None:
@@ -85,13 +61,10 @@ class Tax:
         :param name: Nombre del impuesto
         :param status_id: ID del nuevo estado
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE taxes SET
                 status_id = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE name = ?
-        ''', (status_id, name))
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        ''', (status_id, name)))
+        ReferenceCache.invalidate("taxes")
\ No newline at end of file
@@ -1,6 +1,8 @@
 # models/user_model.py
 from sqlite_cli.database.database import get_db_connection
-from typing import List, Dict, Optional
+from sqlite_cli.database.pagination import PAGE_SIZE, paginate
+from sqlite_cli.database.write_queue import write_transaction
+from typing import List, Dict, Optional, Tuple
 import bcrypt
 
 class User:
@@ -14,15 +16,11 @@ class User:
     ) -> None:
         """Crea un nuevo usuario en la base de datos."""
         hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             INSERT INTO users (
                 username, password, person_id, status_id, role_id
             ) VALUES (?, ?, ?, ?, ?)
-        ''', (username, hashed_password.decode('utf-8'), person_id, status_id, role_id))
-        conn.commit()
-        conn.close()
+        ''', (username, hashed_password.decode('utf-8'), person_id, status_id, role_id)))
 
     @staticmethod
     def all() -> List[Dict]:
@@ -61,71 +59,61 @@ class User:
     @staticmethod
     def search_active(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
         """Busca usuarios activos con filtro opcional."""
+        return User._search('active', search_term, field)
+
+    @staticmethod
+    def search_inactive(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
+        """Busca usuarios inactivos con filtro opcional."""
+        return User._search('inactive', search_term, field)
+
+    @staticmethod
+    def page_active(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de usuarios activos en orden de registro (ver ``paginate``)."""
+        query, params = User._search_query('active', search_term, field)
+        return paginate(query, params, "u.id", None, cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def page_inactive(
+        search_term: str = "",
+        field: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+        with_total: bool = False
+    ) -> Dict:
+        """Página de usuarios inactivos en orden de registro (ver ``paginate``)."""
+        query, params = User._search_query('inactive', search_term, field)
+        return paginate(query, params, "u.id", None, cursor, page_size, with_total=with_total)
+
+    @staticmethod
+    def _search(status_name: str, search_term: str, field: Optional[str]) -> List[Dict]:
+        """Busca usuarios por estado con filtro opcional."""
+        query, params = User._search_query(status_name, search_term, field)
         conn = get_db_connection()
         cursor = conn.cursor()
-        
-        base_query = '''
-            SELECT u.*, p.first_name, p.last_name, p.email, r.name as role_name, s.name as status_name
-            FROM users u
-            JOIN person p ON u.person_id = p.id
-            JOIN roles r ON u.role_id = r.id
-            JOIN status s ON u.status_id = s.id
-            WHERE s.name = 'active'
-        '''
-        
-        params = []
-        
-        if search_term:
-            if field:
-                field_map = {
-                    "ID": "u.id",
-                    "Username": "u.username",
-                    "Name": "p.first_name || ' ' || p.last_name",
-                    "Email": "p.email",
-                    "Role": "r.name"
-                }
-                field_name = field_map.get(field)
-                if field_name:
-                    if field == "ID":
-                        try:
-                            user_id = int(search_term)
-                            base_query += f" AND {field_name} = ?"
-                            params.append(user_id)
-                        except ValueError:
-                            base_query += " AND 1 = 0"
-                    else:
-                        base_query += f" AND LOWER({field_name}) LIKE ?"
-                        params.append(f"%{search_term}%")
-            else:
-                base_query += '''
-                    AND (LOWER(u.username) LIKE ? OR 
-                        LOWER(p.first_name || ' ' || p.last_name) LIKE ? OR 
-                        LOWER(p.email) LIKE ? OR
-                        LOWER(r.name) LIKE ?)
-                '''
-                params.extend([f"%{search_term}%"] * 4)
-        
-        cursor.execute(base_query, params)
+        cursor.execute(query, params)
         users = [dict(row) for row in cursor.fetchall()]
         conn.close()
         return users
 
     @staticmethod
-    def search_inactive(search_term: str = "", field: Optional[str] = None) -> List[Dict]:
-        """Busca usuarios inactivos con filtro opcional."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
+    def _search_query(status_name: str, search_term: str, field: Optional[str]) -> Tuple[str, List]:
+        """Arma el ``SELECT ... WHERE`` de la búsqueda, sin ``ORDER BY`` ni ``LIMIT``."""
         base_query = '''
             SELECT u.*, p.first_name, p.last_name, p.email, r.name as role_name, s.name as status_name
             FROM users u
             JOIN person p ON u.person_id = p.id
             JOIN roles r ON u.role_id = r.id
             JOIN status s ON u.status_id = s.id
-            WHERE s.name = 'inactive'
+            WHERE s.name = ?
         '''
         
-        params = []
+        params = [status_name]
         
         if search_term:
             if field:
@@ -157,10 +145,7 @@ class User:
                 '''
                 params.extend([f"%{search_term}%"] * 4)
         
-        cursor.execute(base_query, params)
-        users = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return users
+        return base_query, params
 
     @staticmethod
     def get_by_id(user_id: int) -> Optional[Dict]:
@@ -187,12 +172,9 @@ class User:
         password: Optional[str] = None
     ) -> None:
         """Actualiza un usuario existente."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         if password:
             hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-            cursor.execute('''
+            write_transaction(lambda uow: uow.execute('''
                 UPDATE users SET
                     username = ?,
                     password = ?,
@@ -200,33 +182,26 @@ class User:
                     role_id = ?,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
-            ''', (username, hashed_password.decode('utf-8'), person_id, role_id, user_id))
+            ''', (username, hashed_password.decode('utf-8'), person_id, role_id, user_id)))
         else:
-            cursor.execute('''
+            write_transaction(lambda uow: uow.execute('''
                 UPDATE users SET
                     username = ?,
                     person_id = ?,
                     role_id = ?,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
-            ''', (username, person_id, role_id, user_id))
-        
-        conn.commit()
-        conn.close()
+            ''', (username, person_id, role_id, user_id)))
 
     @staticmethod
     def update_status(user_id: int, status_id: int) -> None:
         """Actualiza el estado de un usuario."""
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
+        write_transaction(lambda uow: uow.execute('''
             UPDATE users SET
                 status_id = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        ''', (status_id, user_id))
-        conn.commit()
-        conn.close()
+        ''', (status_id, user_id)))
 
     @staticmethod
     def get_by_username(username: str) -> Optional[Dict]:
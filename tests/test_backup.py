@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from sqlite_cli.database import connection_manager
+from sqlite_cli.database.backup import backup_database, restore_database
+from sqlite_cli.database.connection_manager import configure, get_manager
+from sqlite_cli.database.database import init_db
+
+
+class BackupRestoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self._previous = connection_manager._manager
+        connection_manager._manager = None
+        configure(db_path=os.path.join(self.directory, "db.db"))
+        init_db()
+
+    def tearDown(self) -> None:
+        get_manager().close_all()
+        connection_manager._manager = self._previous
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_backups_never_overwrite(self) -> None:
+        paths = [backup_database() for _ in range(3)]
+        self.assertEqual(len(set(paths)), 3)
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+    def test_restore_keeps_connections_in_use(self) -> None:
+        source = backup_database()
+        conn = get_manager().checkout()  # Como el hilo de Tk durante la restauración
+        count = conn.execute("SELECT COUNT(*) FROM status").fetchone()[0]
+
+        result = {}
+        worker = threading.Thread(target=lambda: result.update(safety=restore_database(source)))
+        worker.start()
+        worker.join()
+
+        self.assertNotEqual(result["safety"], source)
+        self.assertTrue(os.path.exists(source))
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM status").fetchone()[0], count)
+        conn.close()
+
+        with get_manager().connection() as fresh:
+            self.assertEqual(fresh.execute("SELECT COUNT(*) FROM status").fetchone()[0], count)
+
+
+if __name__ == "__main__":
+    unittest.main()
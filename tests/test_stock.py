@@ -0,0 +1,142 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from sqlite_cli.database import connection_manager, write_queue
+from sqlite_cli.database.connection_manager import configure, get_manager
+from sqlite_cli.database.database import init_db
+from sqlite_cli.database.write_queue import WriteQueue, write_transaction
+from sqlite_cli.models.invoice_model import Invoice
+from sqlite_cli.models.stock_model import InsufficientStockError, Stock
+from utils.session_manager import SessionManager
+
+
+class StockTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.directory, "db.db")
+        self._previous = (connection_manager._manager, write_queue._write_queue, SessionManager._current_user)
+        connection_manager._manager = None
+        configure(db_path=self.db_path)
+        init_db()
+        with get_manager().connection() as conn:
+            conn.executemany("INSERT INTO status (name) VALUES (?)", [("active",), ("inactive",)])
+            conn.execute("INSERT INTO roles (name) VALUES ('admin')")
+            conn.execute("INSERT INTO person (first_name, last_name, id_number) VALUES ('Ana', 'Pérez', 'V-1')")
+            user_id = conn.execute("INSERT INTO users (username, password, person_id, role_id) VALUES ('ana', '-', 1, 1)").lastrowid
+            conn.execute("INSERT INTO invoice_status (name) VALUES ('Paid'), ('Cancelled')")
+            conn.execute("INSERT INTO invoice_types (name) VALUES ('Venta')")
+            conn.execute('''
+                INSERT INTO movement_types (name, affects_quantity, affects_stock)
+                VALUES ('Venta', 1, 1), ('Ajuste positivo', 1, 1)
+            ''')
+            self.customer_id = conn.execute('''
+                INSERT INTO customers (first_name, last_name, id_number, status_id)
+                VALUES ('Luis', 'Díaz', 'V-2', 1)
+            ''').lastrowid
+            self.product_id = conn.execute('''
+                INSERT INTO inventory (code, product, quantity, stock, cost, price, status_id)
+                VALUES ('PROD000001', 'Teclado', 10, 10, 5, 10, 1)
+            ''').lastrowid
+            self.sale_type = conn.execute("SELECT id FROM movement_types WHERE name = 'Venta'").fetchone()[0]
+            conn.commit()
+        self.queue = WriteQueue()
+        write_queue._write_queue = self.queue
+        SessionManager._current_user = {"id": user_id, "username": "ana"}
+
+    def tearDown(self) -> None:
+        self.queue.shutdown()
+        get_manager().close_all()
+        connection_manager._manager, write_queue._write_queue, SessionManager._current_user = self._previous
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _query(self, sql: str) -> list:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    def _stock(self) -> tuple:
+        return self._query(f"SELECT quantity, stock FROM inventory WHERE id = {self.product_id}")[0]
+
+    def _sell(self, quantity: int) -> int:
+        return Invoice.create_paid_invoice(
+            self.customer_id, 10.0 * quantity, 0, 10.0 * quantity,
+            [{"id": self.product_id, "quantity": quantity, "unit_price": 10.0, "total": 10.0 * quantity}],
+            [{"method": "Efectivo", "amount": 10.0 * quantity}]
+        )
+
+    def test_oversell_leaves_nothing_behind(self) -> None:
+        with self.assertRaises(InsufficientStockError) as raised:
+            self._sell(11)
+
+        self.assertEqual(raised.exception.inventory_id, self.product_id)
+        self.assertEqual(self._stock(), (10, 10))
+        for table in ("invoices", "invoice_payments", "invoice_details", "inventory_movements"):
+            self.assertEqual(self._query(f"SELECT COUNT(*) FROM {table}"), [(0,)], table)
+
+    def test_concurrent_sales_stop_at_zero(self) -> None:
+        sold = []
+
+        def sell_until_empty() -> None:
+            while True:
+                try:
+                    Stock.apply(self.product_id, self.sale_type, SessionManager.get_user_id(), stock_change=-1)
+                except InsufficientStockError:
+                    return
+                sold.append(1)
+
+        workers = [threading.Thread(target=sell_until_empty) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+        self.assertEqual(len(sold), 10)
+        self.assertEqual(self._stock(), (10, 0))
+        self.assertEqual(
+            self._query("SELECT previous_stock, new_stock FROM inventory_movements ORDER BY id"),
+            [(stock, stock - 1) for stock in range(10, 0, -1)]
+        )
+
+    def test_movements_record_previous_and_new_values(self) -> None:
+        results = write_transaction(lambda uow: Stock.apply_many(
+            uow,
+            [
+                {"inventory_id": self.product_id, "stock_change": -2},
+                {"inventory_id": self.product_id, "quantity_change": 4, "stock_change": 4},
+            ],
+            self.sale_type, SessionManager.get_user_id(), reference_id=None, reference_type="test"
+        ))
+
+        expected = [(0, -2, 10, 10, 10, 8), (4, 4, 10, 14, 8, 12)]
+        self.assertEqual(
+            [(r["new_quantity"] - r["previous_quantity"], r["new_stock"] - r["previous_stock"],
+              r["previous_quantity"], r["new_quantity"], r["previous_stock"], r["new_stock"]) for r in results],
+            expected
+        )
+        self.assertEqual(self._query('''
+            SELECT quantity_change, stock_change, previous_quantity, new_quantity, previous_stock, new_stock
+            FROM inventory_movements ORDER BY id
+        '''), expected)
+        self.assertEqual(self._stock(), (14, 12))
+
+    def test_cancelling_twice_restocks_once(self) -> None:
+        invoice_id = self._sell(3)
+        self.assertEqual(self._stock()[1], 7)
+
+        Invoice.update_status(invoice_id, "Cancelled")
+        Invoice.update_status(invoice_id, "Cancelled")
+
+        self.assertEqual(self._stock()[1], 10)
+        self.assertEqual(
+            self._query("SELECT COUNT(*) FROM inventory_movements WHERE reference_type = 'invoice_cancellation'"),
+            [(1,)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import tkinter
+import unittest
+from utils import ui_monitor
+
+
+class _StubRoot:
+    """Raíz mínima: guarda los ``after`` programados (no requiere pantalla)."""
+
+    def __init__(self) -> None:
+        self.scheduled = []
+
+    def after(self, ms, func=None, *args):
+        self.scheduled.append((ms, func))
+        return f"after#{len(self.scheduled)}"
+
+    def after_idle(self, func, *args):
+        return self.after("idle", func)
+
+
+class InstallUIMonitorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._call_wrapper = tkinter.CallWrapper
+        self._monitor = ui_monitor._monitor
+        ui_monitor._monitor = None
+
+    def tearDown(self) -> None:
+        tkinter.CallWrapper = self._call_wrapper
+        ui_monitor._monitor = self._monitor
+
+    def test_install_schedules_quiet_heartbeat(self) -> None:
+        root = _StubRoot()
+        monitor = ui_monitor.install_ui_monitor(root)
+
+        self.assertIs(tkinter.CallWrapper, ui_monitor._TimedCallWrapper)
+        self.assertEqual(len(root.scheduled), 1)
+        ms, beat = root.scheduled[0]
+        self.assertEqual(ms, ui_monitor.HEARTBEAT_MS)
+        self.assertTrue(beat._ui_monitor_skip)
+
+        # El latido se reprograma y no aparece entre los manejadores medidos
+        ui_monitor._TimedCallWrapper(beat, None, root)()
+        self.assertEqual(len(root.scheduled), 2)
+        self.assertEqual(monitor.handlers(), [])
+
+    def test_handlers_are_timed(self) -> None:
+        root = _StubRoot()
+        monitor = ui_monitor.install_ui_monitor(root)
+
+        class Screen:
+            def update_totals(self) -> None:
+                pass
+
+        ui_monitor._TimedCallWrapper(Screen().update_totals, None, root)()
+        handlers = monitor.handlers()
+        self.assertEqual(len(handlers), 1)
+        self.assertTrue(handlers[0]["handler"].endswith("Screen.update_totals"))
+        self.assertEqual(handlers[0]["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from sqlite_cli.database import connection_manager, write_queue
+from sqlite_cli.database.connection_manager import configure, get_manager
+from sqlite_cli.database.write_queue import WriteQueue, run_exclusive, write_transaction
+
+
+class WriteQueueTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.directory, "db.db")
+        self._previous = (connection_manager._manager, write_queue._write_queue)
+        connection_manager._manager = None
+        configure(db_path=self.db_path)
+        with get_manager().connection() as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+            conn.commit()
+        self.queue = WriteQueue()
+        write_queue._write_queue = self.queue
+
+    def tearDown(self) -> None:
+        self.queue.shutdown()
+        get_manager().close_all()
+        connection_manager._manager, write_queue._write_queue = self._previous
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _names(self) -> list:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return [row[0] for row in conn.execute("SELECT name FROM items ORDER BY id")]
+        finally:
+            conn.close()
+
+    def _hold_writer(self) -> threading.Event:
+        """Ocupa el escritor hasta que se active el evento devuelto: lo que se encole después va en un lote."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def hold() -> None:
+            started.set()
+            release.wait(5)
+
+        self.queue.submit_exclusive(hold)
+        started.wait(5)
+        return release
+
+    @staticmethod
+    def _insert(name: str):
+        return lambda uow: uow.insert("INSERT INTO items (name) VALUES (?)", (name,))
+
+    def test_failing_job_only_rolls_back_its_savepoint(self) -> None:
+        release = self._hold_writer()
+        first = self.queue.submit(self._insert("a"))
+        duplicate = self.queue.submit(self._insert("a"))
+        last = self.queue.submit(self._insert("c"))
+        release.set()
+
+        self.assertIsInstance(first.result(5), int)
+        with self.assertRaises(sqlite3.IntegrityError):
+            duplicate.result(5)
+        self.assertIsInstance(last.result(5), int)
+        self.assertEqual(self._names(), ["a", "c"])
+        self.assertEqual(self.queue.stats()["max_batch"], 3)
+
+    def test_futures_resolve_after_commit(self) -> None:
+        seen = []
+        release = self._hold_writer()
+        first = self.queue.submit(self._insert("a"))
+        # Al entregarse el primer resultado el lote completo ya está confirmado
+        first.add_done_callback(lambda future: seen.append(self._names()))
+        second = self.queue.submit(self._insert("b"))
+        release.set()
+
+        second.result(5)
+        first.result(5)
+        self.assertEqual(seen, [["a", "b"]])
+
+    def test_exclusive_runs_between_the_writes_around_it(self) -> None:
+        release = self._hold_writer()
+        before = self.queue.submit(self._insert("a"))
+        exclusive = self.queue.submit_exclusive(self._names)
+        after = self.queue.submit(self._insert("b"))
+        release.set()
+
+        self.assertEqual(exclusive.result(5), ["a"])
+        before.result(5)
+        after.result(5)
+        self.assertEqual(self._names(), ["a", "b"])
+        self.assertEqual(run_exclusive(self._names), ["a", "b"])
+
+    def test_timeout_before_start_cancels_the_write(self) -> None:
+        release = self._hold_writer()
+        with self.assertRaises(TimeoutError):
+            write_transaction(self._insert("late"), timeout=0.2)
+        release.set()
+
+        write_transaction(self._insert("next"))
+        self.assertEqual(self._names(), ["next"])
+
+    def test_timeout_after_start_waits_for_the_result(self) -> None:
+        def slow(uow) -> int:
+            time.sleep(0.8)
+            return uow.insert("INSERT INTO items (name) VALUES ('slow')")
+
+        write_transaction(self._insert("warm"))  # Escritor ya en marcha
+        self.assertIsInstance(write_transaction(slow, timeout=0.3), int)
+        self.assertEqual(self._names(), ["warm", "slow"])
+
+
+if __name__ == "__main__":
+    unittest.main()
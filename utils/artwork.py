@@ -0,0 +1,172 @@
+import glob
+import hashlib
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+import tkinter as tk
+from PIL import Image, ImageDraw
+
+# Ilustraciones ya escaladas (y con bordes redondeados) de arranques anteriores
+ARTWORK_CACHE_DIR = os.path.join("assets", ".cache")
+POLL_MS = 50  # Frecuencia con la que el hilo de Tk recoge ilustraciones renderizadas
+
+ArtworkCallback = Callable[[Optional[Image.Image]], None]
+
+
+def _cache_prefix(path: str, size: Tuple[int, int], radius: int) -> str:
+    source = os.path.abspath(path)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:10]
+    name = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(ARTWORK_CACHE_DIR, f"{name}_{digest}_{size[0]}x{size[1]}_r{radius}_")
+
+
+def _cache_path(path: str, size: Tuple[int, int], radius: int) -> str:
+    """Archivo de caché de la ilustración; el mtime del original invalida las copias viejas."""
+    return f"{_cache_prefix(path, size, radius)}{os.stat(path).st_mtime_ns}.tiff"
+
+
+def cached(path: str, size: Tuple[int, int], radius: int = 0) -> Optional[Image.Image]:
+    """
+    Ilustración ya renderizada en un arranque anterior, o ``None`` si no
+    está en caché (o el original cambió). Leerla no requiere escalar nada.
+    """
+    try:
+        with Image.open(_cache_path(path, size, radius)) as img:
+            img.load()
+            return img
+    except (OSError, ValueError):
+        return None
+
+
+def render(path: str, size: Tuple[int, int], radius: int = 0) -> Image.Image:
+    """
+    Ilustración escalada a ``size`` (LANCZOS) y, con ``radius``, con bordes
+    redondeados sobre fondo transparente.
+
+    El resultado se guarda como TIFF sin compresión en ``ARTWORK_CACHE_DIR``
+    (se lee en pocos milisegundos); los arranques siguientes lo reutilizan
+    mientras el original no cambie. Puede llamarse desde cualquier hilo.
+
+    :raises OSError: Si el original no existe o no se puede leer
+    """
+    image = cached(path, size, radius)
+    if image is not None:
+        return image
+
+    with Image.open(path) as img:
+        if img.format == "JPEG":
+            # Decodifica el JPEG ya reducido (escala DCT) antes del LANCZOS
+            img.draft("RGB", size)
+        image = img.resize(size, Image.Resampling.LANCZOS)
+    if radius:
+        mask = Image.new("L", size, 0)
+        ImageDraw.Draw(mask).rounded_rectangle((0, 0) + size, radius=radius, fill=255)
+        rounded = Image.new("RGBA", size)
+        rounded.paste(image, (0, 0), mask)
+        image = rounded
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGB")
+
+    _store(path, size, radius, image)
+    return image
+
+
+def _store(path: str, size: Tuple[int, int], radius: int, image: Image.Image) -> None:
+    try:
+        target = _cache_path(path, size, radius)
+        os.makedirs(ARTWORK_CACHE_DIR, exist_ok=True)
+        for stale in glob.glob(glob.escape(_cache_prefix(path, size, radius)) + "*.tiff"):
+            os.remove(stale)
+        temp = f"{target}.{os.getpid()}.part"
+        image.save(temp, format="TIFF")
+        os.replace(temp, target)
+    except OSError:
+        # La caché es opcional (p. ej. carpeta de solo lectura): se volverá a renderizar
+        pass
+
+
+class ArtworkLoader:
+    """
+    Renderiza ilustraciones en un hilo aparte y las entrega en el hilo de Tk.
+
+    Un solo hilo de trabajo: las ilustraciones se procesan en orden y sin
+    competir con la interfaz. La entrega se hace con ``after()``; el
+    ``PhotoImage`` lo crea quien recibe la imagen, en el hilo de Tk.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._results: "queue.Queue" = queue.Queue()
+        self._pending = 0
+        self._poll_after: Optional[str] = None
+        self._root: Optional[tk.Misc] = None
+
+    def load_async(
+        self,
+        path: str,
+        size: Tuple[int, int],
+        widget: tk.Misc,
+        callback: ArtworkCallback,
+        radius: int = 0
+    ) -> None:
+        """
+        Llama a ``callback`` (en el hilo de Tk) con la ilustración renderizada,
+        o con ``None`` si no se pudo leer. No se llama si ``widget`` fue destruido.
+        """
+        if self._root is None:
+            self._root = widget.nametowidget(".")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artwork")
+        self._pending += 1
+        self._executor.submit(self._work, path, size, radius, widget, callback)
+        if self._poll_after is None:
+            self._poll_after = self._root.after(POLL_MS, self._poll)
+
+    def shutdown(self) -> None:
+        """Descarta lo pendiente (al cerrar la aplicación)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _work(self, path: str, size: Tuple[int, int], radius: int, widget: tk.Misc, callback: ArtworkCallback) -> None:
+        try:
+            image = render(path, size, radius)
+        except (OSError, ValueError) as e:
+            print(f"Error cargando ilustración {path}: {e}")
+            image = None
+        self._results.put((widget, callback, image))
+
+    def _poll(self) -> None:
+        self._poll_after = None
+        while True:
+            try:
+                widget, callback, image = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            try:
+                if widget.winfo_exists():
+                    callback(image)
+            except tk.TclError:
+                # El widget fue destruido
+                pass
+
+        if self._pending:
+            self._poll_after = self._root.after(POLL_MS, self._poll)
+
+
+_loader: Optional[ArtworkLoader] = None
+
+
+def get_artwork_loader() -> ArtworkLoader:
+    """Cargador de ilustraciones compartido por todas las pantallas."""
+    global _loader
+    if _loader is None:
+        _loader = ArtworkLoader()
+    return _loader
+
+
+def shutdown_artwork_loader() -> None:
+    if _loader is not None:
+        _loader.shutdown()
@@ -0,0 +1,199 @@
+import csv
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlite_cli.models.inventory_report_model import InventoryReport
+from sqlite_cli.models.purchase_order_report_model import PurchaseOrderReport
+from sqlite_cli.models.sales_report_model import SalesReport
+
+# Avance de la exportación: (fracción entre 0 y 1, mensaje), como en ``utils.pdf_render``
+ProgressCallback = Callable[[float, str], None]
+
+# Formatos de archivo por extensión
+EXPORT_FORMATS: Dict[str, str] = {
+    ".csv": "CSV",
+    ".jsonl": "JSON Lines",
+}
+
+# Separador del CSV: el mismo que usan las plantillas de importación
+# (Excel en español abre así las columnas sin asistente)
+CSV_DELIMITER = ";"
+PROGRESS_EVERY_ROWS = 1000
+
+
+def _inventory_rows(**query: Any) -> Iterator[Dict]:
+    return InventoryReport.iter_inventory_report(raw=True, **query)
+
+
+def _movement_rows(**query: Any) -> Iterator[Dict]:
+    return InventoryReport.iter_inventory_movements_report(raw=True, **query)
+
+
+# Exportaciones disponibles: clave -> (título, filas con los filtros del
+# reporte, columnas como (clave de la fila, encabezado del CSV))
+EXPORTS: Dict[str, Tuple[str, Callable[..., Iterator[Dict]], List[Tuple[str, str]]]] = {
+    "sales_report": ("Ventas", SalesReport.iter_sales_report, [
+        ("invoice_id", "Factura"),
+        ("issue_date", "Fecha"),
+        ("customer_name", "Cliente"),
+        ("customer_id_number", "Cédula"),
+        ("invoice_type", "Tipo"),
+        ("status_name", "Estado"),
+        ("product_count", "Productos"),
+        ("service_count", "Servicios"),
+        ("subtotal", "Subtotal"),
+        ("taxes", "IVA"),
+        ("total", "Total"),
+    ]),
+    "sales_report_items": ("Detalle de ventas", SalesReport.iter_sales_report_items, [
+        ("invoice_id", "Factura"),
+        ("issue_date", "Fecha"),
+        ("customer_name", "Cliente"),
+        ("customer_id_number", "Cédula"),
+        ("status_name", "Estado"),
+        ("item_type", "Tipo"),
+        ("item_code", "Código"),
+        ("item_name", "Descripción"),
+        ("quantity", "Cantidad"),
+        ("unit_price", "P. Unitario"),
+        ("subtotal", "Subtotal"),
+    ]),
+    "purchase_orders_report": ("Órdenes de compra", PurchaseOrderReport.iter_purchase_orders_report, [
+        ("order_number", "N° Orden"),
+        ("issue_date", "Fecha"),
+        ("expected_delivery_date", "Entrega"),
+        ("supplier_company", "Proveedor"),
+        ("supplier_id_number", "RIF/Cédula"),
+        ("created_by", "Usuario"),
+        ("product_count", "Productos"),
+        ("subtotal", "Subtotal"),
+        ("taxes", "IVA"),
+        ("total", "Total"),
+        ("notes", "Notas"),
+    ]),
+    "purchase_orders_report_items": ("Detalle de órdenes de compra", PurchaseOrderReport.iter_purchase_orders_report_items, [
+        ("order_number", "N° Orden"),
+        ("issue_date", "Fecha"),
+        ("supplier_company", "Proveedor"),
+        ("supplier_id_number", "RIF/Cédula"),
+        ("product_code", "Código"),
+        ("product_name", "Producto"),
+        ("quantity", "Cantidad"),
+        ("received_quantity", "Recibido"),
+        ("unit_price", "P. Unitario"),
+        ("subtotal", "Subtotal"),
+    ]),
+    "inventory_report": ("Productos", _inventory_rows, [
+        ("code", "Código"),
+        ("product", "Producto"),
+        ("description", "Descripción"),
+        ("quantity", "Cantidad"),
+        ("stock", "Stock"),
+        ("min_stock", "Stock mínimo"),
+        ("max_stock", "Stock máximo"),
+        ("cost", "Precio de compra"),
+        ("price", "Precio de venta"),
+        ("supplier_company", "Proveedor"),
+        ("expiration_date", "Vencimiento"),
+        ("sales_count", "Ventas"),
+        ("status", "Estado"),
+    ]),
+    "inventory_movements_report": ("Movimientos de inventario", _movement_rows, [
+        ("created_at", "Fecha"),
+        ("product_code", "Código"),
+        ("product_name", "Producto"),
+        ("movement_type", "Tipo"),
+        ("quantity_change", "Cambio cantidad"),
+        ("stock_change", "Cambio stock"),
+        ("previous_quantity", "Cantidad anterior"),
+        ("new_quantity", "Cantidad nueva"),
+        ("previous_stock", "Stock anterior"),
+        ("new_stock", "Stock nuevo"),
+        ("user", "Usuario"),
+        ("reference_type", "Referencia"),
+        ("reference_id", "N° Referencia"),
+        ("notes", "Notas"),
+    ]),
+}
+
+
+def export_format(file_path: str) -> str:
+    """Extensión de ``file_path`` validada contra ``EXPORT_FORMATS``."""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f"Formato no soportado: {ext or file_path} (use {' o '.join(EXPORT_FORMATS)})")
+    return ext
+
+
+def _value(value: Any) -> Any:
+    # Los montos se guardan como REAL: se redondean a céntimos, como en pantalla
+    # (los subtotales calculados traen residuos como 8100.780000000001)
+    if isinstance(value, float):
+        return round(value, 2)
+    return value
+
+
+def _write_csv(f: Any, columns: List[Tuple[str, str]], rows: Iterable[Dict]) -> Iterator[None]:
+    writer = csv.writer(f, delimiter=CSV_DELIMITER)
+    writer.writerow([label for _, label in columns])
+    keys = [key for key, _ in columns]
+    for row in rows:
+        writer.writerow(["" if row[key] is None else _value(row[key]) for key in keys])
+        yield
+
+
+def _write_jsonl(f: Any, columns: List[Tuple[str, str]], rows: Iterable[Dict]) -> Iterator[None]:
+    keys = [key for key, _ in columns]
+    for row in rows:
+        f.write(json.dumps({key: _value(row[key]) for key in keys}, ensure_ascii=False, default=str))
+        f.write("\n")
+        yield
+
+
+def export_report(
+    file_path: str,
+    report: str,
+    query: Optional[Dict] = None,
+    total: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None
+) -> int:
+    """
+    Escribe un reporte en CSV o JSON Lines directamente desde el cursor.
+
+    Las filas se leen por lotes y se escriben a medida que llegan, así que
+    la memoria no depende del tamaño del reporte. El archivo se escribe
+    con otro nombre y se renombra al terminar: si falla o se cancela
+    (``progress`` lanza una excepción) no queda un archivo a medias.
+
+    :param file_path: Archivo de destino (.csv o .jsonl)
+    :param report: Clave de ``EXPORTS``
+    :param query: Filtros del reporte (los mismos de su ``iter_*``)
+    :param total: Filas esperadas, sólo para calcular el avance
+    :param progress: Avance (fracción, mensaje)
+    :return: Filas escritas
+    """
+    ext = export_format(file_path)
+    if report not in EXPORTS:
+        raise ValueError(f"Reporte desconocido: {report} (use {', '.join(EXPORTS)})")
+    _, source, columns = EXPORTS[report]
+    write = _write_csv if ext == ".csv" else _write_jsonl
+
+    partial = f"{file_path}.part"
+    count = 0
+    try:
+        # utf-8-sig: Excel reconoce los acentos del CSV
+        encoding = "utf-8-sig" if ext == ".csv" else "utf-8"
+        with open(partial, "w", encoding=encoding, newline="") as f:
+            for _ in write(f, columns, source(**(query or {}))):
+                count += 1
+                if progress and count % PROGRESS_EVERY_ROWS == 0:
+                    fraction = min(0.99, count / total) if total else 0.0
+                    progress(fraction, f"Exportando filas ({count}{f'/{total}' if total else ''})")
+        os.replace(partial, file_path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    if progress:
+        progress(1.0, f"{count} filas exportadas")
+    return count
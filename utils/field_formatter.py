@@ -76,10 +76,8 @@ class FieldFormatter:
         return ''.join(formatted)
 
     @staticmethod
-    def validate_and_format(widget: tk.Widget, field_type: str) -> None:
-        """Valida y formatea el contenido de un widget según su tipo"""
-        current_text = widget.get()
-        
+    def get_formatter(field_type: str) -> Optional[Callable[[str], str]]:
+        """Formateador de ``field_type``, o None si el tipo no tiene formateador"""
         formatters = {
             'code': FieldFormatter.format_code,
             'name': FieldFormatter.format_name,
@@ -96,12 +94,22 @@ class FieldFormatter:
             'date': FieldFormatter.format_date,
             'notes': FieldFormatter.format_first_name
         }
-        
-        if field_type in formatters:
-            formatted_text = formatters[field_type](current_text)
-            if formatted_text != current_text:
-                widget.delete(0, tk.END)
-                widget.insert(0, formatted_text)
+        return formatters.get(field_type)
+
+    @staticmethod
+    def format_value(text: str, field_type: str) -> str:
+        """Aplica el formateador de ``field_type`` (sin cambios si el tipo no tiene formateador)"""
+        formatter = FieldFormatter.get_formatter(field_type)
+        return formatter(text) if formatter else text
+
+    @staticmethod
+    def validate_and_format(widget: tk.Widget, field_type: str) -> None:
+        """Valida y formatea el contenido de un widget según su tipo"""
+        current_text = widget.get()
+        formatted_text = FieldFormatter.format_value(current_text, field_type)
+        if formatted_text != current_text:
+            widget.delete(0, tk.END)
+            widget.insert(0, formatted_text)
 
     @staticmethod
     def bind_validation(widget: tk.Widget, field_type: str) -> None:
@@ -123,13 +131,18 @@ class FieldFormatter:
                 return False
         return True
 
+    @staticmethod
+    def is_valid_email(email: str) -> bool:
+        """Indica si el email tiene un formato válido (sin mostrar mensajes)"""
+        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        return bool(re.match(pattern, email))
+
     @staticmethod
     def validate_email_format(email: str, parent: Optional[tk.Widget] = None) -> bool:
         """Valida que el email tenga un formato válido"""
         if not email:
             return True
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
+        if not FieldFormatter.is_valid_email(email):
             messagebox.showerror("Error", "El formato del email no es válido", parent=parent)
             return False
         return True
\ No newline at end of file
@@ -0,0 +1,240 @@
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import tkinter as tk
+from PIL import Image, ImageTk
+from utils.image_store import source_for
+
+MEMORY_BUDGET = 64 * 1024 * 1024   # Bytes máximos de imágenes decodificadas en caché
+DECODE_WORKERS = 2                 # Hilos que decodifican miniaturas
+POLL_MS = 30                       # Frecuencia con la que el hilo de Tk recoge miniaturas
+
+# (ruta absoluta, mtime_ns, tamaño): el mtime invalida la entrada si el archivo cambia
+CacheKey = Tuple[str, int, object]
+ImageCallback = Callable[[Optional[tk.PhotoImage]], None]
+
+
+class _Entry:
+    __slots__ = ("image", "photo", "cost")
+
+    def __init__(self, image: Optional[Image.Image], photo: Optional[tk.PhotoImage], cost: int) -> None:
+        self.image = image
+        self.photo = photo
+        self.cost = cost
+
+
+class ImageCache:
+    """
+    Caché LRU de imágenes para pantallas con miniaturas.
+
+    Cada entrada se identifica por (ruta, mtime, tamaño): una misma foto se
+    decodifica una sola vez por tamaño mientras quepa en ``memory_budget``,
+    y se vuelve a leer sólo si el archivo cambia en disco. Se guarda la
+    imagen reducida (PIL) y su ``PhotoImage``; las entradas menos usadas
+    se descartan al superar el presupuesto.
+
+    ``load`` decodifica en el hilo de Tk (paneles de detalle); ``load_async``
+    decodifica en un pool de hilos y entrega el ``PhotoImage`` en el hilo de
+    Tk mediante ``after()`` (tarjetas y listados). Si la imagen tiene
+    derivados pre-escalados (``utils.image_store``) se lee el más pequeño
+    que cubre el tamaño pedido en lugar del original.
+    """
+
+    def __init__(self, memory_budget: int = MEMORY_BUDGET, workers: int = DECODE_WORKERS) -> None:
+        self.memory_budget = memory_budget
+        self.workers = workers
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._results: "queue.Queue" = queue.Queue()
+        self._waiting: Dict[CacheKey, List[Tuple[tk.Misc, ImageCallback]]] = {}
+        self._poll_after: Optional[str] = None
+        self._root: Optional[tk.Misc] = None
+        self.hits = 0
+        self.misses = 0
+
+    # --- API pública -------------------------------------------------
+
+    def load(self, path: Optional[str], size: Optional[Tuple[int, int]] = None) -> Optional[tk.PhotoImage]:
+        """
+        Devuelve la imagen reducida a ``size`` (como ``thumbnail``), o ``None``
+        si no existe o no se puede leer. Debe llamarse desde el hilo de Tk.
+
+        :param path: Ruta de la imagen
+        :param size: Caja máxima (ancho, alto); ``None`` = tamaño original
+        """
+        key = self._key(source_for(path, size) if path else path, size)
+        if key is None:
+            return None
+        photo = self._get_photo(key)
+        if photo is not None:
+            return photo
+        image = self._decode(key)
+        return self._store_photo(key, image) if image is not None else None
+
+    def load_async(
+        self,
+        path: Optional[str],
+        size: Optional[Tuple[int, int]],
+        widget: tk.Misc,
+        callback: ImageCallback
+    ) -> None:
+        """
+        Entrega la imagen a ``callback`` en el hilo de Tk sin bloquearlo.
+
+        Si está en caché se llama de inmediato; si no, se decodifica en el
+        pool. Varias peticiones de la misma imagen comparten una decodificación.
+        El callback no se llama si ``widget`` fue destruido mientras tanto.
+        """
+        key = self._key(source_for(path, size) if path else path, size)
+        if key is None:
+            callback(None)
+            return
+        photo = self._get_photo(key)
+        if photo is not None:
+            callback(photo)
+            return
+
+        if self._root is None:
+            self._root = widget.nametowidget(".")
+        waiting = self._waiting.setdefault(key, [])
+        waiting.append((widget, callback))
+        if len(waiting) == 1:
+            self._get_executor().submit(self._work, key)
+        if self._poll_after is None:
+            self._poll_after = self._root.after(POLL_MS, self._poll)
+
+    def icon(self, path: str, subsample: int) -> Optional[tk.PhotoImage]:
+        """Ícono reducido con ``tk.PhotoImage.subsample`` (sin PIL), cacheado por archivo y factor."""
+        key = self._key(path, ("subsample", subsample))
+        if key is None:
+            return None
+        photo = self._get_photo(key)
+        if photo is None:
+            try:
+                photo = tk.PhotoImage(file=path).subsample(subsample, subsample)
+            except tk.TclError:
+                return None
+            self._put(key, _Entry(None, photo, photo.width() * photo.height() * 4))
+        return photo
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def shutdown(self) -> None:
+        """Detiene el pool de decodificación (al cerrar la aplicación)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def memory_used(self) -> int:
+        return self._size
+
+    # --- Internos ----------------------------------------------------
+
+    @staticmethod
+    def _key(path: Optional[str], size: object) -> Optional[CacheKey]:
+        if not path:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        return (os.path.abspath(path), mtime, size)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="image-decode")
+        return self._executor
+
+    def _get_photo(self, key: CacheKey) -> Optional[tk.PhotoImage]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        if entry.photo is None:
+            # Decodificada en segundo plano: el PhotoImage se crea en el hilo de Tk
+            return self._store_photo(key, entry.image)
+        return entry.photo
+
+    @staticmethod
+    def _decode(key: CacheKey) -> Optional[Image.Image]:
+        path, _, size = key
+        try:
+            with Image.open(path) as img:
+                if size and img.format == "JPEG":
+                    # Decodifica el JPEG ya reducido (escala DCT): mucho más rápido
+                    img.draft("RGB", size)
+                if size:
+                    img.thumbnail(size)
+                else:
+                    img.load()
+                return img.copy()
+        except (OSError, ValueError) as e:
+            print(f"Error loading image: {e}")
+            return None
+
+    def _store_photo(self, key: CacheKey, image: Image.Image) -> tk.PhotoImage:
+        photo = ImageTk.PhotoImage(image)
+        cost = image.width * image.height * (len(image.getbands()) + 4)
+        self._put(key, _Entry(image, photo, cost))
+        return photo
+
+    def _put(self, key: CacheKey, entry: _Entry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.cost
+            self._entries[key] = entry
+            self._size += entry.cost
+            while self._size > self.memory_budget and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.cost
+
+    def _work(self, key: CacheKey) -> None:
+        self._results.put((key, self._decode(key)))
+
+    def _poll(self) -> None:
+        self._poll_after = None
+        while True:
+            try:
+                key, image = self._results.get_nowait()
+            except queue.Empty:
+                break
+            photo = self._store_photo(key, image) if image is not None else None
+            for widget, callback in self._waiting.pop(key, []):
+                try:
+                    if widget.winfo_exists():
+                        callback(photo)
+                except tk.TclError:
+                    # El widget fue destruido
+                    pass
+
+        if self._waiting:
+            self._poll_after = self._root.after(POLL_MS, self._poll)
+
+
+_cache: Optional[ImageCache] = None
+
+
+def get_image_cache() -> ImageCache:
+    """Caché de imágenes compartida por todas las pantallas."""
+    global _cache
+    if _cache is None:
+        _cache = ImageCache()
+    return _cache
+
+
+def shutdown_image_cache() -> None:
+    if _cache is not None:
+        _cache.shutdown()
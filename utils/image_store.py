@@ -0,0 +1,121 @@
+import hashlib
+import os
+import re
+import shutil
+from typing import Dict, Optional, Tuple
+from PIL import Image, features
+
+# Derivados pre-escalados que se generan al guardar una imagen de producto
+VARIANT_SIZES: Dict[str, Tuple[int, int]] = {
+    "grid": (120, 120),      # Tarjetas del catálogo y miniatura del inventario
+    "detail": (330, 300),    # Panel de detalles del catálogo y formulario de producto
+    "viewer": (1024, 1024),  # Ventana de imagen completa
+}
+
+# WebP cuando Pillow lo soporta (mucho más liviano); PNG en caso contrario
+DERIVATIVE_FORMAT = "WEBP" if features.check("webp") else "PNG"
+DERIVATIVE_EXT = ".webp" if DERIVATIVE_FORMAT == "WEBP" else ".png"
+WEBP_QUALITY = 85
+
+HASH_LENGTH = 20
+_HASHED_NAME_RE = re.compile(r"^[0-9a-f]{%d}$" % HASH_LENGTH)
+_CHUNK = 1024 * 1024
+
+
+def content_hash(path: str) -> str:
+    """Hash SHA-256 (abreviado) del contenido del archivo."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def is_stored(path: str) -> bool:
+    """Indica si ``path`` ya es un original guardado con nombre por contenido."""
+    return bool(_HASHED_NAME_RE.match(os.path.splitext(os.path.basename(path))[0]))
+
+
+def variant_path(image_path: str, variant: str) -> str:
+    """Ruta del derivado ``variant`` de un original guardado."""
+    folder = os.path.dirname(image_path)
+    name = os.path.splitext(os.path.basename(image_path))[0]
+    return os.path.join(folder, f"{name}_{variant}{DERIVATIVE_EXT}")
+
+
+def source_for(image_path: str, size: Optional[Tuple[int, int]]) -> str:
+    """
+    Archivo más liviano que sirve para mostrar ``image_path`` en ``size``.
+
+    Devuelve el derivado más pequeño que cubre la caja pedida, o el
+    original si no hay derivados (imágenes sin migrar) o ninguno alcanza.
+    """
+    if not size or not is_stored(image_path):
+        return image_path
+    for variant, (width, height) in sorted(VARIANT_SIZES.items(), key=lambda item: item[1]):
+        if width >= size[0] and height >= size[1]:
+            candidate = variant_path(image_path, variant)
+            if os.path.exists(candidate):
+                return candidate
+    return image_path
+
+
+def store_image(source_path: str, folder: str, derivatives: bool = True) -> str:
+    """
+    Guarda una imagen de producto con nombre por contenido y sus derivados.
+
+    El original se copia como ``<hash><ext>``: subir dos veces la misma foto
+    (en el mismo u otro producto) reutiliza el archivo existente. Los
+    derivados de ``VARIANT_SIZES`` se generan junto al original si faltan.
+
+    :param source_path: Imagen elegida por el usuario
+    :param folder: Carpeta de imágenes del inventario
+    :param derivatives: Genera también los derivados
+    :return: Ruta del original guardado
+    """
+    os.makedirs(folder, exist_ok=True)
+    ext = os.path.splitext(source_path)[1].lower() or ".png"
+    dest_path = os.path.join(folder, f"{content_hash(source_path)}{ext}")
+    if not os.path.exists(dest_path):
+        shutil.copy2(source_path, dest_path)
+    if derivatives:
+        create_derivatives(dest_path)
+    return dest_path
+
+
+def create_derivatives(image_path: str, overwrite: bool = False) -> int:
+    """
+    Genera los derivados pre-escalados de un original guardado.
+
+    :return: Cantidad de derivados escritos
+    """
+    written = 0
+    with Image.open(image_path) as img:
+        img.load()
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "P") else "RGB")
+        for variant, size in VARIANT_SIZES.items():
+            target = variant_path(image_path, variant)
+            if os.path.exists(target) and not overwrite:
+                continue
+            derivative = img.copy()
+            derivative.thumbnail(size, Image.Resampling.LANCZOS)
+            # Escritura atómica: nunca queda un derivado a medias en disco
+            partial = f"{target}.tmp"
+            if DERIVATIVE_FORMAT == "WEBP":
+                derivative.save(partial, DERIVATIVE_FORMAT, quality=WEBP_QUALITY, method=4)
+            else:
+                derivative.save(partial, DERIVATIVE_FORMAT, optimize=True)
+            os.replace(partial, target)
+            written += 1
+    return written
+
+
+def remove_image(image_path: str) -> None:
+    """Elimina un original guardado y sus derivados."""
+    paths = [image_path]
+    if is_stored(image_path):
+        paths.extend(variant_path(image_path, variant) for variant in VARIANT_SIZES)
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
@@ -1,31 +1,66 @@
 # Standard library imports
 from datetime import datetime
-from typing import List, Dict
-import tkinter.messagebox as messagebox
+from typing import List, Dict, Optional
 from tkinter import Toplevel, filedialog
 
-# ReportLab imports
-from reportlab.lib.pagesizes import landscape, letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus.flowables import HRFlowable
-from reportlab.lib.enums import TA_RIGHT, TA_LEFT, TA_CENTER
-
 # Local application imports
 from sqlite_cli.models.tax_model import Tax
 from utils.session_manager import SessionManager
+from utils.pdf_jobs import get_pdf_jobs
 
 class PDFGenerator:
+    """
+    Diálogos de guardado de los PDF del sistema.
+
+    Cada método pide la ruta, resuelve en el hilo de Tk los datos de sesión
+    y de configuración (usuario, IVA) y encola la maquetación en
+    ``utils.pdf_jobs``; el documento se escribe en un proceso aparte con
+    ``utils.pdf_render`` mientras la interfaz sigue respondiendo.
+    """
+
+    @staticmethod
+    def _plain_rows(items: List[Dict]) -> List[Dict]:
+        """Copia las filas como diccionarios simples (se envían a otro proceso)."""
+        return [dict(item) for item in items]
+
+    @staticmethod
+    def _current_user_info() -> str:
+        current_user = SessionManager.get_current_user()
+        user_info = "No disponible"
+        
+        if current_user:
+            if 'first_name' in current_user and 'last_name' in current_user:
+                user_info = f"{current_user['first_name']} {current_user['last_name']}"
+            elif 'username' in current_user:
+                user_info = current_user['username']
+        return user_info
+
+    @staticmethod
+    def _report_rows(items: List[Dict], query: Optional[Dict]) -> Dict:
+        """
+        Filas de un reporte para el proceso de trabajo: los filtros de la
+        consulta si se conocen (el proceso lee las filas por lotes) o una
+        copia de las filas en pantalla.
+        """
+        if query is not None:
+            return {"query": dict(query), "total": len(items)}
+        return {"items": PDFGenerator._plain_rows(items)}
+
     @staticmethod
     def generate_inventory_report(
         parent: Toplevel,
         title: str,
         items: List[Dict],
-        filters: str
+        filters: str,
+        query: Optional[Dict] = None
     ) -> None:
-        """Genera un reporte de inventario en PDF en orientación horizontal con imagen de empresa"""
+        """
+        Genera un reporte de inventario en PDF en orientación horizontal con imagen de empresa.
+
+        :param query: Filtros de ``InventoryReport.iter_inventory_report`` que
+            produjeron ``items``; con ellos el PDF se genera leyendo la base
+            de datos por lotes en lugar de copiar las filas al otro proceso
+        """
         # Mostrar diálogo para guardar el archivo
         file_path = filedialog.asksaveasfilename(
             defaultextension=".pdf",
@@ -38,169 +73,57 @@ class PDFGenerator:
         if not file_path:  # El usuario canceló
             return
         
-        try:
-            # Crear el documento PDF en orientación horizontal
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=landscape(letter),
-                rightMargin=20,
-                leftMargin=20,
-                topMargin=40,
-                bottomMargin=40
-            )
-            
-            # Estilos
-            styles = getSampleStyleSheet()
-            style_title = styles["Title"]
-            style_normal = styles["Normal"]
-            style_heading = styles["Heading2"]
-            
-            # Contenido del PDF
-            elements = []
-            
-            # Encabezado con imagen
-            try:
-                # Intentar cargar la imagen de la empresa
-                logo_path = "assets/empresa.png"
-                logo = Image(logo_path, width=1.5*inch, height=0.7*inch)
-                
-                header_table = Table([
-                    [logo, "", Paragraph(f"Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}", style_normal)],
-                    ["", Paragraph(title, style_heading), Paragraph(f"Filtros: {filters}", style_normal)]
-                ], colWidths=[3*inch, 3*inch, 3*inch])
-                
-                header_table.setStyle(TableStyle([
-                    ('SPAN', (0,0), (0,1)),  # Combinar celdas para el logo
-                    ('SPAN', (1,1), (1,1)),  # Título centrado
-                    ('ALIGN', (1,1), (1,1), 'CENTER'),
-                    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                    ('ALIGN', (2,0), (2,0), 'RIGHT'),
-                    ('ALIGN', (2,1), (2,1), 'RIGHT'),
-                ]))
-                
-            except Exception as e:
-                print(f"Error cargando imagen de empresa: {e}")
-                # Fallback a texto si no se puede cargar la imagen
-                header_table = Table([
-                    [Paragraph("RN&M SERVICIOS INTEGRALES, C.A", style_title), "", Paragraph(f"Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}", style_normal)],
-                    [Paragraph("RIF: J-40339817-8", style_normal), Paragraph(title, style_heading), Paragraph(f"Filtros: {filters}", style_normal)]
-                ], colWidths=[3*inch, 3*inch, 3*inch])
-                
-                header_table.setStyle(TableStyle([
-                    ('SPAN', (0,0), (0,1)),  # Combinar celdas para company info
-                    ('SPAN', (1,1), (1,1)),  # Título centrado
-                    ('ALIGN', (1,1), (1,1), 'CENTER'),
-                    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                    ('ALIGN', (2,0), (2,0), 'RIGHT'),
-                    ('ALIGN', (2,1), (2,1), 'RIGHT'),
-                ]))
-            
-            elements.append(header_table)
-            elements.append(Spacer(1, 24))
-            
-            # Tabla de datos - ajustamos anchos para orientación horizontal
-            headers = ["Código", "Producto", "Descripción", "Cant.", "Stock.", 
-                      "Mín", "Máx", "P. Compra", "P. Venta", "Proveedor"]
-            
-            # Preparar datos para la tabla
-            data = [headers]
-            for item in items:
-                row = [
-                    item['code'],
-                    item['product'],
-                    item['description'],
-                    str(item['quantity']),
-                    str(item['stock']),
-                    str(item['min_stock']),
-                    str(item['max_stock']),
-                    f"{item['cost']:.2f}",
-                    f"{item['price']:.2f}",
-                    item.get('supplier_company', '')
-                ]
-                data.append(row)
-            
-            # Anchos de columna ajustados para horizontal
-            col_widths = [
-                0.8*inch,  # Código
-                2.0*inch,  # Producto
-                2.5*inch,  # Descripción
-                0.5*inch,  # Cantidad
-                0.5*inch,  # Stock
-                0.5*inch,  # Mín
-                0.5*inch,  # Máx
-                0.7*inch,  # P. Compra
-                0.7*inch,  # P. Venta
-                1.5*inch   # Proveedor
-            ]
-            
-            # Crear tabla principal
-            table = Table(data, colWidths=col_widths, repeatRows=1)
-            
-            # Estilo de la tabla
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#4a6fa5")),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (3, 1), (6, -1), 'CENTER'),  # Centrar valores numéricos
-                ('ALIGN', (7, 1), (8, -1), 'RIGHT'),   # Alinear precios a la derecha
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            
-            elements.append(table)
-            elements.append(Spacer(1, 12))
-            
-            # Totales
-            total_items = len(items)
-            total_quantity = sum(item['quantity'] for item in items)
-            total_stock = sum(item['stock'] for item in items)
-            
-            totals_table = Table([
-                [
-                    Paragraph(f"<b>Total Productos:</b> {total_items}", style_normal),
-                    Paragraph(f"<b>Total en Cantidad:</b> {total_quantity}", style_normal),
-                    Paragraph(f"<b>Total Stock:</b> {total_stock}", style_normal)
-                ]
-            ], colWidths=[3*inch, 3*inch, 3*inch])
-            
-            elements.append(totals_table)
-            elements.append(Spacer(1, 12))
-            
-            # Información del generador
-            current_user = SessionManager.get_current_user()
-            user_info = "No disponible"
-            
-            if current_user:
-                if 'first_name' in current_user and 'last_name' in current_user:
-                    user_info = f"{current_user['first_name']} {current_user['last_name']}"
-                elif 'username' in current_user:
-                    user_info = current_user['username']
-            
-            elements.append(Paragraph(f"<b>Generado por:</b> {user_info}", style_normal))
-            elements.append(Spacer(1, 6))
-            elements.append(Paragraph("<i>Este reporte fue generado automáticamente por el sistema.</i>", style_normal))
-            
-            # Generar el PDF
-            doc.build(elements)
-            
-            # Mostrar mensaje de éxito
-            messagebox.showinfo(
-                "Éxito",
-                f"El reporte se ha generado correctamente en:\n{file_path}",
-                parent=parent
-            )
-            
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"No se pudo generar el PDF:\n{str(e)}",
-                parent=parent
-            )
+        get_pdf_jobs().submit(
+            parent,
+            "inventory_report",
+            file_path,
+            {
+                "title": title,
+                "filters": filters,
+                "user_info": PDFGenerator._current_user_info(),
+                **PDFGenerator._report_rows(items, query),
+            },
+            title="Generando reporte de inventario",
+            success_message="El reporte se ha generado correctamente en:\n{file_path}"
+        )
+
+    @staticmethod
+    def generate_inventory_movements_report(
+        parent: Toplevel,
+        title: str,
+        items: List[Dict],
+        filters: str,
+        query: Optional[Dict] = None
+    ) -> None:
+        """
+        Genera el reporte de movimientos de inventario en PDF (horizontal).
+
+        :param query: Filtros de ``InventoryReport.iter_inventory_movements_report``
+        """
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("Archivos PDF", "*.pdf")],
+            title="Guardar reporte como",
+            initialfile=f"Movimientos_Inventario_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+            parent=parent
+        )
+        
+        if not file_path:
+            return
+        
+        get_pdf_jobs().submit(
+            parent,
+            "inventory_movements_report",
+            file_path,
+            {
+                "title": title,
+                "filters": filters,
+                "user_info": PDFGenerator._current_user_info(),
+                **PDFGenerator._report_rows(items, query),
+            },
+            title="Generando reporte de movimientos",
+            success_message="El reporte se ha generado correctamente en:\n{file_path}"
+        )
 
     @staticmethod
     def generate_purchase_order(
@@ -226,197 +149,24 @@ class PDFGenerator:
         if not file_path:
             return
         
-        try:
-            # Configuración del documento
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=letter,
-                rightMargin=20,
-                leftMargin=20,
-                topMargin=40,
-                bottomMargin=40
-            )
-            
-            # Estilos personalizados
-            styles = getSampleStyleSheet()
-            style_title = styles["Title"]
-            style_normal = styles["Normal"]
-            style_bold = ParagraphStyle(
-                name='Bold',
-                parent=style_normal,
-                fontName='Helvetica-Bold'
-            )
-            style_total = ParagraphStyle(
-                name='Total',
-                parent=style_normal,
-                fontSize=12,
-                fontName='Helvetica-Bold',
-                alignment=TA_RIGHT,
-                spaceAfter=12
-            )
-            
-            elements = []
-            
-            # Encabezado con imagen
-            try:
-                # Intentar cargar la imagen de la empresa
-                logo_path = "assets/empresa.png"
-                logo = Image(logo_path, width=1.5*inch, height=0.7*inch)
-                
-                header_data = [
-                    [logo, "", Paragraph(
-                        f"<b>ORDEN DE COMPRA N°:</b> {order_number}<br/>"
-                        f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y')}<br/>"
-                        f"<b>Fecha Entrega:</b> {delivery_date}",
-                        style_normal
-                    )]
-                ]
-                
-                header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
-                header_table.setStyle(TableStyle([
-                    ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                    ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-                ]))
-                
-            except Exception as e:
-                print(f"Error cargando imagen de empresa: {e}")
-                # Fallback a texto si no se puede cargar la imagen
-                header_data = [
-                    [
-                        Paragraph("RN&M SERVICIOS INTEGRALES, C.A", style_title),
-                        "",
-                        Paragraph(
-                            f"<b>ORDEN DE COMPRA N°:</b> {order_number}<br/>"
-                            f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y')}<br/>"
-                            f"<b>Fecha Entrega:</b> {delivery_date}",
-                            style_normal
-                        )
-                    ],
-                    [
-                        Paragraph("RIF: J-40339817-8", style_normal),
-                        "",
-                        ""
-                    ],
-                    [
-                        Paragraph("Av. Principal, Edif. Empresarial", style_normal),
-                        "",
-                        ""
-                    ]
-                ]
-                
-                header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
-                header_table.setStyle(TableStyle([
-                    ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                    ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-                    ('SPAN', (0,1), (1,1)),
-                    ('SPAN', (0,2), (1,2)),
-                ]))
-            
-            elements.append(header_table)
-            elements.append(HRFlowable(width="100%", thickness=1, color=colors.lightgrey))
-            elements.append(Spacer(1, 12))
-            
-            # Información del proveedor
-            elements.append(Paragraph("<b>PROVEEDOR:</b>", style_bold))
-            elements.append(Paragraph(supplier_info, style_normal))
-            elements.append(Spacer(1, 15))
-            
-            # Tabla de productos
-            headers = ["Código", "Descripción", "Cantidad", "P. Unitario", "Total"]
-            col_widths = [1.2*inch, 4.0*inch, 0.8*inch, 1.2*inch, 1.2*inch]
-            
-            table_data = [headers]
-            for item in items:
-                row = [
-                    item['code'],
-                    item['description'],
-                    str(item['quantity']),
-                    f"{item['unit_price']:,.2f}",
-                    f"{item['total']:,.2f}"
-                ]
-                table_data.append(row)
-            
-            items_table = Table(table_data, colWidths=col_widths, repeatRows=1)
-            items_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4a6fa5")),
-                ('TEXTCOLOR', (0,0), (-1,0), colors.white),
-                ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                ('ALIGN', (2,1), (-1,-1), 'RIGHT'),
-                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,0), (-1,0), 10),
-                ('FONTSIZE', (0,1), (-1,-1), 9),
-                ('BOTTOMPADDING', (0,0), (-1,0), 6),
-                ('BACKGROUND', (0,1), (-1,-1), colors.white),
-                ('GRID', (0,0), (-1,-1), 0.5, colors.lightgrey),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-            ]))
-            
-            elements.append(items_table)
-            elements.append(Spacer(1, 15))
-            
-            # Sección de totales
-            iva_tax = Tax.get_by_name("IVA")
-            
-            if iva_tax and iva_tax.get('status_name') == 'active':
-                subtotal_table = Table([
-                    ["Subtotal:", f"{subtotal:,.2f}"]
-                ], colWidths=[1.5*inch, 1.5*inch])
-                
-                subtotal_table.setStyle(TableStyle([
-                    ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
-                    ('FONTSIZE', (0,0), (-1,-1), 10),
-                ]))
-                
-                elements.append(subtotal_table)
-                
-                iva_table = Table([
-                    [f"IVA ({iva_tax['value']}%):", f"{taxes:,.2f}"]
-                ], colWidths=[1.5*inch, 1.5*inch])
-                
-                iva_table.setStyle(TableStyle([
-                    ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
-                    ('FONTSIZE', (0,0), (-1,-1), 10),
-                ]))
-                
-                elements.append(iva_table)
-            
-            # TOTAL con formato especial
-            total_table = Table([
-                ["", ""],
-                [
-                    Paragraph("<b>TOTAL:</b>", style_total),
-                    Paragraph(f"<b>{total:,.2f}</b>", style_total)
-                ]
-            ], colWidths=[3.5*inch, 2*inch])
-            
-            total_table.setStyle(TableStyle([
-                ('ALIGN', (1,0), (1,-1), 'RIGHT'),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-            ]))
-            
-            elements.append(total_table)
-            elements.append(Spacer(1, 20))
-            
-            # Notas y creador
-            elements.append(Paragraph("<i>Esta orden de compra es generada automáticamente por el sistema.</i>", style_normal))
-            elements.append(Spacer(1, 8))
-            elements.append(Paragraph(f"<b>Creado por:</b> {created_by}", style_normal))
-            
-            # Generar PDF
-            doc.build(elements)
-            
-            messagebox.showinfo(
-                "Éxito",
-                f"La orden se ha generado correctamente en:\n{file_path}",
-                parent=parent
-            )
-            
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"No se pudo generar el PDF:\n{str(e)}",
-                parent=parent
-            )
+        get_pdf_jobs().submit(
+            parent,
+            "purchase_order",
+            file_path,
+            {
+                "order_number": order_number,
+                "supplier_info": supplier_info,
+                "items": PDFGenerator._plain_rows(items),
+                "subtotal": subtotal,
+                "taxes": taxes,
+                "total": total,
+                "delivery_date": delivery_date,
+                "created_by": created_by,
+                "iva_tax": Tax.get_by_name("IVA"),
+            },
+            title="Generando orden de compra",
+            success_message="La orden se ha generado correctamente en:\n{file_path}"
+        )
 
     @staticmethod
     def generate_invoice(
@@ -441,205 +191,20 @@ class PDFGenerator:
         if not file_path:
             return
         
-        try:
-            # Configuración del documento
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=letter,
-                rightMargin=20,
-                leftMargin=20,
-                topMargin=40,
-                bottomMargin=40
-            )
-            
-            # Estilos personalizados
-            styles = getSampleStyleSheet()
-            style_normal = styles["Normal"]
-            style_bold = ParagraphStyle(
-                name='Bold',
-                parent=style_normal,
-                fontName='Helvetica-Bold'
-            )
-            style_title = ParagraphStyle(
-                name='Title',
-                parent=style_normal,
-                fontName='Helvetica-Bold',
-                fontSize=12,
-                spaceAfter=6
-            )
-            style_total = ParagraphStyle(
-                name='Total',
-                parent=style_normal,
-                fontSize=12,
-                fontName='Helvetica-Bold',
-                alignment=TA_RIGHT,
-                spaceAfter=12
-            )
-            style_italic = ParagraphStyle(
-                name='Italic',
-                parent=style_normal,
-                fontName='Helvetica-Oblique',
-                fontSize=9
-            )
-            
-            elements = []
-            
-            # Encabezado con imagen
-            try:
-                # Intentar cargar la imagen de la empresa
-                logo_path = "assets/empresa.png"
-                logo = Image(logo_path, width=1.5*inch, height=0.7*inch)
-                
-                header_data = [
-                    [logo, "", Paragraph(
-                        f"<b>RECIBO N°:</b> {invoice_id}<br/>"
-                        f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-                        style_normal
-                    )]
-                ]
-                
-                header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
-                header_table.setStyle(TableStyle([
-                    ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                    ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-                ]))
-                
-            except Exception as e:
-                print(f"Error cargando imagen de empresa: {e}")
-                # Fallback a texto si no se puede cargar la imagen
-                header_data = [
-                    [
-                        Paragraph("RN&M SERVICIOS INTEGRALES, C.A", style_title),
-                        "",
-                        Paragraph(
-                            f"<b>RECIBO N°:</b> {invoice_id}<br/>"
-                            f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y %H:%M')}",
-                            style_normal
-                        )
-                    ],
-                    [
-                        Paragraph("RIF: J-40339817-8", style_normal),
-                        "",
-                        ""
-                    ]
-                ]
-                
-                header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
-                header_table.setStyle(TableStyle([
-                    ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                    ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-                    ('SPAN', (0,1), (1,1)),
-                ]))
-            
-            elements.append(header_table)
-            elements.append(HRFlowable(width="100%", thickness=1, color=colors.lightgrey))
-            elements.append(Spacer(1, 12))
-            
-            # Información del cliente
-            elements.append(Paragraph("<b>CLIENTE:</b>", style_bold))
-            elements.append(Paragraph(customer_info, style_normal))
-            elements.append(Spacer(1, 12))
-            
-            # Tabla de productos/servicios
-            headers = ["Tipo", "Descripción", "Cantidad", "P. Unitario", "Total"]
-            col_widths = [0.8*inch, 3.0*inch, 0.7*inch, 1.0*inch, 1.0*inch]
-            
-            table_data = [headers]
-            for item in items:
-                item_type = "Servicio" if item.get('is_service', False) else "Producto"
-                row = [
-                    item_type,
-                    item['name'],
-                    str(item['quantity']),
-                    f"{item['unit_price']:.2f}",
-                    f"{item['total']:.2f}"
-                ]
-                table_data.append(row)
-            
-            items_table = Table(table_data, colWidths=col_widths, repeatRows=1)
-            items_table.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4a6fa5")),
-                ('TEXTCOLOR', (0,0), (-1,0), colors.white),
-                ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                ('ALIGN', (2,1), (-1,-1), 'RIGHT'),
-                ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0,0), (-1,0), 10),
-                ('FONTSIZE', (0,1), (-1,-1), 9),
-                ('BOTTOMPADDING', (0,0), (-1,0), 6),
-                ('BACKGROUND', (0,1), (-1,-1), colors.white),
-                ('GRID', (0,0), (-1,-1), 0.5, colors.lightgrey),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-            ]))
-            
-            elements.append(items_table)
-            elements.append(Spacer(1, 12))
-            
-            # Totales
-            iva_tax = Tax.get_by_name("IVA")
-            
-            if iva_tax and iva_tax.get('status_name') == 'active':
-                subtotal_table = Table([
-                    ["Subtotal:", f"{subtotal:.2f}"]
-                ], colWidths=[1.5*inch, 1.5*inch])
-                
-                subtotal_table.setStyle(TableStyle([
-                    ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
-                    ('FONTSIZE', (0,0), (-1,-1), 10),
-                ]))
-                
-                elements.append(subtotal_table)
-                
-                iva_table = Table([
-                    [f"IVA ({iva_tax['value']}%):", f"{taxes:.2f}"]
-                ], colWidths=[1.5*inch, 1.5*inch])
-                
-                iva_table.setStyle(TableStyle([
-                    ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
-                    ('FONTSIZE', (0,0), (-1,-1), 10),
-                ]))
-                
-                elements.append(iva_table)
-            
-            # Total
-            total_table = Table([
-                ["", ""],
-                [
-                    Paragraph("<b>TOTAL:</b>", style_total),
-                    Paragraph(f"<b>{total:.2f}</b>", style_total)
-                ]
-            ], colWidths=[3.5*inch, 2*inch])
-            
-            total_table.setStyle(TableStyle([
-                ('ALIGN', (1,0), (1,-1), 'RIGHT'),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-            ]))
-            
-            elements.append(total_table)
-            elements.append(Spacer(1, 15))
-            
-            # Información del empleado
-            elements.append(Paragraph(f"<b>Atendido por:</b> {employee_info}", style_normal))
-            elements.append(Spacer(1, 8))
-            
-            # Notas
-            elements.append(Paragraph("<i>Notas:</i>", style_italic))
-            elements.append(Paragraph("<i>Este recibo es generado automáticamente por el sistema.</i>", style_italic))
-            
-            if any(item.get('is_service', False) for item in items):
-                elements.append(Paragraph("<i>Nota: Los servicios solicitados serán atendidos según lo acordado.</i>", style_italic))
-            
-            # Generar PDF
-            doc.build(elements)
-            
-            messagebox.showinfo(
-                "Éxito",
-                f"El recibo se ha generado correctamente en:\n{file_path}",
-                parent=parent
-            )
-            
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"No se pudo generar el PDF:\n{str(e)}",
-                parent=parent
-            )
\ No newline at end of file
+        get_pdf_jobs().submit(
+            parent,
+            "invoice",
+            file_path,
+            {
+                "invoice_id": invoice_id,
+                "customer_info": customer_info,
+                "items": PDFGenerator._plain_rows(items),
+                "subtotal": subtotal,
+                "taxes": taxes,
+                "total": total,
+                "employee_info": employee_info,
+                "iva_tax": Tax.get_by_name("IVA"),
+            },
+            title="Generando recibo",
+            success_message="El recibo se ha generado correctamente en:\n{file_path}"
+        )
\ No newline at end of file
@@ -0,0 +1,279 @@
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, Optional
+import tkinter as tk
+from tkinter import messagebox
+from sqlite_cli.database.connection_manager import configure, get_manager
+from widgets.progress_window import ProgressWindow
+
+PDF_WORKERS = 2           # Procesos que generan PDF a la vez (el resto espera en cola)
+POLL_MS = 100             # Frecuencia con la que el hilo de Tk recoge avances
+PROGRESS_INTERVAL = 0.2   # Segundos mínimos entre avances enviados por un trabajo
+
+# Estado de cada proceso de trabajo (lo fija ``_init_worker``)
+_worker_progress = None
+_worker_cancelled = None
+
+
+def _init_worker(progress_queue: Any, cancelled: Any, db_path: str, pragma_profile: str) -> None:
+    global _worker_progress, _worker_cancelled
+    _worker_progress = progress_queue
+    _worker_cancelled = cancelled
+    # Los reportes por consulta leen la base de datos desde el proceso de trabajo
+    configure(db_path=db_path, pragma_profile=pragma_profile)
+
+
+def _row_source(kind: str, query: Dict) -> Iterator[Dict]:
+    """Filas de un reporte leídas por lotes del cursor, con los filtros de ``query``."""
+    from sqlite_cli.models.inventory_report_model import InventoryReport
+
+    sources = {
+        "inventory_report": InventoryReport.iter_inventory_report,
+        "inventory_movements_report": InventoryReport.iter_inventory_movements_report,
+    }
+    return sources[kind](**query)
+
+
+def _run_job(job_id: int, kind: str, file_path: str, payload: Dict) -> bool:
+    """
+    Genera un PDF (o una exportación, ``kind == "export"``) en el proceso de trabajo.
+
+    Si ``payload`` trae ``query`` (filtros del reporte) en lugar de ``items``,
+    las filas se leen aquí mismo de la base de datos a medida que se maquetan.
+    Las exportaciones reciben los argumentos de ``utils.data_export.export_report``.
+
+    :return: True si se escribió el archivo, False si se canceló
+    """
+    from utils.pdf_render import RENDERERS, RenderCancelled
+
+    if kind == "export":
+        from utils.data_export import export_report
+        render = export_report
+    else:
+        render = RENDERERS[kind]
+        query = payload.pop("query", None)
+        if query is not None:
+            payload["items"] = _row_source(kind, query)
+
+    last = [0.0]
+
+    def progress(fraction: float, message: str) -> None:
+        now = time.monotonic()
+        if fraction < 1.0 and now - last[0] < PROGRESS_INTERVAL:
+            return
+        last[0] = now
+        if _worker_cancelled.get(job_id):
+            raise RenderCancelled()
+        _worker_progress.put((job_id, fraction, message))
+
+    try:
+        render(file_path, progress=progress, **payload)
+    except BaseException as e:
+        # Cancelado o con error: no queda un PDF a medias
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        if isinstance(e, RenderCancelled):
+            return False
+        raise
+    return True
+
+
+class _Job:
+    __slots__ = ("id", "parent", "file_path", "success_message", "window", "future", "cancelled")
+
+    def __init__(self, job_id: int, parent: tk.Misc, file_path: str, success_message: str) -> None:
+        self.id = job_id
+        self.parent = parent
+        self.file_path = file_path
+        self.success_message = success_message
+        self.window: Optional[ProgressWindow] = None
+        self.future: Optional[Future] = None
+        self.cancelled = False
+
+
+class PDFJobManager:
+    """
+    Genera PDF en un pool de procesos sin bloquear la interfaz.
+
+    La pantalla resuelve en el hilo de Tk todo lo que depende de la sesión y
+    envía sólo datos planos: las filas como diccionarios o, en los reportes
+    grandes, los filtros de la consulta para que el proceso de trabajo lea
+    las filas por lotes mientras maqueta el documento con ReportLab. Cada trabajo
+    muestra una ventana de avance con botón de cancelar y, al terminar,
+    el mensaje de éxito o de error de siempre. Varios reportes pueden
+    generarse a la vez (``PDF_WORKERS``; el resto espera en cola).
+
+    Las exportaciones de reportes a CSV/JSON Lines (``utils.data_export``)
+    usan el mismo pool, con su ventana de avance y cancelación.
+    """
+
+    def __init__(self, workers: int = PDF_WORKERS) -> None:
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._sync = None
+        self._progress = None
+        self._cancelled = None
+        self._done: "queue.Queue" = queue.Queue()
+        self._jobs: Dict[int, _Job] = {}
+        self._ids = itertools.count(1)
+        self._root: Optional[tk.Misc] = None
+        self._poll_after: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        parent: tk.Misc,
+        kind: str,
+        file_path: str,
+        payload: Dict,
+        title: str = "Generando PDF",
+        success_message: str = "El PDF se ha generado correctamente en:\n{file_path}"
+    ) -> int:
+        """
+        Encola la generación de un PDF.
+
+        :param parent: Ventana dueña de los mensajes
+        :param kind: Clave de ``utils.pdf_render.RENDERERS``, o ``"export"``
+        :param file_path: Archivo de destino
+        :param payload: Argumentos del generador (datos planos, serializables);
+            ``query`` reemplaza a ``items`` con los filtros de la consulta
+        :param title: Título de la ventana de avance
+        :param success_message: Mensaje final; ``{file_path}`` se reemplaza por la ruta
+        :return: Identificador del trabajo
+        """
+        job = _Job(next(self._ids), parent, file_path, success_message)
+        self._jobs[job.id] = job
+        job.window = ProgressWindow(parent, title, lambda: self.cancel(job.id))
+
+        executor = self._get_executor()
+        job.future = executor.submit(_run_job, job.id, kind, file_path, payload)
+        job.future.add_done_callback(lambda future, job_id=job.id: self._done.put((job_id, future)))
+
+        if self._root is None:
+            self._root = parent.nametowidget(".")
+        if self._poll_after is None:
+            self._poll_after = self._root.after(POLL_MS, self._poll)
+        return job.id
+
+    def cancel(self, job_id: int) -> None:
+        """Cancela un trabajo en cola o en curso (el archivo parcial se elimina)."""
+        job = self._jobs.get(job_id)
+        if job is None or job.cancelled:
+            return
+        job.cancelled = True
+        if job.future is not None and not job.future.cancel():
+            # Ya está en ejecución: el proceso lo detecta en su próximo avance
+            self._cancelled[job_id] = True
+        if job.window is not None:
+            self._safe(job.window.cancelling)
+
+    def active_jobs(self) -> int:
+        return len(self._jobs)
+
+    def shutdown(self) -> None:
+        """Cancela los trabajos pendientes y detiene los procesos (al cerrar la aplicación)."""
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._sync is not None:
+            self._sync.shutdown()
+            self._sync = None
+
+    # --- Internos ----------------------------------------------------
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Procesos nuevos ("spawn"): no heredan las conexiones SQLite ni
+                # los hilos de la interfaz. El avance y las cancelaciones cruzan
+                # procesos mediante un Manager.
+                context = multiprocessing.get_context("spawn")
+                db = get_manager()
+                self._sync = context.Manager()
+                self._progress = self._sync.Queue()
+                self._cancelled = self._sync.dict()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self._progress, self._cancelled, db.db_path, db.pragma_profile)
+                )
+            return self._executor
+
+    def _poll(self) -> None:
+        self._poll_after = None
+        while True:
+            try:
+                job_id, fraction, message = self._progress.get_nowait()
+            except queue.Empty:
+                break
+            job = self._jobs.get(job_id)
+            if job is not None and not job.cancelled and job.window is not None:
+                self._safe(job.window.update_progress, fraction, message)
+
+        while True:
+            try:
+                job_id, future = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._finish(job_id, future)
+
+        if self._jobs:
+            self._poll_after = self._root.after(POLL_MS, self._poll)
+
+    def _finish(self, job_id: int, future: Future) -> None:
+        job = self._jobs.pop(job_id, None)
+        self._cancelled.pop(job_id, None)
+        if job is None:
+            return
+        if job.window is not None:
+            self._safe(job.window.destroy)
+        parent = job.parent if self._exists(job.parent) else self._root
+
+        try:
+            written = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo generar el PDF:\n{str(e)}", parent=parent)
+            return
+        if written and not job.cancelled:
+            messagebox.showinfo("Éxito", job.success_message.format(file_path=job.file_path), parent=parent)
+
+    @staticmethod
+    def _exists(widget: tk.Misc) -> bool:
+        try:
+            return bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
+
+    @staticmethod
+    def _safe(func, *args: Any) -> None:
+        try:
+            func(*args)
+        except tk.TclError:
+            # La ventana de avance se cerró junto con su pantalla
+            pass
+
+
+_manager: Optional[PDFJobManager] = None
+
+
+def get_pdf_jobs() -> PDFJobManager:
+    """Gestor de PDF compartido por todas las pantallas."""
+    global _manager
+    if _manager is None:
+        _manager = PDFJobManager()
+    return _manager
+
+
+def shutdown_pdf_jobs() -> None:
+    if _manager is not None:
+        _manager.shutdown()
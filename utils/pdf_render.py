@@ -0,0 +1,917 @@
+# Standard library imports
+import zlib
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# ReportLab imports
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.platypus.flowables import Flowable, HRFlowable
+from reportlab.lib.enums import TA_RIGHT
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFDictionary, PDFName, PDFStream
+from reportlab.pdfgen.canvas import Canvas
+
+# Avance de la generación: (fracción entre 0 y 1, mensaje). Puede lanzar
+# ``RenderCancelled`` para detener el documento.
+ProgressCallback = Callable[[float, str], None]
+
+# Parte del avance que corresponde a preparar las filas; el resto es la maquetación
+ROWS_WEIGHT = 0.3
+PROGRESS_EVERY_ROWS = 200
+
+# Parte del avance de los reportes maquetados por página (``_build_stream``)
+# que corresponde a las filas; el resto es escribir el archivo
+STREAM_WEIGHT = 0.95
+
+
+class RenderCancelled(Exception):
+    """El usuario canceló la generación del PDF."""
+
+
+def _no_progress(fraction: float, message: str) -> None:
+    pass
+
+
+def _track_rows(items: List[Dict], progress: ProgressCallback) -> Iterator[Dict]:
+    """Recorre las filas informando el avance cada ``PROGRESS_EVERY_ROWS``."""
+    total = len(items) or 1
+    for index, item in enumerate(items):
+        if index % PROGRESS_EVERY_ROWS == 0:
+            progress(ROWS_WEIGHT * index / total, f"Preparando filas ({index}/{len(items)})")
+        yield item
+    progress(ROWS_WEIGHT, "Maquetando documento")
+
+
+def _build(doc: SimpleDocTemplate, elements: List, progress: ProgressCallback) -> None:
+    """Genera el PDF informando el avance de la maquetación (flowables y páginas)."""
+    state = {"total": 1, "page": 0}
+
+    def on_progress(kind: str, value: int) -> None:
+        if kind == "SIZE_EST":
+            state["total"] = max(1, value)
+        elif kind == "PAGE":
+            state["page"] = value
+        elif kind == "PROGRESS":
+            fraction = ROWS_WEIGHT + (1 - ROWS_WEIGHT) * min(1.0, value / state["total"])
+            progress(fraction, f"Maquetando documento (página {state['page']})")
+
+    doc.setProgressCallBack(on_progress)
+    doc.build(elements)
+    progress(1.0, "Documento generado")
+
+
+class _FlowableStream(list):
+    """
+    Lista de flowables que se rellena a demanda desde un generador.
+
+    ``doc.build`` consume la historia desde el frente (``len``, ``[0]``,
+    ``del [0]``) y reinserta los trozos divididos; esta lista sólo pide el
+    siguiente flowable al generador cuando se vacía, así que en memoria
+    queda la página en curso y no el documento completo.
+    """
+
+    def __init__(self, flowables: Iterable[Flowable]) -> None:
+        super().__init__()
+        self._source = iter(flowables)
+
+    def _fill(self) -> None:
+        if not list.__len__(self):
+            flowable = next(self._source, None)
+            if flowable is not None:
+                self.append(flowable)
+
+    def __len__(self) -> int:
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index: Any) -> Any:
+        self._fill()
+        return list.__getitem__(self, index)
+
+
+class _RowSource:
+    """
+    Filas de un reporte maquetado por página: se leen del iterable
+    (normalmente un cursor) a medida que se maquetan, informando el avance.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Dict],
+        to_cells: Callable[[Dict], List[str]],
+        total: Optional[int],
+        progress: ProgressCallback,
+        on_item: Optional[Callable[[Dict], None]] = None
+    ) -> None:
+        self._items = iter(items)
+        self._to_cells = to_cells
+        self._on_item = on_item
+        self._pending: Optional[Dict] = None
+        self.total = total
+        self.progress = progress
+        self.count = 0
+
+    def has_more(self) -> bool:
+        if self._pending is None:
+            self._pending = next(self._items, None)
+        return self._pending is not None
+
+    def take(self, limit: int) -> List[List[str]]:
+        rows = []
+        while len(rows) < limit and self.has_more():
+            item, self._pending = self._pending, None
+            if self._on_item is not None:
+                self._on_item(item)
+            rows.append(self._to_cells(item))
+        self.count += len(rows)
+        if self.total:
+            fraction = STREAM_WEIGHT * min(1.0, self.count / self.total)
+            self.progress(fraction, f"Maquetando filas ({self.count}/{self.total})")
+        else:
+            self.progress(0.0, f"Maquetando filas ({self.count})")
+        return rows
+
+
+class _PageRows(Flowable):
+    """
+    Trozo de tabla que ocupa el espacio libre de la página actual.
+
+    Al maquetarse toma de ``_RowSource`` tantas filas como caben y arma una
+    ``Table`` con el encabezado repetido. Si una fila resulta más alta de lo
+    previsto (texto con saltos de línea), la tabla se divide como cualquier
+    otra y el resto pasa a la página siguiente.
+    """
+
+    def __init__(self, source: _RowSource, make_table: "_ChunkedTable") -> None:
+        super().__init__()
+        self.source = source
+        self.make_table = make_table
+        self.table: Optional[Table] = None
+
+    def wrap(self, avail_width: float, avail_height: float) -> tuple:
+        if self.table is None:
+            header_height, row_height = self.make_table.metrics(avail_width)
+            fits = int((avail_height - header_height) // row_height)
+            if fits < 1:
+                # No cabe ni una fila: se pide más alto para pasar a la página siguiente
+                self.width, self.height = avail_width, header_height + row_height
+                return self.width, self.height
+            self.table = self.make_table(self.source.take(fits))
+        self.width, self.height = self.table.wrap(avail_width, avail_height)
+        return self.width, self.height
+
+    def split(self, avail_width: float, avail_height: float) -> List[Flowable]:
+        if self.table is None:
+            return []
+        return self.table.split(avail_width, avail_height)
+
+    def draw(self) -> None:
+        self.table.drawOn(self.canv, 0, 0)
+
+
+class _ChunkedTable:
+    """Arma las tablas de cada trozo con el mismo encabezado, anchos y estilo."""
+
+    def __init__(self, headers: List[str], col_widths: Sequence[float], style: List[tuple]) -> None:
+        self.headers = headers
+        self.col_widths = col_widths
+        self.style = TableStyle(style)
+        self._metrics: Optional[tuple] = None
+
+    def metrics(self, avail_width: float) -> tuple:
+        """Alto del encabezado y de una fila de una sola línea."""
+        if self._metrics is None:
+            header_height = self([]).wrap(avail_width, 1e6)[1]
+            row_height = self([["0"] * len(self.headers)]).wrap(avail_width, 1e6)[1] - header_height
+            self._metrics = (header_height, row_height)
+        return self._metrics
+
+    def __call__(self, rows: List[List[str]]) -> Table:
+        table = Table([self.headers] + rows, colWidths=self.col_widths, repeatRows=1)
+        table.setStyle(self.style)
+        return table
+
+
+def _table_rows(source: _RowSource, make_table: _ChunkedTable) -> Iterator[Flowable]:
+    """Trozos de tabla (uno por página) hasta agotar las filas."""
+    while source.has_more():
+        yield _PageRows(source, make_table)
+
+
+class _CompressedPagesCanvas(Canvas):
+    """
+    Canvas que comprime cada página al cerrarla.
+
+    ReportLab guarda el contenido de todas las páginas hasta ``save()`` y
+    recién entonces lo comprime; en reportes de miles de páginas eso es lo
+    único que crece con el documento. Aquí el contenido se guarda ya
+    comprimido (``Filter`` en el diccionario, así ``PDFStream`` no lo vuelve
+    a codificar).
+    """
+
+    def showPage(self) -> None:
+        super().showPage()
+        page = self._doc.Pages.pages[-1]
+        if self._pageCompression and page.stream and not page.Contents:
+            stream = PDFStream(PDFDictionary({"Filter": PDFArray([PDFName("FlateDecode")])}))
+            stream.content = zlib.compress(page.stream.encode("utf8"))
+            stream.__Comment__ = "page stream"
+            page.Contents = stream
+            page.stream = None
+
+
+def _build_stream(doc: SimpleDocTemplate, flowables: Iterable[Flowable], progress: ProgressCallback) -> None:
+    """Genera el PDF consumiendo ``flowables`` a medida que se maqueta."""
+    doc.build(_FlowableStream(flowables), canvasmaker=_CompressedPagesCanvas)
+    progress(1.0, "Documento generado")
+
+
+def _report_header(title: str, filters: str, styles: Any) -> Table:
+    """Encabezado de los reportes horizontales (imagen de empresa, título y filtros)."""
+    style_title = styles["Title"]
+    style_normal = styles["Normal"]
+    style_heading = styles["Heading2"]
+    
+    # Encabezado con imagen
+    try:
+        # Intentar cargar la imagen de la empresa
+        logo_path = "assets/empresa.png"
+        logo = Image(logo_path, width=1.5*inch, height=0.7*inch)
+        
+        header_table = Table([
+            [logo, "", Paragraph(f"Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}", style_normal)],
+            ["", Paragraph(title, style_heading), Paragraph(f"Filtros: {filters}", style_normal)]
+        ], colWidths=[3*inch, 3*inch, 3*inch])
+        
+        header_table.setStyle(TableStyle([
+            ('SPAN', (0,0), (0,1)),  # Combinar celdas para el logo
+            ('SPAN', (1,1), (1,1)),  # Título centrado
+            ('ALIGN', (1,1), (1,1), 'CENTER'),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('ALIGN', (2,0), (2,0), 'RIGHT'),
+            ('ALIGN', (2,1), (2,1), 'RIGHT'),
+        ]))
+        
+    except Exception as e:
+        print(f"Error cargando imagen de empresa: {e}")
+        # Fallback a texto si no se puede cargar la imagen
+        header_table = Table([
+            [Paragraph("RN&M SERVICIOS INTEGRALES, C.A", style_title), "", Paragraph(f"Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}", style_normal)],
+            [Paragraph("RIF: J-40339817-8", style_normal), Paragraph(title, style_heading), Paragraph(f"Filtros: {filters}", style_normal)]
+        ], colWidths=[3*inch, 3*inch, 3*inch])
+        
+        header_table.setStyle(TableStyle([
+            ('SPAN', (0,0), (0,1)),  # Combinar celdas para company info
+            ('SPAN', (1,1), (1,1)),  # Título centrado
+            ('ALIGN', (1,1), (1,1), 'CENTER'),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('ALIGN', (2,0), (2,0), 'RIGHT'),
+            ('ALIGN', (2,1), (2,1), 'RIGHT'),
+        ]))
+
+    return header_table
+
+
+def _inventory_cells(item: Dict) -> List[str]:
+    return [
+        item['code'],
+        item['product'],
+        item['description'],
+        str(item['quantity']),
+        str(item['stock']),
+        str(item['min_stock']),
+        str(item['max_stock']),
+        f"{item['cost']:.2f}",
+        f"{item['price']:.2f}",
+        item.get('supplier_company', '')
+    ]
+
+
+def render_inventory_report(
+    file_path: str,
+    title: str,
+    items: Iterable[Dict],
+    filters: str,
+    user_info: str,
+    total: Optional[int] = None,
+    progress: ProgressCallback = _no_progress
+) -> None:
+    """
+    Escribe el reporte de inventario en ``file_path`` (horizontal, con imagen de empresa).
+
+    ``items`` puede ser una lista o un generador (p. ej.
+    ``InventoryReport.iter_inventory_report``): las filas se maquetan por
+    página a medida que se leen y los totales se acumulan al pasar, así que
+    la memoria no depende del tamaño del reporte. ``total`` sólo se usa
+    para el avance. No usa Tk: se ejecuta en un proceso de trabajo (ver
+    ``PDFGenerator``).
+    """
+    if total is None and isinstance(items, list):
+        total = len(items)
+
+    # Crear el documento PDF en orientación horizontal
+    doc = SimpleDocTemplate(
+        file_path,
+        pagesize=landscape(letter),
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=40,
+        bottomMargin=40,
+        pageCompression=1
+    )
+    
+    # Estilos
+    styles = getSampleStyleSheet()
+    style_normal = styles["Normal"]
+    
+    # Tabla de datos - ajustamos anchos para orientación horizontal
+    headers = ["Código", "Producto", "Descripción", "Cant.", "Stock.", 
+              "Mín", "Máx", "P. Compra", "P. Venta", "Proveedor"]
+    
+    # Anchos de columna ajustados para horizontal
+    col_widths = [
+        0.8*inch,  # Código
+        2.0*inch,  # Producto
+        2.5*inch,  # Descripción
+        0.5*inch,  # Cantidad
+        0.5*inch,  # Stock
+        0.5*inch,  # Mín
+        0.5*inch,  # Máx
+        0.7*inch,  # P. Compra
+        0.7*inch,  # P. Venta
+        1.5*inch   # Proveedor
+    ]
+    
+    # Estilo de la tabla (cada trozo repite el encabezado)
+    make_table = _ChunkedTable(headers, col_widths, [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#4a6fa5")),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (3, 1), (6, -1), 'CENTER'),  # Centrar valores numéricos
+        ('ALIGN', (7, 1), (8, -1), 'RIGHT'),   # Alinear precios a la derecha
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+    
+    # Totales acumulados mientras se leen las filas
+    totals = {"items": 0, "quantity": 0, "stock": 0}
+    
+    def add_to_totals(item: Dict) -> None:
+        totals["items"] += 1
+        totals["quantity"] += item['quantity']
+        totals["stock"] += item['stock']
+    
+    source = _RowSource(items, _inventory_cells, total, progress, add_to_totals)
+    
+    def story() -> Iterator[Flowable]:
+        yield _report_header(title, filters, styles)
+        yield Spacer(1, 24)
+        if not source.has_more():
+            # Sin filas: sólo el encabezado de la tabla
+            yield make_table([])
+        yield from _table_rows(source, make_table)
+        yield Spacer(1, 12)
+        
+        # Totales (ya acumulados: se generan después de la última fila)
+        yield Table([
+            [
+                Paragraph(f"<b>Total Productos:</b> {totals['items']}", style_normal),
+                Paragraph(f"<b>Total en Cantidad:</b> {totals['quantity']}", style_normal),
+                Paragraph(f"<b>Total Stock:</b> {totals['stock']}", style_normal)
+            ]
+        ], colWidths=[3*inch, 3*inch, 3*inch])
+        yield Spacer(1, 12)
+        
+        # Información del generador
+        yield Paragraph(f"<b>Generado por:</b> {user_info}", style_normal)
+        yield Spacer(1, 6)
+        yield Paragraph("<i>Este reporte fue generado automáticamente por el sistema.</i>", style_normal)
+    
+    # Generar el PDF
+    _build_stream(doc, story(), progress)
+
+
+def _movement_cells(movement: Dict) -> List[str]:
+    reference = (
+        f"{movement['reference_type']} #{movement['reference_id']}"
+        if movement['reference_type'] != "None" else "None"
+    )
+    return [
+        movement['created_at'],
+        movement['product_code'] or "",
+        movement['movement_type'],
+        str(movement['quantity_change']),
+        str(movement['stock_change']),
+        str(movement['previous_quantity']),
+        str(movement['new_quantity']),
+        str(movement['previous_stock']),
+        str(movement['new_stock']),
+        movement['user'],
+        reference,
+        movement['notes']
+    ]
+
+
+def render_inventory_movements_report(
+    file_path: str,
+    title: str,
+    items: Iterable[Dict],
+    filters: str,
+    user_info: str,
+    total: Optional[int] = None,
+    progress: ProgressCallback = _no_progress
+) -> None:
+    """
+    Escribe el reporte de movimientos de inventario en ``file_path``.
+
+    Igual que ``render_inventory_report``: ``items`` puede ser un generador
+    (``InventoryReport.iter_inventory_movements_report``) y se maqueta por página.
+    """
+    if total is None and isinstance(items, list):
+        total = len(items)
+
+    doc = SimpleDocTemplate(
+        file_path,
+        pagesize=landscape(letter),
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=40,
+        bottomMargin=40,
+        pageCompression=1
+    )
+    
+    styles = getSampleStyleSheet()
+    style_normal = styles["Normal"]
+    
+    headers = ["Fecha", "Código", "Tipo", "Cant.", "Stock", "Ant. Cant.",
+              "Nva. Cant.", "Ant. Stock", "Nva. Stock", "Usuario", "Referencia", "Notas"]
+    col_widths = [
+        0.95*inch,  # Fecha
+        0.8*inch,   # Código
+        0.9*inch,   # Tipo
+        0.45*inch,  # Cantidad
+        0.45*inch,  # Stock
+        0.6*inch,   # Ant. Cantidad
+        0.6*inch,   # Nva. Cantidad
+        0.6*inch,   # Ant. Stock
+        0.6*inch,   # Nva. Stock
+        0.8*inch,   # Usuario
+        0.9*inch,   # Referencia
+        1.55*inch   # Notas
+    ]
+    
+    make_table = _ChunkedTable(headers, col_widths, [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#4a6fa5")),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (3, 1), (8, -1), 'CENTER'),  # Centrar valores numéricos
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('FONTSIZE', (0, 1), (-1, -1), 7),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+    
+    totals = {"movements": 0, "quantity": 0, "stock": 0}
+    
+    def add_to_totals(movement: Dict) -> None:
+        totals["movements"] += 1
+        totals["quantity"] += movement['quantity_change'] or 0
+        totals["stock"] += movement['stock_change'] or 0
+    
+    source = _RowSource(items, _movement_cells, total, progress, add_to_totals)
+    
+    def story() -> Iterator[Flowable]:
+        yield _report_header(title, filters, styles)
+        yield Spacer(1, 24)
+        if not source.has_more():
+            yield make_table([])
+        yield from _table_rows(source, make_table)
+        yield Spacer(1, 12)
+        
+        # Totales
+        yield Table([
+            [
+                Paragraph(f"<b>Total Movimientos:</b> {totals['movements']}", style_normal),
+                Paragraph(f"<b>Variación de Cantidad:</b> {totals['quantity']}", style_normal),
+                Paragraph(f"<b>Variación de Stock:</b> {totals['stock']}", style_normal)
+            ]
+        ], colWidths=[3*inch, 3*inch, 3*inch])
+        yield Spacer(1, 12)
+        
+        yield Paragraph(f"<b>Generado por:</b> {user_info}", style_normal)
+        yield Spacer(1, 6)
+        yield Paragraph("<i>Este reporte fue generado automáticamente por el sistema.</i>", style_normal)
+    
+    _build_stream(doc, story(), progress)
+
+
+def render_purchase_order(
+    file_path: str,
+    order_number: str,
+    supplier_info: str,
+    items: List[Dict],
+    subtotal: float,
+    taxes: float,
+    total: float,
+    delivery_date: str,
+    created_by: str,
+    iva_tax: Optional[Dict],
+    progress: ProgressCallback = _no_progress
+) -> None:
+    """Escribe la orden de compra en ``file_path``, idéntica a PurchaseOrderViewer."""
+    # Configuración del documento
+    doc = SimpleDocTemplate(
+        file_path,
+        pagesize=letter,
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=40,
+        bottomMargin=40
+    )
+    
+    # Estilos personalizados
+    styles = getSampleStyleSheet()
+    style_title = styles["Title"]
+    style_normal = styles["Normal"]
+    style_bold = ParagraphStyle(
+        name='Bold',
+        parent=style_normal,
+        fontName='Helvetica-Bold'
+    )
+    style_total = ParagraphStyle(
+        name='Total',
+        parent=style_normal,
+        fontSize=12,
+        fontName='Helvetica-Bold',
+        alignment=TA_RIGHT,
+        spaceAfter=12
+    )
+    
+    elements = []
+    
+    # Encabezado con imagen
+    try:
+        # Intentar cargar la imagen de la empresa
+        logo_path = "assets/empresa.png"
+        logo = Image(logo_path, width=1.5*inch, height=0.7*inch)
+        
+        header_data = [
+            [logo, "", Paragraph(
+                f"<b>ORDEN DE COMPRA N°:</b> {order_number}<br/>"
+                f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y')}<br/>"
+                f"<b>Fecha Entrega:</b> {delivery_date}",
+                style_normal
+            )]
+        ]
+        
+        header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
+        header_table.setStyle(TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
+        ]))
+        
+    except Exception as e:
+        print(f"Error cargando imagen de empresa: {e}")
+        # Fallback a texto si no se puede cargar la imagen
+        header_data = [
+            [
+                Paragraph("RN&M SERVICIOS INTEGRALES, C.A", style_title),
+                "",
+                Paragraph(
+                    f"<b>ORDEN DE COMPRA N°:</b> {order_number}<br/>"
+                    f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y')}<br/>"
+                    f"<b>Fecha Entrega:</b> {delivery_date}",
+                    style_normal
+                )
+            ],
+            [
+                Paragraph("RIF: J-40339817-8", style_normal),
+                "",
+                ""
+            ],
+            [
+                Paragraph("Av. Principal, Edif. Empresarial", style_normal),
+                "",
+                ""
+            ]
+        ]
+        
+        header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
+        header_table.setStyle(TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
+            ('SPAN', (0,1), (1,1)),
+            ('SPAN', (0,2), (1,2)),
+        ]))
+    
+    elements.append(header_table)
+    elements.append(HRFlowable(width="100%", thickness=1, color=colors.lightgrey))
+    elements.append(Spacer(1, 12))
+    
+    # Información del proveedor
+    elements.append(Paragraph("<b>PROVEEDOR:</b>", style_bold))
+    elements.append(Paragraph(supplier_info, style_normal))
+    elements.append(Spacer(1, 15))
+    
+    # Tabla de productos
+    headers = ["Código", "Descripción", "Cantidad", "P. Unitario", "Total"]
+    col_widths = [1.2*inch, 4.0*inch, 0.8*inch, 1.2*inch, 1.2*inch]
+    
+    table_data = [headers]
+    for item in _track_rows(items, progress):
+        row = [
+            item['code'],
+            item['description'],
+            str(item['quantity']),
+            f"{item['unit_price']:,.2f}",
+            f"{item['total']:,.2f}"
+        ]
+        table_data.append(row)
+    
+    items_table = Table(table_data, colWidths=col_widths, repeatRows=1)
+    items_table.setStyle(TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4a6fa5")),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('ALIGN', (2,1), (-1,-1), 'RIGHT'),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,0), 10),
+        ('FONTSIZE', (0,1), (-1,-1), 9),
+        ('BOTTOMPADDING', (0,0), (-1,0), 6),
+        ('BACKGROUND', (0,1), (-1,-1), colors.white),
+        ('GRID', (0,0), (-1,-1), 0.5, colors.lightgrey),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ]))
+    
+    elements.append(items_table)
+    elements.append(Spacer(1, 15))
+    
+    # Sección de totales
+    if iva_tax and iva_tax.get('status_name') == 'active':
+        subtotal_table = Table([
+            ["Subtotal:", f"{subtotal:,.2f}"]
+        ], colWidths=[1.5*inch, 1.5*inch])
+        
+        subtotal_table.setStyle(TableStyle([
+            ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
+            ('FONTSIZE', (0,0), (-1,-1), 10),
+        ]))
+        
+        elements.append(subtotal_table)
+        
+        iva_table = Table([
+            [f"IVA ({iva_tax['value']}%):", f"{taxes:,.2f}"]
+        ], colWidths=[1.5*inch, 1.5*inch])
+        
+        iva_table.setStyle(TableStyle([
+            ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
+            ('FONTSIZE', (0,0), (-1,-1), 10),
+        ]))
+        
+        elements.append(iva_table)
+    
+    # TOTAL con formato especial
+    total_table = Table([
+        ["", ""],
+        [
+            Paragraph("<b>TOTAL:</b>", style_total),
+            Paragraph(f"<b>{total:,.2f}</b>", style_total)
+        ]
+    ], colWidths=[3.5*inch, 2*inch])
+    
+    total_table.setStyle(TableStyle([
+        ('ALIGN', (1,0), (1,-1), 'RIGHT'),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ]))
+    
+    elements.append(total_table)
+    elements.append(Spacer(1, 20))
+    
+    # Notas y creador
+    elements.append(Paragraph("<i>Esta orden de compra es generada automáticamente por el sistema.</i>", style_normal))
+    elements.append(Spacer(1, 8))
+    elements.append(Paragraph(f"<b>Creado por:</b> {created_by}", style_normal))
+    
+    # Generar PDF
+    _build(doc, elements, progress)
+
+
+def render_invoice(
+    file_path: str,
+    invoice_id: str,
+    customer_info: str,
+    items: List[Dict],
+    subtotal: float,
+    taxes: float,
+    total: float,
+    employee_info: str,
+    iva_tax: Optional[Dict],
+    progress: ProgressCallback = _no_progress
+) -> None:
+    """Escribe el recibo en ``file_path``, idéntico a InvoiceViewer."""
+    # Configuración del documento
+    doc = SimpleDocTemplate(
+        file_path,
+        pagesize=letter,
+        rightMargin=20,
+        leftMargin=20,
+        topMargin=40,
+        bottomMargin=40
+    )
+    
+    # Estilos personalizados
+    styles = getSampleStyleSheet()
+    style_normal = styles["Normal"]
+    style_bold = ParagraphStyle(
+        name='Bold',
+        parent=style_normal,
+        fontName='Helvetica-Bold'
+    )
+    style_title = ParagraphStyle(
+        name='Title',
+        parent=style_normal,
+        fontName='Helvetica-Bold',
+        fontSize=12,
+        spaceAfter=6
+    )
+    style_total = ParagraphStyle(
+        name='Total',
+        parent=style_normal,
+        fontSize=12,
+        fontName='Helvetica-Bold',
+        alignment=TA_RIGHT,
+        spaceAfter=12
+    )
+    style_italic = ParagraphStyle(
+        name='Italic',
+        parent=style_normal,
+        fontName='Helvetica-Oblique',
+        fontSize=9
+    )
+    
+    elements = []
+    
+    # Encabezado con imagen
+    try:
+        # Intentar cargar la imagen de la empresa
+        logo_path = "assets/empresa.png"
+        logo = Image(logo_path, width=1.5*inch, height=0.7*inch)
+        
+        header_data = [
+            [logo, "", Paragraph(
+                f"<b>RECIBO N°:</b> {invoice_id}<br/>"
+                f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+                style_normal
+            )]
+        ]
+        
+        header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
+        header_table.setStyle(TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
+        ]))
+        
+    except Exception as e:
+        print(f"Error cargando imagen de empresa: {e}")
+        # Fallback a texto si no se puede cargar la imagen
+        header_data = [
+            [
+                Paragraph("RN&M SERVICIOS INTEGRALES, C.A", style_title),
+                "",
+                Paragraph(
+                    f"<b>RECIBO N°:</b> {invoice_id}<br/>"
+                    f"<b>Fecha:</b> {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+                    style_normal
+                )
+            ],
+            [
+                Paragraph("RIF: J-40339817-8", style_normal),
+                "",
+                ""
+            ]
+        ]
+        
+        header_table = Table(header_data, colWidths=[3.5*inch, 0.5*inch, 3*inch])
+        header_table.setStyle(TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
+            ('SPAN', (0,1), (1,1)),
+        ]))
+    
+    elements.append(header_table)
+    elements.append(HRFlowable(width="100%", thickness=1, color=colors.lightgrey))
+    elements.append(Spacer(1, 12))
+    
+    # Información del cliente
+    elements.append(Paragraph("<b>CLIENTE:</b>", style_bold))
+    elements.append(Paragraph(customer_info, style_normal))
+    elements.append(Spacer(1, 12))
+    
+    # Tabla de productos/servicios
+    headers = ["Tipo", "Descripción", "Cantidad", "P. Unitario", "Total"]
+    col_widths = [0.8*inch, 3.0*inch, 0.7*inch, 1.0*inch, 1.0*inch]
+    
+    table_data = [headers]
+    for item in _track_rows(items, progress):
+        item_type = "Servicio" if item.get('is_service', False) else "Producto"
+        row = [
+            item_type,
+            item['name'],
+            str(item['quantity']),
+            f"{item['unit_price']:.2f}",
+            f"{item['total']:.2f}"
+        ]
+        table_data.append(row)
+    
+    items_table = Table(table_data, colWidths=col_widths, repeatRows=1)
+    items_table.setStyle(TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4a6fa5")),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('ALIGN', (2,1), (-1,-1), 'RIGHT'),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,0), 10),
+        ('FONTSIZE', (0,1), (-1,-1), 9),
+        ('BOTTOMPADDING', (0,0), (-1,0), 6),
+        ('BACKGROUND', (0,1), (-1,-1), colors.white),
+        ('GRID', (0,0), (-1,-1), 0.5, colors.lightgrey),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ]))
+    
+    elements.append(items_table)
+    elements.append(Spacer(1, 12))
+    
+    # Totales
+    if iva_tax and iva_tax.get('status_name') == 'active':
+        subtotal_table = Table([
+            ["Subtotal:", f"{subtotal:.2f}"]
+        ], colWidths=[1.5*inch, 1.5*inch])
+        
+        subtotal_table.setStyle(TableStyle([
+            ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
+            ('FONTSIZE', (0,0), (-1,-1), 10),
+        ]))
+        
+        elements.append(subtotal_table)
+        
+        iva_table = Table([
+            [f"IVA ({iva_tax['value']}%):", f"{taxes:.2f}"]
+        ], colWidths=[1.5*inch, 1.5*inch])
+        
+        iva_table.setStyle(TableStyle([
+            ('ALIGN', (0,0), (-1,-1), 'RIGHT'),
+            ('FONTSIZE', (0,0), (-1,-1), 10),
+        ]))
+        
+        elements.append(iva_table)
+    
+    # Total
+    total_table = Table([
+        ["", ""],
+        [
+            Paragraph("<b>TOTAL:</b>", style_total),
+            Paragraph(f"<b>{total:.2f}</b>", style_total)
+        ]
+    ], colWidths=[3.5*inch, 2*inch])
+    
+    total_table.setStyle(TableStyle([
+        ('ALIGN', (1,0), (1,-1), 'RIGHT'),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ]))
+    
+    elements.append(total_table)
+    elements.append(Spacer(1, 15))
+    
+    # Información del empleado
+    elements.append(Paragraph(f"<b>Atendido por:</b> {employee_info}", style_normal))
+    elements.append(Spacer(1, 8))
+    
+    # Notas
+    elements.append(Paragraph("<i>Notas:</i>", style_italic))
+    elements.append(Paragraph("<i>Este recibo es generado automáticamente por el sistema.</i>", style_italic))
+    
+    if any(item.get('is_service', False) for item in items):
+        elements.append(Paragraph("<i>Nota: Los servicios solicitados serán atendidos según lo acordado.</i>", style_italic))
+    
+    # Generar PDF
+    _build(doc, elements, progress)
+
+
+# Generadores disponibles para los procesos de trabajo
+RENDERERS: Dict[str, Callable[..., None]] = {
+    "inventory_report": render_inventory_report,
+    "inventory_movements_report": render_inventory_movements_report,
+    "purchase_order": render_purchase_order,
+    "invoice": render_invoice,
+}
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Dict, Optional
+from tkinter import Toplevel, filedialog
+
+from utils.data_export import EXPORT_FORMATS, EXPORTS
+from utils.pdf_jobs import get_pdf_jobs
+
+
+class ReportExporter:
+    """
+    Diálogo de guardado de las exportaciones CSV/JSON Lines de los reportes.
+
+    Como ``PDFGenerator``: pide la ruta y encola la exportación en
+    ``utils.pdf_jobs``; el proceso de trabajo lee las filas del reporte por
+    lotes con los filtros de la pantalla y las escribe a medida que llegan.
+    """
+
+    @staticmethod
+    def export_report(
+        parent: Toplevel,
+        report: str,
+        query: Optional[Dict] = None,
+        total: Optional[int] = None
+    ) -> None:
+        """
+        :param report: Clave de ``utils.data_export.EXPORTS``
+        :param query: Filtros con que la pantalla consultó el reporte
+        :param total: Filas esperadas (sólo para la barra de avance)
+        """
+        title = EXPORTS[report][0]
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[(f"Archivos {name}", f"*{ext}") for ext, name in EXPORT_FORMATS.items()],
+            title="Exportar reporte como",
+            initialfile=f"{title.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+            parent=parent
+        )
+
+        if not file_path:  # El usuario canceló
+            return
+
+        get_pdf_jobs().submit(
+            parent,
+            "export",
+            file_path,
+            {"report": report, "query": dict(query or {}), "total": total},
+            title="Exportando reporte",
+            success_message="El reporte se ha exportado correctamente en:\n{file_path}"
+        )
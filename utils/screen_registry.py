@@ -0,0 +1,141 @@
+import importlib
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import tkinter as tk
+from utils.ui_monitor import get_ui_monitor
+
+WARM_UP_DELAY_MS = 1500      # Espera tras mostrar el inicio antes de precargar
+WARM_UP_INTERVAL_MS = 300    # Pausa entre pantallas precargadas (la UI sigue respondiendo)
+
+
+class ScreenRegistry:
+    """
+    Registro de pantallas que se importan y construyen al abrirse por primera vez.
+
+    Cada pantalla se registra con un nombre y la ruta ``"paquete.modulo:Clase"``;
+    el módulo no se importa ni la pantalla se construye (``configure_ui`` y
+    consultas iniciales) hasta que se abre o se precarga. Las pantallas
+    reciben ``(parent, volver)`` como hasta ahora.
+    """
+
+    def __init__(self, parent: tk.Misc, on_back: Callable[[tk.Frame], None]) -> None:
+        """
+        :param parent: Ventana principal donde se empaquetan las pantallas
+        :param on_back: Callback de "volver" que recibe la pantalla actual
+        """
+        self.parent = parent
+        self.on_back = on_back
+        self._specs: Dict[str, Tuple[str, str]] = {}
+        self._screens: Dict[str, tk.Frame] = {}
+        self._warm_up_queue: List[str] = []
+        self._warm_up_after: Optional[str] = None
+
+    def register(self, name: str, target: str) -> None:
+        """
+        :param name: Nombre de la pantalla (p. ej. ``"inventory"``)
+        :param target: ``"screens.inventory.inventory:Inventory"``
+        """
+        module_path, _, class_name = target.partition(":")
+        self._specs[name] = (module_path, class_name)
+
+    def add(self, name: str, screen: tk.Frame) -> None:
+        """Registra una pantalla ya construida (inicio de sesión, inicio)."""
+        self._screens[name] = screen
+
+    def get(self, name: str) -> tk.Frame:
+        """Devuelve la pantalla, importándola y construyéndola si hace falta."""
+        screen = self._screens.get(name)
+        if screen is None:
+            started = time.perf_counter()
+            module_path, class_name = self._specs[name]
+            screen_class = getattr(importlib.import_module(module_path), class_name)
+            screen = screen_class(self.parent, lambda: self.on_back(self._screens[name]))
+            self._screens[name] = screen
+            get_ui_monitor().screen_built(name, time.perf_counter() - started)
+        return screen
+
+    def is_built(self, name: str) -> bool:
+        return name in self._screens
+
+    def built_screens(self) -> List[tk.Frame]:
+        """Pantallas ya construidas (las únicas que puede haber que ocultar)."""
+        return list(self._screens.values())
+
+    def show(self, name: str) -> tk.Frame:
+        """
+        Oculta las pantallas construidas y muestra ``name``. El monitor de
+        la interfaz mide la construcción, el ``pack()`` y el primer pintado.
+        """
+        started = time.perf_counter()
+        self.cancel_warm_up_of(name)
+        screen = self.get(name)
+        for other in self.built_screens():
+            if other is not screen:
+                other.pack_forget()
+        screen.pack(fill=tk.BOTH, expand=True)
+        get_ui_monitor().screen_shown(name, screen, started)
+        return screen
+
+    def opener(self, name: str) -> Callable[[], None]:
+        """Callback ``open_*`` sin argumentos para la navegación."""
+        def open_screen() -> None:
+            self.show(name)
+        # Nombre con el que aparece en el diagnóstico de la interfaz
+        open_screen.__qualname__ = f"open_{name}"
+        return open_screen
+
+    def warm_up(self, names: Iterable[str], delay_ms: int = WARM_UP_DELAY_MS) -> None:
+        """
+        Precarga pantallas probables sin bloquear la interfaz.
+
+        Los módulos se importan en un hilo aparte; la construcción de los
+        widgets (que debe ocurrir en el hilo de Tk) se reparte en ticks de
+        ``after`` de una pantalla cada uno, así el usuario puede seguir
+        usando la aplicación entre ellos.
+        """
+        pending = [name for name in names if name in self._specs and not self.is_built(name)]
+        if not pending:
+            return
+        self._warm_up_queue = pending
+        modules = [self._specs[name][0] for name in pending]
+        threading.Thread(target=self._import_modules, args=(modules,), name="screen-warm-up", daemon=True).start()
+        self._schedule_warm_up(delay_ms)
+
+    def cancel_warm_up(self) -> None:
+        """Detiene la precarga pendiente (p. ej. al cerrar sesión)."""
+        self._warm_up_queue = []
+        if self._warm_up_after is not None:
+            self.parent.after_cancel(self._warm_up_after)
+            self._warm_up_after = None
+
+    def cancel_warm_up_of(self, name: str) -> None:
+        if name in self._warm_up_queue:
+            self._warm_up_queue.remove(name)
+
+    @staticmethod
+    def _import_modules(modules: List[str]) -> None:
+        for module_path in modules:
+            try:
+                importlib.import_module(module_path)
+            except Exception:
+                # El error se repetirá (y se mostrará) al abrir la pantalla
+                pass
+
+    def _schedule_warm_up(self, delay_ms: int) -> None:
+        self._warm_up_after = self.parent.after(delay_ms, self._warm_up_next)
+
+    def _warm_up_next(self) -> None:
+        self._warm_up_after = None
+        while self._warm_up_queue:
+            name = self._warm_up_queue.pop(0)
+            if self.is_built(name):
+                continue
+            try:
+                self.get(name)
+            except Exception:
+                # La precarga es opcional: al abrirla se intentará de nuevo
+                self._screens.pop(name, None)
+            break
+        if self._warm_up_queue:
+            self._schedule_warm_up(WARM_UP_INTERVAL_MS)
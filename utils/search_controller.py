@@ -0,0 +1,155 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+import tkinter as tk
+from tkinter import messagebox
+
+DEBOUNCE_MS = 250      # Espera tras la última tecla antes de consultar
+POLL_MS = 30           # Frecuencia con la que el hilo de Tk recoge resultados
+SEARCH_WORKERS = 2     # Hilos compartidos por todas las pantallas
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Pool de hilos compartido para las consultas de búsqueda."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="search")
+        return _executor
+
+
+def shutdown_search_workers() -> None:
+    """Detiene el pool de búsqueda (al cerrar la aplicación)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+class SearchController:
+    """
+    Búsqueda asíncrona con antirrebote para pantallas con ``<KeyRelease>``.
+
+    Cada tecla reprograma la consulta; sólo cuando el usuario deja de escribir
+    durante ``delay_ms`` se envía ``fetch`` a un hilo de trabajo. Cada envío
+    recibe un número de generación: si llega una tecla nueva, los resultados
+    anteriores se descartan sin tocar la interfaz. El resultado vigente se
+    entrega a ``render`` en el hilo de Tk mediante ``after()``.
+
+    ``fetch`` corre fuera del hilo de Tk, así que no debe leer variables ni
+    widgets: la pantalla lee sus filtros antes y los captura en el closure.
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        render: Callable[[Any], None],
+        on_error: Optional[Callable[[Exception], None]] = None,
+        delay_ms: int = DEBOUNCE_MS
+    ) -> None:
+        """
+        :param widget: Widget dueño (provee ``after``/``after_cancel``)
+        :param render: Recibe el resultado de ``fetch`` en el hilo de Tk
+        :param on_error: Recibe la excepción de ``fetch``; por defecto muestra un mensaje
+        :param delay_ms: Tiempo de antirrebote en milisegundos
+        """
+        self.widget = widget
+        self.render = render
+        self.on_error = on_error or self._show_error
+        self.delay_ms = delay_ms
+        self._generation = 0
+        self._pending_after: Optional[str] = None
+        self._poll_after: Optional[str] = None
+        self._results: "queue.Queue" = queue.Queue()
+        self._in_flight = 0
+
+    def schedule(self, fetch: Callable[[], Any]) -> None:
+        """Programa ``fetch`` tras el antirrebote, reemplazando lo pendiente."""
+        self._cancel_pending()
+        self._generation += 1
+        generation = self._generation
+        self._pending_after = self.widget.after(self.delay_ms, lambda: self._submit(fetch, generation))
+
+    def run(self, fetch: Callable[[], Any]) -> None:
+        """Ejecuta ``fetch`` de inmediato (sin antirrebote), también en segundo plano."""
+        self._cancel_pending()
+        self._generation += 1
+        self._submit(fetch, self._generation)
+
+    def submit(self, fetch: Callable[[], Any], event: Optional[tk.Event] = None) -> None:
+        """
+        Punto de entrada para ``on_search``: con un evento de teclado aplica
+        antirrebote; sin evento (``refresh_data``, botones) consulta de inmediato.
+        """
+        if event is None:
+            self.run(fetch)
+        else:
+            self.schedule(fetch)
+
+    def cancel(self) -> None:
+        """Descarta la búsqueda pendiente y cualquier resultado en camino."""
+        self._cancel_pending()
+        self._generation += 1
+
+    @property
+    def busy(self) -> bool:
+        """Indica si hay una búsqueda programada o en ejecución."""
+        return self._pending_after is not None or self._poll_after is not None
+
+    def _cancel_pending(self) -> None:
+        if self._pending_after is not None:
+            self.widget.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def _submit(self, fetch: Callable[[], Any], generation: int) -> None:
+        self._pending_after = None
+        if generation != self._generation:
+            return
+        self._in_flight += 1
+        _get_executor().submit(self._work, fetch, generation)
+        if self._poll_after is None:
+            self._poll_after = self.widget.after(POLL_MS, self._poll)
+
+    def _work(self, fetch: Callable[[], Any], generation: int) -> None:
+        # Si llegó otra tecla mientras esperaba en la cola, no se consulta
+        if generation != self._generation:
+            self._results.put((generation, None, None))
+            return
+        try:
+            self._results.put((generation, fetch(), None))
+        except Exception as e:
+            self._results.put((generation, None, e))
+
+    def _poll(self) -> None:
+        self._poll_after = None
+        if not self.widget.winfo_exists():
+            # La ventana se cerró mientras se consultaba
+            return
+        while True:
+            try:
+                generation, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._in_flight -= 1
+            if generation != self._generation:
+                continue
+            if error is not None:
+                self.on_error(error)
+            else:
+                self.render(result)
+
+        # Quedan consultas en curso: seguir recogiendo
+        if self._in_flight > 0:
+            try:
+                self._poll_after = self.widget.after(POLL_MS, self._poll)
+            except tk.TclError:
+                # El widget fue destruido
+                pass
+
+    def _show_error(self, error: Exception) -> None:
+        messagebox.showerror("Error", f"No se pudo completar la búsqueda: {str(error)}", parent=self.widget)
@@ -0,0 +1,330 @@
+import json
+import platform
+import time
+import tkinter
+import tkinter as tk
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+FRAME_BUDGET_MS = 50.0        # Un manejador que tarda más congela la interfaz de forma perceptible
+HEARTBEAT_MS = 50             # Latido del bucle de Tk para medir el tiempo bloqueado
+SAMPLES_PER_HANDLER = 200     # Duraciones recientes por manejador para el p95
+MAX_STALLS = 200              # Bloqueos recientes que se conservan
+FIRST_PAINT_FALLBACK_MS = 500  # Si la pantalla no recibe <Expose>, se usa su <Map>
+
+_KIND_LABELS = {"event": "evento", "command": "comando", "after": "after"}
+
+
+def _quiet(func: Callable) -> Callable:
+    """Marca callbacks propios del monitor para que no se midan a sí mismos."""
+    if not hasattr(func, "__dict__") or hasattr(func, "__self__"):
+        # Métodos ligados (y otros invocables sin atributos propios): se envuelven
+        method = func
+
+        def func(*args: Any) -> Any:
+            return method(*args)
+    func._ui_monitor_skip = True
+    return func
+
+
+def _target(func: Any) -> Any:
+    """Función que realmente se ejecuta: ``after`` la envuelve en ``callit``."""
+    if _is_after(func):
+        code = func.__code__
+        func = func.__closure__[code.co_freevars.index("func")].cell_contents
+    return func
+
+
+def _handler_name(func: Any) -> str:
+    """Nombre legible del callback: ``modulo:Clase.metodo``."""
+    func = _target(func)
+    func = getattr(func, "func", func)  # functools.partial
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    module = getattr(func, "__module__", None) or ""
+    return f"{module.rsplit('.', 1)[-1]}:{name}" if module else name
+
+
+def _is_after(func: Any) -> bool:
+    return getattr(func, "__qualname__", "").endswith("after.<locals>.callit")
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class _HandlerStats:
+    __slots__ = ("kind", "calls", "seconds", "max", "over_budget", "samples")
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.calls = 0
+        self.seconds = 0.0
+        self.max = 0.0
+        self.over_budget = 0
+        self.samples: Deque[float] = deque(maxlen=SAMPLES_PER_HANDLER)
+
+
+class _ScreenStats:
+    __slots__ = ("opens", "build", "show", "paint")
+
+    def __init__(self) -> None:
+        self.opens = 0
+        self.build: Optional[float] = None
+        self.show: Deque[float] = deque(maxlen=SAMPLES_PER_HANDLER)
+        self.paint: Deque[float] = deque(maxlen=SAMPLES_PER_HANDLER)
+
+
+class _TimedCallWrapper(tkinter.CallWrapper):
+    """``CallWrapper`` de tkinter que mide cada callback (bind, command, after)."""
+
+    def __call__(self, *args: Any) -> Any:
+        monitor = _monitor
+        if monitor is None or not monitor.enabled or getattr(_target(self.func), "_ui_monitor_skip", False):
+            return super().__call__(*args)
+        started = time.perf_counter()
+        try:
+            return super().__call__(*args)
+        finally:
+            monitor.record_handler(self.func, bool(self.subst), time.perf_counter() - started)
+
+
+class UIMonitor:
+    """
+    Medición de la respuesta de la interfaz.
+
+    Una vez instalado (``install_ui_monitor``), todo callback que Tk invoca
+    desde el bucle principal (eventos de ``bind``, ``command`` de botones y
+    ``after``) se mide por nombre de manejador; los que superan
+    ``budget_ms`` se cuentan como fuera de presupuesto. Un latido cada
+    ``HEARTBEAT_MS`` mide cuánto tiempo estuvo bloqueado el bucle de Tk y
+    registra cada bloqueo con el manejador más lento que lo causó.
+    ``ScreenRegistry`` informa por pantalla la construcción, el ``show``
+    (incluido el ``pack()`` que refresca los datos) y el tiempo hasta el
+    primer pintado.
+    """
+
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS) -> None:
+        self.enabled = True
+        self.budget_ms = budget_ms
+        self._root: Optional[tk.Misc] = None
+        self._beat_after: Optional[str] = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self.started_at = datetime.now()
+        self._handlers: Dict[str, _HandlerStats] = {}
+        self._screens: Dict[str, _ScreenStats] = {}
+        self._pending_paint: Dict[str, Dict[str, Any]] = {}
+        self._stalls: Deque[Dict[str, Any]] = deque(maxlen=MAX_STALLS)
+        self._blocked_seconds = 0.0
+        self._max_lag = 0.0
+        self._slowest_since_beat: Optional[tuple] = None
+        self._next_beat: Optional[float] = None
+
+    def install(self, root: tk.Misc) -> None:
+        """Activa la medición de callbacks y el latido del bucle principal."""
+        tkinter.CallWrapper = _TimedCallWrapper
+        self._root = root
+        if self._beat_after is None:
+            self._schedule_beat()
+
+    # --- Registro ----------------------------------------------------
+
+    def record_handler(self, func: Any, is_event: bool, seconds: float) -> None:
+        name = _handler_name(func)
+        stats = self._handlers.get(name)
+        if stats is None:
+            kind = "after" if _is_after(func) else ("event" if is_event else "command")
+            stats = self._handlers[name] = _HandlerStats(kind)
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.samples.append(seconds)
+        if seconds > stats.max:
+            stats.max = seconds
+        if seconds * 1000 >= self.budget_ms:
+            stats.over_budget += 1
+            if self._slowest_since_beat is None or seconds > self._slowest_since_beat[0]:
+                self._slowest_since_beat = (seconds, name)
+
+    def screen_built(self, name: str, seconds: float) -> None:
+        if self.enabled:
+            self._screen(name).build = seconds
+
+    def screen_shown(self, name: str, screen: tk.Misc, started: float) -> None:
+        """Registra un ``show`` y espera el primer pintado de la pantalla."""
+        if not self.enabled:
+            return
+        stats = self._screen(name)
+        stats.opens += 1
+        stats.show.append(time.perf_counter() - started)
+        pending = self._pending_paint.get(name)
+        self._pending_paint[name] = {"started": started, "mapped": None}
+        if pending is None and not getattr(screen, "_ui_monitor_bound", False):
+            screen._ui_monitor_bound = True
+            screen.bind("<Map>", _quiet(lambda event, n=name: self._on_map(n)), add="+")
+            screen.bind("<Expose>", _quiet(lambda event, n=name: self._on_expose(n)), add="+")
+
+    # --- Resultados --------------------------------------------------
+
+    def handlers(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Manejadores ordenados por tiempo total."""
+        rows = []
+        for name, s in self._handlers.items():
+            rows.append({
+                "handler": name,
+                "kind": _KIND_LABELS[s.kind],
+                "calls": s.calls,
+                "total_ms": round(s.seconds * 1000, 2),
+                "avg_ms": round(s.seconds * 1000 / s.calls, 3) if s.calls else 0.0,
+                "p95_ms": round(_percentile(list(s.samples), 0.95) * 1000, 2),
+                "max_ms": round(s.max * 1000, 2),
+                "over_budget": s.over_budget,
+            })
+        rows.sort(key=lambda row: (row["over_budget"] > 0, row["total_ms"]), reverse=True)
+        return rows[:limit] if limit else rows
+
+    def screens(self) -> List[Dict[str, Any]]:
+        """Por pantalla: aperturas, construcción, ``show`` y primer pintado (ms)."""
+        rows = []
+        for name, s in self._screens.items():
+            show = [value * 1000 for value in s.show]
+            paint = [value * 1000 for value in s.paint]
+            rows.append({
+                "screen": name,
+                "opens": s.opens,
+                "build_ms": round(s.build * 1000, 2) if s.build is not None else None,
+                "show_ms_last": round(show[-1], 2) if show else None,
+                "show_ms_max": round(max(show), 2) if show else None,
+                "first_paint_ms_last": round(paint[-1], 2) if paint else None,
+                "first_paint_ms_p95": round(_percentile(paint, 0.95), 2) if paint else None,
+            })
+        rows.sort(key=lambda row: row["first_paint_ms_last"] or 0.0, reverse=True)
+        return rows
+
+    def loop(self) -> Dict[str, Any]:
+        """Estado del bucle principal: bloqueos por encima del presupuesto y peor retraso."""
+        uptime = (datetime.now() - self.started_at).total_seconds()
+        return {
+            "uptime_s": round(uptime, 1),
+            "budget_ms": self.budget_ms,
+            "heartbeat_ms": HEARTBEAT_MS,
+            "stalls": len(self._stalls),
+            "blocked_ms": round(self._blocked_seconds * 1000, 1),
+            "blocked_pct": round(self._blocked_seconds * 100 / uptime, 2) if uptime else 0.0,
+            "max_lag_ms": round(self._max_lag * 1000, 1),
+        }
+
+    def stalls(self) -> List[Dict[str, Any]]:
+        """Bloqueos recientes del bucle, el más reciente primero."""
+        return list(reversed(self._stalls))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Todo el diagnóstico (interfaz, cola de escritura y perfilador SQL) en un diccionario."""
+        from sqlite_cli.database.profiler import get_profiler
+        from sqlite_cli.database.write_queue import get_write_queue
+
+        profiler = get_profiler()
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "tk": tk.TkVersion,
+            "platform": platform.platform(),
+            "since": self.started_at.isoformat(timespec="seconds"),
+            "loop": self.loop(),
+            "handlers": self.handlers(),
+            "screens": self.screens(),
+            "stalls": self.stalls(),
+            "write_queue": get_write_queue().stats(),
+            "sql_profile": profiler.stats() if profiler.enabled else None,
+        }
+
+    def export_json(self, file_path: str) -> None:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+    def reset(self) -> None:
+        self._reset_state()
+
+    # --- Internos ----------------------------------------------------
+
+    def _screen(self, name: str) -> _ScreenStats:
+        stats = self._screens.get(name)
+        if stats is None:
+            stats = self._screens[name] = _ScreenStats()
+        return stats
+
+    def _on_map(self, name: str) -> None:
+        pending = self._pending_paint.get(name)
+        if pending is None or self._root is None:
+            return
+
+        def mapped() -> None:
+            if self._pending_paint.get(name) is pending:
+                pending["mapped"] = time.perf_counter() - pending["started"]
+                self._root.after(FIRST_PAINT_FALLBACK_MS, _quiet(lambda: self._paint_fallback(name, pending)))
+
+        self._root.after_idle(_quiet(mapped))
+
+    def _on_expose(self, name: str) -> None:
+        pending = self._pending_paint.get(name)
+        if pending is None or self._root is None:
+            return
+
+        def painted() -> None:
+            # Las tareas de redibujo que Tk encoló por el <Expose> ya corrieron
+            if self._pending_paint.get(name) is pending:
+                del self._pending_paint[name]
+                self._screen(name).paint.append(time.perf_counter() - pending["started"])
+
+        self._root.after_idle(_quiet(painted))
+
+    def _paint_fallback(self, name: str, pending: Dict[str, Any]) -> None:
+        if self._pending_paint.get(name) is pending and pending["mapped"] is not None:
+            del self._pending_paint[name]
+            self._screen(name).paint.append(pending["mapped"])
+
+    def _schedule_beat(self) -> None:
+        self._next_beat = time.perf_counter() + HEARTBEAT_MS / 1000
+        self._beat_after = self._root.after(HEARTBEAT_MS, _quiet(self._beat))
+
+    def _beat(self) -> None:
+        lag = time.perf_counter() - self._next_beat
+        if self.enabled and lag > 0:
+            if lag > self._max_lag:
+                self._max_lag = lag
+            if lag * 1000 >= self.budget_ms:
+                self._blocked_seconds += lag
+                culprit = self._slowest_since_beat
+                self._stalls.append({
+                    "at": datetime.now().isoformat(timespec="seconds"),
+                    "blocked_ms": round(lag * 1000, 1),
+                    "handler": culprit[1] if culprit else None,
+                    "handler_ms": round(culprit[0] * 1000, 1) if culprit else None,
+                })
+        self._slowest_since_beat = None
+        self._schedule_beat()
+
+
+_monitor: Optional[UIMonitor] = None
+
+
+def get_ui_monitor() -> UIMonitor:
+    """Monitor de la interfaz compartido por toda la aplicación."""
+    global _monitor
+    if _monitor is None:
+        _monitor = UIMonitor()
+    return _monitor
+
+
+def install_ui_monitor(root: tk.Misc) -> UIMonitor:
+    """
+    Instala la medición antes de construir las pantallas: los callbacks se
+    envuelven cuando Tk los registra.
+    """
+    monitor = get_ui_monitor()
+    monitor.install(root)
+    return monitor
@@ -0,0 +1,37 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+
+
+class ProgressWindow(tk.Toplevel):
+    """
+    Ventana no modal con el avance de una tarea en segundo plano.
+
+    Si se indica ``on_cancel`` muestra el botón para cancelarla; sin él, la
+    ventana no se puede cerrar hasta que la tarea la destruya.
+    """
+
+    def __init__(self, parent: tk.Misc, title: str, on_cancel: Optional[Callable[[], None]] = None) -> None:
+        super().__init__(parent)
+        self.title(title)
+        self.configure(bg="#f5f5f5", padx=20, pady=15)
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", on_cancel or (lambda: None))
+
+        self.message = tk.Label(self, text="En cola...", font=("Arial", 10), bg="#f5f5f5", anchor="w", width=45)
+        self.message.pack(fill=tk.X)
+        self.bar = ttk.Progressbar(self, orient=tk.HORIZONTAL, length=320, mode="determinate", maximum=100)
+        self.bar.pack(fill=tk.X, pady=10)
+        self.cancel_button: Optional[ttk.Button] = None
+        if on_cancel is not None:
+            self.cancel_button = ttk.Button(self, text="Cancelar", command=on_cancel)
+            self.cancel_button.pack(anchor="e")
+
+    def update_progress(self, fraction: float, message: str) -> None:
+        self.bar["value"] = round(fraction * 100)
+        self.message.configure(text=message)
+
+    def cancelling(self) -> None:
+        self.message.configure(text="Cancelando...")
+        if self.cancel_button is not None:
+            self.cancel_button.state(["disabled"])
@@ -0,0 +1,212 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Construye una tarjeta vacía (con todos sus widgets) dentro del padre dado
+CardBuilder = Callable[[tk.Widget], tk.Frame]
+# Rellena una tarjeta existente con los datos de un ítem
+CardFiller = Callable[[tk.Frame, Dict], None]
+
+
+class VirtualGrid(tk.Frame):
+    def __init__(
+        self,
+        parent: tk.Widget,
+        build_card: CardBuilder,
+        fill_card: CardFiller,
+        on_click: Optional[Callable[[Dict], None]] = None,
+        card_width: int = 200,
+        card_height: int = 250,
+        columns: int = 3,
+        gap: int = 10,
+        buffer_rows: int = 1,
+        empty_text: str = "Sin resultados",
+        bg: str = "#f5f5f5",
+        **kwargs: Any
+    ) -> None:
+        """
+        Grid de tarjetas virtualizado: sólo existen widgets para las filas visibles.
+
+        Los ítems viven en memoria como diccionarios; el grid crea tarjetas
+        (con ``build_card``) únicamente para la ventana visible más
+        ``buffer_rows`` filas arriba y abajo. Al desplazarse, las tarjetas
+        que salen de la ventana se reciclan para los ítems que entran y se
+        vuelven a rellenar con ``fill_card``, así que la cantidad de widgets
+        no depende del número de resultados.
+
+        ``fill_card`` se llama cada vez que una tarjeta pasa a mostrar otro
+        ítem: es el momento de pedir su miniatura, de forma que sólo se
+        cargan imágenes de tarjetas visibles.
+
+        Args:
+            parent: Widget padre
+            build_card: Crea una tarjeta vacía con todos sus widgets
+            fill_card: Muestra un ítem en una tarjeta (nueva o reciclada)
+            on_click: Se llama con el ítem al hacer clic en su tarjeta
+            card_width: Ancho fijo de cada tarjeta
+            card_height: Alto fijo de cada tarjeta
+            columns: Tarjetas por fila
+            gap: Separación alrededor de cada tarjeta
+            buffer_rows: Filas extra materializadas fuera de la ventana visible
+            empty_text: Texto que se muestra cuando no hay ítems
+            bg: Color de fondo
+            **kwargs: Argumentos clave adicionales para tk.Frame
+        """
+        super().__init__(parent, bg=bg, **kwargs)
+        self.build_card = build_card
+        self.fill_card = fill_card
+        self.on_click = on_click
+        self.card_width = card_width
+        self.card_height = card_height
+        self.columns = columns
+        self.gap = gap
+        self.buffer_rows = buffer_rows
+        self.empty_text = empty_text
+
+        self._items: List[Dict] = []
+        self._active: Dict[int, tk.Frame] = {}     # índice del ítem -> tarjeta
+        self._free: List[tk.Frame] = []            # tarjetas ocultas listas para reciclar
+        self._windows: Dict[tk.Frame, int] = {}    # tarjeta -> ítem de ventana del canvas
+        self._cell_width = card_width + 2 * gap
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0, yscrollincrement=20)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self._empty_item = self.canvas.create_text(
+            0, 20, text="", anchor="n", font=("Arial", 12), fill="#666"
+        )
+
+        # Eventos comunes a todas las tarjetas (y sus hijos) en una etiqueta propia
+        self._tag = f"VirtualGrid{self._w}"
+        self.bind_class(self._tag, "<Button-1>", self._on_card_click)
+        self.bind_class(self._tag, "<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        for sequence, units in (("<Button-4>", -3), ("<Button-5>", 3)):
+            self.canvas.bind(sequence, lambda e, u=units: self._scroll_by(u))
+            self.bind_class(self._tag, sequence, lambda e, u=units: self._scroll_by(u))
+        self.canvas.bind("<Configure>", self._on_configure)
+
+    # ------------------------------------------------------------------
+    # API de datos
+    # ------------------------------------------------------------------
+
+    def set_items(self, items: Sequence[Dict]) -> None:
+        """Reemplaza los ítems y vuelve al inicio del grid."""
+        self._items = list(items)
+        for index in list(self._active):
+            self._release(index)
+        self.canvas.itemconfigure(self._empty_item, text="" if self._items else self.empty_text)
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self._render()
+
+    def item_count(self) -> int:
+        return len(self._items)
+
+    def card_count(self) -> int:
+        """Tarjetas creadas (visibles y recicladas): acotado por la ventana, no por los ítems."""
+        return len(self._windows)
+
+    # ------------------------------------------------------------------
+    # Ventana visible
+    # ------------------------------------------------------------------
+
+    @property
+    def _row_height(self) -> int:
+        return self.card_height + 2 * self.gap
+
+    def _row_count(self) -> int:
+        return (len(self._items) + self.columns - 1) // self.columns
+
+    def _position(self, index: int) -> Tuple[int, int]:
+        row, col = divmod(index, self.columns)
+        x = col * self._cell_width + (self._cell_width - self.card_width) // 2
+        return x, row * self._row_height + self.gap
+
+    def _render(self) -> None:
+        if not self._items:
+            return
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), self._row_height)
+        first_row = max(0, int(top // self._row_height) - self.buffer_rows)
+        last_row = min(self._row_count() - 1, int((top + height) // self._row_height) + self.buffer_rows)
+        wanted = range(first_row * self.columns, min(len(self._items), (last_row + 1) * self.columns))
+
+        for index in [index for index in self._active if index not in wanted]:
+            self._release(index)
+        for index in wanted:
+            if index not in self._active:
+                self._show(index)
+
+    def _show(self, index: int) -> None:
+        card = self._free.pop() if self._free else self._new_card()
+        self._active[index] = card
+        window = self._windows[card]
+        self.canvas.coords(window, *self._position(index))
+        self.canvas.itemconfigure(window, state="normal")
+        self.fill_card(card, self._items[index])
+
+    def _release(self, index: int) -> None:
+        card = self._active.pop(index)
+        window = self._windows[card]
+        # Además de ocultarla, se saca del área desplazable
+        self.canvas.itemconfigure(window, state="hidden")
+        self.canvas.coords(window, -self.card_width - self.gap, -self.card_height - self.gap)
+        self._free.append(card)
+
+    def _new_card(self) -> tk.Frame:
+        card = self.build_card(self.canvas)
+        self._windows[card] = self.canvas.create_window(
+            0, 0, window=card, anchor="nw", width=self.card_width, height=self.card_height
+        )
+        self._add_tag(card)
+        return card
+
+    def _add_tag(self, widget: tk.Misc) -> None:
+        widget.bindtags((self._tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_tag(child)
+
+    def _update_scrollregion(self) -> None:
+        width = self._cell_width * self.columns
+        height = self._row_count() * self._row_height + self.gap
+        self.canvas.configure(scrollregion=(0, 0, width, max(height, 1)))
+
+    # ------------------------------------------------------------------
+    # Eventos
+    # ------------------------------------------------------------------
+
+    def _on_yview(self, low: str, high: str) -> None:
+        self.scrollbar.set(low, high)
+        self._render()
+
+    def _on_configure(self, event: tk.Event) -> None:
+        # Las columnas se reparten el ancho disponible, como con ``weight=1``
+        cell_width = max(self.card_width + 2 * self.gap, event.width // self.columns)
+        if cell_width != self._cell_width:
+            self._cell_width = cell_width
+            self._update_scrollregion()
+            for index, card in self._active.items():
+                self.canvas.coords(self._windows[card], *self._position(index))
+        self.canvas.coords(self._empty_item, event.width // 2, 20)
+        self._render()
+
+    def _on_card_click(self, event: tk.Event) -> None:
+        if self.on_click is None:
+            return
+        widget = event.widget
+        while widget is not None and widget not in self._windows:
+            widget = widget.master
+        for index, card in self._active.items():
+            if card is widget:
+                self.on_click(self._items[index])
+                return
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        return self._scroll_by(-1 * (event.delta // 120 or (1 if event.delta > 0 else -1)) * 3)
+
+    def _scroll_by(self, units: int) -> str:
+        self.canvas.yview_scroll(units, "units")
+        return "break"
@@ -0,0 +1,401 @@
+import tkinter as tk
+from tkinter import messagebox, ttk
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from utils.search_controller import SearchController
+
+# Carga de páginas adicionales: recibe el cursor de la página anterior y
+# devuelve (filas de valores, cursor siguiente o None si no hay más).
+# Corre en un hilo de trabajo: no debe leer variables ni widgets.
+PageLoader = Callable[[Optional[str]], Tuple[List[Sequence], Optional[str]]]
+
+HEADING_HEIGHT = 25     # Alto aproximado de la fila de encabezados
+DEFAULT_ROW_HEIGHT = 20
+LOADING_IID = "__loading__"     # Fila provisional mientras llega una página
+
+
+class VirtualTreeview(ttk.Treeview):
+    def __init__(
+        self,
+        parent: tk.Widget,
+        key_column: int = 0,
+        buffer_rows: int = 5,
+        prefetch_rows: int = 50,
+        striped: bool = True,
+        **kwargs: Any
+    ) -> None:
+        """
+        Treeview virtualizado: sólo materializa en Tk las filas visibles.
+
+        Las filas viven en memoria como tuplas de valores y el widget crea
+        ítems únicamente para la ventana visible más ``buffer_rows``. Al
+        desplazarse, la ventana se actualiza por diferencia (se borran los
+        ítems que salen, se insertan los que entran y se reordenan los
+        demás), igual que al recibir datos nuevos con ``set_rows``.
+
+        Las páginas siguientes se piden al ``loader`` en el pool de búsqueda
+        y se agregan en el hilo de Tk al llegar; mientras tanto la ventana
+        muestra una fila "Cargando..." donde faltan datos.
+
+        El iid de cada ítem es el valor de ``key_column`` (normalmente el ID),
+        así que ``selection()`` e ``item(iid)['values']`` siguen funcionando
+        como en un ``ttk.Treeview`` normal, incluso si la fila seleccionada
+        salió de la ventana visible.
+
+        Args:
+            parent: Widget padre
+            key_column: Columna cuyo valor identifica la fila (debe ser única)
+            buffer_rows: Filas extra materializadas bajo la ventana visible
+            prefetch_rows: Al acercarse a este número de filas del final se pide la página siguiente
+            striped: Aplica las etiquetas 'evenrow'/'oddrow' según la posición absoluta
+            **kwargs: Argumentos clave adicionales para ttk.Treeview
+        """
+        self._yscroll: Optional[Callable[[float, float], None]] = None
+        yscroll = kwargs.pop("yscrollcommand", None) or kwargs.pop("yscroll", None)
+        super().__init__(parent, **kwargs)
+        self._yscroll = yscroll
+
+        self.key_column = key_column
+        self.buffer_rows = buffer_rows
+        self.prefetch_rows = prefetch_rows
+        self.striped = striped
+
+        self._rows: List[Tuple] = []
+        self._index: Dict[str, int] = {}
+        self._rendered: Dict[str, Tuple] = {}
+        self._selected: Tuple[str, ...] = ()
+        self._first = 0
+        self._visible = int(kwargs.get("height", 10))
+        self._total: Optional[int] = None
+        self._cursor: Optional[str] = None
+        self._loader: Optional[PageLoader] = None
+        self._loading = False
+        self._target: Optional[int] = None
+        self._pages = SearchController(self, self._on_page, self._on_page_error)
+        self.tag_configure("loading", foreground="gray")
+
+        # Los eventos propios van en una etiqueta anterior a la del widget:
+        # así un ``bind("<<TreeviewSelect>>", ...)`` de la pantalla no los
+        # reemplaza, y el "break" evita el desplazamiento nativo de Tk.
+        tag = f"VirtualTreeview{self._w}"
+        self.bindtags((tag,) + self.bindtags())
+        self.bind_class(tag, "<Configure>", self._on_configure)
+        self.bind_class(tag, "<<TreeviewSelect>>", self._on_select)
+        self.bind_class(tag, "<MouseWheel>", self._on_mousewheel)
+        self.bind_class(tag, "<Button-4>", lambda e: self._scroll_by(-3))
+        self.bind_class(tag, "<Button-5>", lambda e: self._scroll_by(3))
+        self.bind_class(tag, "<Up>", lambda e: self._move_selection(-1))
+        self.bind_class(tag, "<Down>", lambda e: self._move_selection(1))
+        self.bind_class(tag, "<Prior>", lambda e: self._move_selection(-self._visible))
+        self.bind_class(tag, "<Next>", lambda e: self._move_selection(self._visible))
+        self.bind_class(tag, "<Home>", lambda e: self._move_selection(-len(self._rows)))
+        self.bind_class(tag, "<End>", lambda e: self._move_selection(len(self._rows)))
+
+    # ------------------------------------------------------------------
+    # API de datos
+    # ------------------------------------------------------------------
+
+    def set_rows(
+        self,
+        rows: Sequence[Sequence],
+        loader: Optional[PageLoader] = None,
+        cursor: Optional[str] = None,
+        total: Optional[int] = None,
+        keep_position: bool = False
+    ) -> None:
+        """
+        Reemplaza las filas del widget.
+
+        Args:
+            rows: Tuplas de valores (primera página o resultado completo)
+            loader: Función para pedir la página siguiente al desplazarse
+            cursor: Cursor que se pasa a ``loader`` para la página siguiente
+            total: Número total de filas, si se conoce (ajusta la barra de desplazamiento)
+            keep_position: Conserva la posición de desplazamiento (refresco de los mismos datos)
+        """
+        self._stop_loading()
+        self._rows = [tuple(values) for values in rows]
+        self._index = {str(values[self.key_column]): i for i, values in enumerate(self._rows)}
+        self._loader = loader if cursor is not None else None
+        self._cursor = cursor
+        self._total = total
+        self._selected = tuple(key for key in self._selected if key in self._index)
+        self._target = None
+        if not keep_position:
+            self._first = 0
+        self._render()
+
+    def row_count(self) -> int:
+        """Filas cargadas en memoria (no necesariamente materializadas)."""
+        return len(self._rows)
+
+    def total_count(self) -> int:
+        """Total conocido de filas: el informado, o las cargadas si no se informó."""
+        return self._total if self._total is not None else len(self._rows)
+
+    def has_more(self) -> bool:
+        """Indica si quedan páginas por cargar."""
+        return self._loader is not None
+
+    def update_row(self, values: Sequence) -> None:
+        """Actualiza (o agrega al final) una fila sin recargar el resto."""
+        values = tuple(values)
+        key = str(values[self.key_column])
+        if key in self._index:
+            self._rows[self._index[key]] = values
+        else:
+            self._index[key] = len(self._rows)
+            self._rows.append(values)
+        self._render()
+
+    def remove_rows(self, keys: Sequence[Any]) -> None:
+        """Quita filas por su clave sin recargar el resto."""
+        removed = {str(key) for key in keys} & set(self._index)
+        if not removed:
+            return
+        self._rows = [values for values in self._rows if str(values[self.key_column]) not in removed]
+        self._index = {str(values[self.key_column]): i for i, values in enumerate(self._rows)}
+        self._selected = tuple(key for key in self._selected if key not in removed)
+        if self._total is not None:
+            self._total = max(0, self._total - len(removed))
+        if not self._rows:
+            # Se vació la tabla: no seguir cargando páginas de la consulta anterior
+            self._stop_loading()
+            self._loader = None
+            self._cursor = None
+        self._render()
+
+    # ------------------------------------------------------------------
+    # Compatibilidad con ttk.Treeview
+    # ------------------------------------------------------------------
+
+    def selection(self) -> Tuple[str, ...]:
+        """Claves seleccionadas, aunque la fila ya no esté materializada."""
+        materialized = tuple(key for key in super().selection() if key != LOADING_IID)
+        if materialized:
+            return materialized
+        return tuple(key for key in self._selected if key not in self._rendered)
+
+    def selection_set(self, *items: Any) -> None:
+        self._selected = tuple(str(item) for item in self._flatten(items))
+        self._apply_selection()
+
+    def item(self, item: Any, option: Optional[str] = None, **kw: Any) -> Any:
+        key = str(item)
+        if not super().exists(key) and key in self._index and option is None and not kw:
+            return {"text": "", "image": "", "values": list(self._rows[self._index[key]]),
+                    "open": 0, "tags": ""}
+        return super().item(key, option, **kw)
+
+    def get_children(self, item: Optional[str] = None) -> Tuple[str, ...]:
+        """Claves de todas las filas cargadas (no sólo las materializadas)."""
+        if item:
+            return super().get_children(item)
+        return tuple(str(values[self.key_column]) for values in self._rows)
+
+    def delete(self, *items: Any) -> None:
+        self.remove_rows(self._flatten(items))
+
+    def configure(self, cnf: Optional[Dict] = None, **kw: Any) -> Any:
+        # La barra de desplazamiento refleja la posición virtual, no la de Tk
+        for option in ("yscroll", "yscrollcommand"):
+            if option in kw:
+                self._yscroll = kw.pop(option)
+                self._update_scrollbar()
+        if cnf and any(option in cnf for option in ("yscroll", "yscrollcommand")):
+            cnf = dict(cnf)
+            self._yscroll = cnf.pop("yscroll", None) or cnf.pop("yscrollcommand", None)
+            self._update_scrollbar()
+        if cnf is None and not kw:
+            return super().configure()
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def yview(self, *args: Any) -> Any:
+        """Desplazamiento en coordenadas virtuales (lo usa la barra de desplazamiento)."""
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            # Si la posición cae en filas sin cargar se llega a ella al recibirlas
+            self._target = int(float(args[1]) * self.total_count())
+        elif args[0] == "scroll":
+            self._target = None
+            amount = int(args[1])
+            self._first += amount * (self._visible if args[2] == "pages" else 1)
+        self._render()
+        return None
+
+    def see(self, item: Any) -> None:
+        key = str(item)
+        if key not in self._index:
+            return
+        position = self._index[key]
+        self._target = None
+        if position < self._first:
+            self._first = position
+        elif position >= self._first + self._visible:
+            self._first = position - self._visible + 1
+        self._render()
+
+    # ------------------------------------------------------------------
+    # Ventana visible
+    # ------------------------------------------------------------------
+
+    def _render(self) -> None:
+        if self._target is not None:
+            self._first = self._target
+            if self._loader is None or len(self._rows) >= self._target + self._visible:
+                self._target = None
+        self._ensure_loaded(self._first + self._visible + self.buffer_rows + self.prefetch_rows)
+        max_first = max(0, len(self._rows) - self._visible)
+        self._first = min(max(0, self._first), max_first)
+        window = self._rows[self._first:self._first + self._visible + self.buffer_rows]
+
+        wanted = {}
+        for offset, values in enumerate(window):
+            position = self._first + offset
+            tags = ("evenrow" if position % 2 == 0 else "oddrow",) if self.striped else ()
+            wanted[str(values[self.key_column])] = (offset, values, tags)
+        if self._loading and len(window) < self._visible + self.buffer_rows:
+            wanted[LOADING_IID] = (len(window), self._placeholder(), ("loading",))
+
+        stale = [key for key in self._rendered if key not in wanted]
+        if stale:
+            super().delete(*stale)
+            for key in stale:
+                del self._rendered[key]
+
+        current = list(super().get_children())
+        for key, (offset, values, tags) in wanted.items():
+            if key not in self._rendered:
+                super().insert("", offset, iid=key, values=values, tags=tags)
+                current.insert(offset, key)
+            else:
+                if self._rendered[key] != (values, tags):
+                    super().item(key, values=values, tags=tags)
+                if offset >= len(current) or current[offset] != key:
+                    super().move(key, "", offset)
+                    current.remove(key)
+                    current.insert(offset, key)
+            self._rendered[key] = (values, tags)
+        self._apply_selection()
+        super().yview("moveto", 0)
+        self._update_scrollbar()
+
+    def _ensure_loaded(self, count: int) -> None:
+        """
+        Pide en segundo plano la página siguiente si faltan filas para llegar
+        a ``count``; al llegar, ``_on_page`` vuelve a dibujar y pide otra si
+        todavía faltan.
+        """
+        if self._loader is None or self._loading or len(self._rows) >= count:
+            return
+        self._loading = True
+        loader, cursor = self._loader, self._cursor
+        self._pages.run(lambda: loader(cursor))
+
+    def _on_page(self, page: Tuple[List[Sequence], Optional[str]]) -> None:
+        rows, cursor = page
+        self._loading = False
+        for values in rows:
+            values = tuple(values)
+            key = str(values[self.key_column])
+            if key in self._index:
+                # Ya agregada con ``update_row`` mientras llegaba la página
+                continue
+            self._index[key] = len(self._rows)
+            self._rows.append(values)
+        self._cursor = cursor
+        if cursor is None or not rows:
+            self._loader = None
+        self._render()
+
+    def _on_page_error(self, error: Exception) -> None:
+        # Sin más páginas: reintentar en cada dibujo repetiría el error
+        self._loading = False
+        self._loader = None
+        self._target = None
+        self._render()
+        messagebox.showerror("Error", f"No se pudieron cargar más filas: {error}", parent=self)
+
+    def _stop_loading(self) -> None:
+        """Descarta la página en camino (los datos cambiaron)."""
+        self._pages.cancel()
+        self._loading = False
+
+    def _placeholder(self) -> Tuple:
+        values = [""] * max(1, len(self["columns"]))
+        values[min(len(values) - 1, 1) if self.key_column == 0 else 0] = "Cargando..."
+        return tuple(values)
+
+    def _fractions(self) -> Tuple[float, float]:
+        total = self.total_count()
+        if self._loader is not None and self._total is None:
+            # Tamaño desconocido: se deja margen para indicar que hay más
+            total += self._visible * 2
+        if total <= 0:
+            return 0.0, 1.0
+        low = self._first / total
+        high = min(1.0, (self._first + self._visible) / total)
+        return low, high
+
+    def _update_scrollbar(self) -> None:
+        if self._yscroll:
+            low, high = self._fractions()
+            self._yscroll(low, high)
+
+    def _apply_selection(self) -> None:
+        visible = [key for key in self._selected if key in self._rendered]
+        if tuple(super().selection()) != tuple(visible):
+            super().selection_set(visible)
+
+    def _on_select(self, event: tk.Event) -> None:
+        materialized = tuple(key for key in super().selection() if key != LOADING_IID)
+        hidden = tuple(key for key in self._selected if key not in self._rendered)
+        # Si sólo cambió porque la fila salió de la ventana, se conserva la selección
+        if materialized or not hidden:
+            self._selected = materialized
+
+    def _on_configure(self, event: tk.Event) -> None:
+        style = self.cget("style") or "Treeview"
+        row_height = ttk.Style().lookup(style, "rowheight") or DEFAULT_ROW_HEIGHT
+        heading = HEADING_HEIGHT if "headings" in str(self.cget("show")) else 0
+        visible = max(1, (event.height - heading) // int(row_height))
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        self._scroll_by(-1 * (event.delta // 120 or (1 if event.delta > 0 else -1)) * 3)
+        return "break"
+
+    def _scroll_by(self, rows: int) -> str:
+        self._target = None
+        self._first += rows
+        self._render()
+        return "break"
+
+    def _move_selection(self, step: int) -> str:
+        if not self._rows:
+            return "break"
+        if self._selected and self._selected[0] in self._index:
+            position = self._index[self._selected[0]] + step
+        else:
+            position = self._first if step > 0 else self._first + self._visible - 1
+        self._ensure_loaded(position + 1)
+        position = min(max(0, position), len(self._rows) - 1)
+        key = str(self._rows[position][self.key_column])
+        self._selected = (key,)
+        self.see(key)
+        super().focus(key)
+        return "break"
+
+    @staticmethod
+    def _flatten(items: Tuple) -> List[Any]:
+        flat = []
+        for item in items:
+            if isinstance(item, (list, tuple)):
+                flat.extend(item)
+            else:
+                flat.append(item)
+        return flat